@@ -4,7 +4,8 @@ from django.utils import timezone
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
-from ..opensearch_client import get_opensearch_client
+from ..exceptions import AuditLogException
+from ..opensearch_client import MAX_RESULT_WINDOW, decode_search_cursor, get_opensearch_client
 
 
 @extend_schema_field(
@@ -124,6 +125,30 @@ class AuditLogSearchSerializer(serializers.Serializer):
         help_text="Sort order by timestamp (default: desc - newest first)",
     )
     summary_fields_only = serializers.BooleanField(required=False, default=True)
+    cursor = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        help_text=(
+            "Cursor pagination: pass an empty cursor to start, then the next_cursor of each page. "
+            "Use it to walk past the first 10000 results; page is ignored."
+        ),
+    )
+
+    def validate_cursor(self, value):
+        if value:
+            try:
+                decode_search_cursor(value)
+            except AuditLogException as e:
+                raise serializers.ValidationError(str(e)) from e
+        return value
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        if "cursor" not in attrs and attrs.get("page", 1) * attrs.get("page_size", 25) > MAX_RESULT_WINDOW:
+            raise serializers.ValidationError(
+                {"page": f"Page results beyond {MAX_RESULT_WINDOW} are only available with cursor pagination"}
+            )
+        return attrs
 
     def search(self):
         """
@@ -178,6 +203,21 @@ class AuditLogSearchSerializer(serializers.Serializer):
 
         # Search logs using OpenSearch with summary fields only
         opensearch_client = get_opensearch_client()
+        if "cursor" in self.validated_data:
+            result = opensearch_client.search_logs_after(
+                filters=filters,
+                page_size=page_size,
+                cursor=self.validated_data["cursor"] or None,
+                sort_order=sort_order,
+                summary_fields_only=summary_fields_only,
+            )
+            return {
+                "results": result["results"],
+                "count": result["count"],
+                "next_cursor": result["next_cursor"],
+                "object_name": self.context.get("object_name") or "",
+            }
+
         result = opensearch_client.search_logs(
             filters=filters,
             page_size=page_size,
@@ -245,5 +285,6 @@ class AuditLogSearchResponseSerializer(serializers.Serializer):
     count = serializers.IntegerField()
     next = serializers.IntegerField(required=False, allow_null=True)
     previous = serializers.IntegerField(required=False, allow_null=True)
+    next_cursor = serializers.CharField(required=False, allow_null=True)
     results = AuditLogSummarySerializer(many=True)
     object_name = serializers.CharField(required=False, allow_null=True)
@@ -14,7 +14,7 @@ from typing import Any, List, Optional
 
 from .constants import LogAction
 from .middleware import get_current_request, get_current_user
-from .producer import _audit_producer
+from .producer import _audit_producer, log_audit_event
 from .registry import AuditLogRegistry
 from .utils import prepare_request_info, prepare_user_info
 
@@ -146,6 +146,35 @@ class BatchContext:
         """Increment the count of objects processed in this batch."""
         self.object_count += 1
 
+    def log_objects(self, action: str, instances) -> None:
+        """
+        Log one audit entry per object written by a bulk operation.
+
+        `bulk_create` and `bulk_update` bypass the save signals that log the
+        objects of a batch, so bulk writers call this after writing.
+
+        Args:
+            action: The action performed on each object (e.g., LogAction.ADD)
+            instances: The written model instances, or `(original, modified)`
+                pairs so that CHANGE entries record the changed fields
+        """
+        metadata = self.get_metadata()
+        for instance in instances:
+            original, modified = instance if isinstance(instance, tuple) else (None, instance)
+            try:
+                log_audit_event(
+                    action=action,
+                    original_object=original,
+                    modified_object=modified,
+                    user=self.user,
+                    request=self.request,
+                    **metadata,
+                )
+                self.increment_count()
+            except Exception as e:
+                logger.error(f"Failed to log audit event for {modified.__class__.__name__} {modified.pk}: {e}")
+                self.add_error(str(e), {"object_id": modified.pk})
+
     def add_error(self, error_message: str, context: Optional[dict] = None):
         """
         Track an error that occurred during the batch operation.
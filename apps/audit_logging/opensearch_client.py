@@ -1,21 +1,68 @@
 # nosec
 
+import base64
+import binascii
 import datetime
+import json
 import logging
 from collections.abc import Iterable
 from typing import Any, Dict, List
 
 from django.conf import settings
 from opensearchpy import OpenSearch, RequestsHttpConnection
-from opensearchpy.exceptions import OpenSearchException, RequestError
+from opensearchpy.exceptions import NotFoundError, OpenSearchException, RequestError
 
 from .exceptions import AuditLogException
+from .utils import get_log_id_timestamp
 
 logger = logging.getLogger(__name__)
 
 # Index name pattern: audit-logs-YYYY-MM
 INDEX_NAME_TEMPLATE = "{prefix}-{year}-{month:02d}"
 
+# How long a cursor search keeps its point in time open between two pages
+CURSOR_KEEP_ALIVE = "5m"
+
+# Deepest result reachable with from/size paging (OpenSearch max_result_window)
+MAX_RESULT_WINDOW = 10000
+
+SUMMARY_FIELDS = [
+    "log_id",
+    "timestamp",
+    "user_id",
+    "username",
+    "employee_code",
+    "full_name",
+    "department_id",
+    "department_name",
+    "action",
+    "object_type",
+    "object_id",
+    "object_repr",
+]
+
+
+def encode_search_cursor(pit_id: str, search_after: List[Any]) -> str:
+    """Encode the point in time and last sort values of a page into an opaque cursor."""
+    payload = json.dumps({"pit": pit_id, "after": search_after}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_search_cursor(cursor: str) -> tuple[str, List[Any]]:
+    """Decode a cursor from `encode_search_cursor`.
+
+    Raises:
+        AuditLogException: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        pit_id, search_after = payload["pit"], payload["after"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise AuditLogException("Invalid search cursor") from e
+    if not isinstance(pit_id, str) or not isinstance(search_after, list):
+        raise AuditLogException("Invalid search cursor")
+    return pit_id, search_after
+
 
 class OpenSearchClient:
     """Provides an interface to index and query audit logs in OpenSearch."""
@@ -155,10 +202,45 @@ class OpenSearchClient:
         # This ensures we always search the last 12 months of data
         return f"{self.index_prefix}-*"
 
+    def _get_indices_for_range(self, from_date: str | None = None, to_date: str | None = None) -> str:
+        """
+        Return the monthly indices that can hold logs between two timestamps.
+
+        Without a lower bound the months cannot be enumerated, so the index pattern
+        of all months is used.
+
+        Returns:
+            str: Comma-separated list of index names or pattern
+        """
+        if not from_date:
+            return self._get_last_12_months_indices()
+
+        start = datetime.datetime.fromisoformat(from_date.replace("Z", "+00:00"))
+        end = (
+            datetime.datetime.fromisoformat(to_date.replace("Z", "+00:00"))
+            if to_date
+            else datetime.datetime.now(datetime.timezone.utc)
+        )
+        # Index names follow the UTC month of the log timestamp
+        if start.tzinfo:
+            start = start.astimezone(datetime.timezone.utc)
+        if end.tzinfo:
+            end = end.astimezone(datetime.timezone.utc)
+
+        year, month = start.year, start.month
+        indices = []
+        while (year, month) <= (end.year, end.month):
+            indices.append(INDEX_NAME_TEMPLATE.format(prefix=self.index_prefix, year=year, month=month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return ",".join(indices) or self._get_last_12_months_indices()
+
     def get_log_by_id(self, log_id: str) -> Dict[str, Any]:
         """
         Retrieve a single audit log by its log_id.
 
+        Log ids that encode their creation time are fetched directly from their
+        monthly index; older ids are searched for across all indices.
+
         Args:
             log_id: The unique identifier of the log
 
@@ -168,6 +250,19 @@ class OpenSearchClient:
         Raises:
             AuditLogException: If log is not found or retrieval fails
         """
+        created_at = get_log_id_timestamp(log_id)
+        if created_at is not None:
+            index_name = INDEX_NAME_TEMPLATE.format(
+                prefix=self.index_prefix, year=created_at.year, month=created_at.month
+            )
+            try:
+                return self.client.get(index=index_name, id=log_id)["_source"]
+            except NotFoundError as e:
+                raise AuditLogException(f"Log with id {log_id} not found") from e
+            except OpenSearchException as e:
+                logger.error(f"Failed to retrieve log {log_id}: {e}")
+                raise AuditLogException(f"Failed to retrieve log: {e}") from e
+
         # Search across all indices for the log_id
         index_pattern = self._get_last_12_months_indices()
 
@@ -215,8 +310,8 @@ class OpenSearchClient:
         """
         query = self._build_search_query(filters)
 
-        # Use index pattern to search across last 12 months of indices
-        index_pattern = self._get_last_12_months_indices()
+        # Only the monthly indices covered by the date filters are searched
+        index_pattern = self._get_indices_for_range(filters.get("from_date"), filters.get("to_date"))
 
         search_body: Dict[str, Any] = {
             "query": query,
@@ -227,23 +322,12 @@ class OpenSearchClient:
 
         # If summary fields only, use _source filtering
         if summary_fields_only:
-            search_body["_source"] = [
-                "log_id",
-                "timestamp",
-                "user_id",
-                "username",
-                "employee_code",
-                "full_name",
-                "department_id",
-                "department_name",
-                "action",
-                "object_type",
-                "object_id",
-                "object_repr",
-            ]
+            search_body["_source"] = SUMMARY_FIELDS
 
         try:
-            response = self.client.search(index=index_pattern, body=search_body)
+            response = self.client.search(
+                index=index_pattern, body=search_body, ignore_unavailable=True, allow_no_indices=True
+            )
 
             hits = response["hits"]
             logs = [hit["_source"] for hit in hits["hits"]]
@@ -263,6 +347,84 @@ class OpenSearchClient:
             logger.error(f"Failed to search logs: {e}")
             raise AuditLogException(f"Failed to search logs: {e}") from e
 
+    def search_logs_after(
+        self,
+        *,
+        filters: Dict[str, Any],
+        page_size: int = 25,
+        cursor: str | None = None,
+        sort_order: str = "desc",
+        summary_fields_only: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Search audit logs page by page with a cursor, without a depth limit.
+
+        The first call opens a point in time on the indices covered by the date
+        filters, so all pages see the same snapshot of the logs; each page resumes
+        after the sort values of the previous one (`search_after`). The point in
+        time is closed once the last page has been read. The same filters must be
+        passed for every page of a search.
+
+        Args:
+            filters: Dictionary of filter criteria
+            page_size: Number of results per page
+            cursor: `next_cursor` of the previous page, None for the first page
+            sort_order: Sort order ('asc' or 'desc')
+            summary_fields_only: If True, return only the summary fields
+
+        Returns:
+            dict: `results`, the `count` of matching logs and `next_cursor` (None on the last page)
+
+        Raises:
+            AuditLogException: If the cursor is invalid or expired, or the search fails
+        """
+        search_after = None
+        try:
+            if cursor:
+                pit_id, search_after = decode_search_cursor(cursor)
+            else:
+                index_pattern = self._get_indices_for_range(filters.get("from_date"), filters.get("to_date"))
+                pit_id = self.client.create_point_in_time(
+                    index=index_pattern,
+                    keep_alive=CURSOR_KEEP_ALIVE,
+                    ignore_unavailable=True,
+                    allow_no_indices=True,
+                )["pit_id"]
+
+            search_body: Dict[str, Any] = {
+                "query": self._build_search_query(filters),
+                # log_id breaks ties between logs with the same timestamp
+                "sort": [{"timestamp": {"order": sort_order}}, {"log_id": {"order": sort_order}}],
+                "size": page_size,
+                "pit": {"id": pit_id, "keep_alive": CURSOR_KEEP_ALIVE},
+                "track_total_hits": cursor is None,
+            }
+            if search_after:
+                search_body["search_after"] = search_after
+            if summary_fields_only:
+                search_body["_source"] = SUMMARY_FIELDS
+
+            response = self.client.search(body=search_body)
+            hits = response["hits"]["hits"]
+            total = response["hits"].get("total")
+
+            next_cursor = None
+            if len(hits) == page_size:
+                next_cursor = encode_search_cursor(response.get("pit_id", pit_id), hits[-1]["sort"])
+            else:
+                self.client.delete_point_in_time(body={"pit_id": [pit_id]})
+
+            return {
+                "count": total["value"] if isinstance(total, dict) else total,
+                "next_cursor": next_cursor,
+                "results": [hit["_source"] for hit in hits],
+            }
+        except NotFoundError as e:
+            raise AuditLogException("Search cursor expired") from e
+        except OpenSearchException as e:
+            logger.error(f"Failed to search logs: {e}")
+            raise AuditLogException(f"Failed to search logs: {e}") from e
+
     def _build_search_query(self, filters: Dict[str, Any]) -> Dict[str, Any]:
         """Build OpenSearch query from filters."""
         must_clauses: List[Dict[str, Any]] = []
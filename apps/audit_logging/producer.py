@@ -3,7 +3,6 @@ import asyncio
 import datetime
 import json
 import logging
-import uuid
 from typing import Any, Optional
 
 from django.conf import settings
@@ -12,7 +11,7 @@ from django.utils.translation import gettext as _, gettext_lazy as _l
 from rstream import Producer, exceptions
 
 from .registry import AuditLogRegistry
-from .utils import prepare_request_info, prepare_user_info
+from .utils import new_log_id, prepare_request_info, prepare_user_info
 
 file_audit_logger = logging.getLogger("audit_logging")
 
@@ -27,6 +26,7 @@ IGNORED_FIELD_NAMES = {
     "created",
     "updated",
     "modified",
+    "search_text",
 }
 
 
@@ -97,8 +97,9 @@ class AuditStreamProducer:
         Formats a log event, writes it to a local file, and sends it to
         the RabbitMQ Stream.
         """
-        kwargs["log_id"] = str(uuid.uuid4())
-        kwargs["timestamp"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        now = datetime.datetime.now(datetime.timezone.utc)
+        kwargs["log_id"] = new_log_id(now)
+        kwargs["timestamp"] = now.isoformat()
         log_json_string = json.dumps(kwargs)
 
         # Step 1: Write to local file for backup/local auditing.
@@ -209,6 +209,37 @@ class TestAuditLogViewSet(TestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_deep_page_requires_cursor(self):
+        """Test that pages beyond the result window are rejected in favour of cursor pagination."""
+        url = "/api/audit-logs/search/"
+        response = self.client.get(url, {"page_size": "100", "page": "101"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("apps.audit_logging.api.serializers.get_opensearch_client")
+    def test_search_audit_logs_with_cursor(self, mock_get_client):
+        """Test that an empty cursor starts a cursor search."""
+        mock_client = MagicMock()
+        mock_get_client.return_value = mock_client
+        mock_client.search_logs_after.return_value = {"results": [], "count": 0, "next_cursor": None}
+
+        url = "/api/audit-logs/search/"
+        response = self.client.get(url, {"cursor": "", "page_size": "50"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.json()["data"]["next_cursor"])
+        mock_client.search_logs.assert_not_called()
+        mock_client.search_logs_after.assert_called_once_with(
+            filters={}, page_size=50, cursor=None, sort_order="desc", summary_fields_only=True
+        )
+
+    def test_search_audit_logs_invalid_cursor(self):
+        """Test that a malformed cursor is rejected."""
+        url = "/api/audit-logs/search/"
+        response = self.client.get(url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     @patch("apps.audit_logging.api.serializers.get_opensearch_client")
     def test_search_audit_logs_opensearch_exception(self, mock_get_client):
         """Test search when OpenSearch raises an exception."""
@@ -1,9 +1,13 @@
 # audit_logging/tests/test_opensearch_client.py
+import datetime
 from unittest.mock import MagicMock, patch
 
 from django.test import TestCase, override_settings
+from opensearchpy.exceptions import NotFoundError
 
-from ..opensearch_client import OpenSearchClient
+from ..exceptions import AuditLogException
+from ..opensearch_client import OpenSearchClient, decode_search_cursor, encode_search_cursor
+from ..utils import get_log_id_timestamp, new_log_id
 
 
 @override_settings(
@@ -278,6 +282,114 @@ class TestOpenSearchClient(TestCase):
         self.assertIn("headers", result["change_message"])
         self.assertIn("rows", result["change_message"])
 
+    def test_search_logs_targets_indices_of_date_range(self):
+        """Test that a date-filtered search only queries the months of the range."""
+        self.mock_opensearch.search.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
+
+        self.client.search_logs(
+            filters={"from_date": "2023-11-20T17:00:00+00:00", "to_date": "2024-01-02T16:59:59+00:00"}
+        )
+
+        call_args = self.mock_opensearch.search.call_args
+        self.assertEqual(
+            call_args.kwargs["index"], "test-audit-logs-2023-11,test-audit-logs-2023-12,test-audit-logs-2024-01"
+        )
+        self.assertTrue(call_args.kwargs["ignore_unavailable"])
+
+    def test_indices_for_range_use_utc_month(self):
+        """Test that index months are taken in UTC, like the index names."""
+        indices = self.client._get_indices_for_range("2023-12-01T00:00:00+07:00", "2023-12-01T23:59:59+07:00")
+        self.assertEqual(indices, "test-audit-logs-2023-11,test-audit-logs-2023-12")
+
+    def test_indices_without_lower_bound_use_pattern(self):
+        """Test that searches without from_date fall back to the index pattern."""
+        self.assertEqual(self.client._get_indices_for_range(None, "2023-12-31"), "test-audit-logs-*")
+
+    def test_get_log_by_id_reads_index_encoded_in_id(self):
+        """Test that time-ordered log ids are fetched directly from their monthly index."""
+        log_id = new_log_id(datetime.datetime(2023, 12, 15, 10, 30, tzinfo=datetime.UTC))
+        self.mock_opensearch.get.return_value = {"_source": {"log_id": log_id}}
+
+        result = self.client.get_log_by_id(log_id)
+
+        self.mock_opensearch.get.assert_called_once_with(index="test-audit-logs-2023-12", id=log_id)
+        self.mock_opensearch.search.assert_not_called()
+        self.assertEqual(result["log_id"], log_id)
+
+    def test_get_log_by_id_encoded_in_id_not_found(self):
+        """Test that a missing time-ordered log id raises a not found error."""
+        log_id = new_log_id(datetime.datetime(2023, 12, 15, tzinfo=datetime.UTC))
+        self.mock_opensearch.get.side_effect = NotFoundError(404, "not_found", {})
+
+        with self.assertRaises(AuditLogException) as context:
+            self.client.get_log_by_id(log_id)
+
+        self.assertIn("not found", str(context.exception))
+
+    def test_search_logs_after_opens_point_in_time(self):
+        """Test that the first cursor page opens a point in time and returns a cursor."""
+        self.mock_opensearch.create_point_in_time.return_value = {"pit_id": "pit-1"}
+        self.mock_opensearch.search.return_value = {
+            "pit_id": "pit-1",
+            "hits": {
+                "total": {"value": 3},
+                "hits": [
+                    {"_source": {"log_id": "a"}, "sort": [1702636200000, "a"]},
+                    {"_source": {"log_id": "b"}, "sort": [1702636100000, "b"]},
+                ],
+            },
+        }
+
+        result = self.client.search_logs_after(
+            filters={"from_date": "2023-12-01T00:00:00+00:00", "to_date": "2023-12-31T23:59:59+00:00"}, page_size=2
+        )
+
+        self.mock_opensearch.create_point_in_time.assert_called_once()
+        self.assertEqual(
+            self.mock_opensearch.create_point_in_time.call_args.kwargs["index"], "test-audit-logs-2023-12"
+        )
+        search_body = self.mock_opensearch.search.call_args.kwargs["body"]
+        self.assertEqual(search_body["pit"]["id"], "pit-1")
+        self.assertNotIn("search_after", search_body)
+        self.assertEqual(result["count"], 3)
+        self.assertEqual(decode_search_cursor(result["next_cursor"]), ("pit-1", [1702636100000, "b"]))
+        self.mock_opensearch.delete_point_in_time.assert_not_called()
+
+    def test_search_logs_after_last_page_closes_point_in_time(self):
+        """Test that the page after a cursor resumes with search_after and closes the point in time at the end."""
+        self.mock_opensearch.search.return_value = {
+            "pit_id": "pit-1",
+            "hits": {"hits": [{"_source": {"log_id": "c"}, "sort": [1702636000000, "c"]}]},
+        }
+
+        result = self.client.search_logs_after(
+            filters={}, page_size=2, cursor=encode_search_cursor("pit-1", [1702636100000, "b"])
+        )
+
+        self.mock_opensearch.create_point_in_time.assert_not_called()
+        search_body = self.mock_opensearch.search.call_args.kwargs["body"]
+        self.assertEqual(search_body["search_after"], [1702636100000, "b"])
+        self.assertIsNone(result["next_cursor"])
+        self.mock_opensearch.delete_point_in_time.assert_called_once_with(body={"pit_id": ["pit-1"]})
+
+    def test_invalid_cursor_is_rejected(self):
+        """Test that malformed cursors raise an AuditLogException."""
+        with self.assertRaises(AuditLogException):
+            decode_search_cursor("not-a-cursor")
+
+
+class TestLogId(TestCase):
+    """Test cases for time-ordered log ids."""
+
+    def test_timestamp_round_trip(self):
+        created_at = datetime.datetime(2024, 2, 29, 23, 59, 59, 123000, tzinfo=datetime.UTC)
+
+        self.assertEqual(get_log_id_timestamp(new_log_id(created_at)), created_at)
+
+    def test_legacy_ids_have_no_timestamp(self):
+        self.assertIsNone(get_log_id_timestamp("6f1c3a52-2b4e-4d0a-9a57-0c1f5e2b8d11"))
+        self.assertIsNone(get_log_id_timestamp("test-123"))
+
 
 @override_settings(
     OPENSEARCH_HOST="localhost",
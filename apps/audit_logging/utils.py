@@ -1,3 +1,8 @@
+import datetime
+import os
+import uuid
+
+
 def prepare_request_info(log_data: dict, request):
     # Get IP address
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
@@ -39,3 +44,28 @@ def prepare_user_info(log_data: dict, user=None):
         log_data["full_name"] = ""
         log_data["department_id"] = None
         log_data["department_name"] = None
+
+
+def new_log_id(timestamp: datetime.datetime) -> str:
+    """Generate a time-ordered log id (UUID version 7) for a log created at `timestamp`.
+
+    The first 48 bits hold the Unix time in milliseconds, so the monthly index
+    of a log can be derived from its id (see `get_log_id_timestamp`).
+    """
+    unix_ms = int(timestamp.timestamp() * 1000)
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Version 7 in bits 48-51, RFC 4122 variant in bits 64-65
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return str(uuid.UUID(int=value))
+
+
+def get_log_id_timestamp(log_id: str) -> datetime.datetime | None:
+    """Return the UTC creation time encoded in a log id, or None for ids without one."""
+    try:
+        parsed = uuid.UUID(log_id)
+    except ValueError:
+        return None
+    if parsed.version != 7:
+        return None
+    return datetime.datetime.fromtimestamp((parsed.int >> 80) / 1000, tz=datetime.timezone.utc)
@@ -9,6 +9,8 @@ from .models import (
     DeviceChangeRequest,
     MobileAppConfig,
     Nationality,
+    NightlyPipelineRun,
+    NightlyPipelineStep,
     PasswordResetOTP,
     Permission,
     Province,
@@ -113,6 +115,22 @@ class MobileAppConfigAdmin(admin.ModelAdmin):
         cache.delete(settings.MOBILE_APP_CONFIG_CACHE_KEY)
 
 
+class NightlyPipelineStepInline(admin.TabularInline):
+    model = NightlyPipelineStep
+    extra = 0
+    fields = ["name", "resource", "status", "attempts", "started_at", "finished_at", "duration_ms", "error"]
+    readonly_fields = fields
+    can_delete = False
+
+
+@admin.register(NightlyPipelineRun)
+class NightlyPipelineRunAdmin(admin.ModelAdmin):
+    list_display = ["run_date", "status", "started_at", "finished_at"]
+    list_filter = ["status"]
+    readonly_fields = ["run_date", "status", "started_at", "finished_at"]
+    inlines = [NightlyPipelineStepInline]
+
+
 admin.site.register(PasswordResetOTP)
 admin.site.register(AdministrativeUnit)
 admin.site.register(Nationality)
@@ -1,5 +1,6 @@
 import logging
 
+from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext as _
 from rest_framework import serializers
@@ -7,6 +8,7 @@ from rest_framework.exceptions import APIException
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from apps.core.models import User, UserDevice
+from apps.core.utils.login import record_login_device
 
 logger = logging.getLogger(__name__)
 
@@ -120,27 +122,27 @@ class LoginSerializer(serializers.Serializer):
         if client == UserDevice.Client.MOBILE:
             if not device_id:
                 raise serializers.ValidationError({"device_id": _("Device ID is required for mobile login.")})
-            device_taken = (
+            # One query covers both checks: who owns this device, and which device this user has bound
+            active_devices = list(
                 UserDevice.objects.filter(
+                    Q(device_id=device_id) | Q(user=user),
                     client=UserDevice.Client.MOBILE,
                     state=UserDevice.State.ACTIVE,
-                    device_id=device_id,
-                )
-                .exclude(user=user)
-                .first()
+                ).values_list("user_id", "device_id")
             )
-            if device_taken is not None:
+            if any(
+                owner_id != user.pk and active_device_id == device_id for owner_id, active_device_id in active_devices
+            ):
                 raise serializers.ValidationError(
                     {"device_id": _("This device is already registered to another user.")}
                 )
 
-            active_device = UserDevice.objects.filter(
-                user=user,
-                client=UserDevice.Client.MOBILE,
-                state=UserDevice.State.ACTIVE,
-            ).first()
-            if active_device is not None and active_device.device_id != device_id:
+            user_device_ids = [
+                active_device_id for owner_id, active_device_id in active_devices if owner_id == user.pk
+            ]
+            if user_device_ids and device_id not in user_device_ids:
                 raise MobileDeviceConflict()
+            attrs["has_active_device"] = bool(user_device_ids)
 
         attrs["user"] = user
         attrs["device_id"] = device_id
@@ -148,43 +150,39 @@ class LoginSerializer(serializers.Serializer):
         attrs["push_token"] = push_token
         return attrs
 
-    def get_tokens(self, user: User, *, client: str) -> dict[str, str]:
+    def get_tokens(self, user: User, *, client: str, defer_device_bookkeeping: bool = False) -> dict[str, str]:
+        """Bind the device and issue the JWT pair.
+
+        A mobile device is always bound here because the device checks of later logins
+        depend on it. The remaining device bookkeeping (push token, platform, last seen
+        time and the web device) is skipped when `defer_device_bookkeeping` is set, so the
+        caller can run it outside the request with `record_login_device`.
+        """
         device_id: str = self.validated_data["device_id"]
+        platform = str(self.validated_data.get("platform") or "")
         push_token = str(self.validated_data.get("push_token") or device_id)
         now = timezone.now()
 
         if client == UserDevice.Client.MOBILE:
-            active_device = UserDevice.objects.filter(
-                user=user,
-                client=UserDevice.Client.MOBILE,
-                state=UserDevice.State.ACTIVE,
-            ).first()
-            if active_device is None:
+            if not self.validated_data.get("has_active_device"):
                 UserDevice.objects.create(
                     user=user,
                     client=UserDevice.Client.MOBILE,
                     device_id=device_id,
-                    platform=str(self.validated_data.get("platform") or ""),
+                    platform=platform,
                     push_token=push_token,
                     last_seen_at=now,
                     state=UserDevice.State.ACTIVE,
                 )
-            else:
-                active_device.platform = str(self.validated_data.get("platform") or "")
-                active_device.push_token = push_token
-                active_device.last_seen_at = now
-                active_device.save(update_fields=["platform", "push_token", "last_seen_at"])
-
-        if client == UserDevice.Client.WEB:
-            UserDevice.objects.update_or_create(
-                user=user,
-                client=UserDevice.Client.WEB,
+
+        if not defer_device_bookkeeping:
+            record_login_device(
+                user.id,
+                client=client,
                 device_id=device_id,
-                defaults={
-                    "last_seen_at": now,
-                    "state": UserDevice.State.ACTIVE,
-                    "platform": UserDevice.Platform.WEB,
-                },
+                platform=platform,
+                push_token=push_token,
+                seen_at=now,
             )
 
         refresh = RefreshToken.for_user(user)
@@ -1,7 +1,9 @@
 import logging
 
 from django.conf import settings
-from django.utils.translation import gettext as _
+from django.db import transaction
+from django.utils import timezone
+from django.utils.translation import get_language, gettext as _
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status
 from rest_framework.exceptions import Throttled
@@ -10,12 +12,10 @@ from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
 from rest_framework.views import APIView
 
-from apps.audit_logging import LogAction, log_audit_event
 from apps.core.api.authentication import get_request_client
 from apps.core.api.serializers.auth import LoginSerializer
+from apps.core.tasks.login import process_login_side_effects
 from apps.core.utils.jwt import revoke_user_outstanding_tokens
-from apps.notifications.models import Notification
-from apps.notifications.utils import create_notification
 from libs.request_utils import UNKNOWN_IP, get_client_ip, get_user_agent
 
 logger = logging.getLogger(__name__)
@@ -29,7 +29,9 @@ class LoginRateThrottle(AnonRateThrottle):
 class LoginView(APIView):
     """API endpoint for user login with username and password.
 
-    Issues JWT tokens immediately (no OTP step).
+    Issues JWT tokens immediately (no OTP step). Only the credential and device checks
+    and token issuance run on the request path; device bookkeeping, the audit event and
+    the login notification run in `process_login_side_effects` after commit.
     """
 
     permission_classes = [AllowAny]
@@ -115,36 +117,21 @@ class LoginView(APIView):
         if revoked:
             logger.info("Revoked %s previous refresh token(s) for user %s", revoked, user.username)
 
-        tokens = serializer.get_tokens(user, client=client)
-
-        try:
-            modified_object = user.employee
-        except Exception:
-            modified_object = None
-
-        log_audit_event(
-            action=LogAction.LOGIN,
-            modified_object=modified_object,
-            user=user,
-            request=request,
-            change_message=f"User {user.username} logged in successfully",
-        )
-
-        ip_address = get_client_ip(request) or UNKNOWN_IP
-        user_agent = get_user_agent(request)
-        login_message = _("Your account was logged in from IP address: {ip_address}").format(ip_address=ip_address)
-
-        create_notification(
-            actor=user,
-            recipient=user,
-            verb=_("logged in"),
-            message=login_message,
-            extra_data={
-                "ip_address": ip_address,
-                "user_agent": user_agent,
-            },
-            delivery_method=Notification.DeliveryMethod.FIREBASE,
-        )
+        tokens = serializer.get_tokens(user, client=client, defer_device_bookkeeping=True)
+
+        # Audit, notification and device bookkeeping do not affect the response; run them after commit
+        side_effect_kwargs = {
+            "user_id": user.id,
+            "client": client,
+            "device_id": serializer.validated_data["device_id"],
+            "platform": serializer.validated_data["platform"],
+            "push_token": serializer.validated_data["push_token"],
+            "logged_in_at": timezone.now(),
+            "ip_address": get_client_ip(request) or UNKNOWN_IP,
+            "user_agent": get_user_agent(request),
+            "language": get_language(),
+        }
+        transaction.on_commit(lambda: process_login_side_effects.delay(**side_effect_kwargs))
 
         response_data = {
             "message": _("Login successful."),
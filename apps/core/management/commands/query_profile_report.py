@@ -0,0 +1,70 @@
+"""
+Management command to summarize the request profiles recorded by QueryProfilingMiddleware.
+
+Reads the JSON lines report at QUERY_PROFILING_REPORT_PATH (or --path) and
+prints, per route, the query counts, duplicated queries, DB, serializer and
+total times and the cache hit ratio, routes with the most queries first.
+"""
+
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from libs.query_profiling import aggregate_report, read_report
+
+
+class Command(BaseCommand):
+    help = "Summarize the per-route query and latency profiles recorded by QueryProfilingMiddleware"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--path",
+            default=settings.QUERY_PROFILING_REPORT_PATH,
+            help="Report file (defaults to QUERY_PROFILING_REPORT_PATH)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Number of routes to show",
+        )
+        parser.add_argument(
+            "--duplicates",
+            action="store_true",
+            help="Show the most duplicated queries of each route",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Delete the report file after printing it",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path or not os.path.exists(path):
+            raise CommandError(f"No query profiling report found at '{path}'")
+
+        rows = aggregate_report(read_report(path))
+        if not rows:
+            self.stdout.write(self.style.WARNING("The report is empty"))
+            return
+
+        self.stdout.write(
+            f"{'Route':<60} {'Reqs':>5} {'Q avg':>6} {'Q max':>6} {'Dup':>4} "
+            f"{'DB avg':>8} {'DB p95':>8} {'Ser avg':>8} {'Tot avg':>8} {'Cache':>6}"
+        )
+        for row in rows[: options["limit"]]:
+            hit_ratio = "-" if row["cache_hit_ratio"] is None else f"{row['cache_hit_ratio']:.0%}"
+            self.stdout.write(
+                f"{row['route'][:60]:<60} {row['requests']:>5} {row['queries_avg']:>6} {row['queries_max']:>6} "
+                f"{row['duplicates_max']:>4} {row['db_ms_avg']:>8} {row['db_ms_p95']:>8} "
+                f"{row['serializer_ms_avg']:>8} {row['total_ms_avg']:>8} {hit_ratio:>6}"
+            )
+            if options["duplicates"]:
+                for sql, count in row["top_duplicates"]:
+                    self.stdout.write(f"    {count}x {sql[:200]}")
+
+        if options["reset"]:
+            os.remove(path)
+            self.stdout.write(self.style.SUCCESS(f"Deleted {path}"))
@@ -0,0 +1,54 @@
+"""
+Management command to start or resume a nightly pipeline run.
+
+Without options it starts today's run, like the beat schedule does. With
+`--resume` it reruns the failed and skipped steps of an existing run, keeping
+the steps that already succeeded.
+"""
+
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.core.models import NightlyPipelineRun
+from apps.core.utils.nightly_pipeline import resume_run, start_run
+
+
+class Command(BaseCommand):
+    help = "Start or resume the nightly job pipeline"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--date",
+            type=date.fromisoformat,
+            help="Run date (YYYY-MM-DD), defaults to today",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Rerun the failed and skipped steps of an existing run",
+        )
+        parser.add_argument(
+            "--include-running",
+            action="store_true",
+            help="With --resume, also rerun steps left running (e.g. after a worker crash)",
+        )
+
+    def handle(self, *args, **options):
+        run_date = options["date"] or timezone.localdate()
+
+        if options["resume"]:
+            run = NightlyPipelineRun.objects.filter(run_date=run_date).first()
+            if run is None:
+                raise CommandError(f"No nightly pipeline run exists for {run_date}")
+            reset = resume_run(run, include_running=options["include_running"])
+            self.stdout.write(
+                self.style.SUCCESS(f"Resumed run {run_date}: {', '.join(reset) if reset else 'no step to rerun'}")
+            )
+            return
+
+        run, created = start_run(run_date)
+        if not created:
+            raise CommandError(f"A nightly pipeline run already exists for {run_date}, use --resume to continue it")
+        self.stdout.write(self.style.SUCCESS(f"Started nightly pipeline run {run_date}"))
@@ -25,10 +25,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Force update all tasks even if they exist",
         )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Disable periodic tasks that are no longer in CELERY_BEAT_SCHEDULE",
+        )
 
     def handle(self, *args, **options):
         dry_run = options["dry_run"]
         force = options["force"]
+        prune = options["prune"]
 
         schedule = getattr(settings, "CELERY_BEAT_SCHEDULE", {})
 
@@ -49,12 +55,38 @@ class Command(BaseCommand):
             elif result == "skipped":
                 skipped_count += 1
 
+        disabled_count = self._prune_tasks(schedule, dry_run) if prune else 0
+
         # Summary
         self.stdout.write("")
         self.stdout.write(
-            self.style.SUCCESS(f"Summary: {created_count} created, {updated_count} updated, {skipped_count} skipped")
+            self.style.SUCCESS(
+                f"Summary: {created_count} created, {updated_count} updated, {skipped_count} skipped, "
+                f"{disabled_count} disabled"
+            )
         )
 
+    def _prune_tasks(self, schedule, dry_run):
+        """Disable enabled periodic tasks whose name is no longer scheduled.
+
+        Jobs moved into the nightly pipeline must not keep firing from the
+        database scheduler on their old crontab.
+        """
+        stale_tasks = PeriodicTask.objects.filter(enabled=True).exclude(name__in=schedule.keys())
+        # Celery's own housekeeping task is managed by the beat scheduler itself
+        stale_tasks = stale_tasks.exclude(task__startswith="celery.")
+
+        disabled_count = 0
+        for task in stale_tasks:
+            if dry_run:
+                self.stdout.write(f"  [DRY-RUN] Would DISABLE: {task.name}")
+            else:
+                task.enabled = False
+                task.save(update_fields=["enabled"])
+                self.stdout.write(self.style.WARNING(f"  [DISABLE] {task.name}"))
+            disabled_count += 1
+        return disabled_count
+
     def _process_task(self, task_name, task_config, dry_run, force):
         """Process a single task and return the action taken."""
         task_path = task_config.get("task")
@@ -1,13 +1,26 @@
 import json
 
-from django.http import JsonResponse
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse, JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 from rest_framework.response import Response
 
+from libs.query_profiling import append_report, install_serializer_timing, profiling
+from libs.renderers import EnvelopeJSONRenderer, build_envelope, dumps, is_error_response
+
+# Longest JSON body that can encode an empty value, e.g. {}, [], "", 0.0 or null
+EMPTY_JSON_MAX_LENGTH = 32
+
 
 class ApiResponseWrapperMiddleware(MiddlewareMixin):
     """
     Middleware to wrap API responses in a consistent format.
+
+    DRF responses rendered by `libs.renderers.EnvelopeJSONRenderer` (the default
+    renderer) already hold the envelope and are returned as is. Other DRF
+    responses are wrapped from their data, and plain JSON responses by embedding
+    their body in the envelope without decoding it.
     """
 
     def process_response(self, request, response):
@@ -16,20 +29,55 @@ class ApiResponseWrapperMiddleware(MiddlewareMixin):
 
         # Only wrap DRF responses or JSON responses
         if isinstance(response, Response):
-            status = response.status_code
-            data = response.data if response.data else None
+            if isinstance(getattr(response, "accepted_renderer", None), EnvelopeJSONRenderer):
+                return response
+            content = dumps(build_envelope(response.data, is_error_response(response)))
         elif isinstance(response, JsonResponse):
-            status = response.status_code
-            data = json.loads(response.content)
+            content = self._wrap_json(response.content, is_error_response(response))
         else:
             # Do not wrap non-JSON responses
             return response
 
-        is_error = getattr(response, "exception", False) or status >= 400
-        envelope = {
-            "success": not is_error,
-            "data": None if is_error else data,
-            "error": data if is_error else None,
-        }
-        # Return a new JsonResponse with the wrapped data
-        return JsonResponse(envelope, status=status)
+        return HttpResponse(content, status=response.status_code, content_type="application/json")
+
+    @staticmethod
+    def _wrap_json(content: bytes, is_error: bool) -> bytes:
+        # Only short bodies can hold empty data (sent as null), decode those
+        if len(content) <= EMPTY_JSON_MAX_LENGTH:
+            return dumps(build_envelope(json.loads(content), is_error))
+        if is_error:
+            return b'{"success":false,"data":null,"error":' + content + b"}"
+        return b'{"success":true,"data":' + content + b',"error":null}'
+
+
+class QueryProfilingMiddleware:
+    """
+    Middleware to profile the SQL queries and latency of each request.
+
+    Enabled with the QUERY_PROFILING_ENABLED setting. Each response gets the
+    query count, duplicated queries, DB, serializer and cache measurements as
+    X-Query-* / X-DB-Time-Ms / X-Serializer-Time-Ms / X-Cache-* and
+    Server-Timing headers. When QUERY_PROFILING_REPORT_PATH is set the profile
+    is also appended to that file, keyed by HTTP method and URL name, for the
+    query_profile_report management command.
+    """
+
+    def __init__(self, get_response):
+        if not settings.QUERY_PROFILING_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.report_path = settings.QUERY_PROFILING_REPORT_PATH
+        install_serializer_timing()
+
+    def __call__(self, request):
+        with profiling() as profile:
+            response = self.get_response(request)
+
+        match = request.resolver_match
+        profile.route = f"{request.method} {match.view_name if match else request.path}"
+        profile.status_code = response.status_code
+        for header, value in profile.headers().items():
+            response[header] = value
+        if self.report_path:
+            append_report(self.report_path, profile)
+        return response
@@ -0,0 +1,89 @@
+# Generated by Django 5.2.6 on 2026-10-18 10:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import libs.models.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0003_merge_0002_mobileappconfig_0002_role_data_scope_level"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="NightlyPipelineRun",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                ("run_date", models.DateField(unique=True, verbose_name="Run date")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("running", "Running"), ("succeeded", "Succeeded"), ("failed", "Failed")],
+                        default="running",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("started_at", models.DateTimeField(blank=True, null=True, verbose_name="Started at")),
+                ("finished_at", models.DateTimeField(blank=True, null=True, verbose_name="Finished at")),
+            ],
+            options={
+                "verbose_name": "Nightly pipeline run",
+                "verbose_name_plural": "Nightly pipeline runs",
+                "db_table": "core_nightly_pipeline_run",
+                "ordering": ["-run_date"],
+            },
+        ),
+        migrations.CreateModel(
+            name="NightlyPipelineStep",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                ("name", models.CharField(max_length=100, verbose_name="Name")),
+                ("resource", models.CharField(max_length=50, verbose_name="Resource")),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("succeeded", "Succeeded"),
+                            ("failed", "Failed"),
+                            ("skipped", "Skipped"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                        verbose_name="Status",
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, verbose_name="Attempts")),
+                ("started_at", models.DateTimeField(blank=True, null=True, verbose_name="Started at")),
+                ("finished_at", models.DateTimeField(blank=True, null=True, verbose_name="Finished at")),
+                ("duration_ms", models.PositiveIntegerField(blank=True, null=True, verbose_name="Duration (ms)")),
+                ("error", libs.models.fields.SafeTextField(blank=True, default="", verbose_name="Error")),
+                (
+                    "run",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="steps",
+                        to="core.nightlypipelinerun",
+                        verbose_name="Run",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Nightly pipeline step",
+                "verbose_name_plural": "Nightly pipeline steps",
+                "db_table": "core_nightly_pipeline_step",
+                "ordering": ["run", "id"],
+                "constraints": [
+                    models.UniqueConstraint(fields=("run", "name"), name="core_nightly_pipeline_step_run_name_unique")
+                ],
+            },
+        ),
+    ]
@@ -3,6 +3,7 @@ from .device import UserDevice
 from .device_change_request import DeviceChangeRequest
 from .mobile_app_config import MobileAppConfig
 from .nationality import Nationality
+from .nightly_pipeline import NightlyPipelineRun, NightlyPipelineStep
 from .password_reset import PasswordResetOTP
 from .permission import Permission
 from .province import Province
@@ -20,4 +21,6 @@ __all__ = [
     "AdministrativeUnit",
     "Nationality",
     "MobileAppConfig",
+    "NightlyPipelineRun",
+    "NightlyPipelineStep",
 ]
@@ -0,0 +1,76 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from libs.models.base_model_mixin import BaseModel
+from libs.models.fields import SafeTextField
+
+
+class NightlyPipelineRun(BaseModel):
+    """One execution of the nightly job pipeline (see `settings.NIGHTLY_PIPELINE`)."""
+
+    class Status(models.TextChoices):
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+
+    run_date = models.DateField(unique=True, verbose_name=_("Run date"))
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.RUNNING,
+        verbose_name=_("Status"),
+    )
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Started at"))
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Finished at"))
+
+    class Meta:
+        db_table = "core_nightly_pipeline_run"
+        verbose_name = _("Nightly pipeline run")
+        verbose_name_plural = _("Nightly pipeline runs")
+        ordering = ["-run_date"]
+
+    def __str__(self):
+        return f"{self.run_date} ({self.status})"
+
+
+class NightlyPipelineStep(BaseModel):
+    """State and timing of one step of a nightly pipeline run."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", _("Pending")
+        RUNNING = "running", _("Running")
+        SUCCEEDED = "succeeded", _("Succeeded")
+        FAILED = "failed", _("Failed")
+        SKIPPED = "skipped", _("Skipped")
+
+    run = models.ForeignKey(
+        NightlyPipelineRun,
+        on_delete=models.CASCADE,
+        related_name="steps",
+        verbose_name=_("Run"),
+    )
+    name = models.CharField(max_length=100, verbose_name=_("Name"))
+    resource = models.CharField(max_length=50, verbose_name=_("Resource"))
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+        verbose_name=_("Status"),
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, verbose_name=_("Attempts"))
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Started at"))
+    finished_at = models.DateTimeField(null=True, blank=True, verbose_name=_("Finished at"))
+    duration_ms = models.PositiveIntegerField(null=True, blank=True, verbose_name=_("Duration (ms)"))
+    error = SafeTextField(blank=True, default="", verbose_name=_("Error"))
+
+    class Meta:
+        db_table = "core_nightly_pipeline_step"
+        verbose_name = _("Nightly pipeline step")
+        verbose_name_plural = _("Nightly pipeline steps")
+        ordering = ["run", "id"]
+        constraints = [
+            models.UniqueConstraint(fields=["run", "name"], name="core_nightly_pipeline_step_run_name_unique"),
+        ]
+
+    def __str__(self):
+        return f"{self.run.run_date} {self.name} ({self.status})"
@@ -7,10 +7,10 @@ from django.utils import timezone
 
 from apps.core.constants import APP_TESTER_OTP_CODE, APP_TESTER_USERNAME
 from apps.core.querysets import UserManager
-from libs.models import BaseModel
+from libs.models import BaseModel, FieldTrackerMixin
 
 
-class User(BaseModel, AbstractBaseUser, PermissionsMixin):
+class User(FieldTrackerMixin, BaseModel, AbstractBaseUser, PermissionsMixin):
     username = models.CharField(max_length=100, unique=True, verbose_name="Username")
     email = models.EmailField(unique=True, verbose_name="Email")
     phone_number = models.CharField(max_length=15, blank=True, null=True, verbose_name="Phone number")
@@ -49,6 +49,7 @@ class User(BaseModel, AbstractBaseUser, PermissionsMixin):
     objects = UserManager()
 
     USERNAME_FIELD = "username"
+    TRACKED_FIELDS = ("role",)
     REQUIRED_FIELDS = ["email"]
 
     class Meta:
@@ -1,10 +1,19 @@
+from .dbbackup import run_dbbackup
 from .email import (
     send_otp_device_change_task,
     send_otp_email_task,
     send_password_reset_email_task,
 )
+from .login import process_login_side_effects
+from .nightly import run_nightly_pipeline, run_nightly_pipeline_step
+from .tokens import purge_expired_tokens_task
 
 __all__ = [
+    "process_login_side_effects",
+    "run_dbbackup",
+    "run_nightly_pipeline",
+    "run_nightly_pipeline_step",
+    "purge_expired_tokens_task",
     "send_otp_device_change_task",
     "send_otp_email_task",
     "send_password_reset_email_task",
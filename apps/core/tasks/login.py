@@ -0,0 +1,92 @@
+"""Celery task running the side effects of a successful login.
+
+The login request only verifies credentials and the device, binds a new mobile
+device and issues tokens. Everything else (device bookkeeping, the audit event
+and the login notification) is coalesced into this single task, dispatched after
+the login transaction commits.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from celery import shared_task
+from django.utils import translation
+from django.utils.translation import gettext as _
+
+from apps.audit_logging import LogAction, log_audit_event
+from apps.core.models import User
+from apps.core.utils.login import record_login_device
+from apps.notifications.models import Notification
+from apps.notifications.utils import create_notification
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def process_login_side_effects(
+    user_id,
+    client: str,
+    device_id: str,
+    platform: str,
+    push_token: str,
+    logged_in_at: datetime,
+    ip_address: str,
+    user_agent: str,
+    language: str | None = None,
+) -> None:
+    """Record device bookkeeping, the audit event and the login notification of a login.
+
+    Args:
+        user_id: ID of the user who logged in
+        client: Client the user logged in from (web/mobile)
+        device_id: Device identifier sent with the login
+        platform: Device platform sent with the login
+        push_token: Push token sent with the login
+        logged_in_at: Time of the login
+        ip_address: Client IP address of the login request
+        user_agent: User agent of the login request
+        language: Active language of the login request, used for the notification text
+    """
+    user = User.objects.filter(id=user_id).first()
+    if user is None:
+        logger.warning("process_login_side_effects: user %s no longer exists", user_id)
+        return
+
+    record_login_device(
+        user.id,
+        client=client,
+        device_id=device_id,
+        platform=platform,
+        push_token=push_token,
+        seen_at=logged_in_at,
+    )
+
+    try:
+        modified_object = user.employee
+    except Exception:
+        modified_object = None
+
+    log_audit_event(
+        action=LogAction.LOGIN,
+        modified_object=modified_object,
+        user=user,
+        change_message=f"User {user.username} logged in successfully",
+        ip_address=ip_address,
+        user_agent=user_agent,
+    )
+
+    with translation.override(language):
+        login_message = _("Your account was logged in from IP address: {ip_address}").format(ip_address=ip_address)
+        create_notification(
+            actor=user,
+            recipient=user,
+            verb=_("logged in"),
+            message=login_message,
+            extra_data={
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+            },
+            delivery_method=Notification.DeliveryMethod.FIREBASE,
+        )
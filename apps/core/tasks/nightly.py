@@ -0,0 +1,43 @@
+"""Celery tasks driving the nightly job pipeline.
+
+`run_nightly_pipeline` is the only nightly entry in the beat schedule. It starts
+the run of the day, and each `run_nightly_pipeline_step` dispatches the steps
+that became ready when it finishes (see `apps.core.utils.nightly_pipeline`).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery import shared_task
+
+from apps.core.utils.nightly_pipeline import advance_run, execute_step, start_run
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def run_nightly_pipeline() -> dict[str, Any]:
+    """Start today's nightly pipeline run.
+
+    Returns:
+        dict with keys: `run_id` (int) and `created` (bool, False when a run
+        already exists for today).
+    """
+    run, created = start_run()
+    if not created:
+        logger.warning("run_nightly_pipeline: a run for %s already exists (status %s)", run.run_date, run.status)
+    return {"run_id": run.id, "created": created}
+
+
+@shared_task
+def run_nightly_pipeline_step(run_id: int, name: str) -> dict[str, Any]:
+    """Run one pipeline step, then dispatch the steps it unblocked.
+
+    Returns:
+        dict with keys: `step` (str), `status` (str) and `duration_ms` (int).
+    """
+    step = execute_step(run_id, name)
+    advance_run(run_id)
+    return {"step": step.name, "status": step.status, "duration_ms": step.duration_ms}
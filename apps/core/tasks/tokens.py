@@ -0,0 +1,37 @@
+"""Celery task to purge expired refresh tokens.
+
+Every login and token refresh adds an OutstandingToken row (and usually a
+BlacklistedToken row for the rotated one). Expired rows are useless, so this
+task removes them in chunks to keep the token tables, and therefore login,
+from growing over the lifetime of an account.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from celery import shared_task
+
+from apps.core.utils.jwt import purge_expired_tokens
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PURGE_MAX_BATCHES_PER_RUN = 50
+
+
+@shared_task
+def purge_expired_tokens_task() -> dict[str, Any]:
+    """Delete expired outstanding and blacklisted refresh tokens.
+
+    Returns:
+        dict with keys: `success` (bool) and `deleted` (int) or `error` (str)
+        when `success` is False.
+    """
+    try:
+        deleted = purge_expired_tokens(max_batches=TOKEN_PURGE_MAX_BATCHES_PER_RUN)
+        logger.info("purge_expired_tokens_task: deleted %s expired token(s)", deleted)
+        return {"success": True, "deleted": deleted}
+    except Exception as e:  # pragma: no cover - defensive logging
+        logger.exception("purge_expired_tokens_task: unexpected error: %s", e)
+        return {"success": False, "error": str(e)}
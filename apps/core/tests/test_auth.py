@@ -341,14 +341,18 @@ class TestAuthentication:
 
     @patch("apps.core.api.views.auth.login.LoginView.throttle_classes", new=[])
     @patch("apps.notifications.utils.trigger_send_notification")
-    def test_web_login_sets_claims_and_updates_last_web_device(self, mock_trigger_send_notification):
+    def test_web_login_sets_claims_and_updates_last_web_device(
+        self, mock_trigger_send_notification, settings, django_capture_on_commit_callbacks
+    ):
+        settings.CELERY_TASK_ALWAYS_EAGER = True
         device_id = "web-device-123"
 
-        resp = self.client.post(
-            self.login_url,
-            {"username": self.user.username, "password": "testpass123", "device_id": device_id},
-            format="json",
-        )
+        with django_capture_on_commit_callbacks(execute=True):
+            resp = self.client.post(
+                self.login_url,
+                {"username": self.user.username, "password": "testpass123", "device_id": device_id},
+                format="json",
+            )
         assert resp.status_code == status.HTTP_200_OK
         access = resp.json()["data"]["tokens"]["access"]
 
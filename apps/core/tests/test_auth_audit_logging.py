@@ -10,7 +10,7 @@ from apps.core.models import AdministrativeUnit, PasswordResetOTP, Province, Use
 from apps.hrm.models import Block, Branch, Department, Employee
 
 
-@override_settings(AUDIT_LOG_DISABLED=False)
+@override_settings(AUDIT_LOG_DISABLED=False, CELERY_TASK_ALWAYS_EAGER=True)
 class AuthAuditLoggingTestCase(TestCase):
     """Test cases for audit logging in authentication flows"""
 
@@ -30,11 +30,12 @@ class AuthAuditLoggingTestCase(TestCase):
 
     @patch("apps.notifications.utils.trigger_send_notification")
     @patch("apps.core.api.views.auth.login.LoginView.throttle_classes", new=[])
-    @patch("apps.core.api.views.auth.login.log_audit_event")
+    @patch("apps.core.tasks.login.log_audit_event")
     def test_login_audit_log(self, mock_log_audit_event, mock_trigger_send_notification):
         """Test that successful login creates an audit log"""
         data = {"username": "testuser001", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(self.login_url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.login_url, data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -115,7 +116,7 @@ class AuthAuditLoggingTestCase(TestCase):
     #     self.assertEqual(call_kwargs["reset_channel"], "sms")
 
 
-@override_settings(AUDIT_LOG_DISABLED=False)
+@override_settings(AUDIT_LOG_DISABLED=False, CELERY_TASK_ALWAYS_EAGER=True)
 class AuthAuditLoggingWithEmployeeTestCase(TestCase):
     """Test cases for audit logging with employee records in authentication flows"""
 
@@ -182,7 +183,8 @@ class AuthAuditLoggingWithEmployeeTestCase(TestCase):
     def test_login_audit_log_includes_employee_code_and_object(self, mock_log_event, mock_trigger_send_notification):
         """Test that successful login includes employee code and object type/id"""
         data = {"username": "emp001", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(self.login_url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.login_url, data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -290,7 +292,8 @@ class AuthAuditLoggingWithEmployeeTestCase(TestCase):
         )
 
         data = {"username": "noemployee", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(self.login_url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.login_url, data, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
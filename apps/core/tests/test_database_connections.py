@@ -0,0 +1,16 @@
+"""Tests for the database connection settings."""
+
+from settings.base import database
+
+
+class TestDatabaseConnectionSettings:
+    def test_connections_are_persistent_with_health_checks(self):
+        default = database.DATABASES["default"]
+
+        assert default["CONN_MAX_AGE"] == database.DB_CONN_MAX_AGE
+        assert default["CONN_HEALTH_CHECKS"] is database.DB_CONN_HEALTH_CHECKS
+
+    def test_no_connection_pool_is_configured(self):
+        # Django's pool requires psycopg 3, the project uses psycopg2
+        assert "pool" not in database.DATABASES["default"].get("OPTIONS", {})
+        assert not any(name.startswith("DB_POOL_") for name in vars(database))
@@ -1,8 +1,14 @@
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
 
-from apps.core.utils.jwt import get_mobile_token_version, revoke_user_outstanding_tokens
+from apps.core.utils.jwt import get_mobile_token_version, purge_expired_tokens, revoke_user_outstanding_tokens
+
+User = get_user_model()
 
 
 class MobileTokenVersionCacheTests(TestCase):
@@ -37,17 +43,79 @@ class MobileTokenVersionCacheTests(TestCase):
 
 
 class RevokeOutstandingTokensTests(TestCase):
-    @patch("apps.core.utils.jwt.BlacklistedToken")
-    @patch("apps.core.utils.jwt.OutstandingToken")
-    def test_revoke_user_outstanding_tokens_excludes_jti(self, mock_outstanding, mock_blacklisted):
-        user = MagicMock()
-
-        token1 = MagicMock(jti="jti-1")
-        token2 = MagicMock(jti="jti-2")
-        mock_outstanding.objects.filter.return_value = [token1, token2]
-        mock_blacklisted.objects.get_or_create = MagicMock()
+    def setUp(self):
+        self.user = User.objects.create_user(username="jwtuser", email="jwtuser@example.com", password="x")
+        self.other_user = User.objects.create_user(username="otheruser", email="otheruser@example.com", password="x")
+        now = timezone.now()
+        self.active = OutstandingToken.objects.create(
+            user=self.user, jti="jti-1", token="t1", created_at=now, expires_at=now + timedelta(days=1)
+        )
+        self.current = OutstandingToken.objects.create(
+            user=self.user, jti="jti-2", token="t2", created_at=now, expires_at=now + timedelta(days=1)
+        )
+        self.expired = OutstandingToken.objects.create(
+            user=self.user, jti="jti-3", token="t3", created_at=now, expires_at=now - timedelta(days=1)
+        )
+        self.already_blacklisted = OutstandingToken.objects.create(
+            user=self.user, jti="jti-4", token="t4", created_at=now, expires_at=now + timedelta(days=1)
+        )
+        BlacklistedToken.objects.create(token=self.already_blacklisted)
+        self.other = OutstandingToken.objects.create(
+            user=self.other_user, jti="jti-5", token="t5", created_at=now, expires_at=now + timedelta(days=1)
+        )
 
-        count = revoke_user_outstanding_tokens(user, exclude_jti="jti-2")
+    def test_revoke_user_outstanding_tokens_excludes_jti(self):
+        count = revoke_user_outstanding_tokens(self.user, exclude_jti="jti-2")
 
         self.assertEqual(count, 1)
-        mock_blacklisted.objects.get_or_create.assert_called_once_with(token=token1)
+        self.assertTrue(BlacklistedToken.objects.filter(token=self.active).exists())
+        self.assertFalse(BlacklistedToken.objects.filter(token=self.current).exists())
+
+    def test_revoke_user_outstanding_tokens_skips_expired_blacklisted_and_other_users(self):
+        count = revoke_user_outstanding_tokens(self.user)
+
+        self.assertEqual(count, 2)
+        self.assertEqual(
+            set(BlacklistedToken.objects.values_list("token__jti", flat=True)), {"jti-1", "jti-2", "jti-4"}
+        )
+
+    def test_revoke_user_outstanding_tokens_is_idempotent(self):
+        revoke_user_outstanding_tokens(self.user)
+
+        self.assertEqual(revoke_user_outstanding_tokens(self.user), 0)
+
+    def test_revoke_user_outstanding_tokens_uses_single_query(self):
+        with self.assertNumQueries(1):
+            revoke_user_outstanding_tokens(self.user)
+
+
+class PurgeExpiredTokensTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="purgeuser", email="purgeuser@example.com", password="x")
+        now = timezone.now()
+        for index in range(5):
+            token = OutstandingToken.objects.create(
+                user=self.user,
+                jti=f"expired-{index}",
+                token=f"e{index}",
+                created_at=now - timedelta(days=40),
+                expires_at=now - timedelta(days=10),
+            )
+            BlacklistedToken.objects.create(token=token)
+        self.valid = OutstandingToken.objects.create(
+            user=self.user, jti="valid", token="v", created_at=now, expires_at=now + timedelta(days=1)
+        )
+        BlacklistedToken.objects.create(token=self.valid)
+
+    def test_purge_expired_tokens_deletes_only_expired_tokens(self):
+        deleted = purge_expired_tokens(batch_size=2)
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(list(OutstandingToken.objects.values_list("jti", flat=True)), ["valid"])
+        self.assertEqual(list(BlacklistedToken.objects.values_list("token__jti", flat=True)), ["valid"])
+
+    def test_purge_expired_tokens_respects_max_batches(self):
+        deleted = purge_expired_tokens(batch_size=2, max_batches=1)
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(OutstandingToken.objects.filter(jti__startswith="expired-").count(), 3)
@@ -2,7 +2,7 @@
 
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APIClient
@@ -12,6 +12,7 @@ from apps.notifications.models import Notification
 from libs.request_utils import UNKNOWN_IP
 
 
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True)
 class LoginNotificationTestCase(TestCase):
     """Test cases for notifications created during login."""
 
@@ -36,7 +37,8 @@ class LoginNotificationTestCase(TestCase):
 
         # Act - Complete login with OTP verification
         data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(self.login_url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.login_url, data, format="json")
 
         # Assert - Check response and notification
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -56,12 +58,13 @@ class LoginNotificationTestCase(TestCase):
 
         # Act - Complete login with a specific IP address
         data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(
-            self.login_url,
-            data,
-            format="json",
-            REMOTE_ADDR="192.168.1.100",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.login_url,
+                data,
+                format="json",
+                REMOTE_ADDR="192.168.1.100",
+            )
 
         # Assert - Check notification has IP address
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -80,12 +83,13 @@ class LoginNotificationTestCase(TestCase):
 
         # Act - Complete login with X-Forwarded-For header
         data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(
-            self.login_url,
-            data,
-            format="json",
-            HTTP_X_FORWARDED_FOR="203.0.113.42, 198.51.100.1",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.login_url,
+                data,
+                format="json",
+                HTTP_X_FORWARDED_FOR="203.0.113.42, 198.51.100.1",
+            )
 
         # Assert - Check notification uses the first IP from X-Forwarded-For
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -100,7 +104,8 @@ class LoginNotificationTestCase(TestCase):
 
         # Act
         data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(self.login_url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.login_url, data, format="json")
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -116,12 +121,13 @@ class LoginNotificationTestCase(TestCase):
 
         # Act
         data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response = self.client.post(
-            self.login_url,
-            data,
-            format="json",
-            HTTP_USER_AGENT=user_agent,
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                self.login_url,
+                data,
+                format="json",
+                HTTP_USER_AGENT=user_agent,
+            )
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -135,16 +141,18 @@ class LoginNotificationTestCase(TestCase):
         """Test that multiple logins create separate notifications."""
         # Arrange & Act - First login
         data_1 = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response_1 = self.client.post(self.login_url, data_1, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response_1 = self.client.post(self.login_url, data_1, format="json")
 
         # Arrange & Act - Second login
         data_2 = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-        response_2 = self.client.post(
-            self.login_url,
-            data_2,
-            format="json",
-            REMOTE_ADDR="10.0.0.5",
-        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response_2 = self.client.post(
+                self.login_url,
+                data_2,
+                format="json",
+                REMOTE_ADDR="10.0.0.5",
+            )
 
         # Assert - Check both logins succeeded and created notifications
         self.assertEqual(response_1.status_code, status.HTTP_200_OK)
@@ -167,7 +175,8 @@ class LoginNotificationTestCase(TestCase):
         with patch("apps.core.api.views.auth.login.get_client_ip") as mock_get_ip:
             mock_get_ip.return_value = None
             data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
-            response = self.client.post(self.login_url, data, format="json")
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(self.login_url, data, format="json")
 
         # Assert - Notification is still created with "Unknown" IP
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -180,8 +189,25 @@ class LoginNotificationTestCase(TestCase):
         """Test that failed login attempts do not create notifications."""
         # Act - Try to login with invalid password
         data = {"username": "testuser", "password": "wrongpassword", "device_id": "web-device-1"}
-        response = self.client.post(self.login_url, data, format="json")
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.login_url, data, format="json")
 
         # Assert - Login failed and no notification was created
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertEqual(Notification.objects.count(), 0)
+
+    @patch("apps.core.api.views.auth.login.LoginView.throttle_classes", new=[])
+    @patch("apps.notifications.utils.trigger_send_notification")
+    def test_login_defers_side_effects_until_commit(self, mock_trigger_send_notification):
+        """Test that the notification is created by a single job queued after commit."""
+        data = {"username": "testuser", "password": "testpass123", "device_id": "web-device-1"}
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            response = self.client.post(self.login_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(Notification.objects.count(), 0)
+
+        callbacks[0]()
+
+        self.assertEqual(Notification.objects.count(), 1)
@@ -3,6 +3,7 @@ from django.utils import timezone
 
 from apps.core.api.serializers.auth.login import LoginSerializer, MobileDeviceConflict
 from apps.core.models import User, UserDevice
+from apps.core.utils.login import record_login_device
 
 
 @pytest.mark.django_db
@@ -111,6 +112,43 @@ class TestLoginSerializerMobile:
         tokens = ser.get_tokens(user, client=UserDevice.Client.MOBILE)
         assert isinstance(tokens["access"], str)
 
+    def test_get_tokens_defers_existing_device_bookkeeping(self, user):
+        UserDevice.objects.create(
+            user=user,
+            client=UserDevice.Client.MOBILE,
+            device_id="devX",
+            platform=UserDevice.Platform.ANDROID,
+            push_token="p1",
+            last_seen_at=timezone.now(),
+            state=UserDevice.State.ACTIVE,
+        )
+        ser = LoginSerializer(
+            data={
+                "username": user.username,
+                "password": "pass1234",
+                "device_id": "devX",
+                "platform": UserDevice.Platform.IOS,
+                "push_token": "p2",
+            },
+            context={"client": UserDevice.Client.MOBILE},
+        )
+        assert ser.is_valid(), ser.errors
+        ser.get_tokens(user, client=UserDevice.Client.MOBILE, defer_device_bookkeeping=True)
+        dev = UserDevice.objects.get(user=user, client=UserDevice.Client.MOBILE, device_id="devX")
+        assert dev.push_token == "p1"
+
+        record_login_device(
+            user.id,
+            client=UserDevice.Client.MOBILE,
+            device_id="devX",
+            platform=UserDevice.Platform.IOS,
+            push_token="p2",
+            seen_at=timezone.now(),
+        )
+        dev.refresh_from_db()
+        assert dev.platform == UserDevice.Platform.IOS
+        assert dev.push_token == "p2"
+
 
 @pytest.mark.django_db
 class TestLoginSerializerWeb:
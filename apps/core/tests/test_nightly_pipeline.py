@@ -0,0 +1,150 @@
+import pytest
+from celery import current_app, shared_task
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.test import override_settings
+from django.utils.module_loading import autodiscover_modules
+
+from apps.core.models import NightlyPipelineRun, NightlyPipelineStep
+from apps.core.utils.nightly_pipeline import advance_run, get_pipeline_definition, resume_run, start_run
+
+executed_steps: list[str] = []
+failing_steps: set[str] = set()
+
+
+@shared_task(name="tests.nightly_pipeline.record_step")
+def record_step(label: str) -> dict:
+    executed_steps.append(label)
+    if label in failing_steps:
+        return {"success": False, "error": f"{label} failed"}
+    return {"success": True}
+
+
+def _step(name, depends_on=(), resource="database"):
+    return {
+        "name": name,
+        "task": "tests.nightly_pipeline.record_step",
+        "depends_on": list(depends_on),
+        "resource": resource,
+        "kwargs": {"label": name},
+    }
+
+
+PIPELINE = [
+    _step("sync", resource="devices"),
+    _step("contracts", depends_on=["sync"]),
+    _step("reports", depends_on=["contracts"]),
+    _step("tokens"),
+    _step("backup", depends_on=["reports", "tokens"], resource="backup"),
+]
+
+
+@pytest.fixture(autouse=True)
+def reset_steps():
+    executed_steps.clear()
+    failing_steps.clear()
+    yield
+    executed_steps.clear()
+    failing_steps.clear()
+
+
+def _statuses(run):
+    return dict(run.steps.values_list("name", "status"))
+
+
+class TestPipelineDefinition:
+    def test_configured_tasks_are_registered(self):
+        definition = get_pipeline_definition()
+        scheduled = [config["task"] for config in settings.CELERY_BEAT_SCHEDULE.values()]
+        # Registers the shared tasks of every app, like the worker's autodiscovery
+        autodiscover_modules("tasks")
+
+        missing = [
+            task for task in [step.task for step in definition.values()] + scheduled if task not in current_app.tasks
+        ]
+
+        assert missing == []
+
+    @override_settings(NIGHTLY_PIPELINE=[_step("a", depends_on=["b"]), _step("b", depends_on=["a"])])
+    def test_cycle_is_rejected(self):
+        with pytest.raises(ImproperlyConfigured):
+            get_pipeline_definition()
+
+    @override_settings(NIGHTLY_PIPELINE=[_step("a", depends_on=["missing"])])
+    def test_unknown_dependency_is_rejected(self):
+        with pytest.raises(ImproperlyConfigured):
+            get_pipeline_definition()
+
+
+@pytest.mark.django_db
+class TestPipelineRun:
+    @pytest.fixture(autouse=True)
+    def pipeline_settings(self, settings):
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+        settings.NIGHTLY_PIPELINE = PIPELINE
+        settings.NIGHTLY_PIPELINE_RESOURCE_LIMITS = {"database": 1}
+
+    def test_steps_run_in_dependency_order(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            run, created = start_run()
+
+        run.refresh_from_db()
+        assert created
+        assert run.status == NightlyPipelineRun.Status.SUCCEEDED
+        assert set(_statuses(run).values()) == {NightlyPipelineStep.Status.SUCCEEDED}
+        assert executed_steps.index("sync") < executed_steps.index("contracts") < executed_steps.index("reports")
+        assert executed_steps[-1] == "backup"
+        step = run.steps.get(name="backup")
+        assert step.attempts == 1
+        assert step.duration_ms is not None
+
+    def test_second_start_does_not_rerun(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            start_run()
+            _run, created = start_run()
+
+        assert not created
+        assert len(executed_steps) == len(PIPELINE)
+
+    def test_failure_skips_dependents_and_resume_reruns_them(self, django_capture_on_commit_callbacks):
+        failing_steps.add("contracts")
+        with django_capture_on_commit_callbacks(execute=True):
+            run, _created = start_run()
+
+        run.refresh_from_db()
+        statuses = _statuses(run)
+        assert run.status == NightlyPipelineRun.Status.FAILED
+        assert statuses["contracts"] == NightlyPipelineStep.Status.FAILED
+        assert statuses["reports"] == NightlyPipelineStep.Status.SKIPPED
+        assert statuses["backup"] == NightlyPipelineStep.Status.SKIPPED
+        assert statuses["tokens"] == NightlyPipelineStep.Status.SUCCEEDED
+
+        failing_steps.clear()
+        executed_steps.clear()
+        with django_capture_on_commit_callbacks(execute=True):
+            reset = resume_run(run)
+
+        run.refresh_from_db()
+        assert set(reset) == {"contracts", "reports", "backup"}
+        assert executed_steps == ["contracts", "reports", "backup"]
+        assert run.status == NightlyPipelineRun.Status.SUCCEEDED
+        assert run.steps.get(name="contracts").attempts == 2
+        assert run.steps.get(name="sync").attempts == 1
+
+    def test_resource_limit_caps_dispatch(self):
+        run = NightlyPipelineRun.objects.create(run_date="2026-01-01")
+        for config in PIPELINE:
+            status = (
+                NightlyPipelineStep.Status.SUCCEEDED
+                if config["name"] == "sync"
+                else NightlyPipelineStep.Status.PENDING
+            )
+            NightlyPipelineStep.objects.create(
+                run=run, name=config["name"], resource=config["resource"], status=status
+            )
+
+        dispatched = advance_run(run.id)
+
+        # "contracts" and "tokens" are both ready but share the single database slot
+        assert dispatched == ["contracts"]
+        assert _statuses(run)["tokens"] == NightlyPipelineStep.Status.PENDING
@@ -0,0 +1,187 @@
+"""Tests for the per-request query profiling middleware, report and test helpers."""
+
+import json
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import JsonResponse
+from django.test import override_settings
+from django.urls import reverse
+
+from apps.core.models import AdministrativeUnit, Nationality, Province
+from libs.query_profiling import (
+    assert_queries_do_not_grow,
+    assert_query_budget,
+    fingerprint_sql,
+    install_serializer_timing,
+    profiling,
+    read_report,
+)
+
+
+class NPlusOneClient:
+    """Client stub answering a page of `page_size` provinces with one query per row."""
+
+    def get(self, url, data=None, **extra):
+        pks = Province.objects.values_list("pk", flat=True)[: int(data["page_size"])]
+        provinces = [Province.objects.get(pk=pk) for pk in pks]
+        return JsonResponse({"success": True, "data": {"results": [p.code for p in provinces]}})
+
+
+@pytest.fixture
+def nationalities(db):
+    return Nationality.objects.bulk_create([Nationality(name=f"Nationality {index}") for index in range(12)])
+
+
+@pytest.fixture
+def admin_units(province):
+    return AdministrativeUnit.objects.bulk_create(
+        [
+            AdministrativeUnit(
+                code=f"U{index:02d}",
+                name=f"Unit {index}",
+                parent_province=province,
+                level=AdministrativeUnit.UnitLevel.DISTRICT,
+            )
+            for index in range(12)
+        ]
+    )
+
+
+class TestFingerprint:
+    def test_values_are_normalized(self):
+        assert fingerprint_sql("SELECT * FROM t WHERE id = 5 AND name = 'a''b'  LIMIT 21") == (
+            "SELECT * FROM t WHERE id = ? AND name = ? LIMIT ?"
+        )
+
+    def test_in_lists_collapse(self):
+        assert fingerprint_sql('SELECT "t"."id" FROM "t" WHERE "t"."id" IN (%s, %s, %s)') == fingerprint_sql(
+            'SELECT "t"."id" FROM "t" WHERE "t"."id" IN (%s)'
+        )
+
+
+@pytest.mark.django_db
+class TestProfiling:
+    def test_counts_queries_duplicates_and_cache_lookups(self, nationalities):
+        cache.set("query-profiling-hit", 1)
+
+        with profiling() as profile:
+            for nationality in nationalities[:3]:
+                Nationality.objects.get(pk=nationality.pk)
+            Province.objects.count()
+            cache.get("query-profiling-hit")
+            cache.get("query-profiling-miss")
+            cache.get_many(["query-profiling-hit", "query-profiling-miss"])
+
+        assert profile.query_count == 4
+        assert profile.duplicate_count == 2
+        ((sql, count),) = profile.duplicates.items()
+        assert count == 3 and "core_nationality" in sql
+        assert (profile.cache_hits, profile.cache_misses) == (2, 2)
+        assert profile.db_time > 0
+        assert cache.get("query-profiling-miss", "default") == "default"
+
+    def test_nested_profiling(self, nationalities):
+        with profiling() as outer:
+            cache.get("query-profiling-miss")
+            with profiling() as inner:
+                Province.objects.count()
+                cache.get_many(["query-profiling-miss"])
+            cache.get("query-profiling-miss")
+
+        assert (inner.query_count, inner.cache_misses) == (1, 1)
+        assert (outer.query_count, outer.cache_misses) == (1, 3)
+        assert cache.get("query-profiling-miss", "default") == "default"
+
+    def test_serializer_time_is_recorded(self, api_client, nationalities):
+        install_serializer_timing()
+
+        with profiling() as profile:
+            api_client.get(reverse("core:nationality-list"))
+
+        assert profile.serializer_time > 0
+
+
+@pytest.mark.django_db
+class TestQueryProfilingMiddleware:
+    def test_disabled_by_default(self, api_client, nationalities):
+        response = api_client.get(reverse("core:nationality-list"))
+
+        assert "X-Query-Count" not in response
+
+    def test_headers_and_report(self, api_client, nationalities, tmp_path):
+        report_path = tmp_path / "profile.jsonl"
+
+        with override_settings(QUERY_PROFILING_ENABLED=True, QUERY_PROFILING_REPORT_PATH=str(report_path)):
+            response = api_client.get(reverse("core:nationality-list"))
+            api_client.get(reverse("core:nationality-list"), {"page_size": 5})
+
+        assert response.status_code == 200
+        assert response.json()["success"] is True
+        assert int(response["X-Query-Count"]) >= 1
+        assert response["X-Query-Duplicates"] == "0"
+        assert "db;dur=" in response["Server-Timing"]
+        entries = read_report(str(report_path))
+        assert [entry["route"] for entry in entries] == ["GET core:nationality-list"] * 2
+        assert entries[0]["status"] == 200
+
+    def test_report_command_aggregates_by_route(self, tmp_path):
+        report_path = tmp_path / "profile.jsonl"
+        entry = {
+            "route": "GET hrm:employee-list",
+            "status": 200,
+            "queries": 30,
+            "duplicates": 25,
+            "duplicate_fingerprints": [{"sql": "SELECT ? FROM x", "count": 26, "hash": "abc"}],
+            "db_ms": 12.5,
+            "serializer_ms": 3.0,
+            "total_ms": 40.0,
+            "cache_hits": 1,
+            "cache_misses": 1,
+        }
+        report_path.write_text(json.dumps(entry) + "\n" + json.dumps({**entry, "route": "GET core:me"}) + "\n")
+
+        call_command("query_profile_report", path=str(report_path), duplicates=True, reset=True)
+
+        assert not report_path.exists()
+
+
+@pytest.mark.django_db
+class TestQueryBudgetHelpers:
+    def test_endpoint_within_budget(self, api_client, nationalities):
+        response = assert_query_budget(api_client, reverse("core:nationality-list"), max_queries=5)
+
+        assert response.status_code == 200
+
+    def test_budget_with_profiling_middleware_enabled(self, api_client, nationalities):
+        with override_settings(QUERY_PROFILING_ENABLED=True):
+            response = assert_query_budget(api_client, reverse("core:nationality-list"), max_queries=5)
+
+        # The middleware profiles the request inside the helper's profiling() block
+        assert int(response["X-Query-Count"]) >= 1
+
+    def test_endpoint_over_budget_fails(self, api_client, nationalities):
+        with pytest.raises(AssertionError, match="exceeded its query budget of 0"):
+            assert_query_budget(api_client, reverse("core:nationality-list"), max_queries=0)
+
+    def test_list_endpoint_queries_do_not_grow(self, api_client, admin_units):
+        counts = assert_queries_do_not_grow(api_client, reverse("core:administrative-unit-list"), page_sizes=(1, 10))
+
+        assert counts[1] == counts[10]
+
+    def test_n_plus_one_is_reported(self, nationalities):
+        Province.objects.bulk_create(
+            [
+                Province(code=f"9{index}", name=f"Province {index}", level=Province.ProvinceLevel.PROVINCE)
+                for index in range(4)
+            ]
+        )
+
+        with pytest.raises(AssertionError, match=r"page_size=3 \(4\).*\n  3x SELECT"):
+            assert_queries_do_not_grow(NPlusOneClient(), "/provinces/", page_sizes=(1, 3))
+
+    def test_growth_check_needs_more_rows_than_smallest_page(self, api_client, nationalities):
+        # Nationalities are not paginated: every page size returns all of them
+        with pytest.raises(AssertionError, match="create more rows"):
+            assert_queries_do_not_grow(api_client, reverse("core:nationality-list"))
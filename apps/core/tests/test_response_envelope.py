@@ -0,0 +1,115 @@
+"""Tests for the API response envelope rendered by EnvelopeJSONRenderer and ApiResponseWrapperMiddleware."""
+
+import json
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.test import RequestFactory
+from django.urls import reverse
+from django.utils.translation import gettext_lazy as _
+from rest_framework.response import Response
+
+from apps.core.middlewares import ApiResponseWrapperMiddleware
+from apps.core.models import Nationality
+from libs.renderers import EnvelopeJSONRenderer, build_envelope
+
+
+def previous_envelope(data, is_error=False):
+    """Body previously produced by the middleware re-encoding the response data."""
+    return json.loads(json.dumps(build_envelope(data, is_error), cls=DjangoJSONEncoder))
+
+
+def render(data, status_code=200, exception=False):
+    response = Response(data, status=status_code)
+    response.exception = exception
+    return EnvelopeJSONRenderer().render(data, renderer_context={"response": response})
+
+
+def wrap(response):
+    middleware = ApiResponseWrapperMiddleware(lambda request: response)
+    return middleware(RequestFactory().get("/api/test/"))
+
+
+class TestEnvelopeJSONRenderer:
+    def test_body_matches_previous_encoding(self):
+        data = {
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "amount": Decimal("1234.50"),
+            "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc),
+            "date": date(2025, 1, 2),
+            "time": time(8, 30),
+            "duration": timedelta(hours=1, minutes=30),
+            "label": _("Active"),
+            "name": "Zürich",
+            "counts": {1: 2},
+            "rows": [{"values": (1, 2.5, None, True)}],
+        }
+
+        assert json.loads(render(data)) == previous_envelope(data)
+
+    @pytest.mark.parametrize("data", [None, {}, []])
+    def test_empty_data_is_null(self, data):
+        assert json.loads(render(data)) == {"success": True, "data": None, "error": None}
+
+    def test_error_response(self):
+        data = {"detail": "Not found."}
+
+        assert json.loads(render(data, status_code=404)) == previous_envelope(data, is_error=True)
+
+    def test_exception_with_success_status_is_an_error(self):
+        assert json.loads(render({"detail": "x"}, exception=True))["success"] is False
+
+
+class TestApiResponseWrapperMiddleware:
+    def test_json_response_body_is_embedded(self):
+        data = {"results": [{"id": index, "name": f"Row {index}"} for index in range(50)]}
+
+        response = wrap(JsonResponse(data, status=201))
+
+        assert response.status_code == 201
+        assert response["Content-Type"] == "application/json"
+        assert json.loads(response.content) == previous_envelope(data)
+
+    def test_json_response_error(self):
+        data = {"detail": "Validation failed for the submitted rows"}
+
+        response = wrap(JsonResponse(data, status=400))
+
+        assert json.loads(response.content) == previous_envelope(data, is_error=True)
+
+    @pytest.mark.parametrize("data", [{}, [], 0, ""])
+    def test_empty_json_response_is_null(self, data):
+        response = wrap(JsonResponse(data, safe=False))
+
+        assert json.loads(response.content) == {"success": True, "data": None, "error": None}
+
+    def test_response_rendered_as_envelope_is_not_wrapped_again(self):
+        response = Response({"id": 1})
+        response.accepted_renderer = EnvelopeJSONRenderer()
+
+        assert wrap(response) is response
+
+
+@pytest.mark.django_db
+class TestApiEnvelope:
+    def test_api_response_is_rendered_once(self, api_client):
+        Nationality.objects.create(name="Vietnamese")
+
+        response = api_client.get(reverse("core:nationality-list"))
+
+        assert isinstance(response, Response)
+        assert json.loads(response.content) == previous_envelope(response.data)
+        assert response.json()["data"][0]["name"] == "Vietnamese"
+
+    def test_api_error_response(self, api_client):
+        response = api_client.get(reverse("core:nationality-detail", kwargs={"pk": 0}))
+
+        assert response.status_code == 404
+        body = response.json()
+        assert body["success"] is False
+        assert body["data"] is None
+        assert body["error"] == previous_envelope(response.data, is_error=True)["error"]
@@ -2,6 +2,8 @@ from typing import Optional
 
 from django.apps import apps
 from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
 
 try:
     from rest_framework_simplejwt.token_blacklist.models import (
@@ -15,6 +17,7 @@ except Exception:  # token_blacklist app might not be installed in some environm
 
 MOBILE_TOKEN_VERSION_CACHE_KEY = "mvl:mobile_token_version:{user_id}"  # nosec: B105
 MOBILE_TOKEN_VERSION_CACHE_TTL_SECONDS = 300
+TOKEN_PURGE_BATCH_SIZE = 5000
 
 
 def get_mobile_token_version(user_id: str) -> int:
@@ -45,6 +48,9 @@ def revoke_user_outstanding_tokens(user, exclude_jti: Optional[str] = None) -> i
     """
     Blacklist all existing outstanding refresh tokens for a user.
 
+    - Runs as a single INSERT ... SELECT that only picks tokens which are not
+      blacklisted yet and not expired, so the cost does not grow with the
+      number of tokens the user has accumulated.
     - If exclude_jti is provided, skip that token (e.g., the one just issued).
     - Returns number of tokens blacklisted.
     """
@@ -54,10 +60,67 @@ def revoke_user_outstanding_tokens(user, exclude_jti: Optional[str] = None) -> i
     if not user:
         return 0
 
-    count = 0
-    for token in OutstandingToken.objects.filter(user=user):
-        if exclude_jti and token.jti == exclude_jti:
-            continue
-        BlacklistedToken.objects.get_or_create(token=token)
-        count += 1
-    return count
+    outstanding_table = OutstandingToken._meta.db_table
+    blacklisted_table = BlacklistedToken._meta.db_table
+    token_column = BlacklistedToken._meta.get_field("token").column
+    user_column = OutstandingToken._meta.get_field("user").column
+
+    now = timezone.now()
+    params: list = [now, user.pk, now]
+    exclude_clause = ""
+    if exclude_jti:
+        exclude_clause = "AND o.jti <> %s"
+        params.append(exclude_jti)
+
+    sql = f"""
+        INSERT INTO {blacklisted_table} ({token_column}, blacklisted_at)
+        SELECT o.id, %s
+        FROM {outstanding_table} o
+        WHERE o.{user_column} = %s
+          AND o.expires_at > %s
+          {exclude_clause}
+          AND NOT EXISTS (SELECT 1 FROM {blacklisted_table} b WHERE b.{token_column} = o.id)
+        ON CONFLICT ({token_column}) DO NOTHING
+    """  # nosec B608
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return max(cursor.rowcount, 0)
+
+
+def purge_expired_tokens(batch_size: int = TOKEN_PURGE_BATCH_SIZE, max_batches: Optional[int] = None) -> int:
+    """
+    Delete expired outstanding refresh tokens and their blacklist entries in chunks.
+
+    Expired tokens can no longer be used, so neither the outstanding row nor its
+    blacklist entry is needed. Deleting in chunks keeps each transaction short.
+
+    - batch_size: number of outstanding tokens deleted per chunk.
+    - max_batches: stop after this many chunks (None means until nothing is left).
+    - Returns number of outstanding tokens deleted.
+    """
+    if OutstandingToken is None or BlacklistedToken is None:
+        return 0
+
+    now = timezone.now()
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        token_ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by("id")
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if not token_ids:
+            break
+
+        with transaction.atomic():
+            BlacklistedToken.objects.filter(token_id__in=token_ids).delete()
+            OutstandingToken.objects.filter(id__in=token_ids).delete()
+
+        total += len(token_ids)
+        batches += 1
+        if len(token_ids) < batch_size:
+            break
+
+    return total
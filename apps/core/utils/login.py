@@ -0,0 +1,41 @@
+from datetime import datetime
+from typing import Optional
+
+from apps.core.models import UserDevice
+
+
+def record_login_device(
+    user_id,
+    *,
+    client: str,
+    device_id: str,
+    platform: str = "",
+    push_token: str = "",
+    seen_at: Optional[datetime] = None,
+) -> None:
+    """
+    Update the device bookkeeping of a successful login.
+
+    - Mobile: refresh platform, push token and last seen time of the active device
+      the user logged in with (the device itself is bound on the request path).
+    - Web: upsert the web device and mark it active.
+    """
+    if client == UserDevice.Client.MOBILE:
+        UserDevice.objects.filter(
+            user_id=user_id,
+            client=UserDevice.Client.MOBILE,
+            state=UserDevice.State.ACTIVE,
+            device_id=device_id,
+        ).update(platform=platform, push_token=push_token or device_id, last_seen_at=seen_at)
+
+    if client == UserDevice.Client.WEB:
+        UserDevice.objects.update_or_create(
+            user_id=user_id,
+            client=UserDevice.Client.WEB,
+            device_id=device_id,
+            defaults={
+                "last_seen_at": seen_at,
+                "state": UserDevice.State.ACTIVE,
+                "platform": UserDevice.Platform.WEB,
+            },
+        )
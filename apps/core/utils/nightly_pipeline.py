@@ -0,0 +1,270 @@
+"""Dependency-aware nightly job pipeline.
+
+The nightly maintenance jobs are declared in `settings.NIGHTLY_PIPELINE` as steps
+with explicit dependencies and the resource they load (e.g. `devices`,
+`database`, `backup`). A run is started once per day by the beat schedule:
+
+- a step is dispatched only after all of its dependencies succeeded;
+- `settings.NIGHTLY_PIPELINE_RESOURCE_LIMITS` caps how many steps of the same
+  resource run at the same time (1 when not configured);
+- a step whose dependency failed or was skipped is skipped;
+- every step records its status, attempts, start/finish time and duration, so a
+  run can be resumed: failed and skipped steps are reset and the run continues
+  without repeating the steps that already succeeded.
+
+Each step runs its Celery task synchronously inside `run_nightly_pipeline_step`
+and then calls `advance_run`, which dispatches whatever became ready.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Dict, List, Optional, Tuple
+
+from celery import current_app
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
+from django.utils import timezone
+
+from apps.core.models import NightlyPipelineRun, NightlyPipelineStep
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RESOURCE = "database"
+
+
+@dataclass(frozen=True)
+class PipelineStepDefinition:
+    """Declarative definition of one nightly pipeline step."""
+
+    name: str
+    task: str
+    depends_on: Tuple[str, ...] = ()
+    resource: str = DEFAULT_RESOURCE
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+def get_pipeline_definition() -> Dict[str, PipelineStepDefinition]:
+    """Return the configured steps keyed by name, in declaration order.
+
+    Raises:
+        ImproperlyConfigured: If a step is duplicated, depends on an unknown step
+            or the dependencies contain a cycle
+    """
+    steps: Dict[str, PipelineStepDefinition] = {}
+    for config in getattr(settings, "NIGHTLY_PIPELINE", []):
+        step = PipelineStepDefinition(
+            name=config["name"],
+            task=config["task"],
+            depends_on=tuple(config.get("depends_on", ())),
+            resource=config.get("resource", DEFAULT_RESOURCE),
+            kwargs=dict(config.get("kwargs", {})),
+        )
+        if step.name in steps:
+            raise ImproperlyConfigured(f"Nightly pipeline step '{step.name}' is declared twice")
+        steps[step.name] = step
+
+    for step in steps.values():
+        unknown = [name for name in step.depends_on if name not in steps]
+        if unknown:
+            raise ImproperlyConfigured(
+                f"Nightly pipeline step '{step.name}' depends on unknown step(s): {', '.join(unknown)}"
+            )
+
+    _check_acyclic(steps)
+    return steps
+
+
+def _check_acyclic(steps: Dict[str, PipelineStepDefinition]) -> None:
+    resolved: set[str] = set()
+    remaining = dict(steps)
+    while remaining:
+        ready = [name for name, step in remaining.items() if resolved.issuperset(step.depends_on)]
+        if not ready:
+            raise ImproperlyConfigured(
+                f"Nightly pipeline has a dependency cycle between: {', '.join(sorted(remaining))}"
+            )
+        for name in ready:
+            resolved.add(name)
+            del remaining[name]
+
+
+def get_resource_limit(resource: str) -> int:
+    """Return how many steps of a resource may run at the same time."""
+    return max(1, getattr(settings, "NIGHTLY_PIPELINE_RESOURCE_LIMITS", {}).get(resource, 1))
+
+
+def start_run(run_date: Optional[date] = None) -> Tuple[NightlyPipelineRun, bool]:
+    """Create the run of `run_date` (today by default) and dispatch its first steps.
+
+    A run that already exists for the date is left alone; use `resume_run` to
+    continue it.
+
+    Returns:
+        Tuple of the run and whether it was created
+    """
+    run_date = run_date or timezone.localdate()
+    definition = get_pipeline_definition()
+
+    with transaction.atomic():
+        run, created = NightlyPipelineRun.objects.get_or_create(
+            run_date=run_date, defaults={"started_at": timezone.now()}
+        )
+        if not created:
+            return run, False
+        NightlyPipelineStep.objects.bulk_create(
+            [NightlyPipelineStep(run=run, name=step.name, resource=step.resource) for step in definition.values()]
+        )
+
+    advance_run(run.id)
+    return run, True
+
+
+def resume_run(run: NightlyPipelineRun, include_running: bool = False) -> List[str]:
+    """Rerun the failed and skipped steps of a run; succeeded steps are kept.
+
+    Args:
+        run: The run to resume
+        include_running: Also reset steps left RUNNING, e.g. after a worker crash
+
+    Returns:
+        Names of the steps that were reset
+    """
+    definition = get_pipeline_definition()
+    statuses = [NightlyPipelineStep.Status.FAILED, NightlyPipelineStep.Status.SKIPPED]
+    if include_running:
+        statuses.append(NightlyPipelineStep.Status.RUNNING)
+
+    with transaction.atomic():
+        run = NightlyPipelineRun.objects.select_for_update().get(pk=run.pk)
+        existing = set(run.steps.values_list("name", flat=True))
+        # Steps added to the pipeline after the run started are run as well
+        NightlyPipelineStep.objects.bulk_create(
+            [
+                NightlyPipelineStep(run=run, name=step.name, resource=step.resource)
+                for step in definition.values()
+                if step.name not in existing
+            ]
+        )
+        reset = list(run.steps.filter(status__in=statuses).values_list("name", flat=True))
+        run.steps.filter(status__in=statuses).update(status=NightlyPipelineStep.Status.PENDING, error="")
+        run.status = NightlyPipelineRun.Status.RUNNING
+        run.finished_at = None
+        run.save(update_fields=["status", "finished_at", "updated_at"])
+
+    advance_run(run.id)
+    return reset
+
+
+def advance_run(run_id: int) -> List[str]:
+    """Skip blocked steps, dispatch ready ones and close the run when nothing is left.
+
+    Returns:
+        Names of the steps dispatched
+    """
+    # Imported here to avoid a circular import (the task module uses this one)
+    from apps.core.tasks.nightly import run_nightly_pipeline_step
+
+    definition = get_pipeline_definition()
+    Status = NightlyPipelineStep.Status
+
+    with transaction.atomic():
+        run = NightlyPipelineRun.objects.select_for_update().get(pk=run_id)
+        steps = {step.name: step for step in run.steps.all()}
+
+        # Steps removed from the configuration are not waited for
+        active = {name: step for name, step in steps.items() if name in definition}
+
+        _skip_blocked_steps(active, definition)
+
+        running = Counter(step.resource for step in active.values() if step.status == Status.RUNNING)
+        dispatched = []
+        for name, step_definition in definition.items():
+            step = active.get(name)
+            if step is None or step.status != Status.PENDING:
+                continue
+            dependencies = [active.get(dependency) for dependency in step_definition.depends_on]
+            if any(dependency is None or dependency.status != Status.SUCCEEDED for dependency in dependencies):
+                continue
+            if running[step.resource] >= get_resource_limit(step.resource):
+                continue
+            running[step.resource] += 1
+            step.status = Status.RUNNING
+            step.save(update_fields=["status", "updated_at"])
+            dispatched.append(name)
+
+        if not any(step.status in (Status.PENDING, Status.RUNNING) for step in active.values()):
+            all_succeeded = all(step.status == Status.SUCCEEDED for step in active.values())
+            run.status = NightlyPipelineRun.Status.SUCCEEDED if all_succeeded else NightlyPipelineRun.Status.FAILED
+            run.finished_at = timezone.now()
+            run.save(update_fields=["status", "finished_at", "updated_at"])
+            logger.info("Nightly pipeline %s finished with status %s", run.run_date, run.status)
+
+        for name in dispatched:
+            transaction.on_commit(lambda name=name: run_nightly_pipeline_step.delay(run_id, name))
+
+    return dispatched
+
+
+def _skip_blocked_steps(steps: Dict[str, NightlyPipelineStep], definition: Dict[str, PipelineStepDefinition]) -> None:
+    blocked_statuses = (NightlyPipelineStep.Status.FAILED, NightlyPipelineStep.Status.SKIPPED)
+    for name in definition:
+        step = steps.get(name)
+        if step is None or step.status != NightlyPipelineStep.Status.PENDING:
+            continue
+        if _has_blocked_dependency(name, steps, definition, blocked_statuses):
+            step.status = NightlyPipelineStep.Status.SKIPPED
+            step.error = "Skipped because a dependency did not succeed"
+            step.save(update_fields=["status", "error", "updated_at"])
+
+
+def _has_blocked_dependency(name, steps, definition, blocked_statuses) -> bool:
+    # Walk the dependencies transitively so a failure skips the whole subtree in one pass
+    pending = list(definition[name].depends_on)
+    seen = set()
+    while pending:
+        dependency = pending.pop()
+        if dependency in seen:
+            continue
+        seen.add(dependency)
+        dependency_step = steps.get(dependency)
+        if dependency_step is not None and dependency_step.status in blocked_statuses:
+            return True
+        pending.extend(definition[dependency].depends_on)
+    return False
+
+
+def execute_step(run_id: int, name: str) -> NightlyPipelineStep:
+    """Run the task of one step synchronously and record its outcome.
+
+    A task returning a dict with `success: False` (the convention of the
+    maintenance tasks) counts as a failure.
+    """
+    step_definition = get_pipeline_definition()[name]
+    step = NightlyPipelineStep.objects.get(run_id=run_id, name=name)
+    step.status = NightlyPipelineStep.Status.RUNNING
+    step.attempts += 1
+    step.started_at = timezone.now()
+    step.finished_at = None
+    step.duration_ms = None
+    step.error = ""
+    step.save()
+
+    logger.info("Nightly pipeline step %s started", name)
+    try:
+        result = current_app.tasks[step_definition.task](**step_definition.kwargs)
+        if isinstance(result, dict) and result.get("success") is False:
+            raise RuntimeError(result.get("error") or "Task reported a failure")
+        step.status = NightlyPipelineStep.Status.SUCCEEDED
+    except Exception as e:
+        logger.exception("Nightly pipeline step %s failed: %s", name, e)
+        step.status = NightlyPipelineStep.Status.FAILED
+        step.error = str(e)
+
+    step.finished_at = timezone.now()
+    step.duration_ms = int((step.finished_at - step.started_at).total_seconds() * 1000)
+    step.save()
+    logger.info("Nightly pipeline step %s %s in %s ms", name, step.status, step.duration_ms)
+    return step
@@ -5,6 +5,7 @@ import json
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
 from django.core.cache import cache
+from django.db import transaction
 from django.utils.translation import gettext as _
 from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework import status
@@ -281,7 +282,12 @@ class ConfirmMultipleFilesView(PermissionedAPIView):
         return self.confirm_multiple_files(request)
 
     def confirm_multiple_files(self, request):  # noqa: C901
-        """Confirm multiple file uploads and create FileModel records."""
+        """Confirm multiple file uploads and create FileModel records.
+
+        The S3 checks and moves of all files run concurrently on a bounded pool,
+        related models and objects are looked up once, and the FileModel records
+        are created with one insert.
+        """
         serializer = ConfirmMultipleFilesSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -290,134 +296,156 @@ class ConfirmMultipleFilesView(PermissionedAPIView):
         # Initialize S3 service
         s3_service = S3FileUploadService()
 
-        # Collect file metadata for all tokens
-        files_to_confirm = []
-        for file_config in files_config:
-            file_token = file_config["file_token"]
-            purpose = file_config["purpose"]
-            related_model = file_config.get("related_model")
-            related_object_id = file_config.get("related_object_id")
-            related_field = file_config.get("related_field")
-
-            cache_key = f"{CACHE_KEY_PREFIX}{file_token}"
-            cached_data = cache.get(cache_key)
-
-            if not cached_data:
+        # Load the upload metadata of all tokens at once
+        cache_keys = [f"{CACHE_KEY_PREFIX}{file_config['file_token']}" for file_config in files_config]
+        cached_entries = cache.get_many(cache_keys)
+        for file_config, cache_key in zip(files_config, cache_keys, strict=True):
+            if not cached_entries.get(cache_key):
                 return Response(
-                    {"detail": _(ERROR_INVALID_FILE_TOKEN) + f": {file_token}"},
+                    {"detail": _(ERROR_INVALID_FILE_TOKEN) + f": {file_config['file_token']}"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
+        cached_metadata = [json.loads(cached_entries[cache_key]) for cache_key in cache_keys]
+        temp_file_paths = [file_metadata["file_path"] for file_metadata in cached_metadata]
 
-            file_metadata = json.loads(cached_data)
-            temp_file_path = file_metadata["file_path"]
-            file_name = file_metadata["file_name"]
-            file_type = file_metadata["file_type"]
-            cached_purpose = file_metadata["purpose"]
-
-            # Check if file already exists in database (already confirmed)
-            if FileModel.objects.filter(file_path=temp_file_path, is_confirmed=True).exists():
+        # Check if files already exist in database (already confirmed)
+        confirmed_paths = set(
+            FileModel.objects.filter(file_path__in=temp_file_paths, is_confirmed=True).values_list(
+                "file_path", flat=True
+            )
+        )
+        for file_config, temp_file_path in zip(files_config, temp_file_paths, strict=True):
+            if temp_file_path in confirmed_paths:
                 return Response(
-                    {"detail": _(ERROR_FILE_ALREADY_CONFIRMED) + f": {file_token}"},
+                    {"detail": _(ERROR_FILE_ALREADY_CONFIRMED) + f": {file_config['file_token']}"},
                     status=status.HTTP_409_CONFLICT,
                 )
 
-            # Verify file exists in S3
-            if not s3_service.check_file_exists(temp_file_path):
+        # One HEAD per file verifies it exists in S3 and returns its actual content type
+        temp_files_metadata = s3_service.get_files_metadata(temp_file_paths)
+
+        # Get model classes and content types once per related model
+        model_classes = {}
+        content_types = {}
+        for related_model in {file_config.get("related_model") for file_config in files_config} - {None, ""}:
+            model_classes[related_model] = apps.get_model(related_model)
+            content_types[related_model] = ContentType.objects.get_for_model(model_classes[related_model])
+
+        files_to_confirm = []
+        for index, file_config in enumerate(files_config):
+            file_token = file_config["file_token"]
+            purpose = file_config["purpose"]
+            related_model = file_config.get("related_model")
+            file_metadata = cached_metadata[index]
+            temp_file_path = file_metadata["file_path"]
+            cache_key = cache_keys[index]
+
+            temp_file_metadata = temp_files_metadata[index]
+            if temp_file_metadata is None:
                 return Response(
                     {"detail": _(ERROR_FILE_NOT_FOUND_S3) + f": {file_token}"},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Get file metadata to verify actual content type
-            temp_file_metadata = s3_service.get_file_metadata(temp_file_path)
-            if temp_file_metadata:
-                actual_content_type = temp_file_metadata.get("content_type")
-                expected_content_type = file_type
-
-                # Verify content type matches what was declared during presign
-                # Use the purpose from the request (can be different from cached)
-                check_purpose = purpose if purpose else cached_purpose
-                if check_purpose in ALLOWED_FILE_TYPES:
-                    allowed_types = ALLOWED_FILE_TYPES[check_purpose]
-                    if actual_content_type != expected_content_type or actual_content_type not in allowed_types:
-                        # Delete the uploaded file as it doesn't match expected type
-                        s3_service.delete_file(temp_file_path)
-                        cache.delete(cache_key)
-                        return Response(
-                            {
-                                "detail": _(ERROR_CONTENT_TYPE_MISMATCH) + f": {file_token}",
-                                "expected": expected_content_type,
-                                "actual": actual_content_type,
-                            },
-                            status=status.HTTP_400_BAD_REQUEST,
-                        )
-
-            # Get model class and content type (if related model is provided)
-            model_class = None
-            content_type = None
-            if related_model:
-                model_class = apps.get_model(related_model)
-                content_type = ContentType.objects.get_for_model(model_class)
+            # Verify content type matches what was declared during presign
+            # Use the purpose from the request (can be different from cached)
+            actual_content_type = temp_file_metadata.get("content_type")
+            expected_content_type = file_metadata["file_type"]
+            check_purpose = purpose if purpose else file_metadata["purpose"]
+            if check_purpose in ALLOWED_FILE_TYPES:
+                allowed_types = ALLOWED_FILE_TYPES[check_purpose]
+                if actual_content_type != expected_content_type or actual_content_type not in allowed_types:
+                    # Delete the uploaded file as it doesn't match expected type
+                    s3_service.delete_file(temp_file_path)
+                    cache.delete(cache_key)
+                    return Response(
+                        {
+                            "detail": _(ERROR_CONTENT_TYPE_MISMATCH) + f": {file_token}",
+                            "expected": expected_content_type,
+                            "actual": actual_content_type,
+                        },
+                        status=status.HTTP_400_BAD_REQUEST,
+                    )
 
             files_to_confirm.append(
                 {
-                    "file_token": file_token,
                     "cache_key": cache_key,
                     "temp_file_path": temp_file_path,
-                    "file_name": file_name,
-                    "purpose": purpose if purpose else cached_purpose,
-                    "temp_metadata": temp_file_metadata,
-                    "model_class": model_class,
-                    "content_type": content_type,
-                    "object_id": related_object_id,
-                    "related_field": related_field,
+                    "file_name": file_metadata["file_name"],
+                    "purpose": check_purpose,
+                    "related_model": related_model,
+                    "content_type": content_types.get(related_model),
+                    "object_id": file_config.get("related_object_id"),
+                    "related_field": file_config.get("related_field"),
                 }
             )
 
-        # Process all files in a transaction
-        from django.db import transaction
+        # Generate permanent paths (with or without related object)
+        for file_info in files_to_confirm:
+            file_info["permanent_path"] = s3_service.generate_permanent_path(
+                purpose=file_info["purpose"],
+                file_name=file_info["file_name"],
+                object_id=file_info["object_id"],
+            )
 
-        confirmed_files = []
+        uploaded_by = request.user if request.user.is_authenticated else None
         with transaction.atomic():
-            for file_info in files_to_confirm:
-                # Generate permanent path (with or without related object)
-                permanent_path = s3_service.generate_permanent_path(
-                    purpose=file_info["purpose"],
-                    file_name=file_info["file_name"],
-                    object_id=file_info["object_id"],
-                )
-
-                # Move file from temp to permanent location
-                s3_service.move_file(file_info["temp_file_path"], permanent_path)
-
-                # Get file metadata from S3
-                s3_metadata = s3_service.get_file_metadata(permanent_path)
-
-                # Create FileModel record
-                file_record = FileModel.objects.create(
-                    purpose=file_info["purpose"],
-                    file_name=file_info["file_name"],
-                    file_path=permanent_path,
-                    size=s3_metadata.get("size") if s3_metadata else None,
-                    checksum=s3_metadata.get("etag") if s3_metadata else None,
-                    is_confirmed=True,
-                    content_type=file_info["content_type"],
-                    object_id=file_info["object_id"],
-                    uploaded_by=request.user if request.user.is_authenticated else None,
-                )
+            # Move files from temp to permanent location and read their final metadata
+            s3_metadata_list = s3_service.move_files(
+                [(file_info["temp_file_path"], file_info["permanent_path"]) for file_info in files_to_confirm]
+            )
 
-                # If related_field is specified, set it as ForeignKey on related object
-                if file_info["related_field"]:
-                    related_object = file_info["model_class"].objects.get(pk=file_info["object_id"])
-                    if hasattr(related_object, file_info["related_field"]):
-                        setattr(related_object, file_info["related_field"], file_record)
-                        related_object.save(update_fields=[file_info["related_field"]])
+            confirmed_files = FileModel.objects.bulk_create(
+                [
+                    FileModel(
+                        purpose=file_info["purpose"],
+                        file_name=file_info["file_name"],
+                        file_path=file_info["permanent_path"],
+                        size=s3_metadata.get("size") if s3_metadata else None,
+                        checksum=s3_metadata.get("etag") if s3_metadata else None,
+                        is_confirmed=True,
+                        content_type=file_info["content_type"],
+                        object_id=file_info["object_id"],
+                        uploaded_by=uploaded_by,
+                    )
+                    for file_info, s3_metadata in zip(files_to_confirm, s3_metadata_list, strict=True)
+                ]
+            )
 
-                confirmed_files.append(file_record)
+            # If related_field is specified, set it as ForeignKey on related object
+            self._link_related_objects(files_to_confirm, confirmed_files, model_classes)
 
-                # Delete cache entry
-                cache.delete(file_info["cache_key"])
+        cache.delete_many([file_info["cache_key"] for file_info in files_to_confirm])
 
         # Return confirmed files
         file_serializer = FileSerializer(confirmed_files, many=True)
         return Response({"confirmed_files": file_serializer.data}, status=status.HTTP_201_CREATED)
+
+    def _link_related_objects(self, files_to_confirm, confirmed_files, model_classes):
+        """Set the `related_field` of related objects, loading and saving each object once."""
+        updates = {}
+        for file_info, file_record in zip(files_to_confirm, confirmed_files, strict=True):
+            if file_info["related_field"]:
+                key = (file_info["related_model"], file_info["object_id"])
+                updates.setdefault(key, {})[file_info["related_field"]] = file_record
+        if not updates:
+            return
+
+        object_ids_by_model = {}
+        for related_model, object_id in updates:
+            object_ids_by_model.setdefault(related_model, set()).add(object_id)
+        related_objects = {
+            related_model: model_classes[related_model].objects.in_bulk(object_ids)
+            for related_model, object_ids in object_ids_by_model.items()
+        }
+
+        for (related_model, object_id), field_values in updates.items():
+            model_class = model_classes[related_model]
+            related_object = related_objects[related_model].get(model_class._meta.pk.to_python(object_id))
+            if related_object is None:
+                raise model_class.DoesNotExist(f"{model_class.__name__} {object_id} does not exist")
+            update_fields = [field for field in field_values if hasattr(related_object, field)]
+            for field in update_fields:
+                setattr(related_object, field, field_values[field])
+            if update_fields:
+                related_object.save(update_fields=update_fields)
@@ -34,6 +34,9 @@ CACHE_TIMEOUT = 3600  # 1 hour
 S3_TMP_PREFIX = "uploads/tmp/"
 S3_UPLOADS_PREFIX = "uploads/"
 
+# Maximum concurrent S3 requests when confirming several files at once
+S3_MAX_CONCURRENT_REQUESTS = 8
+
 # Presigned URL Settings
 PRESIGNED_URL_EXPIRATION = 3600  # 1 hour
 PRESIGNED_GET_URL_EXPIRATION = 3600  # 1 hour for view/download URLs
@@ -0,0 +1,167 @@
+"""Tests for concurrent file confirmation against an in-memory S3-compatible stand-in."""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from botocore.exceptions import ClientError
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.files.constants import CACHE_KEY_PREFIX
+from apps.files.models import FileModel
+from apps.files.utils import S3FileUploadService
+
+User = get_user_model()
+
+
+class InMemoryS3Client:
+    """Minimal S3-compatible client keeping objects in memory.
+
+    Each request sleeps for `latency` seconds, so overlapping requests can be
+    observed through `max_in_flight`.
+    """
+
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.objects: dict[str, dict] = {}
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _request(self):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self._in_flight -= 1
+
+    def put(self, key: str, body: bytes, content_type: str):
+        self.objects[key] = {"body": body, "content_type": content_type}
+
+    def head_object(self, Bucket, Key):
+        self._request()
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+        stored = self.objects[Key]
+        return {
+            "ContentLength": len(stored["body"]),
+            "ContentType": stored["content_type"],
+            "ETag": f'"{hash(stored["body"]) & 0xFFFFFFFF:08x}"',
+        }
+
+    def copy_object(self, CopySource, Bucket, Key):
+        self._request()
+        with self._lock:
+            self.objects[Key] = dict(self.objects[CopySource["Key"]])
+
+    def delete_object(self, Bucket, Key):
+        self._request()
+        with self._lock:
+            self.objects.pop(Key, None)
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"https://s3.local/{Params['Key']}"
+
+
+@override_settings(AWS_STORAGE_BUCKET_NAME="test-bucket")
+class ConcurrentFileConfirmationTest(TestCase):
+    """Confirm several uploads through the real S3 service backed by the stand-in."""
+
+    def setUp(self):
+        cache.clear()
+        self.s3 = InMemoryS3Client()
+        patcher = patch("apps.files.utils.s3_utils.boto3.client", return_value=self.s3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        prefix_patcher = patch("apps.files.utils.s3_utils.get_storage_prefix", return_value="")
+        prefix_patcher.start()
+        self.addCleanup(prefix_patcher.stop)
+        self.addCleanup(cache.clear)
+
+        self.user = User.objects.create_superuser(username="uploader", email="uploader@example.com", password="x")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _upload(self, index: int, content_type: str = "application/pdf") -> str:
+        file_token = f"token-{index:03d}"
+        file_path = f"uploads/tmp/{file_token}/file{index}.pdf"
+        self.s3.put(file_path, f"content {index}".encode(), content_type)
+        cache.set(
+            f"{CACHE_KEY_PREFIX}{file_token}",
+            json.dumps(
+                {
+                    "file_name": f"file{index}.pdf",
+                    "file_type": "application/pdf",
+                    "purpose": "job_description",
+                    "file_path": file_path,
+                }
+            ),
+            3600,
+        )
+        return file_token
+
+    def test_service_moves_files_concurrently_in_order(self):
+        service = S3FileUploadService()
+        for index in range(6):
+            self.s3.put(f"src/{index}", b"x" * index, "text/plain")
+
+        metadata = service.move_files([(f"src/{index}", f"dst/{index}") for index in range(6)])
+
+        self.assertEqual([item["size"] for item in metadata], list(range(6)))
+        self.assertEqual(sorted(self.s3.objects), [f"dst/{index}" for index in range(6)])
+        self.assertGreater(self.s3.max_in_flight, 1)
+
+    def test_confirm_ten_files(self):
+        tokens = [self._upload(index) for index in range(10)]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("files:confirm"),
+                {
+                    "files": [
+                        {
+                            "file_token": token,
+                            "purpose": "job_description",
+                            "related_model": "core.User",
+                            "related_object_id": self.user.id,
+                        }
+                        for token in tokens
+                    ]
+                },
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        records = list(FileModel.objects.order_by("id"))
+        self.assertEqual([record.file_name for record in records], [f"file{index}.pdf" for index in range(10)])
+        self.assertTrue(all(record.is_confirmed and record.size for record in records))
+        self.assertTrue(all(record.file_path in self.s3.objects for record in records))
+        self.assertFalse(any(key.startswith("uploads/tmp/") for key in self.s3.objects))
+        self.assertGreater(self.s3.max_in_flight, 1)
+
+        inserts = [query for query in queries.captured_queries if query["sql"].startswith('INSERT INTO "files_file')]
+        self.assertEqual(len(inserts), 1)
+        self.assertIsNone(cache.get(f"{CACHE_KEY_PREFIX}{tokens[0]}"))
+
+    def test_missing_upload_confirms_nothing(self):
+        tokens = [self._upload(0), self._upload(1)]
+        del self.s3.objects["uploads/tmp/token-001/file1.pdf"]
+
+        response = self.client.post(
+            reverse("files:confirm"),
+            {"files": [{"file_token": token, "purpose": "job_description"} for token in tokens]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(FileModel.objects.exists())
+        self.assertIn("uploads/tmp/token-000/file0.pdf", self.s3.objects)
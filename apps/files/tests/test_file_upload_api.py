@@ -216,17 +216,17 @@ class ConfirmMultipleFilesAPITest(TestCase, APITestMixin):
         """Test successful confirmation of multiple files."""
         # Arrange: Mock S3 service in views
         mock_instance = mock_s3_service_views.return_value
-        mock_instance.check_file_exists.return_value = True
         mock_instance.generate_permanent_path.side_effect = [
             "uploads/job_description/1/test1.pdf",
             "uploads/job_description/1/test2.pdf",
         ]
-        mock_instance.move_file.return_value = True
 
-        # Mock get_file_metadata calls (2 for validation + 2 for permanent)
-        mock_instance.get_file_metadata.side_effect = [
+        # Mock batch metadata calls (temporary files for validation, then moved files)
+        mock_instance.get_files_metadata.return_value = [
             {"size": 123456, "content_type": "application/pdf", "etag": "abc123"},
             {"size": 234567, "content_type": "application/pdf", "etag": "def456"},
+        ]
+        mock_instance.move_files.return_value = [
             {"size": 123456, "etag": "abc123"},
             {"size": 234567, "etag": "def456"},
         ]
@@ -286,9 +286,16 @@ class ConfirmMultipleFilesAPITest(TestCase, APITestMixin):
         self.assertEqual(file_records[1].file_name, "test2.pdf")
         self.assertEqual(file_records[1].uploaded_by, self.user)
 
-        # Assert: Check S3 service was called correctly
-        self.assertEqual(mock_instance.check_file_exists.call_count, 2)
-        self.assertEqual(mock_instance.move_file.call_count, 2)
+        # Assert: Check S3 service was called once per batch
+        mock_instance.get_files_metadata.assert_called_once_with(
+            ["uploads/tmp/test-token-001/test1.pdf", "uploads/tmp/test-token-002/test2.pdf"]
+        )
+        mock_instance.move_files.assert_called_once_with(
+            [
+                ("uploads/tmp/test-token-001/test1.pdf", "uploads/job_description/1/test1.pdf"),
+                ("uploads/tmp/test-token-002/test2.pdf", "uploads/job_description/1/test2.pdf"),
+            ]
+        )
 
         # Assert: Check cache was cleared
         cache_key_1 = f"{CACHE_KEY_PREFIX}{self.file_token_1}"
@@ -335,12 +342,10 @@ class ConfirmMultipleFilesAPITest(TestCase, APITestMixin):
         """Test confirm multiple files when one doesn't exist in S3."""
         # Arrange: Mock S3 service - first file exists, second doesn't
         mock_instance = mock_s3_service.return_value
-        mock_instance.check_file_exists.side_effect = [True, False]
-        mock_instance.get_file_metadata.return_value = {
-            "size": 123456,
-            "content_type": "application/pdf",
-            "etag": "abc123",
-        }
+        mock_instance.get_files_metadata.return_value = [
+            {"size": 123456, "content_type": "application/pdf", "etag": "abc123"},
+            None,
+        ]
 
         # Act
         url = reverse("files:confirm")
@@ -579,15 +584,11 @@ class FileModelTest(TestCase, APITestMixin):
 
         # Mock S3 service in views
         mock_instance = mock_s3_service_views.return_value
-        mock_instance.check_file_exists.return_value = True
         mock_instance.generate_permanent_path.return_value = "uploads/import_data/unrelated/uuid-123/import_data.csv"
-        mock_instance.move_file.return_value = True
 
-        # Mock get_file_metadata calls
-        mock_instance.get_file_metadata.side_effect = [
-            {"size": 56789, "content_type": "text/csv", "etag": "xyz789"},
-            {"size": 56789, "etag": "xyz789"},
-        ]
+        # Mock batch metadata calls
+        mock_instance.get_files_metadata.return_value = [{"size": 56789, "content_type": "text/csv", "etag": "xyz789"}]
+        mock_instance.move_files.return_value = [{"size": 56789, "etag": "xyz789"}]
 
         # Mock S3 service in utils (for properties in serializer)
         mock_s3_service_utils.return_value.generate_view_url.return_value = "https://s3.amazonaws.com/view-url"
@@ -2,7 +2,8 @@
 
 import logging
 import uuid
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Sequence, TypeVar
 
 import boto3
 from botocore.exceptions import ClientError
@@ -12,6 +13,7 @@ from django.utils.translation import gettext as _
 from apps.files.constants import (
     PRESIGNED_GET_URL_EXPIRATION,
     PRESIGNED_URL_EXPIRATION,
+    S3_MAX_CONCURRENT_REQUESTS,
     S3_TMP_PREFIX,
     S3_UPLOADS_PREFIX,
 )
@@ -20,6 +22,9 @@ from libs.retry import retry
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class S3FileUploadService:
     """Service for handling S3 file upload operations."""
@@ -31,6 +36,8 @@ class S3FileUploadService:
             aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
             aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
             region_name=settings.AWS_REGION_NAME,
+            # Points to an S3-compatible service (e.g. MinIO) when set
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
         )
         self.bucket_name = settings.AWS_STORAGE_BUCKET_NAME
 
@@ -197,6 +204,52 @@ class S3FileUploadService:
         except ClientError:
             return None
 
+    def _map_concurrently(
+        self, func: Callable[[T], R], items: Sequence[T], max_workers: int = S3_MAX_CONCURRENT_REQUESTS
+    ) -> list[R]:
+        """Apply `func` to `items` on a bounded thread pool, keeping the input order.
+
+        The boto3 client is thread-safe, so the S3 round trips of the items overlap.
+        The first exception raised by `func` is re-raised.
+        """
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="s3") as executor:
+            return list(executor.map(func, items))
+
+    def get_files_metadata(self, file_paths: Sequence[str]) -> list[Optional[dict]]:
+        """
+        Get the metadata of several files concurrently.
+
+        Args:
+            file_paths: File paths (with or without prefix)
+
+        Returns:
+            Metadata of each file in input order, None for files not found
+        """
+        return self._map_concurrently(self.get_file_metadata, file_paths)
+
+    def move_files(self, moves: Sequence[tuple[str, str]]) -> list[Optional[dict]]:
+        """
+        Move several files concurrently and return the metadata of their new location.
+
+        Args:
+            moves: (source_path, destination_path) pairs
+
+        Returns:
+            Metadata of each destination file in input order
+
+        Raises:
+            Exception: If a move operation fails after all retries
+        """
+
+        def _move(move: tuple[str, str]) -> Optional[dict]:
+            source_path, destination_path = move
+            self.move_file(source_path, destination_path)
+            return self.get_file_metadata(destination_path)
+
+        return self._map_concurrently(_move, moves)
+
     def delete_file(self, file_path: str) -> bool:
         """
         Delete a file from S3.
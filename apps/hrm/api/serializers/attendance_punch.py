@@ -0,0 +1,85 @@
+"""Serializers for the quick (buffered) mobile attendance punches."""
+
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+
+from apps.hrm.models import AttendanceWifiDevice, PendingAttendancePunch
+from apps.hrm.services.attendance_punch import buffer_geolocation_punch, buffer_wifi_punch
+from apps.hrm.utils.attendance_registry import get_wifi_registry
+from apps.hrm.utils.geofence_index import find_matching_geofence
+
+
+class GeoLocationPunchSerializer(serializers.Serializer):
+    """Serializer for a quick GeoLocation punch.
+
+    Resolves the geolocation containing the coordinates from the geofence index and
+    appends the punch to the pending punch buffer. Expects `employee_id` in context.
+    """
+
+    latitude = serializers.DecimalField(max_digits=20, decimal_places=17, min_value=-90, max_value=90)
+    longitude = serializers.DecimalField(max_digits=20, decimal_places=17, min_value=-180, max_value=180)
+
+    def validate(self, attrs):
+        """Validate that the coordinates are within an active geolocation."""
+        match = find_matching_geofence(attrs["latitude"], attrs["longitude"])
+        if match is None:
+            raise serializers.ValidationError(
+                {"location": _("Your location is not within any active attendance geolocation")}
+            )
+
+        attrs["attendance_geolocation_id"] = match.geolocation_id
+        self.distance_m = match.distance_m
+        return attrs
+
+    def create(self, validated_data):
+        """Buffer the geolocation punch."""
+        return buffer_geolocation_punch(employee_id=self.context["employee_id"], **validated_data)
+
+
+class WiFiPunchSerializer(serializers.Serializer):
+    """Serializer for a quick WiFi punch.
+
+    Validates the BSSID against the cached WiFi registry and appends the punch to the
+    pending punch buffer. Expects `employee_id` in context.
+    """
+
+    bssid = serializers.CharField(
+        max_length=17,
+        help_text="WiFi BSSID (MAC address format: XX:XX:XX:XX:XX:XX)",
+    )
+
+    def validate_bssid(self, value):
+        """Validate that the BSSID exists and is in use."""
+        wifi_device = get_wifi_registry().get(value)
+        if wifi_device is None:
+            raise serializers.ValidationError(_("WiFi device not found"))
+
+        wifi_device_id, state = wifi_device
+        if state != AttendanceWifiDevice.State.IN_USE:
+            raise serializers.ValidationError(_("WiFi device is not in use"))
+
+        self.wifi_device_id = wifi_device_id
+        return value
+
+    def create(self, validated_data):
+        """Buffer the WiFi punch."""
+        return buffer_wifi_punch(
+            employee_id=self.context["employee_id"], attendance_wifi_device_id=self.wifi_device_id
+        )
+
+
+class PendingAttendancePunchSerializer(serializers.ModelSerializer):
+    """Read serializer for an accepted (not yet materialized) attendance punch."""
+
+    class Meta:
+        model = PendingAttendancePunch
+        fields = [
+            "id",
+            "attendance_type",
+            "timestamp",
+            "latitude",
+            "longitude",
+            "attendance_geolocation",
+            "attendance_wifi_device",
+        ]
+        read_only_fields = fields
@@ -7,13 +7,17 @@ from rest_framework import serializers
 from apps.files.api.serializers.mixins import FileConfirmSerializerMixin
 from apps.hrm.constants import AttendanceType
 from apps.hrm.models import AttendanceGeolocation, AttendanceRecord
-from apps.hrm.utils.geolocation import is_within_radius
+from apps.hrm.utils.geofence_index import find_matching_geofence
+from apps.hrm.utils.geolocation import haversine_distance
 
 
 class GeoLocationAttendanceSerializer(FileConfirmSerializerMixin, serializers.ModelSerializer):
     """Serializer for GeoLocation-based attendance recording.
 
     Validates GeoLocation coordinates against AttendanceGeolocation and creates attendance record.
+    When `attendance_geolocation_id` is omitted, the nearest active geolocation containing the
+    coordinates is resolved from the geofence index. The distance to the matched geolocation is
+    exposed as `distance_m` after validation.
     Uses FileConfirmSerializerMixin to handle image confirmation.
     """
 
@@ -24,7 +28,9 @@ class GeoLocationAttendanceSerializer(FileConfirmSerializerMixin, serializers.Mo
         queryset=AttendanceGeolocation.objects.filter(deleted=False, status=AttendanceGeolocation.Status.ACTIVE),
         source="attendance_geolocation",
         write_only=True,
-        help_text="ID of the attendance geolocation to check against",
+        required=False,
+        allow_null=True,
+        help_text="ID of the attendance geolocation to check against. Resolved from the coordinates when omitted",
     )
 
     class Meta:
@@ -42,13 +48,26 @@ class GeoLocationAttendanceSerializer(FileConfirmSerializerMixin, serializers.Mo
         longitude = attrs.get("longitude")
         geolocation = attrs.get("attendance_geolocation")
 
-        if not latitude or not longitude or not geolocation:
-            raise serializers.ValidationError(_("Latitude, longitude, and geolocation are required"))
+        if not latitude or not longitude:
+            raise serializers.ValidationError(_("Latitude and longitude are required"))
+
+        if geolocation is None:
+            match = find_matching_geofence(latitude, longitude)
+            if match is not None:
+                geolocation = AttendanceGeolocation.objects.filter(
+                    pk=match.geolocation_id, deleted=False, status=AttendanceGeolocation.Status.ACTIVE
+                ).first()
+            if match is None or geolocation is None:
+                raise serializers.ValidationError(
+                    {"location": _("Your location is not within any active attendance geolocation")}
+                )
+            attrs["attendance_geolocation"] = geolocation
+            self.distance_m = match.distance_m
+            return attrs
 
         # Check if coordinates are within radius
-        if not is_within_radius(
-            latitude, longitude, geolocation.latitude, geolocation.longitude, geolocation.radius_m
-        ):
+        distance = haversine_distance(latitude, longitude, geolocation.latitude, geolocation.longitude)
+        if distance > geolocation.radius_m:
             raise serializers.ValidationError(
                 {
                     "location": _("Your location is outside the allowed radius ({radius}m) of the geolocation").format(
@@ -57,6 +76,7 @@ class GeoLocationAttendanceSerializer(FileConfirmSerializerMixin, serializers.Mo
                 }
             )
 
+        self.distance_m = distance
         return attrs
 
     def create(self, validated_data):
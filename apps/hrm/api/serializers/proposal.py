@@ -16,6 +16,7 @@ from apps.hrm.api.serializers.common_nested import (
 )
 from apps.hrm.constants import ProposalStatus, ProposalType
 from apps.hrm.models import Proposal, ProposalAsset, ProposalOvertimeEntry, ProposalTimeSheetEntry, ProposalVerifier
+from apps.hrm.services.proposal_bulk import BULK_PROPOSAL_MAX_IDS, bulk_change_proposal_status
 from apps.hrm.services.proposal_service import ProposalService
 from libs.drf.serializers import ColoredValueSerializer, FieldFilteringSerializerMixin
 
@@ -266,6 +267,52 @@ class ProposalTimesheetEntryComplaintRejectSerializer(ProposalRejectSerializer):
         return ProposalType.TIMESHEET_ENTRY_COMPLAINT
 
 
+class ProposalBulkApproveSerializer(serializers.Serializer):
+    """Serializer for bulk approving or rejecting proposals.
+
+    Expects the proposals the user may act on as `queryset` in context.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=BULK_PROPOSAL_MAX_IDS,
+        help_text="IDs of the proposals to approve or reject",
+    )
+    is_approve = serializers.BooleanField(required=True, help_text="True to approve, false to reject")
+    approval_note = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+        help_text="Note for all proposals (required when rejecting)",
+    )
+
+    def validate(self, attrs):
+        if not attrs["is_approve"] and not (attrs.get("approval_note") or "").strip():
+            raise serializers.ValidationError(
+                {"approval_note": _("Resolution note is required when rejecting a proposal")}
+            )
+        return attrs
+
+    def save(self):
+        user = self.context["request"].user
+        return bulk_change_proposal_status(
+            self.context["queryset"],
+            self.validated_data["ids"],
+            approve=self.validated_data["is_approve"],
+            approved_by=getattr(user, "employee", None),
+            approval_note=self.validated_data.get("approval_note"),
+        )
+
+
+class ProposalBulkApproveResultSerializer(serializers.Serializer):
+    """Serializer for the outcome of one proposal in a bulk approval."""
+
+    id = serializers.IntegerField()
+    success = serializers.BooleanField()
+    error = serializers.CharField(allow_null=True)
+
+
 # =============================================================================
 # 3. COMPONENT SERIALIZERS
 # =============================================================================
@@ -9,12 +9,12 @@ from rest_framework.exceptions import APIException
 from apps.hrm.api.serializers import EmployeeSerializer
 from apps.hrm.models import (
     Employee,
-    EmployeeWorkHistory,
     RecruitmentCandidate,
     RecruitmentChannel,
     RecruitmentRequest,
     RecruitmentSource,
 )
+from apps.hrm.services.employee import bulk_onboard_employees
 from libs import ColoredValueSerializer, FieldFilteringSerializerMixin
 
 from .common_nested import (
@@ -304,18 +304,20 @@ class CandidateToEmployeeSerializer(serializers.Serializer):
         return attrs
 
     def create(self, validated_data):
-        """Create an employee from the candidate data."""
+        """Create an employee from the candidate data.
+
+        The employee goes through the bulk onboarding service, which creates its
+        user account, work history and timesheets without the per-save signal chain.
+        """
         employee_serializer: EmployeeSerializer = validated_data["employee_serializer"]
-        employee = employee_serializer.save()
+        (employee,) = bulk_onboard_employees(
+            [Employee(**employee_serializer.validated_data)],
+            note=_("Converted from recruitment candidate {code}").format(code=self.candidate.code),
+            recruitment_candidate_id=self.candidate.id,
+        )
 
         # Link the candidate to the employee
         self.candidate.employee = employee
         self.candidate.save(update_fields=["employee"])
 
-        # Update the automatically created work history to include candidate info
-        work_history = EmployeeWorkHistory.objects.filter(employee=employee).first()
-        if work_history:
-            work_history.note = _("Converted from recruitment candidate {code}").format(code=self.candidate.code)
-            work_history.save(update_fields=["note"])
-
         return employee
@@ -16,6 +16,7 @@ from apps.hrm.models import AttendanceRecord
 from apps.hrm.utils.filters import RoleDataScopeFilterBackend
 from libs.drf.filtersets.search import PhraseSearchFilter
 from libs.drf.mixin.permission import PermissionRegistrationMixin
+from libs.drf.pagination import PageNumberOrKeysetPagination
 
 
 @extend_schema_view(
@@ -109,6 +110,7 @@ class AttendanceRecordViewSet(
     search_fields = ["attendance_code", "employee__code", "employee__fullname"]
     ordering_fields = ["timestamp", "created_at"]
     ordering = ["-timestamp"]
+    pagination_class = PageNumberOrKeysetPagination
     http_method_names = ["get", "put", "patch", "head", "options", "post"]
     permission_classes = [RoleBasedPermission, DataScopePermission]
 
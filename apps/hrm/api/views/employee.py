@@ -32,7 +32,7 @@ from apps.imports.api.mixins import AsyncImportProgressMixin
 from apps.mailtemplates.serializers import TemplatePreviewResponseSerializer
 from apps.mailtemplates.view_mixins import EmailTemplateActionMixin
 from libs import BaseModelViewSet
-from libs.drf.filtersets.search import PhraseSearchFilter
+from libs.drf.filtersets.search import NormalizedSearchFilter
 from libs.export_xlsx import ExportXLSXMixin
 from libs.strings import generate_valid_password
 
@@ -95,7 +95,7 @@ class EmployeeViewSet(
     )
     serializer_class = EmployeeSerializer
     filterset_class = EmployeeFilterSet
-    filter_backends = [RoleDataScopeFilterBackend, DjangoFilterBackend, PhraseSearchFilter, OrderingFilter]
+    filter_backends = [RoleDataScopeFilterBackend, DjangoFilterBackend, OrderingFilter, NormalizedSearchFilter]
     search_fields = ["code", "fullname", "username", "email", "attendance_code", "phone", "citizen_id"]
     ordering_fields = [
         "code",
@@ -8,11 +8,16 @@ from rest_framework.response import Response
 
 from apps.hrm.api.filtersets import AttendanceRecordFilterSet
 from apps.hrm.api.serializers import AttendanceRecordSerializer
+from apps.hrm.api.serializers.attendance_punch import (
+    GeoLocationPunchSerializer,
+    PendingAttendancePunchSerializer,
+    WiFiPunchSerializer,
+)
 from apps.hrm.api.serializers.geolocation_attendance import GeoLocationAttendanceSerializer
 from apps.hrm.api.serializers.other_attendance import OtherAttendanceSerializer
 from apps.hrm.api.serializers.wifi_attendance import WiFiAttendanceSerializer
 from apps.hrm.models import AttendanceRecord
-from apps.hrm.utils.attendance_validation import validate_attendance_device
+from apps.hrm.utils.attendance_validation import validate_attendance_device, validate_attendance_device_cached
 from libs.drf.base_viewset import BaseReadOnlyModelViewSet
 from libs.drf.filtersets.search import PhraseSearchFilter
 
@@ -75,6 +80,14 @@ class MyAttendanceRecordViewSet(BaseReadOnlyModelViewSet):
             "name_template": _("Record attendance by WiFi"),
             "description_template": _("Record attendance using WiFi BSSID"),
         },
+        "geolocation_punch": {
+            "name_template": _("Quick attendance by GeoLocation"),
+            "description_template": _("Submit a GeoLocation punch that is recorded asynchronously"),
+        },
+        "wifi_punch": {
+            "name_template": _("Quick attendance by WiFi"),
+            "description_template": _("Submit a WiFi punch that is recorded asynchronously"),
+        },
         "other_attendance": {
             "name_template": _("Record attendance by Other"),
             "description_template": _("Record attendance manually or by other means"),
@@ -93,7 +106,12 @@ class MyAttendanceRecordViewSet(BaseReadOnlyModelViewSet):
 
     @extend_schema(
         summary="Record attendance by GeoLocation",
-        description="Record attendance using GeoLocation coordinates. Validates location against geolocation radius and status.",
+        description=(
+            "Record attendance using GeoLocation coordinates. Validates location against geolocation radius and "
+            "status. When attendance_geolocation_id is omitted, the nearest active geolocation containing the "
+            "coordinates is resolved by the server. The response includes the distance (in meters) to the "
+            "matched geolocation as distance_m."
+        ),
         tags=["6.11: Attendance Record"],
         request=GeoLocationAttendanceSerializer,
         responses={201: AttendanceRecordSerializer},
@@ -108,6 +126,15 @@ class MyAttendanceRecordViewSet(BaseReadOnlyModelViewSet):
                 },
                 request_only=True,
             ),
+            OpenApiExample(
+                "Request - Auto-resolved geolocation",
+                value={
+                    "latitude": "10.7769000",
+                    "longitude": "106.7009000",
+                    "image_id": 123,
+                },
+                request_only=True,
+            ),
             OpenApiExample(
                 "Success",
                 value={
@@ -129,6 +156,7 @@ class MyAttendanceRecordViewSet(BaseReadOnlyModelViewSet):
                         "notes": "",
                         "created_at": "2025-11-26T10:30:00Z",
                         "updated_at": "2025-11-26T10:30:00Z",
+                        "distance_m": 12.5,
                     },
                     "error": None,
                 },
@@ -153,9 +181,10 @@ class MyAttendanceRecordViewSet(BaseReadOnlyModelViewSet):
         serializer.is_valid(raise_exception=True)
         attendance_record = serializer.save()
 
-        # Return the created attendance record
-        record_serializer = AttendanceRecordSerializer(attendance_record)
-        return Response(record_serializer.data, status=status.HTTP_201_CREATED)
+        # Return the created attendance record with the distance to the matched geolocation
+        data = AttendanceRecordSerializer(attendance_record).data
+        data["distance_m"] = round(serializer.distance_m, 2)
+        return Response(data, status=status.HTTP_201_CREATED)
 
     @extend_schema(
         summary="Record attendance by WiFi",
@@ -218,6 +247,111 @@ class MyAttendanceRecordViewSet(BaseReadOnlyModelViewSet):
         record_serializer = AttendanceRecordSerializer(attendance_record)
         return Response(record_serializer.data, status=status.HTTP_201_CREATED)
 
+    @extend_schema(
+        summary="Quick attendance by GeoLocation",
+        description=(
+            "Submit a GeoLocation punch during peak check-in hours. The device and the geolocation containing the "
+            "coordinates are validated against cached registries, the punch is queued and 202 Accepted is returned "
+            "immediately. The attendance record and timesheet are updated by a background job within seconds. "
+            "Photos are not supported; use geolocation-attendance when an image is required."
+        ),
+        tags=["6.11: Attendance Record"],
+        request=GeoLocationPunchSerializer,
+        responses={202: PendingAttendancePunchSerializer},
+        examples=[
+            OpenApiExample(
+                "Request",
+                value={"latitude": "10.7769000", "longitude": "106.7009000"},
+                request_only=True,
+            ),
+            OpenApiExample(
+                "Success",
+                value={
+                    "success": True,
+                    "data": {
+                        "id": 1,
+                        "attendance_type": "geolocation",
+                        "timestamp": "2025-11-26T08:00:00Z",
+                        "latitude": "10.77690000000000000",
+                        "longitude": "106.70090000000000000",
+                        "attendance_geolocation": 1,
+                        "attendance_wifi_device": None,
+                        "distance_m": 12.5,
+                    },
+                    "error": None,
+                },
+                response_only=True,
+                status_codes=["202"],
+            ),
+            OpenApiExample(
+                "Error - Outside Geolocations",
+                value={
+                    "success": False,
+                    "error": {"location": ["Your location is not within any active attendance geolocation"]},
+                },
+                response_only=True,
+                status_codes=["400"],
+            ),
+        ],
+    )
+    @action(detail=False, methods=["post"], url_path="geolocation-punch")
+    def geolocation_punch(self, request):
+        """Queue a GeoLocation punch for asynchronous recording."""
+        employee_id = validate_attendance_device_cached(request)
+        serializer = GeoLocationPunchSerializer(data=request.data, context={"employee_id": employee_id})
+        serializer.is_valid(raise_exception=True)
+        punch = serializer.save()
+
+        data = PendingAttendancePunchSerializer(punch).data
+        data["distance_m"] = round(serializer.distance_m, 2)
+        return Response(data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        summary="Quick attendance by WiFi",
+        description=(
+            "Submit a WiFi punch during peak check-in hours. The device and BSSID are validated against cached "
+            "registries, the punch is queued and 202 Accepted is returned immediately. The attendance record and "
+            "timesheet are updated by a background job within seconds."
+        ),
+        tags=["6.11: Attendance Record"],
+        request=WiFiPunchSerializer,
+        responses={202: PendingAttendancePunchSerializer},
+        examples=[
+            OpenApiExample(
+                "Request",
+                value={"bssid": "00:11:22:33:44:55"},
+                request_only=True,
+            ),
+            OpenApiExample(
+                "Success",
+                value={
+                    "success": True,
+                    "data": {
+                        "id": 2,
+                        "attendance_type": "wifi",
+                        "timestamp": "2025-11-26T08:00:00Z",
+                        "latitude": None,
+                        "longitude": None,
+                        "attendance_geolocation": None,
+                        "attendance_wifi_device": 1,
+                    },
+                    "error": None,
+                },
+                response_only=True,
+                status_codes=["202"],
+            ),
+        ],
+    )
+    @action(detail=False, methods=["post"], url_path="wifi-punch")
+    def wifi_punch(self, request):
+        """Queue a WiFi punch for asynchronous recording."""
+        employee_id = validate_attendance_device_cached(request)
+        serializer = WiFiPunchSerializer(data=request.data, context={"employee_id": employee_id})
+        serializer.is_valid(raise_exception=True)
+        punch = serializer.save()
+
+        return Response(PendingAttendancePunchSerializer(punch).data, status=status.HTTP_202_ACCEPTED)
+
     @extend_schema(
         summary="Record attendance by Other",
         description="Record attendance manually or by other means. Pending approval.",
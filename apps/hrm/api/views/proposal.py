@@ -26,6 +26,8 @@ from apps.hrm.api.serializers.proposal import (
     ProposalApproveSerializer,
     ProposalAssetAllocationExportXLSXSerializer,
     ProposalAssetAllocationSerializer,
+    ProposalBulkApproveResultSerializer,
+    ProposalBulkApproveSerializer,
     ProposalDeviceChangeExportXLSXSerializer,
     ProposalDeviceChangeSerializer,
     ProposalExportXLSXSerializer,
@@ -157,6 +159,10 @@ class ProposalMixin(DataScopeCreateValidationMixin, AuditLoggingMixin, ExportXLS
             "name_template": _("Reject {model_name}"),
             "description_template": _("Reject {model_name}"),
         },
+        "bulk_approve": {
+            "name_template": _("Bulk approve {model_name}"),
+            "description_template": _("Approve or reject multiple {model_name}"),
+        },
         # "mine": {
         #     "name_template": _("View the list of requests pending my approval"),
         #     "description_template": _("View the list of requests pending my approval"),
@@ -261,6 +267,49 @@ class ProposalMixin(DataScopeCreateValidationMixin, AuditLoggingMixin, ExportXLS
         # Return updated proposal with timesheet entry
         return Response(self.serializer_class(proposal).data)
 
+    @extend_schema(
+        summary="Bulk approve or reject proposals",
+        description=(
+            "Approve or reject a list of pending proposals. Each proposal is validated individually and "
+            "the result of every id is returned; invalid ids do not stop the others. Timesheet updates, "
+            "monthly refreshes, payroll recalculation and notifications are issued once per affected "
+            "employee-month. Complaints without approved times fail; approve them individually with the "
+            "approved times."
+        ),
+        request=ProposalBulkApproveSerializer,
+        responses={200: ProposalBulkApproveResultSerializer(many=True)},
+        examples=[
+            OpenApiExample(
+                "Request",
+                value={"ids": [1, 2], "is_approve": True, "approval_note": "Approved at month end"},
+                request_only=True,
+            ),
+            OpenApiExample(
+                "Success",
+                value={
+                    "success": True,
+                    "data": [
+                        {"id": 1, "success": True, "error": None},
+                        {"id": 2, "success": False, "error": "Proposal has already been approved/rejected"},
+                    ],
+                    "error": None,
+                },
+                response_only=True,
+            ),
+        ],
+    )
+    @action(detail=False, methods=["post"], url_path="bulk-approve")
+    def bulk_approve(self, request):
+        """Approve or reject multiple proposals."""
+        serializer = ProposalBulkApproveSerializer(
+            data=request.data,
+            context={"request": request, "queryset": self.filter_queryset(self.get_queryset())},
+        )
+        serializer.is_valid(raise_exception=True)
+        results = serializer.save()
+
+        return Response(ProposalBulkApproveResultSerializer(results, many=True).data)
+
 
 @extend_schema_view(
     list=extend_schema(
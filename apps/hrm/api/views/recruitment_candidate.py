@@ -21,7 +21,7 @@ from apps.hrm.models import RecruitmentCandidate
 from apps.hrm.utils.filters import RoleDataScopeFilterBackend
 from apps.imports.api.mixins import AsyncImportProgressMixin
 from libs import BaseModelViewSet
-from libs.drf.filtersets.search import PhraseSearchFilter
+from libs.drf.filtersets.search import NormalizedSearchFilter
 from libs.export_xlsx import ExportXLSXMixin
 
 
@@ -429,7 +429,7 @@ class RecruitmentCandidateViewSet(
     ).all()
     serializer_class = RecruitmentCandidateSerializer
     filterset_class = RecruitmentCandidateFilterSet
-    filter_backends = [RoleDataScopeFilterBackend, DjangoFilterBackend, PhraseSearchFilter, OrderingFilter]
+    filter_backends = [RoleDataScopeFilterBackend, DjangoFilterBackend, OrderingFilter, NormalizedSearchFilter]
     search_fields = ["name", "code", "email", "phone", "citizen_id"]
     ordering_fields = ["code", "name", "submitted_date", "status", "created_at"]
     ordering = ["-created_at"]
@@ -4,10 +4,11 @@ from datetime import date, timedelta
 from typing import Any, Iterable
 
 from django.utils import timezone
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import (
     OpenApiExample,
+    OpenApiParameter,
     extend_schema,
     extend_schema_view,
 )
@@ -28,9 +29,18 @@ from apps.hrm.constants import EmployeeSalaryType, ProposalStatus, ProposalType
 from apps.hrm.models import Employee, ProposalTimeSheetEntry
 from apps.hrm.models.monthly_timesheet import EmployeeMonthlyTimesheet
 from apps.hrm.models.timesheet import TimeSheetEntry
+from apps.hrm.services.timesheet_grid import EMPLOYEE_VALUE_FIELDS, build_compact_timesheet_grid
 from apps.hrm.utils.filters import RoleDataScopeFilterBackend
+from apps.hrm.utils.timesheet_grid_cache import (
+    build_timesheet_grid_cache_key,
+    get_timesheet_grid_cache,
+    set_timesheet_grid_cache,
+)
 from libs.drf.base_viewset import BaseGenericViewSet, BaseReadOnlyModelViewSet
 from libs.drf.filtersets.search import PhraseSearchFilter
+from libs.drf.pagination import PageNumberOrKeysetPagination
+
+COMPACT_LAYOUT = "compact"
 
 
 @extend_schema_view(
@@ -38,9 +48,20 @@ from libs.drf.filtersets.search import PhraseSearchFilter
         summary="List employee timesheets",
         description=(
             "Retrieve timesheet summaries for employees. Filters: employee, branch, block, "
-            "department, position, employee_salary_type. Search by employee code or fullname."
+            "department, position, employee_salary_type. Search by employee code or fullname. "
+            "Use `layout=compact` to get a columnar grid: a shared header (`dates`, `employee_columns`, "
+            "`entry_columns`, `summary_columns`) and per-employee arrays aligned to it."
         ),
         tags=["6.6: Timesheet"],
+        parameters=[
+            OpenApiParameter(
+                name="layout",
+                description="Response layout: `compact` returns the columnar grid representation",
+                required=False,
+                type=str,
+                enum=[COMPACT_LAYOUT],
+            ),
+        ],
     ),
     retrieve=extend_schema(summary="Get employee timesheet details", tags=["6.6: Timesheet"]),
 )
@@ -91,6 +112,9 @@ class EmployeeTimesheetViewSet(AuditLoggingMixin, BaseReadOnlyModelViewSet):
     }
 
     def list(self, request, *args, **kwargs):
+        if request.query_params.get("layout") == COMPACT_LAYOUT:
+            return self._list_compact(request)
+
         qs = self.filter_queryset(self.get_queryset())
 
         page = self.paginate_queryset(qs)
@@ -148,6 +172,34 @@ class EmployeeTimesheetViewSet(AuditLoggingMixin, BaseReadOnlyModelViewSet):
 
         return Response(serialized)
 
+    def _list_compact(self, request):
+        """Return the columnar grid for the requested page, cached per (employee page, month)."""
+        qs = self.filter_queryset(self.get_queryset()).values(*EMPLOYEE_VALUE_FIELDS)
+
+        page = self.paginate_queryset(qs)
+        employees = page if page is not None else list(qs)
+
+        first_day, last_day, month_key, employee_salary_type = self._get_timesheet_params(request)
+
+        cache_key = build_timesheet_grid_cache_key(
+            month_key,
+            [employee["id"] for employee in employees],
+            employee_salary_type or "",
+            get_language() or "",
+        )
+        grid = get_timesheet_grid_cache(cache_key)
+        if grid is None:
+            grid = build_compact_timesheet_grid(employees, first_day, last_day, month_key, employee_salary_type)
+            set_timesheet_grid_cache(cache_key, grid)
+
+        if page is not None:
+            header = {key: value for key, value in grid.items() if key != "rows"}
+            response = self.get_paginated_response(grid["rows"])
+            response.data = {**header, **response.data}
+            return response
+
+        return Response(grid)
+
     # @extend_schema(
     #     summary="List timesheets of current employee",
     #     description=("Retrieve timesheet summaries for current employee."),
@@ -418,6 +470,7 @@ class TimeSheetEntryViewSet(
 
     queryset = TimeSheetEntry.objects.select_related("employee").all()
     serializer_class = TimeSheetEntryDetailSerializer
+    pagination_class = PageNumberOrKeysetPagination
 
     module = _("HRM")
     submodule = _("Timesheet")
@@ -9,6 +9,7 @@ from .contract_creation import import_handler as contract_creation_import_handle
 from .contract_update import import_handler as contract_update_import_handler
 from .employee import (
     import_handler as employee_import_handler,
+    on_import_end as employee_on_import_end,
     pre_import_initialize as employee_pre_import_initialize,
 )
 from .employee_relationship import import_handler as employee_relationship_import_handler
@@ -20,6 +21,7 @@ __all__ = [
     "contract_update_import_handler",
     "employee_import_handler",
     "employee_pre_import_initialize",
+    "employee_on_import_end",
     "employee_relationship_import_handler",
     "recruitment_candidate_import_handler",
 ]
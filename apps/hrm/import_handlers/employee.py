@@ -24,6 +24,7 @@ from apps.hrm.models import (
     Position,
 )
 from apps.hrm.services.employee import (
+    complete_onboarding,
     create_position_change_event,
     create_state_change_event,
     create_transfer_event,
@@ -35,6 +36,9 @@ logger = logging.getLogger(__name__)
 
 User = get_user_model()
 
+# Number of created employees whose onboarding side effects are applied together
+ONBOARDING_BATCH_SIZE = 200
+
 # Constants for import mapping
 COLUMN_MAPPING = {
     "stt": "row_number",
@@ -590,6 +594,47 @@ def pre_import_initialize(import_job_id: str, options: dict) -> None:
     logger.info(f"Import job {import_job_id}: Initialized default banks")
 
 
+def _complete_pending_onboarding(options: dict) -> None:
+    """Apply the deferred onboarding side effects of the employees created so far."""
+    employee_ids = options.get("_pending_onboarding_ids")
+    if employee_ids:
+        complete_onboarding(Employee.objects.filter(pk__in=employee_ids), note=_("Imported from file"))
+    # Only cleared once applied, so a failed batch is completed again with the next one
+    options.pop("_pending_onboarding_ids", None)
+
+
+def _defer_onboarding(employee: Employee, options: dict) -> None:
+    """Queue a created employee for bulk onboarding once its row is committed."""
+    options.setdefault("_pending_onboarding_ids", []).append(employee.pk)
+
+
+def _complete_full_onboarding_batch(options: dict) -> None:
+    """Complete the pending onboarding once a full batch of rows is committed."""
+    if len(options.get("_pending_onboarding_ids", [])) < ONBOARDING_BATCH_SIZE:
+        return
+    try:
+        _complete_pending_onboarding(options)
+    except Exception as e:  # noqa: BLE001
+        # The batch stays pending: it is retried with the next one and fails the job in on_import_end
+        logger.exception(f"Failed to complete the onboarding of imported employees: {e}")
+
+
+def on_import_end(import_job_id: str, options: dict) -> None:
+    """
+    Post-processing callback, called whether the import succeeded, failed or was cancelled.
+
+    Applies the onboarding side effects (user accounts, timesheets, payroll
+    records, HR report refresh) of the created employees that are still
+    pending. Errors are raised so that the import job fails.
+
+    Args:
+        import_job_id: UUID of the import job
+        options: Import options dictionary
+    """
+    _complete_pending_onboarding(options)
+    logger.info(f"Import job {import_job_id}: Completed onboarding of created employees")
+
+
 def extract_code_type(code: str) -> str:
     """
     Extract code_type from employee code.
@@ -1158,6 +1203,9 @@ def import_handler(row_index: int, row: list, import_job_id: str, options: dict)
                 "action": "skipped"
             }
     """
+    # Outside of the row transaction, so that a failed batch does not fail this row
+    _complete_full_onboarding_batch(options)
+
     try:
         row_dict, error_result = _validate_row(row_index, row, options)
         if error_result:
@@ -1216,8 +1264,11 @@ def import_handler(row_index: int, row: list, import_job_id: str, options: dict)
                     employee.save()
                     created = False
                 else:
-                    # CREATE case: Use objects.create (code is already in employee_data)
-                    employee = Employee.objects.create(**employee_data)
+                    # CREATE case: code is already in employee_data. The onboarding side
+                    # effects are applied in bulk (see _defer_onboarding)
+                    employee = Employee(**employee_data)
+                    employee._defer_onboarding = True  # type: ignore[attr-defined]
+                    employee.save(force_insert=True)
                     created = True
 
                 action = "created" if created else "updated"
@@ -1228,6 +1279,9 @@ def import_handler(row_index: int, row: list, import_job_id: str, options: dict)
                 # Handle bank accounts
                 _handle_bank_accounts(employee, row_dict, options)
 
+                if created:
+                    _defer_onboarding(employee, options)
+
                 return {
                     "ok": True,
                     "row_index": row_index,
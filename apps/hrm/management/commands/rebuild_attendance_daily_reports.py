@@ -0,0 +1,55 @@
+"""Management command to rebuild attendance daily reports over a date range.
+
+Useful for historical backfills, e.g. after attendance device logs were resynced.
+
+Usage:
+    python manage.py rebuild_attendance_daily_reports --from 2026-01-01 --to 2026-01-31
+    python manage.py rebuild_attendance_daily_reports --from 2026-01-01 --to 2026-01-31 --employee 12 --employee 15
+"""
+
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.hrm.services.attendance_report import rebuild_attendance_daily_reports
+
+
+class Command(BaseCommand):
+    help = "Rebuild attendance daily reports for a date range"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="start_date", type=date.fromisoformat, required=True)
+        parser.add_argument("--to", dest="end_date", type=date.fromisoformat, required=True)
+        parser.add_argument(
+            "--employee",
+            dest="employee_ids",
+            type=int,
+            action="append",
+            help="Only rebuild the reports of this employee ID (repeatable)",
+        )
+        parser.add_argument(
+            "--chunk-days",
+            type=int,
+            default=31,
+            help="Number of days rebuilt per transaction",
+        )
+
+    def handle(self, *args, **options):
+        start_date = options["start_date"]
+        end_date = options["end_date"]
+        chunk_days = options["chunk_days"]
+        if end_date < start_date:
+            raise CommandError("--to must not be before --from")
+        if chunk_days < 1:
+            raise CommandError("--chunk-days must be positive")
+
+        total = 0
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=chunk_days - 1), end_date)
+            count = rebuild_attendance_daily_reports(chunk_start, chunk_end, employee_ids=options["employee_ids"])
+            self.stdout.write(f"  {chunk_start} - {chunk_end}: {count} reports")
+            total += count
+            chunk_start = chunk_end + timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {total} attendance daily reports"))
@@ -1,7 +1,7 @@
 """Management command to update certificate statuses.
 
-This command updates the status field of all EmployeeCertificate records
-based on their expiry_date values according to these rules:
+This command updates the status field of the EmployeeCertificate records whose
+expiry_date crossed a threshold, according to these rules:
 
 - No expiry_date → VALID
 - Current date > expiry_date → EXPIRED
@@ -24,6 +24,7 @@ Recommended crontab entry to run daily at 2 AM:
 from django.core.management.base import BaseCommand
 
 from apps.hrm.models import EmployeeCertificate
+from apps.hrm.services.status_transitions import apply_certificate_status_transitions
 
 
 class Command(BaseCommand):
@@ -42,37 +43,21 @@ class Command(BaseCommand):
         if dry_run:
             self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be made"))
 
-        # Get all certificates
-        certificates = EmployeeCertificate.objects.all()
-        total_count = certificates.count()
+        result = apply_certificate_status_transitions(dry_run=dry_run)
+        Status = EmployeeCertificate.Status
 
-        self.stdout.write("Processing {} certificates...".format(total_count))
+        self.stdout.write("Processing {} certificates...".format(result.total_count))
 
-        updated_count = 0
-        status_changes = {"valid": 0, "near_expiry": 0, "expired": 0}
-
-        for certificate in certificates:
-            old_status = certificate.status
-            new_status = certificate.compute_status()
-
-            if old_status != new_status:
-                updated_count += 1
-                status_changes[new_status] += 1
-
-                self.stdout.write("Certificate {}: {} -> {}".format(certificate.id, old_status, new_status))
-
-                if not dry_run:
-                    certificate.status = new_status
-                    # Skip validation and signals by using update_fields
-                    certificate.save(update_fields=["status", "updated_at"])
+        for certificate_id, old_status, new_status in result.transitions:
+            self.stdout.write("Certificate {}: {} -> {}".format(certificate_id, old_status, new_status))
 
         # Summary
         self.stdout.write("\nSummary:")
-        self.stdout.write("Total certificates: {}".format(total_count))
-        self.stdout.write("Certificates updated: {}".format(updated_count))
-        self.stdout.write("  - Changed to VALID: {}".format(status_changes["valid"]))
-        self.stdout.write("  - Changed to NEAR_EXPIRY: {}".format(status_changes["near_expiry"]))
-        self.stdout.write("  - Changed to EXPIRED: {}".format(status_changes["expired"]))
+        self.stdout.write("Total certificates: {}".format(result.total_count))
+        self.stdout.write("Certificates updated: {}".format(result.updated_count))
+        self.stdout.write("  - Changed to VALID: {}".format(result.count_to(Status.VALID)))
+        self.stdout.write("  - Changed to NEAR_EXPIRY: {}".format(result.count_to(Status.NEAR_EXPIRY)))
+        self.stdout.write("  - Changed to EXPIRED: {}".format(result.count_to(Status.EXPIRED)))
 
         if dry_run:
             self.stdout.write(
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.6 on 2026-10-18 08:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hrm", "0005_alter_attendancedailyreport_options_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingAttendancePunch",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                (
+                    "attendance_type",
+                    models.CharField(
+                        choices=[
+                            ("biometric_device", "Biometric Device"),
+                            ("wifi", "WiFi"),
+                            ("geolocation", "GeoLocation"),
+                            ("other", "Other"),
+                        ],
+                        max_length=20,
+                        verbose_name="Attendance type",
+                    ),
+                ),
+                ("timestamp", models.DateTimeField(verbose_name="Timestamp")),
+                (
+                    "latitude",
+                    models.DecimalField(
+                        blank=True, decimal_places=17, max_digits=20, null=True, verbose_name="Latitude"
+                    ),
+                ),
+                (
+                    "longitude",
+                    models.DecimalField(
+                        blank=True, decimal_places=17, max_digits=20, null=True, verbose_name="Longitude"
+                    ),
+                ),
+                (
+                    "attendance_geolocation",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_attendance_punches",
+                        to="hrm.attendancegeolocation",
+                        verbose_name="Attendance geolocation",
+                    ),
+                ),
+                (
+                    "attendance_wifi_device",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_attendance_punches",
+                        to="hrm.attendancewifidevice",
+                        verbose_name="WiFi device",
+                    ),
+                ),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="pending_attendance_punches",
+                        to="hrm.employee",
+                        verbose_name="Employee",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Pending attendance punch",
+                "verbose_name_plural": "Pending attendance punches",
+                "db_table": "hrm_pending_attendance_punch",
+                "ordering": ["id"],
+            },
+        ),
+    ]
@@ -0,0 +1,92 @@
+# Generated by Django 5.2.6 on 2026-10-18 09:00
+
+import unicodedata
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations, models
+
+SEARCH_TEXT_SEPARATOR = " | "
+
+SEARCH_TEXT_FIELDS = {
+    "Employee": ("fullname", "code", "username", "email", "attendance_code", "phone", "citizen_id"),
+    "RecruitmentCandidate": ("name", "code", "email", "phone", "citizen_id"),
+}
+
+
+def normalize_search_text(value):
+    # Frozen copy of libs.strings.normalize_search_text
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFD", str(value).replace("\u0111", "d").replace("\u0110", "D"))
+    stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
+    return " ".join(stripped.lower().split())
+
+
+def backfill_search_text(apps, schema_editor):
+    for model_name, field_names in SEARCH_TEXT_FIELDS.items():
+        model = apps.get_model("hrm", model_name)
+        batch = []
+        for instance in model._default_manager.only("pk", *field_names).iterator(chunk_size=1000):
+            instance.search_text = SEARCH_TEXT_SEPARATOR.join(
+                normalize_search_text(getattr(instance, field_name)) for field_name in field_names
+            )
+            batch.append(instance)
+            if len(batch) >= 1000:
+                model._default_manager.bulk_update(batch, ["search_text"])
+                batch = []
+        if batch:
+            model._default_manager.bulk_update(batch, ["search_text"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("hrm", "0006_pendingattendancepunch"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employee",
+            name="search_text",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Normalized, unaccented values of the searchable fields",
+                verbose_name="Search text",
+            ),
+        ),
+        migrations.AddField(
+            model_name="recruitmentcandidate",
+            name="search_text",
+            field=models.TextField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Normalized, unaccented values of the searchable fields",
+                verbose_name="Search text",
+            ),
+        ),
+        migrations.RunPython(backfill_search_text, migrations.RunPython.noop),
+        TrigramExtension(),
+        # The indexes are left out of the model state: the SQLite test database is
+        # created from the models and has no GIN indexes.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.AddIndex(
+                    model_name="employee",
+                    index=GinIndex(
+                        fields=["search_text"], name="hrm_employee_search_text_trgm", opclasses=["gin_trgm_ops"]
+                    ),
+                ),
+                migrations.AddIndex(
+                    model_name="recruitmentcandidate",
+                    index=GinIndex(
+                        fields=["search_text"],
+                        name="hrm_recruitment_candidate_search_text_trgm",
+                        opclasses=["gin_trgm_ops"],
+                    ),
+                ),
+            ]
+        ),
+    ]
@@ -1,6 +1,7 @@
 from .attendance_device import AttendanceDevice
 from .attendance_exemption import AttendanceExemption
 from .attendance_geolocation import AttendanceGeolocation
+from .attendance_punch import PendingAttendancePunch
 from .attendance_record import AttendanceRecord
 from .attendance_report import AttendanceDailyReport
 from .attendance_wifi_device import AttendanceWifiDevice
@@ -52,6 +53,7 @@ __all__ = [
     "AttendanceRecord",
     "AttendanceDailyReport",
     "AttendanceWifiDevice",
+    "PendingAttendancePunch",
     "Bank",
     "BankAccount",
     "Branch",
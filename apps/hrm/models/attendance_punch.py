@@ -0,0 +1,75 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from apps.hrm.constants import AttendanceType
+from libs.models import BaseModel
+
+
+class PendingAttendancePunch(BaseModel):
+    """Mobile attendance punch accepted by the quick check-in endpoints.
+
+    Punches are appended here by the request and acknowledged immediately. The
+    `materialize_pending_attendance_punches` task turns them into AttendanceRecord
+    rows in batches, updates the timesheets, and removes them from this table.
+
+    Attributes:
+        employee: Employee who punched
+        attendance_type: Type of attendance (geolocation or wifi)
+        timestamp: Date and time when the punch was accepted
+        latitude: GeoLocation latitude coordinate (for geolocation punches)
+        longitude: GeoLocation longitude coordinate (for geolocation punches)
+        attendance_geolocation: Geolocation that contains the coordinates (for geolocation punches)
+        attendance_wifi_device: WiFi device matched by BSSID (for WiFi punches)
+    """
+
+    class Meta:
+        verbose_name = _("Pending attendance punch")
+        verbose_name_plural = _("Pending attendance punches")
+        db_table = "hrm_pending_attendance_punch"
+        ordering = ["id"]
+
+    employee = models.ForeignKey(
+        "Employee",
+        on_delete=models.CASCADE,
+        related_name="pending_attendance_punches",
+        verbose_name=_("Employee"),
+    )
+    attendance_type = models.CharField(
+        max_length=20,
+        choices=AttendanceType.choices,
+        verbose_name=_("Attendance type"),
+    )
+    timestamp = models.DateTimeField(verbose_name=_("Timestamp"))
+    latitude = models.DecimalField(
+        max_digits=20,
+        decimal_places=17,
+        null=True,
+        blank=True,
+        verbose_name=_("Latitude"),
+    )
+    longitude = models.DecimalField(
+        max_digits=20,
+        decimal_places=17,
+        null=True,
+        blank=True,
+        verbose_name=_("Longitude"),
+    )
+    attendance_geolocation = models.ForeignKey(
+        "AttendanceGeolocation",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="pending_attendance_punches",
+        verbose_name=_("Attendance geolocation"),
+    )
+    attendance_wifi_device = models.ForeignKey(
+        "AttendanceWifiDevice",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="pending_attendance_punches",
+        verbose_name=_("WiFi device"),
+    )
+
+    def __str__(self):
+        return f"{self.employee_id} - {self.attendance_type} - {self.timestamp}"
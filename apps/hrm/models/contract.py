@@ -63,6 +63,9 @@ class Contract(ColoredValueMixin, AutoCodeMixin, BaseModel):
     # Empty CODE_PREFIX because we use custom code generator (generate_contract_code)
     CODE_PREFIX = ""
 
+    # Days before the expiration date from which a contract is ABOUT_TO_EXPIRE
+    ABOUT_TO_EXPIRE_DAYS = 30
+
     code = models.CharField(
         max_length=50,
         unique=True,
@@ -437,7 +440,7 @@ class Contract(ColoredValueMixin, AutoCodeMixin, BaseModel):
         # Calculate days until expiration
         days_until_expiration = (self.expiration_date - today).days
 
-        if days_until_expiration <= 30:
+        if days_until_expiration <= self.ABOUT_TO_EXPIRE_DAYS:
             return self.ContractStatus.ABOUT_TO_EXPIRE
 
         return self.ContractStatus.ACTIVE
@@ -6,7 +6,14 @@ from django.utils.translation import gettext_lazy as _, pgettext_lazy
 
 from apps.audit_logging.decorators import audit_logging_register
 from libs.constants import ColorVariant
-from libs.models import AutoCodeMixin, BaseModel, ColoredValueMixin, SafeTextField
+from libs.models import (
+    AutoCodeMixin,
+    BaseModel,
+    ColoredValueMixin,
+    FieldTrackerMixin,
+    SafeTextField,
+    SearchTextMixin,
+)
 from libs.validators import CitizenIdValidator
 
 from ..constants import TEMP_CODE_PREFIX, EmployeeType
@@ -48,7 +55,7 @@ def generate_code(employee: "Employee", force_save: bool = True) -> None:
 
 
 @audit_logging_register
-class Employee(ColoredValueMixin, AutoCodeMixin, BaseModel):
+class Employee(ColoredValueMixin, AutoCodeMixin, SearchTextMixin, FieldTrackerMixin, BaseModel):
     """Employee model representing staff members in the organization.
 
     This model stores comprehensive employee information including personal details,
@@ -157,6 +164,8 @@ class Employee(ColoredValueMixin, AutoCodeMixin, BaseModel):
 
     CODE_PREFIX = "MV"
     TEMP_CODE_PREFIX = TEMP_CODE_PREFIX
+    SEARCH_TEXT_FIELDS = ("fullname", "code", "username", "email", "attendance_code", "phone", "citizen_id")
+    TRACKED_FIELDS = ("employee_type",)
 
     # Basic employee info
     code_type = models.CharField(
@@ -3,11 +3,11 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from apps.audit_logging.decorators import audit_logging_register
-from libs.models import BaseModel
+from libs.models import BaseModel, FieldTrackerMixin
 
 
 @audit_logging_register
-class Holiday(BaseModel):
+class Holiday(FieldTrackerMixin, BaseModel):
     """Holiday model representing non-working days.
 
     Attributes:
@@ -22,6 +22,8 @@ class Holiday(BaseModel):
     end_date = models.DateField(verbose_name=_("End date"))
     notes = models.TextField(blank=True, verbose_name=_("Notes"))
 
+    TRACKED_FIELDS = ("start_date", "end_date")
+
     class Meta:
         verbose_name = _("Holiday")
         verbose_name_plural = _("Holidays")
@@ -44,7 +46,7 @@ class Holiday(BaseModel):
 
 
 @audit_logging_register
-class CompensatoryWorkday(BaseModel):
+class CompensatoryWorkday(FieldTrackerMixin, BaseModel):
     """Compensatory Workday model representing working days to compensate for holidays.
 
     Attributes:
@@ -74,6 +76,8 @@ class CompensatoryWorkday(BaseModel):
     )
     notes = models.TextField(blank=True, verbose_name=_("Notes"))
 
+    TRACKED_FIELDS = ("date",)
+
     class Meta:
         verbose_name = _("Compensatory Workday")
         verbose_name_plural = _("Compensatory Workdays")
@@ -10,6 +10,7 @@ from django.utils.translation import gettext as _
 
 from apps.hrm.constants import TimesheetReason
 from apps.hrm.models.timesheet import TimeSheetEntry
+from apps.hrm.utils.timesheet_grid_cache import invalidate_timesheet_grid_cache
 from libs.decimals import DECIMAL_ZERO, quantize_decimal
 from libs.models.base_model_mixin import BaseReportModel
 from libs.models.fields import SafeTextField
@@ -294,4 +295,6 @@ class EmployeeMonthlyTimesheet(BaseReportModel):
 
         obj.save()
 
+        invalidate_timesheet_grid_cache(month_key)
+
         return obj
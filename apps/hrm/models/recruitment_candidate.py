@@ -4,18 +4,19 @@ from django.utils.translation import gettext_lazy as _
 
 from apps.audit_logging.decorators import audit_logging_register
 from libs import ColorVariant
-from libs.models import AutoCodeMixin, BaseModel, ColoredValueMixin
+from libs.models import AutoCodeMixin, BaseModel, ColoredValueMixin, SearchTextMixin
 from libs.validators import CitizenIdValidator
 
 from ..constants import TEMP_CODE_PREFIX
 
 
 @audit_logging_register
-class RecruitmentCandidate(ColoredValueMixin, AutoCodeMixin, BaseModel):
+class RecruitmentCandidate(ColoredValueMixin, AutoCodeMixin, SearchTextMixin, BaseModel):
     """Candidate applying for recruitment request"""
 
     CODE_PREFIX = "UV"
     TEMP_CODE_PREFIX = TEMP_CODE_PREFIX
+    SEARCH_TEXT_FIELDS = ("name", "code", "email", "phone", "citizen_id")
 
     class Status(models.TextChoices):
         CONTACTED = "CONTACTED", _("Contacted")
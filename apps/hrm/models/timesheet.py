@@ -1,6 +1,6 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from django.db import models
 from django.utils import timezone
@@ -22,6 +22,9 @@ from libs.constants import ColorVariant
 from libs.decimals import quantize_decimal
 from libs.models import AutoCodeMixin, BaseModel, ColoredValueMixin, SafeTextField
 
+if TYPE_CHECKING:
+    from apps.hrm.services.timesheet_snapshot_service import TimesheetSnapshotService
+
 
 @audit_logging_register
 class TimeSheetEntry(ColoredValueMixin, AutoCodeMixin, BaseModel):
@@ -248,6 +251,16 @@ class TimeSheetEntry(ColoredValueMixin, AutoCodeMixin, BaseModel):
         return False
 
     def clean(self) -> None:
+        self.compute_derived_fields()
+        super().clean()
+
+    def compute_derived_fields(self, snapshot_service: Optional["TimesheetSnapshotService"] = None) -> None:  # NOQA: C901
+        """Snapshot related data and calculate hours, status and working days.
+
+        This is what `clean()` runs before every save. Bulk paths call it directly with a
+        shared snapshot service (optionally preloaded for a date range) and persist the
+        entries with `bulk_update`.
+        """
         # Import local to avoid circular import (model <-> calculator)
         from apps.hrm.services.timesheet_calculator import TimesheetCalculator
         from apps.hrm.services.timesheet_snapshot_service import TimesheetSnapshotService
@@ -259,7 +272,8 @@ class TimeSheetEntry(ColoredValueMixin, AutoCodeMixin, BaseModel):
 
         # Ensure we have the latest snapshotted data (schedule, proposals, contract)
         # before running calculations.
-        snapshot_service = TimesheetSnapshotService()
+        if snapshot_service is None:
+            snapshot_service = TimesheetSnapshotService()
         snapshot_service.snapshot_data(self)
 
         # Ensure hours are quantized to 2 decimals and calculate derived fields
@@ -300,7 +314,7 @@ class TimeSheetEntry(ColoredValueMixin, AutoCodeMixin, BaseModel):
         is_finalizing = self._is_work_day_finalizing()
 
         # Run all calculations via calculator
-        calculator = TimesheetCalculator(self)
+        calculator = TimesheetCalculator(self, snapshot_service)
 
         # Calculate hours, overtime only when finalizing
         if is_finalizing:
@@ -315,8 +329,6 @@ class TimeSheetEntry(ColoredValueMixin, AutoCodeMixin, BaseModel):
         # Compute working_days according to business rules
         calculator.compute_working_days(is_finalizing=is_finalizing)
 
-        super().clean()
-
     @property
     def is_holiday(self) -> bool:
         return self.day_type == TimesheetDayType.HOLIDAY
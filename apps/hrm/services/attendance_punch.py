@@ -0,0 +1,129 @@
+"""Buffered ingestion of mobile attendance punches.
+
+The quick check-in endpoints only append a `PendingAttendancePunch` row and
+acknowledge the request. `materialize_pending_punches` later turns a batch of
+pending punches into AttendanceRecord rows with a single bulk insert carrying
+their final codes, updates timesheets once per (employee, date) and rebuilds
+the daily reports of the whole batch at once instead of once per punch.
+"""
+
+import logging
+from decimal import Decimal
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from apps.hrm.constants import AttendanceType
+from apps.hrm.models import AttendanceRecord, Employee, PendingAttendancePunch
+from apps.hrm.services.attendance_report import rebuild_attendance_daily_reports
+from apps.hrm.services.timesheets import trigger_timesheet_updates_from_records
+from libs.code_generation import assign_auto_codes, generate_model_code
+
+logger = logging.getLogger(__name__)
+
+MATERIALIZE_BATCH_SIZE = 500
+
+
+def buffer_geolocation_punch(
+    employee_id: int, latitude: Decimal, longitude: Decimal, attendance_geolocation_id: int
+) -> PendingAttendancePunch:
+    """Append a geolocation punch to the pending punch buffer.
+
+    Args:
+        employee_id: ID of the employee who punched
+        latitude: Latitude of the punch
+        longitude: Longitude of the punch
+        attendance_geolocation_id: ID of the geolocation that contains the coordinates
+
+    Returns:
+        The buffered PendingAttendancePunch
+    """
+    return PendingAttendancePunch.objects.create(
+        employee_id=employee_id,
+        attendance_type=AttendanceType.GEOLOCATION,
+        timestamp=timezone.now(),
+        latitude=latitude,
+        longitude=longitude,
+        attendance_geolocation_id=attendance_geolocation_id,
+    )
+
+
+def buffer_wifi_punch(employee_id: int, attendance_wifi_device_id: int) -> PendingAttendancePunch:
+    """Append a WiFi punch to the pending punch buffer.
+
+    Args:
+        employee_id: ID of the employee who punched
+        attendance_wifi_device_id: ID of the WiFi device matched by BSSID
+
+    Returns:
+        The buffered PendingAttendancePunch
+    """
+    return PendingAttendancePunch.objects.create(
+        employee_id=employee_id,
+        attendance_type=AttendanceType.WIFI,
+        timestamp=timezone.now(),
+        attendance_wifi_device_id=attendance_wifi_device_id,
+    )
+
+
+def materialize_pending_punches(batch_size: int = MATERIALIZE_BATCH_SIZE) -> int:
+    """Turn one batch of pending punches into attendance records.
+
+    Pending rows are locked with SKIP LOCKED so several workers can drain the
+    buffer concurrently without processing the same punch twice.
+
+    Args:
+        batch_size: Maximum number of punches to process
+
+    Returns:
+        Number of attendance records created
+    """
+    with transaction.atomic():
+        punches = list(PendingAttendancePunch.objects.select_for_update(skip_locked=True).order_by("id")[:batch_size])
+        if not punches:
+            return 0
+
+        attendance_codes = dict(
+            Employee.objects.filter(id__in={punch.employee_id for punch in punches}).values_list(
+                "id", "attendance_code"
+            )
+        )
+
+        records = [
+            AttendanceRecord(
+                attendance_type=punch.attendance_type,
+                employee_id=punch.employee_id,
+                attendance_code=attendance_codes.get(punch.employee_id) or "",
+                timestamp=punch.timestamp,
+                latitude=punch.latitude,
+                longitude=punch.longitude,
+                attendance_geolocation_id=punch.attendance_geolocation_id,
+                attendance_wifi_device_id=punch.attendance_wifi_device_id,
+                is_valid=True,
+            )
+            for punch in punches
+        ]
+
+        # bulk_create bypasses save() and post_save, so codes and side effects are handled here
+        if assign_auto_codes(records):
+            AttendanceRecord.objects.bulk_create(records)
+        else:
+            for record in records:
+                record.code = f"{AttendanceRecord.TEMP_CODE_PREFIX}{get_random_string(20)}"
+            records = AttendanceRecord.objects.bulk_create(records)
+            for record in records:
+                record.code = generate_model_code(record)
+            AttendanceRecord.objects.bulk_update(records, ["code"])
+
+        PendingAttendancePunch.objects.filter(id__in=[punch.id for punch in punches]).delete()
+
+        trigger_timesheet_updates_from_records(records)
+
+        report_dates = {timezone.localdate(record.timestamp) for record in records}
+        rebuild_attendance_daily_reports(
+            min(report_dates), max(report_dates), employee_ids={record.employee_id for record in records}
+        )
+
+    logger.info("Materialized %s pending attendance punches", len(records))
+    return len(records)
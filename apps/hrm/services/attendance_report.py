@@ -1,75 +1,134 @@
 import logging
-from datetime import date
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, Optional
 
-from apps.hrm.models import (
-    AttendanceDailyReport,
-    AttendanceRecord,
-    Employee,
-)
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber, TruncDate
+from django.utils import timezone
+
+from apps.hrm.models import AttendanceDailyReport, AttendanceRecord
 
 logger = logging.getLogger(__name__)
 
 
-def aggregate_attendance_daily_report(employee_id: int, report_date: date) -> None:
-    """Aggregate attendance data for a specific employee and date.
+def get_local_day_range(start_date: date, end_date: date) -> tuple[datetime, datetime]:
+    """Return the half-open `[start, end)` timestamp range covering the given days.
+
+    Days are taken in the current (company) timezone, so filtering on the range
+    can use the timestamp index, unlike `timestamp__date` which casts the column.
+    """
+    start = timezone.make_aware(datetime.combine(start_date, time.min))
+    end = timezone.make_aware(datetime.combine(end_date + timedelta(days=1), time.min))
+    return start, end
+
+
+def rebuild_attendance_daily_reports(
+    start_date: date,
+    end_date: date,
+    employee_ids: Optional[Iterable[int]] = None,
+) -> int:
+    """Rebuild the attendance daily reports of a date range.
 
-    Finds the first attendance record for the employee on the given date.
-    Determines the organizational structure (branch, block, department) valid at that date.
-    Creates or updates the AttendanceDailyReport.
+    The first valid attendance record per employee and day is selected for the
+    whole range in one windowed query, then the reports of the range (limited to
+    `employee_ids` when given) are replaced in bulk. Also used for historical
+    backfills, e.g. after device logs were resynced.
+
+    The organizational structure (branch, block, department) is taken from the
+    current employee data, as it is the source of truth.
 
     Args:
-        employee_id: ID of the employee
-        report_date: Date to aggregate
+        start_date: First day to rebuild
+        end_date: Last day to rebuild (inclusive)
+        employee_ids: Restrict the rebuild to these employees
+
+    Returns:
+        int: Number of reports created
     """
-    # Find all attendance records for the employee on the date
-    records = (
-        AttendanceRecord.objects.filter(
-            employee_id=employee_id,
-            timestamp__date=report_date,
-            is_valid=True,
-        )
-        .select_related("attendance_geolocation")
-        .order_by("timestamp")
+    range_start, range_end = get_local_day_range(start_date, end_date)
+    if employee_ids is not None:
+        employee_ids = list(employee_ids)
+
+    records = AttendanceRecord.objects.filter(
+        timestamp__gte=range_start,
+        timestamp__lt=range_end,
+        is_valid=True,
+        employee_id__isnull=False,
     )
+    reports = AttendanceDailyReport.objects.filter(report_date__gte=start_date, report_date__lte=end_date)
+    if employee_ids is not None:
+        records = records.filter(employee_id__in=employee_ids)
+        reports = reports.filter(employee_id__in=employee_ids)
 
-    first_record = records.first()
+    first_records = (
+        records.annotate(
+            local_date=TruncDate("timestamp", tzinfo=timezone.get_current_timezone()),
+            row_number=Window(
+                expression=RowNumber(),
+                partition_by=[F("employee_id"), F("local_date")],
+                order_by=[F("timestamp").asc(), F("id").asc()],
+            ),
+        )
+        .filter(row_number=1)
+        .values_list(
+            "id",
+            "employee_id",
+            "local_date",
+            "attendance_type",
+            "attendance_geolocation__project_id",
+            "employee__branch_id",
+            "employee__block_id",
+            "employee__department_id",
+        )
+    )
 
-    if not first_record:
-        # No attendance records, delete existing report if any
-        AttendanceDailyReport.objects.filter(
+    new_reports = [
+        AttendanceDailyReport(
             employee_id=employee_id,
             report_date=report_date,
-        ).delete()
-        return
-
-    # Determine organization info at the time of report_date
-    # Always use current employee data as it is the source of truth
-    try:
-        employee = Employee.objects.get(id=employee_id)
-        branch_id = employee.branch_id
-        block_id = employee.block_id
-        department_id = employee.department_id
-    except Employee.DoesNotExist:
-        logger.error(f"Employee {employee_id} not found during aggregation")
-        return
-
-    # Determine project from attendance record's geolocation
-    project_id = None
-    if first_record.attendance_geolocation:
-        project_id = first_record.attendance_geolocation.project_id
-
-    # Create or update the report
-    record, _ = AttendanceDailyReport.objects.get_or_create(
-        employee_id=employee_id,
-        report_date=report_date,
+            branch_id=branch_id,
+            block_id=block_id,
+            department_id=department_id,
+            project_id=project_id,
+            attendance_method=attendance_type,
+            attendance_record_id=record_id,
+        )
+        for (
+            record_id,
+            employee_id,
+            report_date,
+            attendance_type,
+            project_id,
+            branch_id,
+            block_id,
+            department_id,
+        ) in first_records
+    ]
+
+    with transaction.atomic():
+        reports.delete()
+        AttendanceDailyReport.objects.bulk_create(new_reports, batch_size=1000)
+
+    logger.info(
+        "Rebuilt %d attendance daily reports from %s to %s%s",
+        len(new_reports),
+        start_date,
+        end_date,
+        f" for {len(employee_ids)} employee(s)" if employee_ids is not None else "",
     )
+    return len(new_reports)
+
 
-    # Ensure record's attributes always be set using latest values.
-    record.branch_id = branch_id
-    record.block_id = block_id
-    record.department_id = department_id
-    record.project_id = project_id
-    record.attendance_method = first_record.attendance_type
-    record.attendance_record = first_record
+def aggregate_attendance_daily_report(employee_id: int, report_date: date) -> None:
+    """Aggregate attendance data for a specific employee and date.
 
-    record.save()
+    Finds the first attendance record for the employee on the given date and
+    replaces the AttendanceDailyReport with it, or deletes the report when the
+    employee has no valid record that day.
+
+    Args:
+        employee_id: ID of the employee
+        report_date: Date to aggregate
+    """
+    rebuild_attendance_daily_reports(report_date, report_date, employee_ids=[employee_id])
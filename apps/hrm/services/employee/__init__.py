@@ -1,6 +1,8 @@
 """Employee services module."""
 
+from .onboarding import bulk_onboard_employees, complete_onboarding, create_users_for_employees
 from .work_history import (
+    build_state_change_event,
     create_contract_change_event,
     create_employee_type_change_event,
     create_position_change_event,
@@ -9,6 +11,10 @@ from .work_history import (
 )
 
 __all__ = [
+    "bulk_onboard_employees",
+    "complete_onboarding",
+    "create_users_for_employees",
+    "build_state_change_event",
     "create_state_change_event",
     "create_position_change_event",
     "create_transfer_event",
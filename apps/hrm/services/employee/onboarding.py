@@ -0,0 +1,279 @@
+"""Bulk onboarding of new employees.
+
+Saving a new Employee runs its post_save chain once per person: the user
+account (default role lookup, insert, employee re-save), a timesheet
+preparation task, the initial work history with its report aggregation task,
+the payroll records of an open period and an audit event. The functions below
+perform the same side effects for a batch of hires with set-based queries,
+one report refresh task and one audit batch. Only the payroll slips of an
+open salary period are still calculated one by one.
+
+Employees saved one by one can skip the per-instance side effects by setting
+`_defer_onboarding = True` on the instance before the first save, and have
+them applied later in bulk with `complete_onboarding`.
+"""
+
+import logging
+from collections import defaultdict
+from typing import List, Sequence
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+
+from apps.audit_logging import LogAction, batch_audit_context
+from apps.core.models import Role
+from apps.hrm.models import Department, Employee, EmployeeWorkHistory
+from apps.hrm.models.employee import generate_code
+from apps.hrm.services.timesheets import create_timesheets_for_new_employees
+from apps.hrm.tasks.reports_hr import aggregate_hr_reports_for_org_units
+from apps.payroll.models import KPIAssessmentPeriod, PayrollSlip, SalaryPeriod
+from apps.payroll.models.payroll_slip import generate_payroll_slip_code
+from apps.payroll.services.payroll_calculation import PayrollCalculationService
+from apps.payroll.utils import create_assessments_for_new_employees
+from libs.code_generation import assign_auto_codes, is_temp_code
+from libs.models import reset_tracked_values
+
+from .work_history import build_state_change_event
+
+logger = logging.getLogger(__name__)
+
+User = get_user_model()
+
+
+def build_user_for_employee(employee: Employee, role: Role | None):
+    """Build the unsaved user account of an employee.
+
+    The password is unusable (the employee sets one through the password reset
+    flow), so no hashing work is done.
+    """
+    names = employee.fullname.split() if employee.fullname else []
+    return User(
+        username=employee.username,
+        email=User.objects.normalize_email(employee.email),
+        password=make_password(None),
+        first_name=names[0] if names else "",
+        last_name=" ".join(names[1:]),
+        phone_number=employee.phone,
+        role=role,
+    )
+
+
+def create_users_for_employees(employees: Sequence[Employee]) -> List[Employee]:
+    """Create the missing user accounts of employees with one insert.
+
+    The users are assigned to the employees but the employees are not saved.
+
+    Returns:
+        The employees that received a new user
+    """
+    pending = [employee for employee in employees if employee.user_id is None]
+    if not pending:
+        return []
+
+    default_role = Role.objects.filter(is_default_role=True).first()
+    users = User.objects.bulk_create([build_user_for_employee(employee, default_role) for employee in pending])
+    for employee, user in zip(pending, users, strict=True):
+        employee.user = user
+    return pending
+
+
+def _create_initial_work_histories(employees: Sequence[Employee], note: str) -> None:
+    # Employees that already have a history (e.g. a retried batch) are skipped
+    with_history = set(
+        EmployeeWorkHistory.objects.filter(employee__in=employees).values_list("employee_id", flat=True)
+    )
+    events = []
+    for employee in employees:
+        if employee.pk in with_history:
+            continue
+        event = build_state_change_event(
+            employee=employee,
+            old_status=None,
+            new_status=employee.status,
+            effective_date=employee.start_date or timezone.localdate(),
+            note=note,
+        )
+        event.branch_id = employee.branch_id
+        event.block_id = employee.block_id
+        event.department_id = employee.department_id
+        event.position_id = employee.position_id
+        events.append(event)
+    EmployeeWorkHistory.objects.bulk_create(events, batch_size=1000)
+
+
+def _schedule_hr_reports_refresh(employees: Sequence[Employee]) -> None:
+    # Covers the histories created here and those saved with the deferred employees
+    units = (
+        EmployeeWorkHistory.objects.filter(
+            employee__in=employees, branch__isnull=False, block__isnull=False, department__isnull=False
+        )
+        .order_by()
+        .values_list("date", "branch_id", "block_id", "department_id")
+        .distinct()
+    )
+    units = sorted(
+        [day.isoformat(), branch_id, block_id, department_id] for day, branch_id, block_id, department_id in units
+    )
+    if units:
+        transaction.on_commit(lambda: aggregate_hr_reports_for_org_units.delay(units))
+
+
+def _create_payroll_slips(salary_period: SalaryPeriod, employees: Sequence[Employee]) -> None:
+    with_slip = set(
+        PayrollSlip.objects.filter(salary_period=salary_period, employee__in=employees).values_list(
+            "employee_id", flat=True
+        )
+    )
+    slips = [
+        PayrollSlip(salary_period=salary_period, employee=employee)
+        for employee in employees
+        if employee.pk not in with_slip
+    ]
+    if not slips:
+        return
+
+    needs_final_codes = not assign_auto_codes(slips)
+    if needs_final_codes:
+        for slip in slips:
+            slip.code = f"{PayrollSlip.TEMP_CODE_PREFIX}{get_random_string(20)}"
+    PayrollSlip.objects.bulk_create(slips, batch_size=1000)
+    if needs_final_codes:
+        for slip in slips:
+            generate_payroll_slip_code(slip, force_save=False)
+        PayrollSlip.objects.bulk_update(slips, ["code"], batch_size=1000)
+
+    with batch_audit_context(action=LogAction.ADD, model_class=PayrollSlip) as batch:
+        batch.log_objects(LogAction.ADD, slips)
+
+    # The calculation reads each employee's contract, timesheet, KPI grade, sales,
+    # expenses and vouchers, so every slip is still calculated on its own
+    for slip in slips:
+        try:
+            PayrollCalculationService(slip).calculate()
+        except (KeyError, ValueError) as e:
+            logger.warning("Could not calculate payroll for employee %s: %s", slip.employee.code, e)
+
+    salary_period.total_employees = salary_period.payroll_slips.count()
+    salary_period.save(update_fields=["total_employees"])
+    salary_period.update_statistics()
+
+
+def _create_payroll_records(employees: Sequence[Employee]) -> None:
+    """Create the KPI assessments and payroll slips of hires starting in an open period."""
+    employees_by_month = defaultdict(list)
+    for employee in employees:
+        if employee.start_date:
+            employees_by_month[employee.start_date.replace(day=1)].append(employee)
+    if not employees_by_month:
+        return
+
+    for kpi_period in KPIAssessmentPeriod.objects.filter(month__in=employees_by_month, finalized=False):
+        create_assessments_for_new_employees(kpi_period, employees_by_month[kpi_period.month])
+    for salary_period in SalaryPeriod.objects.filter(month__in=employees_by_month).exclude(
+        status=SalaryPeriod.Status.COMPLETED
+    ):
+        _create_payroll_slips(salary_period, employees_by_month[salary_period.month])
+
+
+@transaction.atomic
+def complete_onboarding(employees: Sequence[Employee], note: str = "") -> None:
+    """Apply the onboarding side effects to newly inserted employees in bulk.
+
+    Creates the missing user accounts, the initial work history records, the
+    current month's timesheets of working employees and the payroll records of
+    an open period, then schedules one HR report refresh for all the hires.
+    Employees that already have a user or a work history keep them, so a
+    batch can safely be completed again.
+
+    Args:
+        employees: Saved employees (e.g. created with `_defer_onboarding`)
+        note: Note of the initial work history records
+    """
+    employees = list(employees)
+    if not employees:
+        return
+    for employee in employees:
+        employee.__dict__.pop("_defer_onboarding", None)
+
+    linked = create_users_for_employees(employees)
+    if linked:
+        Employee.objects.bulk_update(linked, ["user"], batch_size=1000)
+
+    _create_initial_work_histories(employees, note)
+
+    working_statuses = Employee.Status.get_working_statuses()
+    create_timesheets_for_new_employees([employee.pk for employee in employees if employee.status in working_statuses])
+
+    _create_payroll_records(employees)
+    _schedule_hr_reports_refresh(employees)
+
+    logger.info("Completed onboarding of %d employee(s), %d user(s) created", len(employees), len(linked))
+
+
+def _assign_codes(employees: Sequence[Employee]) -> bool:
+    """Assign final codes before the insert, or temporary ones to finalize after it."""
+    if assign_auto_codes(employees):
+        return False
+    for employee in employees:
+        if not employee.code:
+            employee.code = f"{Employee.TEMP_CODE_PREFIX}{get_random_string(20)}"
+    return True
+
+
+@transaction.atomic
+def bulk_onboard_employees(employees: Sequence[Employee], note: str = "", **audit_fields) -> List[Employee]:
+    """Insert new employees and apply their onboarding side effects in bulk.
+
+    The employees are validated like in `Employee.save()` (organizational
+    fields derived from the department, `clean()`), inserted together with
+    their user accounts using a few set-based queries, then completed with
+    `complete_onboarding`. The whole batch is logged as one audit batch.
+
+    Args:
+        employees: Unsaved Employee instances
+        note: Note of the initial work history records
+        **audit_fields: Extra fields attached to each audit log of the batch
+
+    Returns:
+        The saved employees
+
+    Raises:
+        ValidationError: If an employee fails validation (nothing is saved)
+    """
+    employees = list(employees)
+    if not employees:
+        return []
+
+    departments = Department.objects.in_bulk(
+        {employee.department_id for employee in employees if employee.department_id}
+    )
+    for employee in employees:
+        if employee.department_id:
+            employee.department = departments[employee.department_id]
+            employee.block_id = employee.department.block_id
+            employee.branch_id = employee.department.branch_id
+        employee.clean()
+
+    create_users_for_employees(employees)
+    needs_final_codes = _assign_codes(employees)
+    for employee in employees:
+        employee.update_search_text()
+    Employee.objects.bulk_create(employees, batch_size=1000)
+
+    if needs_final_codes:
+        temp_coded = [employee for employee in employees if is_temp_code(employee)]
+        for employee in temp_coded:
+            generate_code(employee, force_save=False)
+            employee.update_search_text()
+        Employee.objects.bulk_update(temp_coded, ["code", "search_text"], batch_size=1000)
+    reset_tracked_values(employees)
+
+    complete_onboarding(employees, note=note)
+
+    with batch_audit_context(action=LogAction.ADD, model_class=Employee, **audit_fields) as batch:
+        batch.log_objects(LogAction.ADD, employees)
+
+    return employees
@@ -10,7 +10,7 @@ from django.utils.translation import gettext_lazy as _
 from apps.hrm.models import EmployeeWorkHistory
 
 
-def create_state_change_event(
+def build_state_change_event(
     employee,
     old_status,
     new_status,
@@ -21,21 +21,11 @@ def create_state_change_event(
     extra_detail=None,
     decision=None,
 ):
-    """Create a state change event in employee work history.
-
-    Args:
-        employee: Employee instance
-        old_status: Previous employee status (can be None for new employees)
-        new_status: New employee status
-        effective_date: Date when the status change takes effect
-        start_date: Optional start date for the event period (e.g., leave start date)
-        end_date: Optional end date for the event period (e.g., leave end date)
-        note: Optional additional notes
-        extra_detail: Optional string to append to the detail description
-        decision: Optional Decision instance associated with this event
+    """Build an unsaved state change event, e.g. for `bulk_create`.
 
-    Returns:
-        EmployeeWorkHistory: The created work history record
+    Takes the same arguments as `create_state_change_event`. Unlike `save()`,
+    `bulk_create` does not copy the organizational fields from the employee,
+    so callers writing in bulk must set them.
     """
     previous_data = {"status": old_status}
 
@@ -52,7 +42,7 @@ def create_state_change_event(
     if extra_detail:
         detail = f"{detail}. {extra_detail}"
 
-    return EmployeeWorkHistory.objects.create(
+    return EmployeeWorkHistory(
         employee=employee,
         name=EmployeeWorkHistory.EventType.CHANGE_STATUS,
         date=effective_date,
@@ -66,6 +56,48 @@ def create_state_change_event(
     )
 
 
+def create_state_change_event(
+    employee,
+    old_status,
+    new_status,
+    effective_date,
+    start_date=None,
+    end_date=None,
+    note=None,
+    extra_detail=None,
+    decision=None,
+):
+    """Create a state change event in employee work history.
+
+    Args:
+        employee: Employee instance
+        old_status: Previous employee status (can be None for new employees)
+        new_status: New employee status
+        effective_date: Date when the status change takes effect
+        start_date: Optional start date for the event period (e.g., leave start date)
+        end_date: Optional end date for the event period (e.g., leave end date)
+        note: Optional additional notes
+        extra_detail: Optional string to append to the detail description
+        decision: Optional Decision instance associated with this event
+
+    Returns:
+        EmployeeWorkHistory: The created work history record
+    """
+    event = build_state_change_event(
+        employee,
+        old_status,
+        new_status,
+        effective_date,
+        start_date=start_date,
+        end_date=end_date,
+        note=note,
+        extra_detail=extra_detail,
+        decision=decision,
+    )
+    event.save(force_insert=True)
+    return event
+
+
 def create_position_change_event(
     employee,
     old_position,
@@ -0,0 +1,183 @@
+"""Bulk approval and rejection of proposals.
+
+Changing the status of one proposal fires its own notification, timesheet trigger,
+dashboard cache invalidation and monthly timesheet refresh (with the payroll
+recalculation that follows). `bulk_change_proposal_status` saves every proposal
+with those signals held back (`_bulk_status_change`), executes them grouped by type
+and employee, and then issues the downstream work once per affected employee-month.
+"""
+
+import logging
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Dict, List, Optional, Sequence
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from apps.hrm.constants import ProposalStatus, ProposalType
+from apps.hrm.models import Employee, Proposal
+from apps.hrm.services.proposal_notifications import send_proposal_status_summary_notification
+from apps.hrm.services.proposal_service import ProposalService
+from apps.hrm.services.timesheets import defer_monthly_timesheet_refresh
+from apps.hrm.tasks.timesheet_triggers import TIMESHEET_AFFECTING_PROPOSAL_TYPES, process_employee_proposal_changes
+from apps.hrm.utils.dashboard_cache import invalidate_hrm_dashboard_cache
+from apps.hrm.utils.timesheet_grid_cache import invalidate_timesheet_grid_cache
+
+logger = logging.getLogger(__name__)
+
+BULK_PROPOSAL_MAX_IDS = 500
+
+
+@dataclass
+class BulkProposalResult:
+    """Outcome of one proposal in a bulk status change."""
+
+    id: int
+    success: bool
+    error: Optional[str] = None
+
+
+def bulk_change_proposal_status(
+    queryset: QuerySet,
+    proposal_ids: Sequence[int],
+    approve: bool,
+    approved_by: Optional[Employee] = None,
+    approval_note: Optional[str] = None,
+) -> List[BulkProposalResult]:
+    """Approve or reject several proposals at once.
+
+    Proposals that cannot change status are reported individually and do not stop
+    the others. As with the single approve endpoint, a failure while executing an
+    approved proposal is logged and the approval is kept.
+
+    Args:
+        queryset: Proposals the caller may act on (data scope and type already applied)
+        proposal_ids: IDs of the proposals to change
+        approve: True to approve, False to reject
+        approved_by: Employee recorded as approver
+        approval_note: Note stored on every proposal
+
+    Returns:
+        One result per distinct id, in request order
+    """
+    ordered_ids = list(dict.fromkeys(proposal_ids))
+    proposals = {
+        proposal.id: proposal
+        for proposal in queryset.filter(id__in=ordered_ids).select_related("created_by__user", "approved_by__user")
+    }
+
+    results: Dict[int, BulkProposalResult] = {}
+    pending = []
+    for proposal_id in ordered_ids:
+        proposal = proposals.get(proposal_id)
+        error = _validate_proposal(proposal, approve)
+        if error:
+            results[proposal_id] = BulkProposalResult(id=proposal_id, success=False, error=error)
+        else:
+            pending.append(proposal)
+
+    # Group by type and employee-month so each group's timesheet writes hit the same rows
+    pending.sort(key=lambda proposal: (proposal.proposal_type, proposal.created_by_id, proposal.proposal_date))
+
+    approved_at = timezone.now()
+    target_status = ProposalStatus.APPROVED if approve else ProposalStatus.REJECTED
+    changed = []
+    with transaction.atomic(), defer_monthly_timesheet_refresh():
+        for proposal in pending:
+            error = _save_status(proposal, target_status, approved_at, approved_by, approval_note)
+            if error:
+                results[proposal.id] = BulkProposalResult(id=proposal.id, success=False, error=error)
+                continue
+
+            if approve:
+                try:
+                    ProposalService.execute_approved_proposal(proposal)
+                except Exception as e:
+                    # The proposal is already approved, so we should not rollback
+                    logger.error(f"Failed to execute proposal {proposal.id}: {str(e)}", exc_info=True)
+
+            results[proposal.id] = BulkProposalResult(id=proposal.id, success=True)
+            changed.append(proposal)
+
+        if changed:
+            _dispatch_downstream_effects(changed, approve)
+
+    return [results[proposal_id] for proposal_id in ordered_ids]
+
+
+def _validate_proposal(proposal: Optional[Proposal], approve: bool) -> Optional[str]:
+    if proposal is None:
+        return _("Proposal not found")
+
+    if proposal.proposal_status != ProposalStatus.PENDING:
+        return _("Proposal has already been approved/rejected")
+
+    if approve and proposal.proposal_type == ProposalType.TIMESHEET_ENTRY_COMPLAINT:
+        # The single approve endpoint requires the approved times, which a bulk request cannot carry
+        if not (
+            proposal.timesheet_entry_complaint_approved_check_in_time
+            and proposal.timesheet_entry_complaint_approved_check_out_time
+        ):
+            return _("Approved check-in and check-out times are required")
+
+    return None
+
+
+def _save_status(
+    proposal: Proposal,
+    target_status: str,
+    approved_at,
+    approved_by: Optional[Employee],
+    approval_note: Optional[str],
+) -> Optional[str]:
+    proposal.proposal_status = target_status
+    proposal.approved_at = approved_at
+    if approved_by:
+        proposal.approved_by = approved_by
+    if approval_note is not None:
+        proposal.approval_note = approval_note
+    proposal._bulk_status_change = True  # type: ignore[attr-defined]
+
+    try:
+        with transaction.atomic():
+            proposal.save()
+    except DjangoValidationError as e:
+        return "; ".join(e.messages)
+    return None
+
+
+def _dispatch_downstream_effects(proposals: List[Proposal], approved: bool) -> None:
+    """Issue the work held back from the per-proposal signals once per employee(-month)."""
+    invalidate_hrm_dashboard_cache()
+
+    def employee_month(proposal):
+        return proposal.created_by_id, proposal.proposal_date.replace(day=1)
+
+    for _key, group in groupby(sorted(proposals, key=employee_month), key=employee_month):
+        send_proposal_status_summary_notification(list(group), approved)
+
+    # The timesheet grid flags the entries with a pending complaint
+    complaint_dates = [
+        proposal.timesheet_entry_complaint_complaint_date
+        for proposal in proposals
+        if proposal.proposal_type == ProposalType.TIMESHEET_ENTRY_COMPLAINT
+        and proposal.timesheet_entry_complaint_complaint_date
+    ]
+    complaint_month_keys = {f"{day.year:04d}{day.month:02d}" for day in complaint_dates}
+    for month_key in complaint_month_keys:
+        transaction.on_commit(lambda key=month_key: invalidate_timesheet_grid_cache(key))
+
+    if not approved:
+        return
+
+    timesheet_proposal_ids: Dict[int, List[int]] = {}
+    for proposal in proposals:
+        if proposal.created_by_id and proposal.proposal_type in TIMESHEET_AFFECTING_PROPOSAL_TYPES:
+            timesheet_proposal_ids.setdefault(proposal.created_by_id, []).append(proposal.id)
+
+    for proposal_ids in timesheet_proposal_ids.values():
+        transaction.on_commit(lambda ids=proposal_ids: process_employee_proposal_changes.delay(ids))
@@ -0,0 +1,90 @@
+"""Notifications sent to employees when HR approves or rejects their proposals."""
+
+from typing import Sequence
+
+from django.utils.translation import gettext as _
+
+from apps.core.models import UserDevice
+from apps.hrm.constants import ProposalType
+from apps.hrm.models import Proposal
+from apps.notifications.utils import create_notification
+
+
+def _get_actor(proposal: Proposal, recipient):
+    # Fallback to recipient if no actor, but ideally should be system or HR user
+    if proposal.approved_by and proposal.approved_by.user:
+        return proposal.approved_by.user
+    return recipient
+
+
+def send_proposal_status_notification(proposal: Proposal, approved: bool) -> None:
+    """Notify the creator of a proposal that HR approved or rejected it."""
+    recipient = proposal.created_by.user
+    if not recipient:
+        return
+
+    # Scenario A: Timekeeping Complaint
+    if proposal.proposal_type == ProposalType.TIMESHEET_ENTRY_COMPLAINT:
+        if approved:
+            message = _("Your timekeeping complaint has been approved by HR.")
+        else:
+            note = proposal.approval_note or ""
+            message = _('Your timekeeping complaint was rejected by HR with note: "%(note)s"..') % {"note": note}
+
+    # Scenario B: General Proposal
+    else:
+        proposal_type_display = proposal.get_proposal_type_display()
+        if approved:
+            message = _("Your %(proposal_type)s proposal has been approved by HR.") % {
+                "proposal_type": proposal_type_display
+            }
+        else:
+            note = proposal.approval_note or ""
+            message = _('Your %(proposal_type)s proposal was rejected by HR with note: "%(note)s"..') % {
+                "note": note,
+                "proposal_type": proposal_type_display,
+            }
+
+    create_notification(
+        actor=_get_actor(proposal, recipient),
+        recipient=recipient,
+        verb="updated" if approved else "rejected",
+        target=proposal,
+        message=message,
+        target_client=UserDevice.Client.MOBILE,
+    )
+
+
+def send_proposal_status_summary_notification(proposals: Sequence[Proposal], approved: bool) -> None:
+    """Notify the creator of several proposals with one message.
+
+    All proposals must belong to the same employee. A single proposal gets the
+    regular per-proposal notification.
+    """
+    if not proposals:
+        return
+    if len(proposals) == 1:
+        send_proposal_status_notification(proposals[0], approved)
+        return
+
+    first = proposals[0]
+    recipient = first.created_by.user
+    if not recipient:
+        return
+
+    if approved:
+        message = _("%(count)s of your proposals have been approved by HR.") % {"count": len(proposals)}
+    else:
+        message = _('%(count)s of your proposals were rejected by HR with note: "%(note)s".') % {
+            "count": len(proposals),
+            "note": first.approval_note or "",
+        }
+
+    create_notification(
+        actor=_get_actor(first, recipient),
+        recipient=recipient,
+        verb="updated" if approved else "rejected",
+        message=message,
+        extra_data={"proposal_ids": [proposal.id for proposal in proposals]},
+        target_client=UserDevice.Client.MOBILE,
+    )
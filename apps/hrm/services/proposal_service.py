@@ -8,6 +8,17 @@ from apps.core.models import UserDevice
 from apps.core.utils.jwt import bump_user_mobile_token_version, revoke_user_outstanding_tokens
 from apps.hrm.constants import ProposalType, TimesheetReason
 from apps.hrm.models import Employee, Proposal, ProposalOvertimeEntry, ProposalTimeSheetEntry, TimeSheetEntry
+from apps.hrm.services.timesheet_snapshot_service import TimesheetSnapshotService
+from apps.hrm.services.timesheets import mark_monthly_timesheets_for_refresh
+from apps.hrm.tasks.timesheets import link_timesheet_entries_to_proposal_task
+from apps.hrm.utils.attendance_registry import invalidate_attendance_user_registry
+
+# Fields written back when a leave proposal is executed over a date range
+LEAVE_EXECUTION_UPDATE_FIELDS = [
+    field.name
+    for field in TimeSheetEntry._meta.concrete_fields
+    if not field.primary_key and field.name not in ("employee", "date", "created_at")
+]
 
 
 class ProposalExecutionError(Exception):
@@ -61,10 +72,11 @@ class ProposalService:
         This is mutual for all LEAVE proposals (PAID_LEAVE, UNPAID_LEAVE, MATERNITY_LEAVE).
 
         For leave proposals (PAID_LEAVE, UNPAID_LEAVE, MATERNITY_LEAVE), this method:
-        1. Iterates through the date range from start_date to end_date
-        2. Finds or creates a TimesheetEntry for each date
-        3. Sets status=ABSENT and absent_reason based on proposal type
-        4. Handles full_day vs morning/afternoon shifts
+        1. Loads the existing TimesheetEntry rows of the date range in one query
+        2. Sets status=ABSENT and absent_reason based on proposal type on every date
+        3. Recalculates derived fields with a snapshot service preloaded for the range
+        4. Writes the range with one bulk_update and one bulk_create
+        5. Marks each affected month for refresh once
 
         Args:
             proposal: The approved leave Proposal instance
@@ -94,12 +106,27 @@ class ProposalService:
         if not start_date or not end_date:
             raise ProposalExecutionError(f"Leave proposal {proposal.id} missing start_date or end_date")
 
-        # Iterate through date range
-        current_date = start_date
-        while current_date <= end_date:
-            # Find or create timesheet entry for this date
-            entry, created = TimeSheetEntry.objects.get_or_create(employee=proposal.created_by, date=current_date)
+        employee = proposal.created_by
+        leave_dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
 
+        existing_entries = {
+            entry.date: entry
+            for entry in TimeSheetEntry.objects.filter(employee=employee, date__range=(start_date, end_date))
+        }
+        new_entries = [
+            TimeSheetEntry(employee=employee, date=leave_date)
+            for leave_date in leave_dates
+            if leave_date not in existing_entries
+        ]
+
+        # Load the snapshot data of the whole range once instead of querying per day
+        snapshot_service = TimesheetSnapshotService()
+        snapshot_service.preload_range(employee.id, start_date, end_date)
+
+        now = timezone.now()
+        for entry in [*existing_entries.values(), *new_entries]:
+            # Keep the employee instance so snapshotting does not fetch it per entry
+            entry.employee = employee
             entry.status = None
             entry.absent_reason = absent_reason
 
@@ -112,15 +139,19 @@ class ProposalService:
             entry.overtime_hours = 0
             entry.total_worked_hours = 0
 
-            # Clear times if no existing attendance
-            if not entry.start_time and not entry.end_time:
-                entry.start_time = None
-                entry.end_time = None
+            # Same calculation save() runs through full_clean(), without the per-entry save cascade
+            entry.compute_derived_fields(snapshot_service)
+            entry.updated_at = now
 
-            entry.save()
+        if existing_entries:
+            TimeSheetEntry.objects.bulk_update(existing_entries.values(), fields=LEAVE_EXECUTION_UPDATE_FIELDS)
+        if new_entries:
+            TimeSheetEntry.objects.bulk_create(new_entries)
+            # bulk_create skips post_save, so link the proposal to the new entries once
+            transaction.on_commit(lambda: link_timesheet_entries_to_proposal_task.delay(proposal.id))
 
-            # Move to next date
-            current_date += timedelta(days=1)
+        # One monthly refresh (and payroll recalculation) per affected month
+        mark_monthly_timesheets_for_refresh(employee.id, leave_dates)
 
     @staticmethod
     def _execute_maternity_leave_proposal(proposal: Proposal) -> None:
@@ -266,6 +297,8 @@ class ProposalService:
             client=UserDevice.Client.MOBILE,
             state=UserDevice.State.ACTIVE,
         ).exclude(device_id=new_device_id).update(state=UserDevice.State.REVOKED)
+        # Queryset update() bypasses signals, so drop the cached attendance registry explicitly
+        invalidate_attendance_user_registry(requester_user.id)
 
         # Step 3: Create or update active device mapping for requester
         UserDevice.objects.update_or_create(
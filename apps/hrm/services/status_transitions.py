@@ -0,0 +1,185 @@
+"""Date-driven status transitions for contracts and certificates.
+
+A contract or certificate only changes status when one of its dates crosses a
+threshold (effective date, near-expiry window, expiry date), when a newer
+contract supersedes it, or when its employee stops being eligible. Instead of
+loading every row and recomputing its status, each status is paired with the
+date range it is valid for, and only rows whose stored status lies outside
+that range are selected (indexed range predicates on `status` and the date
+columns). Their target status is computed in SQL and applied with one UPDATE
+per target status, so the nightly cost follows the number of transitions.
+
+The rules mirror `Contract.get_status_from_dates` and
+`EmployeeCertificate.compute_status`.
+"""
+
+import logging
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, CharField, Exists, OuterRef, Q, Value, When
+from django.utils import timezone
+
+from apps.hrm.constants import EmployeeType
+from apps.hrm.models import Contract, Employee, EmployeeCertificate
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class StatusTransitionResult:
+    """Transitions selected (and applied unless in dry run) by one pass."""
+
+    total_count: int
+    transitions: List[tuple] = field(default_factory=list)  # (id, old_status, new_status)
+
+    @property
+    def updated_count(self) -> int:
+        return len(self.transitions)
+
+    def count_to(self, status: str) -> int:
+        return sum(1 for _id, _old, new in self.transitions if new == status)
+
+
+def _apply_transitions(model, transitions: List[tuple]) -> None:
+    ids_by_status: Dict[str, List[int]] = defaultdict(list)
+    for pk, _old_status, new_status in transitions:
+        ids_by_status[new_status].append(pk)
+
+    now = timezone.now()
+    with transaction.atomic():
+        for status, ids in ids_by_status.items():
+            model.objects.filter(pk__in=ids).update(status=status, updated_at=now)
+
+
+def _contract_date_ranges(today: date) -> Dict[str, Q]:
+    """Date range in which each non-draft contract status is correct for its own dates."""
+    near_expiry = today + timedelta(days=Contract.ABOUT_TO_EXPIRE_DAYS)
+    Status = Contract.ContractStatus
+    return {
+        Status.NOT_EFFECTIVE: Q(effective_date__gt=today),
+        Status.ACTIVE: Q(effective_date__lte=today)
+        & (Q(expiration_date__isnull=True) | Q(expiration_date__gt=near_expiry)),
+        Status.ABOUT_TO_EXPIRE: Q(
+            effective_date__lte=today, expiration_date__gte=today, expiration_date__lte=near_expiry
+        ),
+        Status.EXPIRED: Q(effective_date__lte=today, expiration_date__lt=today),
+    }
+
+
+def _contract_status_from_dates(today: date) -> Case:
+    near_expiry = today + timedelta(days=Contract.ABOUT_TO_EXPIRE_DAYS)
+    Status = Contract.ContractStatus
+    return Case(
+        When(effective_date__gt=today, then=Value(Status.NOT_EFFECTIVE)),
+        When(expiration_date__isnull=True, then=Value(Status.ACTIVE)),
+        When(expiration_date__lt=today, then=Value(Status.EXPIRED)),
+        When(expiration_date__lte=near_expiry, then=Value(Status.ABOUT_TO_EXPIRE)),
+        default=Value(Status.ACTIVE),
+        output_field=CharField(),
+    )
+
+
+def get_contract_status_transitions(today: Optional[date] = None) -> StatusTransitionResult:
+    """Select the non-draft contracts whose status no longer matches the rules.
+
+    Only the most recent non-draft contract of an employee (largest id) follows
+    its dates; older ones, and every contract of a resigned or unpaid official
+    employee, are EXPIRED.
+    """
+    today = today or date.today()
+    Status = Contract.ContractStatus
+    contracts = Contract.objects.exclude(status=Status.DRAFT)
+
+    has_newer = Exists(contracts.filter(employee_id=OuterRef("employee_id"), id__gt=OuterRef("id")))
+    employee_ineligible = Q(employee__employee_type=EmployeeType.UNPAID_OFFICIAL) | Q(
+        employee__status=Employee.Status.RESIGNED
+    )
+
+    date_ranges = _contract_date_ranges(today)
+    # Live statuses outside their date range crossed a threshold
+    out_of_range = Q()
+    for status in (Status.NOT_EFFECTIVE, Status.ACTIVE, Status.ABOUT_TO_EXPIRE):
+        out_of_range |= Q(status=status) & ~date_ranges[status]
+
+    candidates = (
+        contracts.annotate(has_newer=has_newer)
+        .filter(
+            out_of_range
+            # Superseded or ineligible contracts that are still live
+            | (~Q(status=Status.EXPIRED) & (Q(has_newer=True) | employee_ineligible))
+            # Expired latest contracts that their dates would make live again
+            | (Q(status=Status.EXPIRED, has_newer=False) & ~date_ranges[Status.EXPIRED] & ~employee_ineligible)
+        )
+        .annotate(
+            target_status=Case(
+                When(Q(has_newer=True) | employee_ineligible, then=Value(Status.EXPIRED)),
+                default=_contract_status_from_dates(today),
+                output_field=CharField(),
+            )
+        )
+        .values_list("id", "status", "target_status")
+    )
+
+    return StatusTransitionResult(
+        total_count=contracts.count(),
+        transitions=[row for row in candidates if row[1] != row[2]],
+    )
+
+
+def apply_contract_status_transitions(today: Optional[date] = None, dry_run: bool = False) -> StatusTransitionResult:
+    """Select the contract status transitions due today and apply them set-based."""
+    result = get_contract_status_transitions(today)
+    if not dry_run and result.transitions:
+        _apply_transitions(Contract, result.transitions)
+    return result
+
+
+def get_certificate_status_transitions(today: Optional[date] = None) -> StatusTransitionResult:
+    """Select the certificates whose status no longer matches their expiry date."""
+    today = today or date.today()
+    near_expiry = today + timedelta(days=getattr(settings, "HRM_CERTIFICATE_NEAR_EXPIRY_DAYS", 30))
+    Status = EmployeeCertificate.Status
+
+    date_ranges = {
+        Status.VALID: Q(expiry_date__isnull=True) | Q(expiry_date__gt=near_expiry),
+        Status.NEAR_EXPIRY: Q(expiry_date__gte=today, expiry_date__lte=near_expiry),
+        Status.EXPIRED: Q(expiry_date__lt=today),
+    }
+    out_of_range = Q()
+    for status, date_range in date_ranges.items():
+        out_of_range |= Q(status=status) & ~date_range
+
+    certificates = EmployeeCertificate.objects.all()
+    candidates = (
+        certificates.filter(out_of_range)
+        .annotate(
+            target_status=Case(
+                When(expiry_date__isnull=True, then=Value(Status.VALID)),
+                When(expiry_date__lt=today, then=Value(Status.EXPIRED)),
+                When(expiry_date__lte=near_expiry, then=Value(Status.NEAR_EXPIRY)),
+                default=Value(Status.VALID),
+                output_field=CharField(),
+            )
+        )
+        .values_list("id", "status", "target_status")
+    )
+
+    return StatusTransitionResult(
+        total_count=certificates.count(),
+        transitions=[row for row in candidates if row[1] != row[2]],
+    )
+
+
+def apply_certificate_status_transitions(
+    today: Optional[date] = None, dry_run: bool = False
+) -> StatusTransitionResult:
+    """Select the certificate status transitions due today and apply them set-based."""
+    result = get_certificate_status_transitions(today)
+    if not dry_run and result.transitions:
+        _apply_transitions(EmployeeCertificate, result.transitions)
+    return result
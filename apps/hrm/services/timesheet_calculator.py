@@ -10,7 +10,7 @@ from apps.hrm.constants import (
     TimesheetReason,
     TimesheetStatus,
 )
-from apps.hrm.models.proposal import Proposal, ProposalType
+from apps.hrm.models.proposal import ProposalType
 from apps.hrm.models.timesheet import TimeSheetEntry
 from apps.hrm.models.work_schedule import WorkSchedule
 from apps.hrm.services.timesheet_snapshot_service import TimesheetSnapshotService
@@ -31,10 +31,11 @@ class TimesheetCalculator:
     - Penalties (Late/Early with Grace Periods)
     """
 
-    # TODO: Pass in related objects to pre-fetch data and reuse it when processing multiple entries,
-    # especially for multiple days of the same employee or multiple employees on the same day.
-    def __init__(self, entry: "TimeSheetEntry"):
+    # Pass a shared snapshot service (preloaded with `preload_range`) to reuse related data
+    # when processing multiple days of the same employee.
+    def __init__(self, entry: "TimeSheetEntry", snapshot_service: Optional[TimesheetSnapshotService] = None):
         self.entry = entry
+        self.snapshot_service = snapshot_service or TimesheetSnapshotService()
         self._work_schedule: Optional[WorkSchedule] = None
         self._fetched_schedule = False
 
@@ -59,8 +60,7 @@ class TimesheetCalculator:
             self._work_schedule = work_schedule
             self._fetched_schedule = True
 
-        snapshot_service = TimesheetSnapshotService()
-        snapshot_service.snapshot_data(self.entry)
+        self.snapshot_service.snapshot_data(self.entry)
 
         # 1. Check Exemption Short-circuit
         if self.handle_exemption():
@@ -324,7 +324,7 @@ class TimesheetCalculator:
     def _determine_adjusted_schedule_boundaries(self, morning_start, morning_end, afternoon_start, afternoon_end):
         """Determine effective schedule start/end based on leave proposals."""
         # Check for Leave Proposals
-        proposals = Proposal.get_active_leave_proposals(self.entry.employee_id, self.entry.date)
+        proposals = self.snapshot_service.get_active_leave_proposals(self.entry)
         has_morning_leave = any(p.is_morning_leave for p in proposals)
         has_afternoon_leave = any(p.is_afternoon_leave for p in proposals)
 
@@ -361,8 +361,7 @@ class TimesheetCalculator:
     def compute_status(self, is_finalizing: bool = False) -> None:
         """Compute status: ABSENT, SINGLE_PUNCH, ON_TIME, NOT_ON_TIME."""
         # 0. Support for direct calls (tests): ensure snapshot and penalties are run
-        snapshot_service = TimesheetSnapshotService()
-        snapshot_service.snapshot_data(self.entry)
+        self.snapshot_service.snapshot_data(self.entry)
 
         # 1. Leave Logic (High Precedence)
         if self._handle_leave_status(is_finalizing):
@@ -507,7 +506,7 @@ class TimesheetCalculator:
     def _get_partial_leave_credits(self) -> Decimal:
         """Calculate credits for partial morning/afternoon leaves."""
         leave_credit = Decimal("0.00")
-        proposals = Proposal.get_active_leave_proposals(self.entry.employee_id, self.entry.date)
+        proposals = self.snapshot_service.get_active_leave_proposals(self.entry)
         for p in proposals:
             if p.proposal_type == ProposalType.PAID_LEAVE:
                 if p.is_morning_leave or p.is_afternoon_leave:
@@ -0,0 +1,209 @@
+"""Compact (columnar) representation of the monthly timesheet grid.
+
+The regular timesheet list builds one `TimeSheetEntry` instance per employee and
+day and serializes them through nested serializers. The compact grid reads the
+same data with `values()` projections and returns, per employee, arrays aligned
+to a shared header so the payload can be built and cached cheaply.
+"""
+
+from datetime import date, timedelta
+from typing import Any, Iterable
+
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+
+from apps.hrm.constants import (
+    EmployeeSalaryType,
+    EmployeeType,
+    ProposalStatus,
+    ProposalType,
+    TimesheetStatus,
+)
+from apps.hrm.models import ProposalTimeSheetEntry
+from apps.hrm.models.monthly_timesheet import EmployeeMonthlyTimesheet
+from apps.hrm.models.timesheet import TimeSheetEntry
+
+# Employee values fetched for every grid row
+EMPLOYEE_VALUE_FIELDS = [
+    "id",
+    "code",
+    "fullname",
+    "employee_type",
+    "branch__name",
+    "block__name",
+    "department__name",
+    "position__name",
+]
+
+EMPLOYEE_COLUMNS = ["id", "code", "fullname", "branch", "block", "department", "position", "payroll_status"]
+
+ENTRY_COLUMNS = [
+    "id",
+    "status",
+    "check_in_time",
+    "check_out_time",
+    "start_time",
+    "end_time",
+    "working_days",
+    "day_type",
+    "has_complaint",
+]
+
+# Summary column -> EmployeeMonthlyTimesheet field (same names as EmployeeTimesheetSerializer)
+SUMMARY_FIELD_MAP = {
+    "probation_days": "probation_working_days",
+    "official_work_days": "official_working_days",
+    "total_work_days": "total_working_days",
+    "unexcused_absence_days": "unexcused_absence_days",
+    "holiday_days": "public_holiday_days",
+    "unpaid_leave_days": "unpaid_leave_days",
+    "maternity_leave_days": "maternity_leave_days",
+    "annual_leave_days": "paid_leave_days",
+    "initial_leave_balance": "opening_balance_leave_days",
+    "remaining_leave_balance": "remaining_leave_days",
+}
+
+UNPAID_EMPLOYEE_TYPES = {EmployeeType.UNPAID_OFFICIAL, EmployeeType.UNPAID_PROBATION}
+
+_datetime_field = serializers.DateTimeField()
+_decimal_field = serializers.DecimalField(max_digits=8, decimal_places=2)
+
+
+def _format_datetime(value) -> str | None:
+    return _datetime_field.to_representation(value) if value is not None else None
+
+
+def _format_decimal(value) -> str | None:
+    return _decimal_field.to_representation(value) if value is not None else None
+
+
+def _list_status(status: str | None) -> str | None:
+    """Map SINGLE_PUNCH to NOT_ON_TIME, as the list serializer does."""
+    if status == TimesheetStatus.SINGLE_PUNCH:
+        return TimesheetStatus.NOT_ON_TIME.value
+    return status
+
+
+def get_status_variants() -> dict[str, str]:
+    """Return the color variant of every status that can appear in the grid."""
+    return {
+        str(status): str(variant)
+        for status, variant in TimeSheetEntry.VARIANT_MAPPING["status"].items()
+        if status != TimesheetStatus.SINGLE_PUNCH
+    }
+
+
+def build_compact_timesheet_grid(
+    employees: Iterable[dict[str, Any]],
+    first_day: date,
+    last_day: date,
+    month_key: str,
+    employee_salary_type: str | None = None,
+) -> dict[str, Any]:
+    """Build the compact timesheet grid for a page of employees.
+
+    Args:
+        employees: Employee dicts projected with `EMPLOYEE_VALUE_FIELDS`, in page order.
+        first_day: First day of the month.
+        last_day: Last day of the month.
+        month_key: Month in YYYYMM format.
+        employee_salary_type: Optional EmployeeSalaryType filter applied to entries.
+
+    Returns:
+        Dict with the shared column headers and one row per employee. Each row holds
+        the employee columns, one entry array per date (None when no entry exists)
+        and the monthly summary columns.
+    """
+    employees = list(employees)
+    employee_ids = [employee["id"] for employee in employees]
+    dates = [first_day + timedelta(days=i) for i in range((last_day - first_day).days + 1)]
+    date_index = {day: index for index, day in enumerate(dates)}
+
+    entries = TimeSheetEntry.objects.filter(employee_id__in=employee_ids, date__range=(first_day, last_day))
+    if employee_salary_type:
+        entries = entries.filter(count_for_payroll=employee_salary_type == EmployeeSalaryType.SALARIED)
+    entry_values = list(
+        entries.values(
+            "id",
+            "employee_id",
+            "date",
+            "status",
+            "check_in_time",
+            "check_out_time",
+            "start_time",
+            "end_time",
+            "working_days",
+            "day_type",
+        )
+    )
+
+    complaint_entry_ids = set(
+        ProposalTimeSheetEntry.objects.filter(
+            timesheet_entry_id__in=[entry["id"] for entry in entry_values],
+            proposal__proposal_type=ProposalType.TIMESHEET_ENTRY_COMPLAINT,
+            proposal__proposal_status=ProposalStatus.PENDING,
+        )
+        .values_list("timesheet_entry_id", flat=True)
+        .distinct()
+    )
+
+    monthly_map = {
+        row["employee_id"]: row
+        for row in EmployeeMonthlyTimesheet.objects.filter(employee_id__in=employee_ids, month_key=month_key).values(
+            "employee_id", *SUMMARY_FIELD_MAP.values()
+        )
+    }
+
+    cells_by_employee: dict[int, list[list[Any] | None]] = {
+        employee_id: [None] * len(dates) for employee_id in employee_ids
+    }
+    for entry in entry_values:
+        cells_by_employee[entry["employee_id"]][date_index[entry["date"]]] = [
+            entry["id"],
+            _list_status(entry["status"]),
+            _format_datetime(entry["check_in_time"]),
+            _format_datetime(entry["check_out_time"]),
+            _format_datetime(entry["start_time"]),
+            _format_datetime(entry["end_time"]),
+            _format_decimal(entry["working_days"]),
+            entry["day_type"],
+            entry["id"] in complaint_entry_ids,
+        ]
+
+    paid_label = str(_("Paid"))
+    unpaid_label = str(_("Unpaid"))
+    zero = _format_decimal(0)
+
+    rows = []
+    for employee in employees:
+        monthly = monthly_map.get(employee["id"])
+        if monthly:
+            summary = [_format_decimal(monthly[field]) for field in SUMMARY_FIELD_MAP.values()]
+        else:
+            summary = [zero] * len(SUMMARY_FIELD_MAP)
+
+        rows.append(
+            {
+                "employee": [
+                    employee["id"],
+                    employee["code"],
+                    employee["fullname"],
+                    employee["branch__name"],
+                    employee["block__name"],
+                    employee["department__name"],
+                    employee["position__name"],
+                    unpaid_label if employee["employee_type"] in UNPAID_EMPLOYEE_TYPES else paid_label,
+                ],
+                "entries": cells_by_employee[employee["id"]],
+                "summary": summary,
+            }
+        )
+
+    return {
+        "dates": [day.isoformat() for day in dates],
+        "employee_columns": EMPLOYEE_COLUMNS,
+        "entry_columns": ENTRY_COLUMNS,
+        "summary_columns": list(SUMMARY_FIELD_MAP.keys()),
+        "status_variants": get_status_variants(),
+        "rows": rows,
+    }
@@ -1,4 +1,8 @@
 import logging
+from datetime import date as date_type
+from typing import Iterable, Optional
+
+from django.db.models import F, Min, Q
 
 from apps.hrm.constants import AllowedLateMinutesReason, ProposalType, TimesheetDayType, TimesheetReason
 from apps.hrm.models import AttendanceExemption, Proposal, TimeSheetEntry
@@ -16,8 +20,139 @@ class TimesheetSnapshotService:
     2. Snapshotting Contract details (Contract ID, Wage Rate, Is Full Salary).
     3. Snapshotting Attendance Exemption status.
     4. Applying Leave reasons (Paid/Unpaid/Maternity).
+
+    Every lookup queries the database per entry by default. When many entries of one
+    employee are snapshotted together (e.g. executing a long leave), call
+    `preload_range` first so the lookups for that employee and date range are served
+    from data loaded once; `preload_employees_range` does the same for several
+    employees.
     """
 
+    def __init__(self):
+        self._preloaded: Optional[dict] = None
+
+    def preload_range(self, employee_id: int, start_date: date_type, end_date: date_type) -> None:
+        """Load the snapshot data of one employee for a date range in a few queries.
+
+        Args:
+            employee_id: ID of the employee whose entries will be snapshotted
+            start_date: First date of the range
+            end_date: Last date of the range
+        """
+        self.preload_employees_range([employee_id], start_date, end_date)
+
+    def preload_employees_range(self, employee_ids: Iterable[int], start_date: date_type, end_date: date_type) -> None:
+        """Load the snapshot data of several employees for a date range in a few queries.
+
+        The number of queries does not depend on the number of employees.
+
+        Args:
+            employee_ids: IDs of the employees whose entries will be snapshotted
+            start_date: First date of the range
+            end_date: Last date of the range
+        """
+        from apps.hrm.models.contract import Contract
+        from apps.hrm.models.proposal import ProposalOvertimeEntry, ProposalStatus
+
+        employee_ids = set(employee_ids)
+        per_employee = {
+            employee_id: {
+                "contracts": [],
+                "exemption_start": None,
+                "leave_proposals": [],
+                "complaint_proposals": [],
+                "overtime_entries": {},
+            }
+            for employee_id in employee_ids
+        }
+
+        proposal_ordering = Proposal._meta.ordering or ["pk"]
+        approved_proposals = Proposal.objects.filter(
+            created_by__in=employee_ids, proposal_status=ProposalStatus.APPROVED
+        )
+
+        for ot_entry in ProposalOvertimeEntry.objects.filter(
+            proposal__created_by__in=employee_ids,
+            proposal__proposal_status=ProposalStatus.APPROVED,
+            date__range=(start_date, end_date),
+        ).annotate(proposal_employee_id=F("proposal__created_by")):
+            overtime_entries = per_employee[ot_entry.proposal_employee_id]["overtime_entries"]
+            overtime_entries.setdefault(ot_entry.date, []).append(ot_entry)
+
+        for contract in Contract.objects.filter(
+            employee_id__in=employee_ids,
+            effective_date__lte=end_date,
+            status__in=[Contract.ContractStatus.ACTIVE, Contract.ContractStatus.ABOUT_TO_EXPIRE],
+        ).order_by("-effective_date"):
+            per_employee[contract.employee_id]["contracts"].append(contract)
+
+        for employee_id, exemption_start in (
+            AttendanceExemption.objects.filter(employee_id__in=employee_ids)
+            .order_by()
+            .values("employee_id")
+            .annotate(start=Min("effective_date"))
+            .values_list("employee_id", "start")
+        ):
+            per_employee[employee_id]["exemption_start"] = exemption_start
+
+        for proposal in approved_proposals.filter(
+            Q(paid_leave_start_date__lte=end_date, paid_leave_end_date__gte=start_date)
+            | Q(unpaid_leave_start_date__lte=end_date, unpaid_leave_end_date__gte=start_date)
+            | Q(maternity_leave_start_date__lte=end_date, maternity_leave_end_date__gte=start_date)
+        ).order_by(*proposal_ordering):
+            per_employee[proposal.created_by_id]["leave_proposals"].append(proposal)
+
+        for proposal in approved_proposals.filter(
+            Q(late_exemption_start_date__lte=end_date, late_exemption_end_date__gte=start_date)
+            | Q(
+                post_maternity_benefits_start_date__lte=end_date,
+                post_maternity_benefits_end_date__gte=start_date,
+            )
+        ).order_by(*proposal_ordering):
+            per_employee[proposal.created_by_id]["complaint_proposals"].append(proposal)
+
+        shared = {
+            "start_date": start_date,
+            "end_date": end_date,
+            "holidays": list(
+                Holiday.objects.filter(start_date__lte=end_date, end_date__gte=start_date).values_list(
+                    "start_date", "end_date"
+                )
+            ),
+            "compensatory_dates": set(
+                CompensatoryWorkday.objects.filter(date__range=(start_date, end_date)).values_list("date", flat=True)
+            ),
+        }
+        self._preloaded = {employee_id: {**shared, **data} for employee_id, data in per_employee.items()}
+
+    def _get_preloaded(self, entry: TimeSheetEntry) -> Optional[dict]:
+        """Return the preloaded data when it covers the entry's employee and date."""
+        preloaded = (self._preloaded or {}).get(entry.employee_id)
+        if (
+            preloaded is not None
+            and entry.date is not None
+            and preloaded["start_date"] <= entry.date <= preloaded["end_date"]
+        ):
+            return preloaded
+        return None
+
+    def get_active_leave_proposals(self, entry: TimeSheetEntry) -> list:
+        """Approved leave proposals (Paid, Unpaid, Maternity) covering the entry's date."""
+        preloaded = self._get_preloaded(entry)
+        if preloaded is None:
+            return list(Proposal.get_active_leave_proposals(entry.employee_id, entry.date))
+        return [
+            p
+            for p in preloaded["leave_proposals"]
+            if self._in_range(entry.date, p.paid_leave_start_date, p.paid_leave_end_date)
+            or self._in_range(entry.date, p.unpaid_leave_start_date, p.unpaid_leave_end_date)
+            or self._in_range(entry.date, p.maternity_leave_start_date, p.maternity_leave_end_date)
+        ]
+
+    @staticmethod
+    def _in_range(day: date_type, start: Optional[date_type], end: Optional[date_type]) -> bool:
+        return start is not None and end is not None and start <= day <= end
+
     def snapshot_data(self, entry: TimeSheetEntry) -> None:
         """Perform all snapshot operations for a timesheet entry."""
         # 1. Determine Day Type (Holiday, Compensatory, Normal)
@@ -47,14 +182,22 @@ class TimesheetSnapshotService:
         if not date:
             return
 
+        preloaded = self._get_preloaded(entry)
+
         # Check for Holiday
-        holiday = Holiday.objects.filter(start_date__lte=date, end_date__gte=date).first()
-        if holiday:
+        if preloaded is not None:
+            is_holiday = any(start <= date <= end for start, end in preloaded["holidays"])
+        else:
+            is_holiday = Holiday.objects.filter(start_date__lte=date, end_date__gte=date).exists()
+        if is_holiday:
             entry.day_type = TimesheetDayType.HOLIDAY
             return
 
         # Check for Compensatory (Work on Sunday)
-        comp = CompensatoryWorkday.objects.filter(date=date).exists()
+        if preloaded is not None:
+            comp = date in preloaded["compensatory_dates"]
+        else:
+            comp = CompensatoryWorkday.objects.filter(date=date).exists()
         if comp:
             entry.day_type = TimesheetDayType.COMPENSATORY
             return
@@ -69,16 +212,20 @@ class TimesheetSnapshotService:
         if not entry.employee_id:
             return
 
-        # Fetch directly if not prefetched
-        contract = (
-            Contract.objects.filter(
-                employee_id=entry.employee_id,
-                effective_date__lte=entry.date,
-                status__in=[Contract.ContractStatus.ACTIVE, Contract.ContractStatus.ABOUT_TO_EXPIRE],
+        preloaded = self._get_preloaded(entry)
+        if preloaded is not None:
+            contract = next((c for c in preloaded["contracts"] if c.effective_date <= entry.date), None)
+        else:
+            # Fetch directly if not prefetched
+            contract = (
+                Contract.objects.filter(
+                    employee_id=entry.employee_id,
+                    effective_date__lte=entry.date,
+                    status__in=[Contract.ContractStatus.ACTIVE, Contract.ContractStatus.ABOUT_TO_EXPIRE],
+                )
+                .order_by("-effective_date")
+                .first()
             )
-            .order_by("-effective_date")
-            .first()
-        )
 
         if contract:
             entry.contract = contract
@@ -105,6 +252,12 @@ class TimesheetSnapshotService:
         if entry.is_exempt:
             return
 
+        preloaded = self._get_preloaded(entry)
+        if preloaded is not None:
+            exemption_start = preloaded["exemption_start"]
+            entry.is_exempt = exemption_start is not None and exemption_start <= entry.date
+            return
+
         # Fetch directly if not prefetched
         entry.is_exempt = AttendanceExemption.objects.filter(
             employee_id=entry.employee_id, effective_date__lte=entry.date
@@ -112,13 +265,12 @@ class TimesheetSnapshotService:
 
     def snapshot_leave_reason(self, entry: "TimeSheetEntry") -> None:
         """Populate absent_reason if an approved PAID_LEAVE or UNPAID_LEAVE proposal exists."""
-        from apps.hrm.models.proposal import Proposal, ProposalType
+        from apps.hrm.models.proposal import ProposalType
 
         if entry.absent_reason:
             return
 
-        # Use Proposal model directly to avoid circular dependency
-        leave = Proposal.get_active_leave_proposals(entry.employee_id, entry.date).first()
+        leave = next(iter(self.get_active_leave_proposals(entry)), None)
 
         if leave:
             # Only set absent_reason if it's a full day leave (no partial shift specified)
@@ -144,10 +296,19 @@ class TimesheetSnapshotService:
             allowed_minutes = work_schedule.allowed_late_minutes or 0
 
         # 2. Check Proposals (Complaints/Benefits)
-        proposals = Proposal.get_active_complaint_proposals(
-            employee_id=entry.employee_id,
-            date=entry.date,
-        )
+        preloaded = self._get_preloaded(entry)
+        if preloaded is not None:
+            proposals = [
+                p
+                for p in preloaded["complaint_proposals"]
+                if self._in_range(entry.date, p.late_exemption_start_date, p.late_exemption_end_date)
+                or self._in_range(entry.date, p.post_maternity_benefits_start_date, p.post_maternity_benefits_end_date)
+            ]
+        else:
+            proposals = Proposal.get_active_complaint_proposals(
+                employee_id=entry.employee_id,
+                date=entry.date,
+            )
 
         for p in proposals:
             if p.proposal_type == ProposalType.POST_MATERNITY_BENEFITS:
@@ -178,13 +339,19 @@ class TimesheetSnapshotService:
         # Find all approved overtime entries for this employee and date
         # Note: Filtering by proposal__created_by and proposal__proposal_status=APPROVED
         # which is the logic used in TimesheetCalculator previously.
-        ot_entries = ProposalOvertimeEntry.objects.filter(
-            proposal__created_by=entry.employee_id,
-            proposal__proposal_status=ProposalStatus.APPROVED,
-            date=entry.date,
-        )
+        preloaded = self._get_preloaded(entry)
+        if preloaded is not None:
+            ot_entries = preloaded["overtime_entries"].get(entry.date, [])
+        else:
+            ot_entries = list(
+                ProposalOvertimeEntry.objects.filter(
+                    proposal__created_by=entry.employee_id,
+                    proposal__proposal_status=ProposalStatus.APPROVED,
+                    date=entry.date,
+                )
+            )
 
-        if not ot_entries.exists():
+        if not ot_entries:
             entry.approved_ot_start_time = None
             entry.approved_ot_end_time = None
             entry.approved_ot_minutes = 0
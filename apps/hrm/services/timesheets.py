@@ -1,8 +1,10 @@
 import logging
 from calendar import monthrange
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterable, List
 
 from django.db import transaction
 from django.db.models import Max, Min, Q, Sum
@@ -12,16 +14,61 @@ from apps.hrm.models import AttendanceRecord, Contract, Employee, EmployeeMonthl
 from apps.hrm.services.day_type_service import get_day_type_map
 from apps.hrm.services.timesheet_calculator import TimesheetCalculator
 from apps.hrm.services.timesheet_snapshot_service import TimesheetSnapshotService
+from apps.hrm.utils.timesheet_grid_cache import invalidate_timesheet_grid_cache
 from libs.decimals import DECIMAL_ZERO, quantize_decimal
 
 logger = logging.getLogger(__name__)
 
+# (employee_id, first day of month) pairs collected while monthly refreshes are deferred
+_deferred_monthly_refreshes: ContextVar[set | None] = ContextVar("deferred_monthly_refreshes", default=None)
+
 
 def _normalize_year_month(year: int | None, month: int | None) -> tuple[int, int]:
     today = date.today()
     return (year or today.year, month or today.month)
 
 
+_FINALIZED_ENTRY_FIELDS = [
+    "working_days",
+    "status",
+    "day_type",
+    "absent_reason",
+    "morning_hours",
+    "afternoon_hours",
+    "official_hours",
+    "overtime_hours",
+    "total_worked_hours",
+    "is_punished",
+    "late_minutes",
+    "early_minutes",
+    "contract",
+    "net_percentage",
+    "is_full_salary",
+    "is_exempt",
+]
+
+
+def _finalize_past_entries(entries: Iterable[TimeSheetEntry]) -> List[TimeSheetEntry]:
+    """Compute and store the fields of bulk-created entries dated before today.
+
+    This ensures working_days, status, and other computed fields are set for past dates.
+    """
+    today = date.today()
+    past_entries = [e for e in entries if e.date < today]
+    if past_entries:
+        # Load proposals, contracts and overtime of all the employees at once instead of per day
+        snapshot_service = TimesheetSnapshotService()
+        dates = [entry.date for entry in past_entries]
+        snapshot_service.preload_employees_range({e.employee_id for e in past_entries}, min(dates), max(dates))
+        for entry in past_entries:
+            snapshot_service.snapshot_data(entry)
+            calculator = TimesheetCalculator(entry, snapshot_service)
+            calculator.compute_all(is_finalizing=True)
+
+        TimeSheetEntry.objects.bulk_update(past_entries, fields=_FINALIZED_ENTRY_FIELDS, batch_size=1000)
+    return past_entries
+
+
 @transaction.atomic
 def create_entries_for_employee_month(
     employee_id: int, year: int | None = None, month: int | None = None
@@ -63,37 +110,7 @@ def create_entries_for_employee_month(
         created = list(TimeSheetEntry.objects.filter(employee_id=employee_id, date__in=created_dates))
 
         # Finalize past entries since bulk_create skips clean() -> compute_working_days()
-        # This ensures working_days, status, and other computed fields are set for past dates
-        today = date.today()
-        past_entries = [e for e in created if e.date < today]
-        if past_entries:
-            snapshot_service = TimesheetSnapshotService()
-            for entry in past_entries:
-                snapshot_service.snapshot_data(entry)
-                calculator = TimesheetCalculator(entry)
-                calculator.compute_all(is_finalizing=True)
-
-            TimeSheetEntry.objects.bulk_update(
-                past_entries,
-                fields=[
-                    "working_days",
-                    "status",
-                    "day_type",
-                    "absent_reason",
-                    "morning_hours",
-                    "afternoon_hours",
-                    "official_hours",
-                    "overtime_hours",
-                    "total_worked_hours",
-                    "is_punished",
-                    "late_minutes",
-                    "early_minutes",
-                    "contract",
-                    "net_percentage",
-                    "is_full_salary",
-                    "is_exempt",
-                ],
-            )
+        _finalize_past_entries(created)
 
         for timesheet_entry in created:
             post_save.send(sender=TimeSheetEntry, instance=timesheet_entry, created=True)
@@ -242,6 +259,80 @@ def create_monthly_timesheets_for_month_all(
     return created
 
 
+@transaction.atomic
+def create_timesheets_for_new_employees(
+    employee_ids: Iterable[int], year: int | None = None, month: int | None = None
+) -> int:
+    """Create the month's timesheet entries and monthly rows of newly hired employees in bulk.
+
+    Set-based counterpart of `create_entries_for_employee_month` followed by
+    `create_monthly_timesheet_for_employee` for a batch of hires: one day type
+    lookup, one insert for the entries and one for the monthly rows. New hires have
+    no previous month row or contract yet, so their monthly row starts with empty
+    leave balances. The per-entry post_save signal is not sent (new hires have no
+    proposals to link); instead the grid cache of the month is invalidated once and
+    the monthly rows are marked for refresh when past days were finalized.
+
+    Returns:
+        Number of timesheet entries created
+    """
+    employee_ids = list(employee_ids)
+    if not employee_ids:
+        return 0
+
+    year, month = _normalize_year_month(year, month)
+    _, last_day = monthrange(year, month)
+    all_dates = [date(year, month, d) for d in range(1, last_day + 1)]
+    day_type_map = get_day_type_map(all_dates[0], all_dates[-1])
+
+    existing = set(
+        TimeSheetEntry.objects.filter(employee_id__in=employee_ids, date__in=all_dates).values_list(
+            "employee_id", "date"
+        )
+    )
+    entries_to_create = [
+        TimeSheetEntry(employee_id=employee_id, date=entry_date, day_type=day_type_map.get(entry_date))
+        for employee_id in employee_ids
+        for entry_date in all_dates
+        if (employee_id, entry_date) not in existing
+    ]
+    TimeSheetEntry.objects.bulk_create(entries_to_create, ignore_conflicts=True, batch_size=1000)
+
+    # Re-fetch the past entries to get their PKs (bulk_create with ignore_conflicts doesn't set PKs)
+    created_employee_ids = {entry.employee_id for entry in entries_to_create}
+    past_entries = TimeSheetEntry.objects.filter(
+        employee_id__in=created_employee_ids, date__range=(all_dates[0], all_dates[-1]), date__lt=date.today()
+    ).select_related("employee")
+    finalized = _finalize_past_entries(
+        entry for entry in past_entries if (entry.employee_id, entry.date) not in existing
+    )
+
+    month_key = f"{year:04d}{month:02d}"
+    refreshed_employee_ids = {entry.employee_id for entry in finalized}
+    EmployeeMonthlyTimesheet.objects.bulk_create(
+        [
+            EmployeeMonthlyTimesheet(
+                employee_id=employee_id,
+                month_key=month_key,
+                report_date=all_dates[0],
+                need_refresh=employee_id in refreshed_employee_ids,
+            )
+            for employee_id in employee_ids
+        ],
+        ignore_conflicts=True,
+        batch_size=1000,
+    )
+    invalidate_timesheet_grid_cache(month_key)
+
+    logger.info(
+        "Created %d timesheet entries for %d new employee(s) in %s",
+        len(entries_to_create),
+        len(employee_ids),
+        month_key,
+    )
+    return len(entries_to_create)
+
+
 def update_start_end_times(attendance_code: str, timehsheet_entry: TimeSheetEntry):
     # Use aggregated values to determine start_time and end_time.
     # - If `first_ts` exists, use it for `start_time`.
@@ -316,24 +407,62 @@ def trigger_timesheet_updates_from_records(records: List[AttendanceRecord]) -> N
             logger.error(f"Failed to mark monthly refresh for employee {emp_id} month {month_key}: {e}")
 
 
-def update_day_types_for_range(start_date: date, end_date: date) -> None:
-    """Batch update day_type for all TimeSheetEntries in the given date range.
+def collect_deferred_monthly_refresh(employee_id: int, dates: Iterable[date]) -> bool:
+    """Record the months of `dates` for a deferred refresh if one is being collected.
+
+    Returns:
+        True if the refresh was deferred, False if the caller should refresh now
+    """
+    pending = _deferred_monthly_refreshes.get()
+    if pending is None:
+        return False
+    pending.update((employee_id, entry_date.replace(day=1)) for entry_date in dates)
+    return True
+
 
-    Logic:
-    1. Get the map of day types for the range using DayTypeService.
-    2. Group dates by their day_type.
-    3. Perform bulk updates on TimeSheetEntry objects.
+@contextmanager
+def defer_monthly_timesheet_refresh():
+    """Collect monthly refresh marks and issue them once per employee-month on exit.
+
+    Used by bulk operations that save many timesheet entries of the same employees:
+    the per-entry post_save refresh and `mark_monthly_timesheets_for_refresh` only
+    record the affected employee-months while the block runs. Nested blocks join the
+    outermost one. Nothing is marked if the block raises.
+    """
+    if _deferred_monthly_refreshes.get() is not None:
+        yield
+        return
+
+    pending: set = set()
+    token = _deferred_monthly_refreshes.set(pending)
+    try:
+        yield
+    finally:
+        _deferred_monthly_refreshes.reset(token)
+
+    months_by_employee: dict[int, list[date]] = {}
+    for employee_id, report_date in pending:
+        months_by_employee.setdefault(employee_id, []).append(report_date)
+    for employee_id, months in months_by_employee.items():
+        mark_monthly_timesheets_for_refresh(employee_id, months)
+
+
+def mark_monthly_timesheets_for_refresh(employee_id: int, dates: Iterable[date]) -> None:
+    """Mark the monthly timesheets of an employee covering `dates` for refresh.
+
+    Bulk timesheet writes skip the per-entry post_save signal, so this does its work
+    once per affected month instead: invalidates the cached grid of the month and marks
+    the EmployeeMonthlyTimesheet for refresh (saving it also queues the payroll
+    recalculation for that month). Inside `defer_monthly_timesheet_refresh` the months
+    are only recorded.
     """
-    day_type_map_result = get_day_type_map(start_date, end_date)
-
-    # Group dates by type
-    grouped_map: dict[Optional[str], list[date]] = {}
-    for d_date, d_type in day_type_map_result.items():
-        if d_type not in grouped_map:
-            grouped_map[d_type] = []
-        grouped_map[d_type].append(d_date)
-
-    # Perform updates
-    for d_type, dates in grouped_map.items():
-        # d_type can be OFFICIAL, HOLIDAY, COMPENSATORY, or None
-        TimeSheetEntry.objects.filter(date__in=dates).update(day_type=d_type)
+    if collect_deferred_monthly_refresh(employee_id, dates):
+        return
+
+    months = {entry_date.replace(day=1) for entry_date in dates}
+    for report_date in sorted(months):
+        month_key = f"{report_date.year:04d}{report_date.month:02d}"
+        invalidate_timesheet_grid_cache(month_key)
+        EmployeeMonthlyTimesheet.objects.get_or_create(
+            employee_id=employee_id, month_key=month_key, defaults={"report_date": report_date}
+        )[0].mark_refresh()
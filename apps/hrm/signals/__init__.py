@@ -46,10 +46,11 @@ User = get_user_model()
 from libs.code_generation import register_auto_code_signal  # noqa: E402
 
 from .attendance import *  # noqa: E402, F401, F403
+from .attendance_registry import *  # noqa: E402, F401, F403
 from .attendance_report import *  # noqa: E402, F401, F403
 from .dashboard_cache import *  # noqa: E402, F401, F403
-from .day_type_triggers import *  # noqa: E402, F401, F403
 from .employee import *  # noqa: E402, F401, F403
+from .geofence_index import *  # noqa: E402, F401, F403
 from .hr_reports import *  # noqa: E402, F401, F403
 from .monthly_timesheet_triggers import *  # noqa: E402, F401, F403
 from .proposal_timesheet_entry import *  # noqa: E402, F401, F403
@@ -84,6 +85,7 @@ register_auto_code_signal(
     Employee,
     temp_code_prefix=TEMP_CODE_PREFIX,
     custom_generate_code=employee_generate_code,
+    assign_before_insert=True,
 )
 
 # Register auto-code generation for EmployeeCertificate with custom generate_code
@@ -91,6 +93,7 @@ register_auto_code_signal(
     EmployeeCertificate,
     temp_code_prefix=TEMP_CODE_PREFIX,
     custom_generate_code=certificate_generate_code,
+    assign_before_insert=True,
 )
 
 # Register auto-code generation for Contract with custom generate_code
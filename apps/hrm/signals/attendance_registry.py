@@ -0,0 +1,45 @@
+"""Signal handlers for the attendance registries.
+
+Handles invalidation of the cached user and WiFi registries used by the quick
+mobile check-in endpoints.
+"""
+
+import logging
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.core.models import UserDevice
+from apps.hrm.models import AttendanceWifiDevice, Employee
+from apps.hrm.utils.attendance_registry import invalidate_attendance_user_registry, invalidate_wifi_registry
+
+__all__ = [
+    "invalidate_attendance_registry_on_user_device_change",
+    "invalidate_attendance_registry_on_employee_change",
+    "invalidate_wifi_registry_on_change",
+]
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=UserDevice)
+@receiver(post_delete, sender=UserDevice)
+def invalidate_attendance_registry_on_user_device_change(sender, instance, **kwargs):
+    """Invalidate the user's attendance registry when one of their devices changes."""
+    invalidate_attendance_user_registry(instance.user_id)
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def invalidate_attendance_registry_on_employee_change(sender, instance, **kwargs):
+    """Invalidate the linked user's attendance registry when an Employee changes."""
+    if instance.user_id:
+        invalidate_attendance_user_registry(instance.user_id)
+
+
+@receiver(post_save, sender=AttendanceWifiDevice)
+@receiver(post_delete, sender=AttendanceWifiDevice)
+def invalidate_wifi_registry_on_change(sender, instance, **kwargs):
+    """Invalidate the WiFi registry when an AttendanceWifiDevice is saved or deleted."""
+    logger.info("AttendanceWifiDevice %s changed, invalidating WiFi registry", instance.id)
+    invalidate_wifi_registry()
@@ -1,5 +1,6 @@
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from apps.hrm.models import AttendanceRecord
 from apps.hrm.tasks.attendance_report import update_attendance_daily_report_task
@@ -12,7 +13,7 @@ def trigger_attendance_report_update_on_save(sender, instance, created, **kwargs
         update_attendance_daily_report_task.apply_async(
             args=(
                 instance.employee_id,
-                instance.timestamp.date().strftime("%Y-%m-%d"),
+                timezone.localdate(instance.timestamp).strftime("%Y-%m-%d"),
             ),
             countdown=5,
         )
@@ -25,7 +26,7 @@ def trigger_attendance_report_update_on_delete(sender, instance, **kwargs):
         update_attendance_daily_report_task.apply_async(
             args=(
                 instance.employee_id,
-                instance.timestamp.date().strftime("%Y-%m-%d"),
+                timezone.localdate(instance.timestamp).strftime("%Y-%m-%d"),
             ),
             countdown=5,
         )
@@ -30,6 +30,9 @@ logger = logging.getLogger(__name__)
 @receiver(post_save, sender=Proposal)
 def invalidate_hrm_cache_on_proposal_save(sender, instance, created, **kwargs):
     """Invalidate HRM dashboard cache when a Proposal is created or updated."""
+    if getattr(instance, "_bulk_status_change", False):
+        # Invalidated once after the whole batch
+        return
     action = "created" if created else "updated"
     logger.debug("Proposal %s %s, invalidating HRM dashboard cache", instance.id, action)
     invalidate_hrm_dashboard_cache()
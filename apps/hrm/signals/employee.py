@@ -19,10 +19,11 @@ def create_user_for_employee(sender, instance, created, **kwargs):  # noqa: ARG0
     """Create a User instance for the Employee after it is created.
 
     This signal handler automatically creates a User account when an Employee
-    is created. It uses the employee's username and email fields.
+    is created. It uses the employee's username and email fields. Employees
+    saved with `_defer_onboarding` get theirs from `complete_onboarding`.
     """
     # Only create user if employee was just created and doesn't have a user yet
-    if created and not instance.user:
+    if created and not instance.user and not getattr(instance, "_defer_onboarding", False):
         default_role = Role.objects.filter(is_default_role=True).first()
         user = User.objects.create_user(
             username=instance.username,
@@ -43,7 +44,12 @@ def prepare_timesheet_on_hire_post_save(sender, instance: Employee, created, **k
 
     - If the employee is newly created and has an active status, schedule timesheet preparation for the current month.
     - If the employee's status changes from a leave status (e.g., resigned) to an active status, schedule timesheet preparation.
+
+    Employees created with `_defer_onboarding` get their timesheets from `complete_onboarding`.
     """
+    if created and getattr(instance, "_defer_onboarding", False):
+        return
+
     working_statuses = Employee.Status.get_working_statuses()
     leave_statuses = Employee.Status.get_leave_statuses()
 
@@ -63,16 +69,10 @@ def track_employee_type_change(sender, instance: Employee, **kwargs):  # noqa: A
     """Track employee_type changes by storing the old value before save.
 
     This pre_save signal stores the original employee_type value in
-    instance._old_employee_type for comparison in the post_save signal.
+    instance._old_employee_type for comparison in the post_save signal. The
+    value is the one captured when the instance was loaded (no query).
     """
-    if instance.pk:
-        try:
-            old_instance = Employee.objects.get(pk=instance.pk)
-            instance._old_employee_type = old_instance.employee_type  # type: ignore[attr-defined]
-        except Employee.DoesNotExist:
-            instance._old_employee_type = None  # type: ignore[attr-defined]
-    else:
-        instance._old_employee_type = None  # type: ignore[attr-defined]
+    instance._old_employee_type = instance.get_original_value("employee_type")  # type: ignore[attr-defined]
 
 
 @receiver(post_save, sender=Employee)
@@ -0,0 +1,33 @@
+"""Signal handlers for AttendanceGeolocation model.
+
+Handles geofence index invalidation when AttendanceGeolocation records are modified.
+The index is invalidated once the transaction commits, so that a concurrent request
+cannot rebuild it from the rows being replaced.
+"""
+
+import logging
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.hrm.models import AttendanceGeolocation
+from apps.hrm.utils.geofence_index import invalidate_geofence_index
+
+__all__ = ["invalidate_geofence_index_on_save", "invalidate_geofence_index_on_delete"]
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=AttendanceGeolocation)
+def invalidate_geofence_index_on_save(sender, instance, created, **kwargs):
+    """Invalidate the geofence index when an AttendanceGeolocation is created or updated."""
+    logger.info("AttendanceGeolocation %s saved, invalidating geofence index", instance.id)
+    transaction.on_commit(invalidate_geofence_index)
+
+
+@receiver(post_delete, sender=AttendanceGeolocation)
+def invalidate_geofence_index_on_delete(sender, instance, **kwargs):
+    """Invalidate the geofence index when an AttendanceGeolocation is deleted."""
+    logger.info("AttendanceGeolocation %s deleted, invalidating geofence index", instance.id)
+    transaction.on_commit(invalidate_geofence_index)
@@ -46,6 +46,10 @@ def trigger_hr_reports_aggregation_on_save(sender, instance, created, **kwargs):
     1. Fires a Celery task to incrementally update HR reports using snapshot data
     2. Marks affected report records with need_refresh=True for batch reconciliation
     """
+    # Histories of deferred hires are aggregated in bulk by complete_onboarding
+    if created and getattr(instance.employee, "_defer_onboarding", False):
+        return
+
     # Only trigger if the work history has required organizational fields
     if instance.branch_id and instance.block_id and instance.department_id:
         # Create current snapshot
@@ -1,7 +1,11 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from apps.hrm.models import EmployeeMonthlyTimesheet, TimeSheetEntry
+from apps.hrm.constants import ProposalType
+from apps.hrm.models import EmployeeMonthlyTimesheet, Proposal, TimeSheetEntry
+from apps.hrm.services.timesheets import collect_deferred_monthly_refresh
+from apps.hrm.utils.timesheet_grid_cache import invalidate_timesheet_grid_cache
 
 
 @receiver(post_save, sender=TimeSheetEntry)
@@ -12,9 +16,14 @@ def trigger_monthly_refresh(sender, instance, **kwargs):
     is reflected in the aggregated monthly report.
     """
     date_obj = instance.date
+    if collect_deferred_monthly_refresh(instance.employee_id, [date_obj]):
+        return
+
     month_key = f"{date_obj.year:04d}{date_obj.month:02d}"
     report_date = date_obj.replace(day=1)
 
+    invalidate_timesheet_grid_cache(month_key)
+
     # Efficiently mark for refresh
     updated = EmployeeMonthlyTimesheet.objects.filter(employee_id=instance.employee_id, month_key=month_key).update(
         need_refresh=True
@@ -28,3 +37,22 @@ def trigger_monthly_refresh(sender, instance, **kwargs):
             month_key=month_key,
             defaults={"report_date": report_date, "need_refresh": True},
         )
+
+
+@receiver([post_save, post_delete], sender=Proposal)
+def invalidate_timesheet_grid_on_complaint_change(sender, instance: Proposal, **kwargs):
+    """Invalidate the timesheet grid month of a complaint proposal when it changes.
+
+    The grid flags the entries with a pending complaint, so approving, rejecting
+    or deleting one changes the grid. Bulk status changes invalidate once per month
+    in `bulk_change_proposal_status`.
+    """
+    if getattr(instance, "_bulk_status_change", False):
+        return
+
+    complaint_date = instance.timesheet_entry_complaint_complaint_date
+    if instance.proposal_type != ProposalType.TIMESHEET_ENTRY_COMPLAINT or not complaint_date:
+        return
+
+    month_key = f"{complaint_date.year:04d}{complaint_date.month:02d}"
+    transaction.on_commit(lambda: invalidate_timesheet_grid_cache(month_key))
@@ -5,12 +5,16 @@ from django.utils.translation import gettext as _
 from apps.core.models import UserDevice
 from apps.hrm.constants import ProposalStatus, ProposalType, ProposalVerifierStatus
 from apps.hrm.models import Proposal, ProposalVerifier
+from apps.hrm.services.proposal_notifications import send_proposal_status_notification
 from apps.notifications.utils import create_notification
 
 
 @receiver(pre_save, sender=Proposal)
 def track_proposal_status_change(sender, instance, **kwargs):
     """Track proposal status change."""
+    if getattr(instance, "_bulk_status_change", False):
+        # Bulk status changes notify once per employee-month afterwards
+        return
     if instance.pk:
         try:
             old_instance = Proposal.objects.get(pk=instance.pk)
@@ -24,7 +28,7 @@ def track_proposal_status_change(sender, instance, **kwargs):
 @receiver(post_save, sender=Proposal)
 def notify_proposal_status_change(sender, instance, created, **kwargs):
     """Notify employee when their proposal status changes."""
-    if created:
+    if created or getattr(instance, "_bulk_status_change", False):
         return
 
     # Check if status has changed
@@ -37,50 +41,11 @@ def notify_proposal_status_change(sender, instance, created, **kwargs):
 
     if instance.proposal_status == ProposalStatus.APPROVED:
         # HR Approved
-        _send_hr_notification(instance, approved=True)
+        send_proposal_status_notification(instance, approved=True)
 
     elif instance.proposal_status == ProposalStatus.REJECTED:
         # Rejected by HR.
-        _send_hr_notification(instance, approved=False)
-
-
-def _send_hr_notification(proposal, approved):
-    recipient = proposal.created_by.user
-    if not recipient:
-        return
-
-    # Scenario A: Timekeeping Complaint
-    if proposal.proposal_type == ProposalType.TIMESHEET_ENTRY_COMPLAINT:
-        if approved:
-            message = _("Your timekeeping complaint has been approved by HR.")
-        else:
-            note = proposal.approval_note or ""
-            message = _('Your timekeeping complaint was rejected by HR with note: "%(note)s"..') % {"note": note}
-
-    # Scenario B: General Proposal
-    else:
-        proposal_type_display = proposal.get_proposal_type_display()
-        if approved:
-            message = _("Your %(proposal_type)s proposal has been approved by HR.") % {
-                "proposal_type": proposal_type_display
-            }
-        else:
-            note = proposal.approval_note or ""
-            message = _('Your %(proposal_type)s proposal was rejected by HR with note: "%(note)s"..') % {
-                "note": note,
-                "proposal_type": proposal_type_display,
-            }
-
-    create_notification(
-        actor=proposal.approved_by.user
-        if proposal.approved_by and proposal.approved_by.user
-        else recipient,  # Fallback to recipient if no actor, but ideally should be system or HR user
-        recipient=recipient,
-        verb="updated" if approved else "rejected",
-        target=proposal,
-        message=message,
-        target_client=UserDevice.Client.MOBILE,
-    )
+        send_proposal_status_notification(instance, approved=False)
 
 
 @receiver(pre_save, sender=ProposalVerifier)
@@ -21,4 +21,7 @@ def trigger_link_proposals_to_timesheet_entry(sender, instance, created, **kwarg
 def trigger_link_timesheet_entries_to_proposal_save(sender, instance, created, **kwargs):
     """Trigger background task to link timesheets when a Proposal is created or updated."""
     # We trigger on both create and update because dates might change, requiring re-sync.
+    # Bulk status changes leave the dates untouched.
+    if getattr(instance, "_bulk_status_change", False):
+        return
     transaction.on_commit(lambda: link_timesheet_entries_to_proposal_task.delay(instance.id))
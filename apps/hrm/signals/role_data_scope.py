@@ -22,12 +22,10 @@ def invalidate_cache_on_scope_change(sender, instance, **kwargs):
 
 
 @receiver(pre_save, sender="core.User")
-def invalidate_cache_on_user_role_change(sender, instance, **kwargs):
+def invalidate_cache_on_user_role_change(sender, instance, update_fields=None, **kwargs):
     """Invalidate cache when user's role is changed"""
-    if instance.pk:
-        try:
-            old_instance = sender.objects.get(pk=instance.pk)
-            if old_instance.role_id != instance.role_id:
-                invalidate_role_units_cache(instance.pk)
-        except sender.DoesNotExist:
-            pass
+    # Saves that do not write the role (e.g. the last_login update) cannot change it
+    if update_fields is not None and "role" not in update_fields and "role_id" not in update_fields:
+        return
+    if instance.has_tracked_change("role"):
+        invalidate_role_units_cache(instance.pk)
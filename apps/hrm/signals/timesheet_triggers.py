@@ -1,8 +1,12 @@
+from datetime import date
+from functools import partial
+from typing import Optional, Tuple
+
 from django.db import transaction
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
-from apps.hrm.constants import ProposalStatus, ProposalType
+from apps.hrm.constants import ProposalStatus
 from apps.hrm.models import (
     AttendanceExemption,
     CompensatoryWorkday,
@@ -11,6 +15,7 @@ from apps.hrm.models import (
     Proposal,
 )
 from apps.hrm.tasks.timesheet_triggers import (
+    TIMESHEET_AFFECTING_PROPOSAL_TYPES,
     process_calendar_change,
     process_contract_change,
     process_exemption_change,
@@ -37,23 +42,39 @@ def contract_changed_handler(sender, instance: Contract, created, **kwargs):
         transaction.on_commit(lambda: process_contract_change.delay(instance))
 
 
+def _get_calendar_range(instance, original: bool = False) -> Tuple[Optional[date], Optional[date]]:
+    """Return the (start, end) dates covered by a Holiday or CompensatoryWorkday."""
+    value = instance.get_original_value if original else partial(getattr, instance)
+    if isinstance(instance, Holiday):
+        start_date, end_date = value("start_date"), value("end_date")
+    else:
+        start_date = end_date = value("date")
+    return start_date, end_date or start_date
+
+
+@receiver(pre_save, sender=Holiday)
+@receiver(pre_save, sender=CompensatoryWorkday)
+def remember_previous_calendar_range(sender, instance, **kwargs):
+    """Keep the dates an updated calendar event covered before the save."""
+    instance._previous_calendar_range = _get_calendar_range(instance, original=True)
+
+
 @receiver([post_save, post_delete], sender=Holiday)
 @receiver([post_save, post_delete], sender=CompensatoryWorkday)
 def calendar_event_changed_handler(sender, instance, **kwargs):
     """
     Handle Holiday or CompensatoryWorkday changes.
     Affects 'day_type' and potentially status/working_days.
-    """
-    # Determine date range
-    start_date = getattr(instance, "start_date", None) or getattr(instance, "date", None)
-    end_date = getattr(instance, "end_date", None) or getattr(instance, "date", None)
 
-    if not start_date:
+    The timesheets are updated by one background job after the commit, covering
+    both the new dates and the dates the event covered before an update.
+    """
+    dates = [day for day in _get_calendar_range(instance) if day]
+    dates.extend(day for day in instance.__dict__.pop("_previous_calendar_range", ()) if day)
+    if not dates:
         return
 
-    if not end_date:
-        end_date = start_date
-
+    start_date, end_date = min(dates), max(dates)
     transaction.on_commit(lambda: process_calendar_change.delay(start_date, end_date))
 
 
@@ -73,21 +94,13 @@ def proposal_changed_handler(sender, instance: Proposal, **kwargs):
     """
     Handle Proposal changes (Leaves, OT, etc).
     """
-    if not instance.created_by_id:
+    if not instance.created_by_id or getattr(instance, "_bulk_status_change", False):
         return
 
     if instance.proposal_status != ProposalStatus.APPROVED:
         return
 
-    if instance.proposal_type not in [
-        ProposalType.PAID_LEAVE,
-        ProposalType.UNPAID_LEAVE,
-        ProposalType.MATERNITY_LEAVE,
-        ProposalType.OVERTIME_WORK,
-        ProposalType.LATE_EXEMPTION,
-        ProposalType.POST_MATERNITY_BENEFITS,
-        ProposalType.TIMESHEET_ENTRY_COMPLAINT,
-    ]:
+    if instance.proposal_type not in TIMESHEET_AFFECTING_PROPOSAL_TYPES:
         return
 
     transaction.on_commit(lambda: process_proposal_change.delay(instance))
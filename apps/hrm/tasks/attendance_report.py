@@ -1,13 +1,10 @@
 import logging
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
+from typing import Any
 
 from celery import shared_task
-from django.db import transaction
-from django.db.models import F, Window
-from django.db.models.functions import RowNumber
 
-from apps.hrm.models import AttendanceDailyReport, AttendanceRecord, Employee
-from apps.hrm.services.attendance_report import aggregate_attendance_daily_report
+from apps.hrm.services.attendance_report import aggregate_attendance_daily_report, rebuild_attendance_daily_reports
 
 logger = logging.getLogger(__name__)
 
@@ -30,87 +27,38 @@ def update_attendance_daily_report_task(employee_id: int, report_date_str: str)
 
 
 @shared_task(name="hrm.tasks.attendance_report.recalculate_daily_attendance_reports")
-def recalculate_daily_attendance_reports_task(report_date_str: str | None = None) -> None:
-    """Recalculate attendance daily reports for all employees for a specific date.
+def recalculate_daily_attendance_reports_task(
+    start_date_str: str | None = None, end_date_str: str | None = None
+) -> dict[str, Any] | None:
+    """Rebuild attendance daily reports for all employees over a date range.
 
-    Optimized to use bulk operations and window functions (via distinct on Postgres).
+    Without dates, the last complete day (yesterday) is rebuilt: the nightly
+    run happens right after midnight, when today has barely started.
 
     Args:
-        report_date_str: Date string in YYYY-MM-DD format (optional)
-    """
-    if report_date_str:
-        try:
-            report_date = datetime.strptime(report_date_str, "%Y-%m-%d").date()
-        except ValueError:
-            logger.error(f"Invalid date format: {report_date_str}")
-            return
-    else:
-        report_date = date.today()
-
-    logger.info(f"Starting batch recalculation of attendance daily reports for {report_date}")
-
-    # 1. Fetch all valid attendance records for the date
-    # Use distinct('employee_id') with order_by to get the first record per employee
-    # This works on PostgreSQL and is equivalent to using a window function for this purpose
-    qs = (
-        AttendanceRecord.objects.filter(
-            timestamp__date=report_date,
-            is_valid=True,
-            employee_id__isnull=False,
-        )
-        .select_related("attendance_geolocation")
-        .annotate(
-            row_number=Window(
-                expression=RowNumber(),
-                partition_by=[F("employee_id")],
-                order_by=F("timestamp").asc(),
-            )
-        )
-        .filter(row_number=1)
-        .order_by("employee_id", "timestamp")
-    )
-
-    if not qs:
-        logger.info(f"No attendance records found for {report_date}")
-        return
-
-    # 2. Fetch only relevant employees to get current org structure
-    employee_ids = {r.employee_id for r in qs}
-    employees = Employee.objects.in_bulk(employee_ids)
+        start_date_str: First day in YYYY-MM-DD format (optional)
+        end_date_str: Last day in YYYY-MM-DD format (optional, defaults to the start date)
 
-    new_reports = []
-
-    for record in qs:
-        if record.employee_id is None:
-            continue
-
-        employee = employees.get(record.employee_id)
-        if not employee:
-            continue
-
-        project_id = None
-        if record.attendance_geolocation:
-            project_id = record.attendance_geolocation.project_id
+    Returns:
+        dict with keys: `start_date`, `end_date` (str) and `report_count` (int),
+        or None when a date is invalid
+    """
+    try:
+        start_date = _parse_date(start_date_str) or date.today() - timedelta(days=1)
+        end_date = _parse_date(end_date_str) or start_date
+    except ValueError:
+        logger.error(f"Invalid date range: {start_date_str} - {end_date_str}")
+        return None
 
-        new_reports.append(
-            AttendanceDailyReport(
-                employee_id=record.employee_id,
-                report_date=report_date,
-                branch_id=employee.branch_id,
-                block_id=employee.block_id,
-                department_id=employee.department_id,
-                project_id=project_id,
-                attendance_method=record.attendance_type,
-                attendance_record=record,
-            )
-        )
+    logger.info(f"Starting batch recalculation of attendance daily reports from {start_date} to {end_date}")
+    report_count = rebuild_attendance_daily_reports(start_date, end_date)
 
-    # 3. Perform bulk update/create inside a transaction
-    with transaction.atomic():
-        # Delete existing reports for this date
-        AttendanceDailyReport.objects.filter(report_date=report_date).delete()
+    return {
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "report_count": report_count,
+    }
 
-        # Bulk create new reports
-        AttendanceDailyReport.objects.bulk_create(new_reports, batch_size=1000)
 
-    logger.info(f"Recalculated reports for {len(new_reports)} employees on {report_date}")
+def _parse_date(value: str | None) -> date | None:
+    return datetime.strptime(value, "%Y-%m-%d").date() if value else None
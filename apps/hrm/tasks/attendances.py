@@ -16,7 +16,9 @@ from apps.hrm.models import (
     AttendanceRecord,
     Employee,
 )
+from apps.hrm.services.attendance_punch import materialize_pending_punches
 from apps.hrm.services.timesheets import trigger_timesheet_updates_from_records
+from libs.code_generation import assign_auto_codes
 from libs.datetimes import make_aware
 
 logger = logging.getLogger(__name__)
@@ -26,6 +28,7 @@ SYNC_RETRY_DELAY = 300  # 5 minutes
 SYNC_MAX_RETRIES = 3
 SYNC_DEFAULT_LOOKBACK_DAYS = 1  # Default to sync last 1 day of logs
 BULK_CREATE_BATCH_SIZE = 1000  # Number of records to create in each batch
+PUNCH_MAX_BATCHES_PER_RUN = 20  # Upper bound of pending punch batches drained per task run
 
 
 @shared_task(bind=True, max_retries=SYNC_MAX_RETRIES)
@@ -175,9 +178,7 @@ def process_realtime_attendance_event(event_data: dict[str, Any]) -> dict[str, A
         employee = Employee.objects.filter(attendance_code=user_id).first()
 
         # Create record
-        temp_prefix = getattr(AttendanceRecord, "TEMP_CODE_PREFIX", "TEMP_")
         record = AttendanceRecord.objects.create(
-            code=f"{temp_prefix}{get_random_string(16)}",
             biometric_device=device,
             employee=employee,
             attendance_code=user_id,
@@ -198,12 +199,17 @@ def process_realtime_attendance_event(event_data: dict[str, Any]) -> dict[str, A
 
 
 @shared_task
-def sync_all_attendance_devices() -> dict[str, Any]:
+def sync_all_attendance_devices(inline: bool = False) -> dict[str, Any]:
     """Sync attendance logs from all active devices.
 
     This is the main periodic task that runs on schedule.
     It triggers individual sync tasks for each device.
 
+    Args:
+        inline: Sync the devices one after another in this task instead of
+            queueing one task per device, so the task only returns once every
+            device was synced (used by the nightly pipeline)
+
     Returns:
         dict: Summary of sync results with keys:
             - total_devices: int total number of devices
@@ -224,7 +230,10 @@ def sync_all_attendance_devices() -> dict[str, Any]:
 
     for device in devices:
         try:
-            sync_attendance_logs_for_device.delay(device.id)
+            if inline:
+                sync_attendance_logs_for_device.apply(args=(device.id,))
+            else:
+                sync_attendance_logs_for_device.delay(device.id)
             tasks_triggered += 1
             device_ids.append(device.id)
             logger.debug(f"Triggered sync task for device: {device.name} (ID: {device.id})")
@@ -240,6 +249,33 @@ def sync_all_attendance_devices() -> dict[str, Any]:
     }
 
 
+@shared_task
+def materialize_pending_attendance_punches() -> dict[str, Any]:
+    """Materialize punches buffered by the quick mobile check-in endpoints.
+
+    Drains the pending punch buffer in batches until it is empty or the per-run
+    batch limit is reached; the next scheduled run continues from there.
+
+    Returns:
+        dict: Summary with keys:
+            - records_created: int number of attendance records created
+            - batches: int number of batches processed
+    """
+    records_created = 0
+    batches = 0
+    while batches < PUNCH_MAX_BATCHES_PER_RUN:
+        created = materialize_pending_punches()
+        if not created:
+            break
+        records_created += created
+        batches += 1
+
+    if records_created:
+        logger.info(f"Materialized {records_created} pending attendance punches in {batches} batch(es)")
+
+    return {"records_created": records_created, "batches": batches}
+
+
 #### Helper functions
 
 
@@ -317,17 +353,11 @@ def _create_attendance_records_from_logs(
             raw_data = log.copy()
             raw_data["timestamp"] = log["timestamp"].isoformat()
 
-            # Ensure a unique temporary code is assigned since bulk_create bypasses
-            # model save() where AutoCodeMixin would normally populate it.
-            temp_prefix = getattr(AttendanceRecord, "TEMP_CODE_PREFIX", "TEMP_")
-            temp_code = f"{temp_prefix}{get_random_string(20)}"
-
             # Get employee if exists
             employee = employee_map.get(log["user_id"])
 
             records_to_create.append(
                 AttendanceRecord(
-                    code=temp_code,
                     biometric_device=device,
                     employee=employee,
                     attendance_code=log["user_id"],
@@ -336,6 +366,13 @@ def _create_attendance_records_from_logs(
                 )
             )
 
+    # bulk_create bypasses model save() where AutoCodeMixin would normally populate the code,
+    # so reserve ids and assign final codes up front (temporary codes if the database cannot reserve ids)
+    if not assign_auto_codes(records_to_create):
+        temp_prefix = getattr(AttendanceRecord, "TEMP_CODE_PREFIX", "TEMP_")
+        for record in records_to_create:
+            record.code = f"{temp_prefix}{get_random_string(20)}"
+
     return records_to_create
 
 
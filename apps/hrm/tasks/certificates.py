@@ -5,6 +5,7 @@ import logging
 from celery import shared_task
 
 from apps.hrm.models import EmployeeCertificate
+from apps.hrm.services.status_transitions import apply_certificate_status_transitions
 
 logger = logging.getLogger(__name__)
 
@@ -13,8 +14,8 @@ logger = logging.getLogger(__name__)
 def update_certificate_statuses() -> dict[str, int]:
     """Update certificate statuses based on expiry dates.
 
-    This task updates the status field of all EmployeeCertificate records
-    based on their expiry_date values according to these rules:
+    Only certificates whose expiry date crossed a threshold are selected and
+    updated set-based (see `apps.hrm.services.status_transitions`). The rules are:
 
     - No expiry_date → VALID
     - Current date > expiry_date → EXPIRED
@@ -25,7 +26,7 @@ def update_certificate_statuses() -> dict[str, int]:
 
     Returns:
         dict: Summary with keys:
-            - total_certificates: int total number of certificates processed
+            - total_certificates: int total number of certificates
             - updated_count: int number of certificates updated
             - valid_count: int number changed to VALID
             - near_expiry_count: int number changed to NEAR_EXPIRY
@@ -33,40 +34,25 @@ def update_certificate_statuses() -> dict[str, int]:
     """
     logger.info("Starting certificate status update task")
 
-    # Get all certificates
-    certificates = EmployeeCertificate.objects.all()
-    total_count = certificates.count()
+    result = apply_certificate_status_transitions()
+    Status = EmployeeCertificate.Status
 
-    logger.info(f"Processing {total_count} certificates")
+    for certificate_id, old_status, new_status in result.transitions:
+        logger.debug(f"Certificate {certificate_id}: {old_status} -> {new_status}")
 
-    updated_count = 0
-    status_changes = {"valid": 0, "near_expiry": 0, "expired": 0}
-
-    for certificate in certificates:
-        old_status = certificate.status
-        new_status = certificate.compute_status()
-
-        if old_status != new_status:
-            updated_count += 1
-            status_changes[new_status] += 1
-
-            logger.debug(f"Certificate {certificate.id}: {old_status} -> {new_status}")
-
-            certificate.status = new_status
-            # Skip validation and signals by using update_fields
-            certificate.save(update_fields=["status", "updated_at"])
-
-    logger.info(f"Certificate status update complete: {updated_count} certificates updated out of {total_count}")
     logger.info(
-        f"Status changes - VALID: {status_changes['valid']}, "
-        f"NEAR_EXPIRY: {status_changes['near_expiry']}, "
-        f"EXPIRED: {status_changes['expired']}"
+        f"Certificate status update complete: {result.updated_count} certificates updated out of {result.total_count}"
+    )
+    logger.info(
+        f"Status changes - VALID: {result.count_to(Status.VALID)}, "
+        f"NEAR_EXPIRY: {result.count_to(Status.NEAR_EXPIRY)}, "
+        f"EXPIRED: {result.count_to(Status.EXPIRED)}"
     )
 
     return {
-        "total_certificates": total_count,
-        "updated_count": updated_count,
-        "valid_count": status_changes["valid"],
-        "near_expiry_count": status_changes["near_expiry"],
-        "expired_count": status_changes["expired"],
+        "total_certificates": result.total_count,
+        "updated_count": result.updated_count,
+        "valid_count": result.count_to(Status.VALID),
+        "near_expiry_count": result.count_to(Status.NEAR_EXPIRY),
+        "expired_count": result.count_to(Status.EXPIRED),
     }
@@ -3,9 +3,9 @@
 import logging
 
 from celery import shared_task
-from django.utils import timezone
 
 from apps.hrm.models import Contract
+from apps.hrm.services.status_transitions import apply_contract_status_transitions
 
 logger = logging.getLogger(__name__)
 
@@ -14,108 +14,55 @@ logger = logging.getLogger(__name__)
 def check_contract_status() -> dict[str, int]:
     """Update contract statuses based on effective and expiration dates.
 
-    This task processes contracts per employee:
-    1. For each employee, identify the most recent contract (by effective_date, then created_at)
-    2. Update only the most recent contract's status based on date rules:
+    Only contracts crossing a threshold are selected and updated set-based (see
+    `apps.hrm.services.status_transitions`). The rules per employee are:
+    1. The most recent non-draft contract (largest id) follows the date rules:
        - If status is DRAFT: Keep DRAFT (preserved)
        - If effective_date > today: NOT_EFFECTIVE
        - If expiration_date is None (indefinite): ACTIVE
        - If expiration_date < today: EXPIRED
        - If days until expiration <= 30: ABOUT_TO_EXPIRE
        - Otherwise: ACTIVE
-    3. Mark all older contracts for the same employee as EXPIRED
+    2. All older contracts for the same employee are EXPIRED
+    3. Contracts of resigned or unpaid official employees are EXPIRED
 
     This ensures only one contract per employee can be ACTIVE/ABOUT_TO_EXPIRE at a time.
 
     Returns:
         dict: Summary with keys:
-            - total_contracts: int total number of contracts processed
+            - total_contracts: int total number of non-draft contracts
             - updated_count: int number of contracts updated
             - active_count: int number changed to ACTIVE
             - about_to_expire_count: int number changed to ABOUT_TO_EXPIRE
             - expired_count: int number changed to EXPIRED
             - not_effective_count: int number changed to NOT_EFFECTIVE
     """
-    from collections import defaultdict
-
     logger.info("Starting contract status update task")
 
-    # Get all contracts except DRAFT status (DRAFT is preserved and not auto-updated)
-    # Order by employee_id and -id (largest id = most recent contract)
-    contracts = Contract.objects.exclude(status=Contract.ContractStatus.DRAFT).order_by("employee_id", "-id")
-    total_count = contracts.count()
-
-    logger.info("Processing %d contracts", total_count)
-
-    status_changes: dict[str, int] = {
-        "active": 0,
-        "about_to_expire": 0,
-        "expired": 0,
-        "not_effective": 0,
-    }
-
-    # Group contracts by employee
-    contracts_by_employee: dict[int, list[Contract]] = defaultdict(list)
-    for contract in contracts:
-        contracts_by_employee[contract.employee_id].append(contract)
-
-    # Process each employee's contracts
-    contracts_to_update: list[Contract] = []
-    now = timezone.now()
-
-    for employee_id, employee_contracts in contracts_by_employee.items():
-        # employee_contracts is already sorted by -effective_date, -created_at
-        # First contract is the most recent one
-        for idx, contract in enumerate(employee_contracts):
-            old_status = contract.status
-
-            if idx == 0:
-                # Most recent contract: calculate status from dates
-                new_status = contract.calculate_status()
-            else:
-                # Older contracts: always expire them
-                new_status = Contract.ContractStatus.EXPIRED
-
-            if old_status != new_status:
-                status_changes[new_status] += 1
-
-                logger.debug(
-                    "Contract %s (%s): %s -> %s%s",
-                    contract.id,
-                    contract.code,
-                    old_status,
-                    new_status,
-                    "" if idx == 0 else " (older contract expired)",
-                )
-
-                contract.status = new_status
-                contract.updated_at = now
-                contracts_to_update.append(contract)
+    result = apply_contract_status_transitions()
+    Status = Contract.ContractStatus
 
-    # Bulk update all contracts that need status changes
-    updated_count = len(contracts_to_update)
-    if contracts_to_update:
-        Contract.objects.bulk_update(contracts_to_update, ["status", "updated_at"])
-        logger.info("Bulk updated %d contracts", updated_count)
+    for contract_id, old_status, new_status in result.transitions:
+        logger.debug("Contract %s: %s -> %s", contract_id, old_status, new_status)
 
     logger.info(
         "Contract status update complete: %d contracts updated out of %d",
-        updated_count,
-        total_count,
+        result.updated_count,
+        result.total_count,
     )
     logger.info(
         "Status changes - ACTIVE: %d, ABOUT_TO_EXPIRE: %d, EXPIRED: %d, NOT_EFFECTIVE: %d",
-        status_changes["active"],
-        status_changes["about_to_expire"],
-        status_changes["expired"],
-        status_changes["not_effective"],
+        result.count_to(Status.ACTIVE),
+        result.count_to(Status.ABOUT_TO_EXPIRE),
+        result.count_to(Status.EXPIRED),
+        result.count_to(Status.NOT_EFFECTIVE),
     )
 
     return {
-        "total_contracts": total_count,
-        "updated_count": updated_count,
-        "active_count": status_changes["active"],
-        "about_to_expire_count": status_changes["about_to_expire"],
-        "expired_count": status_changes["expired"],
-        "not_effective_count": status_changes["not_effective"],
+        "total_contracts": result.total_count,
+        "updated_count": result.updated_count,
+        "active_count": result.count_to(Status.ACTIVE),
+        "about_to_expire_count": result.count_to(Status.ABOUT_TO_EXPIRE),
+        "expired_count": result.count_to(Status.EXPIRED),
+        "not_effective_count": result.count_to(Status.NOT_EFFECTIVE),
     }
@@ -5,13 +5,15 @@ StaffGrowthReport and EmployeeStatusBreakdownReport models.
 
 Public API exports:
 - aggregate_hr_reports_for_work_history: Event-driven task for work history changes
+- aggregate_hr_reports_for_org_units: Re-aggregation after bulk work history writes
 - aggregate_hr_reports_batch: Scheduled batch task for daily reconciliation
 """
 
 from .batch_tasks import aggregate_hr_reports_batch
-from .event_tasks import aggregate_hr_reports_for_work_history
+from .event_tasks import aggregate_hr_reports_for_org_units, aggregate_hr_reports_for_work_history
 
 __all__ = [
     "aggregate_hr_reports_for_work_history",
+    "aggregate_hr_reports_for_org_units",
     "aggregate_hr_reports_batch",
 ]
@@ -5,11 +5,18 @@ changes (create, edit, delete) via Django signals.
 """
 
 import logging
+from datetime import date
 from typing import Any, cast
 
 from celery import shared_task
+from django.db import transaction
+
+from apps.hrm.models import Block, Branch, Department
 
 from .helpers import (
+    _aggregate_employee_resigned_reason_for_date,
+    _aggregate_employee_status_for_date,
+    _aggregate_staff_growth_for_date,
     _increment_employee_resigned_reason,
     _increment_employee_status,
     _increment_staff_growth,
@@ -50,3 +57,44 @@ def aggregate_hr_reports_for_work_history(action_type: str, snapshot: dict[str,
     _increment_staff_growth(action_type, snapshot)
     _increment_employee_status(action_type, snapshot)
     _increment_employee_resigned_reason(action_type, snapshot)
+
+
+@shared_task(queue="reports_event")
+def aggregate_hr_reports_for_org_units(units: list[list[Any]]) -> int:
+    """Fully re-aggregate the HR reports of the given dates and org units.
+
+    Used after bulk writes of work history (e.g. onboarding a batch of hires),
+    which skip the per-record signal: one task recomputes each affected report
+    row instead of one incremental task per record.
+
+    Args:
+        units: List of [ISO date, branch_id, block_id, department_id]
+
+    Returns:
+        Number of units aggregated
+    """
+    unique_units = {
+        (date.fromisoformat(str(day)), branch_id, block_id, department_id)
+        for day, branch_id, block_id, department_id in units
+    }
+
+    branches = Branch.objects.in_bulk({unit[1] for unit in unique_units})
+    blocks = Block.objects.in_bulk({unit[2] for unit in unique_units})
+    departments = Department.objects.in_bulk({unit[3] for unit in unique_units})
+
+    aggregated = 0
+    with transaction.atomic():
+        for report_date, branch_id, block_id, department_id in sorted(unique_units):
+            branch = branches.get(branch_id)
+            block = blocks.get(block_id)
+            department = departments.get(department_id)
+            if not (branch and block and department):
+                continue
+
+            _aggregate_staff_growth_for_date(report_date, branch, block, department)
+            _aggregate_employee_status_for_date(report_date, branch, block, department)
+            _aggregate_employee_resigned_reason_for_date(report_date, branch, block, department)
+            aggregated += 1
+
+    logger.info(f"Aggregated HR reports for {aggregated} date/org unit pairs")
+    return aggregated
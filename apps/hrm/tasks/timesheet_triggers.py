@@ -1,19 +1,27 @@
-from datetime import date
-from typing import Optional, Tuple
+import logging
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import List, Optional, Tuple
 
 from celery import shared_task
 from django.db import transaction
+from django.db.models import Q
 from django.db.models.signals import post_save
 
-from apps.hrm.constants import ProposalType
+from apps.hrm.constants import ProposalType, TimesheetDayType
 from apps.hrm.models import (
     AttendanceExemption,
+    CompensatoryWorkday,
     Contract,
+    Holiday,
     Proposal,
     TimeSheetEntry,
 )
 from apps.hrm.services.timesheet_calculator import TimesheetCalculator
 from apps.hrm.services.timesheet_snapshot_service import TimesheetSnapshotService
+from apps.hrm.services.timesheets import defer_monthly_timesheet_refresh
+
+logger = logging.getLogger(__name__)
 
 
 @shared_task
@@ -40,41 +48,109 @@ def process_contract_change(contract: Contract):
             post_save.send(sender=TimeSheetEntry, instance=entry, created=False)
 
 
-@shared_task
-@transaction.atomic
-def process_calendar_change(start_date: date, end_date: date):
-    """
-    Recalculate timesheets for all employees in the date range.
+# Entries of a calendar change are recalculated and committed in chunks of this size
+CALENDAR_CHANGE_CHUNK_SIZE = 500
+
+CALENDAR_CHANGE_UPDATE_FIELDS = [
+    "day_type",
+    "working_days",
+    "status",
+    "ot_tc1_hours",
+    "ot_tc2_hours",
+    "ot_tc3_hours",
+    "overtime_hours",
+    "is_punished",
+]
+
+
+@shared_task(bind=True)
+def process_calendar_change(self, start_date: date, end_date: date) -> int:
     """
-    entries = TimeSheetEntry.objects.filter(date__range=(start_date, end_date))
+    Apply a Holiday/CompensatoryWorkday change to the timesheets of the date range.
 
-    service = TimesheetSnapshotService()
-    updates = []
+    Only the entries whose stored day type differs from the one the calendar now gives
+    their date are updated and recalculated. They are processed in chunks, each in its
+    own transaction, and the progress is reported in the task state.
 
-    for entry in entries:
-        # 1. Re-snapshot Day Type
-        service.determine_day_type(entry)
+    Returns:
+        int: Number of entries updated
+    """
+    entry_ids = list(
+        TimeSheetEntry.objects.filter(_stale_day_type_filter(start_date, end_date))
+        .order_by("employee_id", "date")
+        .values_list("id", flat=True)
+    )
+    total = len(entry_ids)
+
+    for offset in range(0, total, CALENDAR_CHANGE_CHUNK_SIZE):
+        _recalculate_calendar_chunk(entry_ids[offset : offset + CALENDAR_CHANGE_CHUNK_SIZE])
+        if self.request.id:
+            self.update_state(
+                state="PROGRESS",
+                meta={
+                    "current": min(offset + CALENDAR_CHANGE_CHUNK_SIZE, total),
+                    "total": total,
+                    "status": "Updating timesheet day types",
+                },
+            )
+
+    logger.info("Calendar change %s - %s: updated %d timesheet entries", start_date, end_date, total)
+    return total
+
+
+def _stale_day_type_filter(start_date: date, end_date: date) -> Q:
+    """Match the entries of the range whose day type no longer follows the calendar.
+
+    Uses the precedence of `TimesheetSnapshotService.determine_day_type`, which the
+    recalculation applies: HOLIDAY, then COMPENSATORY, otherwise a regular day
+    (stored as OFFICIAL, or empty for days without a work schedule).
+    """
+    day_types = {}
+    for compensatory_date in CompensatoryWorkday.objects.filter(date__range=(start_date, end_date)).values_list(
+        "date", flat=True
+    ):
+        day_types[compensatory_date] = TimesheetDayType.COMPENSATORY
+    for holiday_start, holiday_end in Holiday.objects.filter(
+        start_date__lte=end_date, end_date__gte=start_date
+    ).values_list("start_date", "end_date"):
+        day = max(holiday_start, start_date)
+        while day <= min(holiday_end, end_date):
+            day_types[day] = TimesheetDayType.HOLIDAY
+            day += timedelta(days=1)
+
+    calendar_types = [TimesheetDayType.HOLIDAY, TimesheetDayType.COMPENSATORY]
+    special_dates = set(day_types)
+    regular_dates = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+        if start_date + timedelta(days=offset) not in special_dates
+    ]
+    stale = Q(date__in=regular_dates, day_type__in=calendar_types)
+    for day_type in calendar_types:
+        dates = [day for day, special_type in day_types.items() if special_type == day_type]
+        if dates:
+            stale |= Q(date__in=dates) & ~Q(day_type=day_type)
+    return stale
 
-        # 2. Recalculate
-        calc = TimesheetCalculator(entry)
-        calc.compute_all()
 
-        updates.append(entry)
+@transaction.atomic
+def _recalculate_calendar_chunk(entry_ids: List[int]) -> None:
+    entries = list(TimeSheetEntry.objects.filter(id__in=entry_ids).select_related("employee"))
+    by_employee: dict[int, List[TimeSheetEntry]] = defaultdict(list)
+    for entry in entries:
+        by_employee[entry.employee_id].append(entry)
 
-    if updates:
-        # Update all relevant fields
-        fields = [
-            "day_type",
-            "working_days",
-            "status",
-            "ot_tc1_hours",
-            "ot_tc2_hours",
-            "ot_tc3_hours",
-            "overtime_hours",
-            "is_punished",
-        ]
-        TimeSheetEntry.objects.bulk_update(updates, fields=fields)
-        for entry in updates:
+    snapshot_service = TimesheetSnapshotService()
+    with defer_monthly_timesheet_refresh():
+        for employee_id, employee_entries in by_employee.items():
+            dates = [entry.date for entry in employee_entries]
+            snapshot_service.preload_range(employee_id, min(dates), max(dates))
+            for entry in employee_entries:
+                # Re-snapshots the day type, then recalculates
+                TimesheetCalculator(entry, snapshot_service).compute_all()
+
+        TimeSheetEntry.objects.bulk_update(entries, fields=CALENDAR_CHANGE_UPDATE_FIELDS)
+        for entry in entries:
             post_save.send(sender=TimeSheetEntry, instance=entry, created=False)
 
 
@@ -119,80 +195,125 @@ def process_exemption_change(exemption: AttendanceExemption):
             post_save.send(sender=TimeSheetEntry, instance=entry, created=False)
 
 
+# Proposal types whose approval changes the daily timesheet entries of the creator
+TIMESHEET_AFFECTING_PROPOSAL_TYPES = [
+    ProposalType.PAID_LEAVE,
+    ProposalType.UNPAID_LEAVE,
+    ProposalType.MATERNITY_LEAVE,
+    ProposalType.OVERTIME_WORK,
+    ProposalType.LATE_EXEMPTION,
+    ProposalType.POST_MATERNITY_BENEFITS,
+    ProposalType.TIMESHEET_ENTRY_COMPLAINT,
+]
+
+LEAVE_PROPOSAL_TYPES = [
+    ProposalType.PAID_LEAVE,
+    ProposalType.UNPAID_LEAVE,
+    ProposalType.MATERNITY_LEAVE,
+]
+
+LATE_EXEMPTION_PROPOSAL_TYPES = [
+    ProposalType.LATE_EXEMPTION,
+    ProposalType.POST_MATERNITY_BENEFITS,
+]
+
+PROPOSAL_CHANGE_UPDATE_FIELDS = [
+    "absent_reason",
+    "count_for_payroll",
+    "status",
+    "working_days",
+    "late_minutes",
+    "early_minutes",
+    "is_punished",
+    "overtime_hours",
+    "ot_tc1_hours",
+    "ot_tc2_hours",
+    "ot_tc3_hours",
+    "allowed_late_minutes",
+    "allowed_late_minutes_reason",
+    "approved_ot_start_time",
+    "approved_ot_end_time",
+    "approved_ot_minutes",
+]
+
+
 @shared_task
 def process_proposal_change(proposal: Proposal):
-    # Determine date range
-    start_date = None
-    end_date = None
+    _recalculate_entries_for_proposals(proposal.created_by_id, [proposal])
+
 
-    # Extract dates based on type
-    start_date, end_date = _get_start_end_dates(proposal)
+@shared_task
+@transaction.atomic
+def process_employee_proposal_changes(proposal_ids: List[int]):
+    """
+    Recalculate the timesheets of one employee for a batch of approved proposals.
 
-    if not start_date:
+    Entries covered by several proposals are snapshotted and recalculated once, and the
+    monthly timesheets are marked for refresh once per affected month.
+    """
+    proposals = list(Proposal.objects.filter(id__in=proposal_ids).order_by("id"))
+    if not proposals:
         return
 
-    if not end_date:
-        end_date = start_date
+    with defer_monthly_timesheet_refresh():
+        _recalculate_entries_for_proposals(proposals[0].created_by_id, proposals)
+
 
-    entries = TimeSheetEntry.objects.filter(employee_id=proposal.created_by_id, date__range=(start_date, end_date))
+def _get_proposal_ranges(proposals: List[Proposal]) -> List[Tuple[str, date, date]]:
+    """Return (proposal_type, start_date, end_date) for each proposal with dates."""
+    ranges = []
+    for proposal in proposals:
+        start_date, end_date = _get_start_end_dates(proposal)
+        if not start_date:
+            continue
+        ranges.append((proposal.proposal_type, start_date, end_date or start_date))
+    return ranges
+
+
+def _recalculate_entries_for_proposals(employee_id: int, proposals: List[Proposal]) -> None:
+    ranges = _get_proposal_ranges(proposals)
+    if not ranges:
+        return
+
+    start_date = min(proposal_start for _, proposal_start, _ in ranges)
+    end_date = max(proposal_end for _, _, proposal_end in ranges)
+    entries = TimeSheetEntry.objects.filter(employee_id=employee_id, date__range=(start_date, end_date))
 
     snapshot_service = TimesheetSnapshotService()
+    snapshot_service.preload_range(employee_id, start_date, end_date)
     updates = []
 
-    is_leave_proposal = proposal.proposal_type in [
-        ProposalType.PAID_LEAVE,
-        ProposalType.UNPAID_LEAVE,
-        ProposalType.MATERNITY_LEAVE,
-    ]
-    is_late_exemption_proposal = proposal.proposal_type in [
-        ProposalType.LATE_EXEMPTION,
-        ProposalType.POST_MATERNITY_BENEFITS,
-    ]
-    is_overtime_proposal = proposal.proposal_type == ProposalType.OVERTIME_WORK
-
     for entry in entries:
+        proposal_types = {
+            proposal_type
+            for proposal_type, proposal_start, proposal_end in ranges
+            if proposal_start <= entry.date <= proposal_end
+        }
+        if not proposal_types:
+            continue
+
         # Snapshot overtime data for OT proposals
-        if is_overtime_proposal:
+        if ProposalType.OVERTIME_WORK in proposal_types:
             snapshot_service.snapshot_overtime_data(entry)
 
         # Snapshot leave reason and count_for_payroll for leave proposals
-        if is_leave_proposal:
+        if proposal_types.intersection(LEAVE_PROPOSAL_TYPES):
             # Clear existing absent_reason to allow re-snapshotting
             entry.absent_reason = None
             snapshot_service.snapshot_leave_reason(entry)
             snapshot_service.set_count_for_payroll(entry)
 
         # Snapshot allowed late minutes for late exemption/post maternity
-        if is_late_exemption_proposal:
+        if proposal_types.intersection(LATE_EXEMPTION_PROPOSAL_TYPES):
             snapshot_service.snapshot_allowed_late_minutes(entry)
 
         # Recalculate
-        calculator = TimesheetCalculator(entry)
+        calculator = TimesheetCalculator(entry, snapshot_service)
         calculator.compute_all()
         updates.append(entry)
 
     if updates:
-        TimeSheetEntry.objects.bulk_update(
-            updates,
-            fields=[
-                "absent_reason",
-                "count_for_payroll",
-                "status",
-                "working_days",
-                "late_minutes",
-                "early_minutes",
-                "is_punished",
-                "overtime_hours",
-                "ot_tc1_hours",
-                "ot_tc2_hours",
-                "ot_tc3_hours",
-                "allowed_late_minutes",
-                "allowed_late_minutes_reason",
-                "approved_ot_start_time",
-                "approved_ot_end_time",
-                "approved_ot_minutes",
-            ],
-        )
+        TimeSheetEntry.objects.bulk_update(updates, fields=PROPOSAL_CHANGE_UPDATE_FIELDS)
         for entry in updates:
             post_save.send(sender=TimeSheetEntry, instance=entry, created=False)
 
@@ -214,8 +335,9 @@ def _get_start_end_dates(proposal: Proposal) -> Tuple[Optional[date], Optional[d
 
     if proposal.proposal_type == ProposalType.OVERTIME_WORK:
         dates = list(proposal.overtime_entries.values_list("date", flat=True).order_by("date"))
-        start_date = min(dates)
-        end_date = max(dates)
+        if dates:
+            start_date = dates[0]
+            end_date = dates[-1]
 
     if proposal.proposal_type == ProposalType.LATE_EXEMPTION:
         start_date = proposal.late_exemption_start_date
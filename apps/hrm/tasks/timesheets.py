@@ -27,6 +27,7 @@ from apps.hrm.services.timesheets import (
     create_monthly_timesheet_for_employee,
     create_monthly_timesheets_for_month_all,
 )
+from apps.hrm.utils.timesheet_grid_cache import invalidate_timesheet_grid_cache
 
 logger = logging.getLogger(__name__)
 
@@ -275,9 +276,24 @@ def link_proposals_to_timesheet_entry_task(timesheet_entry_id: int) -> dict:
         objs = ProposalTimeSheetEntry.objects.bulk_create(new_links, ignore_conflicts=True)
         logger.info("Linked %s proposals to entry %s", len(objs), entry.id)
 
+    if to_add_ids or to_remove_ids:
+        # The grid flags the entries linked to a pending complaint
+        invalidate_timesheet_grid_cache(f"{date_obj.year:04d}{date_obj.month:02d}")
+
     return {"success": True, "added": len(to_add_ids), "removed": len(to_remove_ids)}
 
 
+def _invalidate_complaint_timesheet_grid_months(proposal: Proposal, entry_ids: set[int]) -> None:
+    """Invalidate the timesheet grid months of entries linked to or unlinked from a complaint.
+
+    The grid flags the entries linked to a pending complaint.
+    """
+    if proposal.proposal_type != ProposalType.TIMESHEET_ENTRY_COMPLAINT or not entry_ids:
+        return
+    for month in TimeSheetEntry.objects.filter(pk__in=entry_ids).dates("date", "month"):
+        invalidate_timesheet_grid_cache(f"{month.year:04d}{month.month:02d}")
+
+
 @shared_task
 def link_timesheet_entries_to_proposal_task(proposal_id: int) -> dict:
     """Link existing timesheet entries to a newly created/updated proposal.
@@ -346,4 +362,6 @@ def link_timesheet_entries_to_proposal_task(proposal_id: int) -> dict:
         objs = ProposalTimeSheetEntry.objects.bulk_create(new_links, ignore_conflicts=True)
         logger.info("Linked %s timesheet entries to proposal %s", len(objs), proposal.id)
 
+    _invalidate_complaint_timesheet_grid_months(proposal, to_add_ids | to_remove_ids)
+
     return {"success": True, "added": len(to_add_ids), "removed": len(to_remove_ids)}
@@ -5,11 +5,20 @@ from unittest.mock import MagicMock
 
 import pytest
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 
 from apps.files.models import FileModel
-from apps.hrm.models import AttendanceGeolocation, AttendanceRecord, AttendanceWifiDevice
+from apps.hrm.models import (
+    AttendanceGeolocation,
+    AttendanceRecord,
+    AttendanceWifiDevice,
+    PendingAttendancePunch,
+    TimeSheetEntry,
+)
+from apps.hrm.tasks.attendances import materialize_pending_attendance_punches
+from apps.hrm.utils.geofence_index import GEOFENCE_INDEX_VERSION_KEY
 
 
 class APITestMixin:
@@ -87,6 +96,69 @@ class TestGeoLocationAttendanceAPI(APITestMixin):
             assert response.status_code == status.HTTP_201_CREATED
             assert AttendanceRecord.objects.filter(employee=employee, attendance_type="geolocation").exists()
 
+    def test_geolocation_attendance_auto_resolves_geolocation(
+        self, user, project, employee, attendance_geolocation, confirmed_file
+    ):
+        """Test GeoLocation attendance resolves the nearest geolocation when no id is sent."""
+        cache.clear()
+        nearby_geolocation = AttendanceGeolocation.objects.create(
+            name="Nearby Office",
+            code="GEO003",
+            project=project,
+            latitude=Decimal("10.7775000"),
+            longitude=Decimal("106.7009000"),
+            radius_m=200,
+            status=AttendanceGeolocation.Status.ACTIVE,
+            created_by=user,
+            updated_by=user,
+        )
+
+        url = reverse("mobile-hrm:my-attendance-record-geolocation-attendance")
+        data = {"latitude": "10.7769100", "longitude": "106.7009000", "image_id": confirmed_file.id}
+
+        response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_201_CREATED
+        response_data = self.get_response_data(response)
+        assert response_data["attendance_geolocation"]["id"] == attendance_geolocation.id
+        assert response_data["attendance_geolocation"]["id"] != nearby_geolocation.id
+        assert response_data["distance_m"] < 5
+
+    def test_geolocation_attendance_auto_resolve_outside_all_geolocations(
+        self, employee, attendance_geolocation, confirmed_file
+    ):
+        """Test GeoLocation attendance without id fails when no geolocation contains the coordinates."""
+        cache.clear()
+        url = reverse("mobile-hrm:my-attendance-record-geolocation-attendance")
+        data = {"latitude": "10.9000000", "longitude": "106.9000000", "image_id": confirmed_file.id}
+
+        response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "location" in str(response.json()).lower()
+        assert not AttendanceRecord.objects.filter(employee=employee, attendance_type="geolocation").exists()
+
+    def test_geolocation_attendance_auto_resolve_skips_deactivated_geolocation(
+        self, employee, attendance_geolocation, confirmed_file, django_capture_on_commit_callbacks
+    ):
+        """Test the geofence index is rebuilt when a geolocation is deactivated."""
+        cache.clear()
+        url = reverse("mobile-hrm:my-attendance-record-geolocation-attendance")
+        data = {"latitude": "10.7769000", "longitude": "106.7009000", "image_id": confirmed_file.id}
+        assert self.client.post(url, data, format="json").status_code == status.HTTP_201_CREATED
+
+        attendance_geolocation.status = AttendanceGeolocation.Status.INACTIVE
+        with django_capture_on_commit_callbacks() as callbacks:
+            attendance_geolocation.save()
+        # The index is only invalidated once the transaction commits
+        assert cache.get(GEOFENCE_INDEX_VERSION_KEY) is not None
+        for callback in callbacks:
+            callback()
+
+        response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_geolocation_attendance_inactive_location(self, user, project, confirmed_file, employee):
         """Test GeoLocation attendance fails with inactive geolocation."""
         inactive_geolocation = AttendanceGeolocation.objects.create(
@@ -202,3 +274,100 @@ class TestWiFiAttendanceAPI(APITestMixin):
         error_data = response.json()
         error_str = str(error_data).lower()
         assert "bssid" in error_str
+
+
+@pytest.mark.django_db
+class TestQuickAttendancePunchAPI(APITestMixin):
+    """Test cases for the buffered GeoLocation and WiFi punch endpoints."""
+
+    @pytest.fixture(autouse=True)
+    def setup_client(self, api_client, user, user_device):
+        cache.clear()
+        self.client = api_client
+        token_mock = MagicMock()
+        token_mock.get.side_effect = lambda k: "device123" if k == "device_id" else None
+        self.client.force_authenticate(user=user, token=token_mock)
+
+    def test_geolocation_punch_is_buffered_then_materialized(self, employee, attendance_geolocation):
+        """Test a GeoLocation punch is acknowledged with 202 and recorded by the consumer task."""
+        url = reverse("mobile-hrm:my-attendance-record-geolocation-punch")
+        data = {"latitude": "10.7769000", "longitude": "106.7009000"}
+
+        response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        response_data = self.get_response_data(response)
+        assert response_data["attendance_type"] == "geolocation"
+        assert response_data["attendance_geolocation"] == attendance_geolocation.id
+        assert response_data["distance_m"] < 1
+        assert PendingAttendancePunch.objects.filter(employee=employee).count() == 1
+        assert not AttendanceRecord.objects.filter(employee=employee).exists()
+
+        result = materialize_pending_attendance_punches()
+
+        assert result["records_created"] == 1
+        assert not PendingAttendancePunch.objects.exists()
+        record = AttendanceRecord.objects.get(employee=employee)
+        assert record.attendance_type == "geolocation"
+        assert record.attendance_code == employee.attendance_code
+        assert record.attendance_geolocation_id == attendance_geolocation.id
+        assert record.code == f"DD{record.id:09d}"
+        assert TimeSheetEntry.objects.filter(employee=employee, date=record.timestamp.date()).exists()
+
+    def test_geolocation_punch_outside_all_geolocations(self, employee, attendance_geolocation):
+        """Test a GeoLocation punch outside every geolocation is rejected and not buffered."""
+        url = reverse("mobile-hrm:my-attendance-record-geolocation-punch")
+        data = {"latitude": "10.9000000", "longitude": "106.9000000"}
+
+        response = self.client.post(url, data, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "location" in str(response.json()).lower()
+        assert not PendingAttendancePunch.objects.exists()
+
+    def test_wifi_punch_is_buffered_then_materialized(self, employee, attendance_wifi_device):
+        """Test a WiFi punch is acknowledged with 202 and recorded by the consumer task."""
+        url = reverse("mobile-hrm:my-attendance-record-wifi-punch")
+
+        response = self.client.post(url, {"bssid": attendance_wifi_device.bssid}, format="json")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert self.get_response_data(response)["attendance_wifi_device"] == attendance_wifi_device.id
+
+        materialize_pending_attendance_punches()
+
+        record = AttendanceRecord.objects.get(employee=employee)
+        assert record.attendance_type == "wifi"
+        assert record.attendance_wifi_device_id == attendance_wifi_device.id
+
+    def test_wifi_punch_rejects_device_taken_out_of_use(self, employee, attendance_wifi_device):
+        """Test the cached WiFi registry is invalidated when a device is taken out of use."""
+        url = reverse("mobile-hrm:my-attendance-record-wifi-punch")
+        assert (
+            self.client.post(url, {"bssid": attendance_wifi_device.bssid}, format="json").status_code
+            == status.HTTP_202_ACCEPTED
+        )
+
+        attendance_wifi_device.state = AttendanceWifiDevice.State.NOT_IN_USE
+        attendance_wifi_device.save()
+
+        response = self.client.post(url, {"bssid": attendance_wifi_device.bssid}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert "bssid" in str(response.json()).lower()
+
+    def test_punch_rejects_revoked_device(self, employee, attendance_wifi_device, user_device):
+        """Test the cached device registry is invalidated when the device is revoked."""
+        url = reverse("mobile-hrm:my-attendance-record-wifi-punch")
+        assert (
+            self.client.post(url, {"bssid": attendance_wifi_device.bssid}, format="json").status_code
+            == status.HTTP_202_ACCEPTED
+        )
+
+        user_device.state = user_device.State.REVOKED
+        user_device.save()
+
+        response = self.client.post(url, {"bssid": attendance_wifi_device.bssid}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert PendingAttendancePunch.objects.count() == 1
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 
 import pytest
@@ -185,6 +185,47 @@ class TestAttendanceReportTasks:
         assert report.project_id == attendance_geolocation.project_id
         assert report.attendance_method == AttendanceType.GEOLOCATION
 
+    def test_recalculate_date_range_uses_first_local_punch_per_day(self, employee, attendance_geolocation):
+        tz = timezone.get_current_timezone()
+        day1 = date(2026, 3, 2)
+        day2 = date(2026, 3, 3)
+        outside = date(2026, 3, 10)
+
+        def punch(day, hour, code, attendance_type=AttendanceType.GEOLOCATION):
+            return AttendanceRecord.objects.create(
+                employee=employee,
+                timestamp=datetime.combine(day, time(hour, 0), tzinfo=tz),
+                attendance_type=attendance_type,
+                attendance_geolocation=attendance_geolocation,
+                is_valid=True,
+                code=code,
+            )
+
+        first_day1 = punch(day1, 8, "RNG001")
+        punch(day1, 17, "RNG002", AttendanceType.WIFI)
+        # Midnight local time belongs to day2 even though it is still day1 in UTC
+        first_day2 = punch(day2, 0, "RNG003", AttendanceType.WIFI)
+        punch(day2, 9, "RNG004")
+        for report_date in (day1, outside):
+            AttendanceDailyReport.objects.create(
+                employee=employee, report_date=report_date, attendance_method=AttendanceType.BIOMETRIC_DEVICE
+            )
+
+        result = recalculate_daily_attendance_reports_task(day1.isoformat(), day2.isoformat())
+
+        assert result["report_count"] == 2
+        reports = {report.report_date: report for report in AttendanceDailyReport.objects.filter(employee=employee)}
+        assert reports[day1].attendance_record_id == first_day1.id
+        assert reports[day2].attendance_record_id == first_day2.id
+        assert reports[day2].attendance_method == AttendanceType.WIFI
+        # Reports outside the range are left alone
+        assert reports[outside].attendance_method == AttendanceType.BIOMETRIC_DEVICE
+
+    def test_recalculate_defaults_to_yesterday(self, employee):
+        result = recalculate_daily_attendance_reports_task()
+
+        assert result["start_date"] == result["end_date"] == (date.today() - timedelta(days=1)).isoformat()
+
 
 @pytest.mark.django_db
 class TestAttendanceReportViewSet:
@@ -0,0 +1,53 @@
+"""Tests for assigning auto codes before the INSERT."""
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.hrm.models import AttendanceRecord
+from libs.code_generation import assign_auto_codes, reserve_ids
+
+
+@pytest.mark.django_db
+class TestAutoCodePreInsert:
+    """Test cases for single-write auto code generation."""
+
+    def test_create_writes_final_code_in_insert(self):
+        """Test a single create stores the final code without a follow-up UPDATE."""
+        with CaptureQueriesContext(connection) as ctx:
+            record = AttendanceRecord.objects.create(attendance_code="531", timestamp=timezone.now())
+
+        assert record.code == f"DD{record.id:09d}"
+        record.refresh_from_db()
+        assert record.code == f"DD{record.id:09d}"
+        assert not [q for q in ctx.captured_queries if q["sql"].startswith('UPDATE "hrm_attendance_record"')]
+
+    def test_bulk_create_with_assigned_codes(self):
+        """Test assign_auto_codes gives bulk-created rows unique final codes."""
+        now = timezone.now()
+        records = [AttendanceRecord(attendance_code=str(i), timestamp=now) for i in range(50)]
+
+        assert assign_auto_codes(records) is True
+        AttendanceRecord.objects.bulk_create(records)
+
+        stored = dict(AttendanceRecord.objects.values_list("id", "code"))
+        assert len(stored) == 50
+        assert all(code == f"DD{record_id:09d}" for record_id, code in stored.items())
+
+    def test_reserved_ids_do_not_collide_with_later_inserts(self):
+        """Test ids handed out by reserve_ids are skipped by later default inserts."""
+        reserved = reserve_ids(AttendanceRecord, 3)
+
+        record = AttendanceRecord.objects.create(attendance_code="531", timestamp=timezone.now())
+
+        assert reserved == sorted(reserved)
+        assert len(set(reserved)) == 3
+        assert record.id > max(reserved)
+
+    def test_explicit_code_is_kept(self):
+        """Test a code provided by the caller is not replaced."""
+        record = AttendanceRecord.objects.create(code="MANUAL001", attendance_code="531", timestamp=timezone.now())
+
+        record.refresh_from_db()
+        assert record.code == "MANUAL001"
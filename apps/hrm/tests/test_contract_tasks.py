@@ -374,3 +374,59 @@ class TestCheckContractStatusTask:
         assert result["updated_count"] == 2
         assert result["expired_count"] == 1  # old contract
         assert result["about_to_expire_count"] == 1  # new contract
+
+    def test_expires_contract_of_resigned_employee(self, db, employee, contract_type):
+        """Test that the latest contract of a resigned employee is EXPIRED regardless of dates."""
+        contract = create_contract_with_forced_status(
+            employee=employee,
+            contract_type=contract_type,
+            sign_date=date.today() - timedelta(days=30),
+            effective_date=date.today() - timedelta(days=10),
+            expiration_date=date.today() + timedelta(days=300),
+            forced_status=Contract.ContractStatus.ACTIVE,
+        )
+        Employee.objects.filter(pk=employee.pk).update(status=Employee.Status.RESIGNED)
+
+        result = check_contract_status()
+
+        contract.refresh_from_db()
+        assert contract.status == Contract.ContractStatus.EXPIRED
+        assert result["updated_count"] == 1
+        assert result["expired_count"] == 1
+
+    def test_reactivates_latest_contract_expired_too_early(self, db, employee, contract_type):
+        """Test that an EXPIRED latest contract whose dates are still valid becomes ACTIVE again."""
+        contract = create_contract_with_forced_status(
+            employee=employee,
+            contract_type=contract_type,
+            sign_date=date.today() - timedelta(days=30),
+            effective_date=date.today() - timedelta(days=10),
+            expiration_date=None,
+            forced_status=Contract.ContractStatus.EXPIRED,
+        )
+
+        result = check_contract_status()
+
+        contract.refresh_from_db()
+        assert contract.status == Contract.ContractStatus.ACTIVE
+        assert result["active_count"] == 1
+
+    def test_queries_do_not_depend_on_contract_count(self, db, employee, contract_type, django_assert_max_num_queries):
+        """Test that the task selects and updates transitions without per-contract queries."""
+        for _ in range(5):
+            create_contract_with_forced_status(
+                employee=employee,
+                contract_type=contract_type,
+                sign_date=date.today() - timedelta(days=30),
+                effective_date=date.today() - timedelta(days=10),
+                expiration_date=date.today() + timedelta(days=15),
+                forced_status=Contract.ContractStatus.ACTIVE,
+            )
+
+        # count + candidate select + one UPDATE per target status (+ savepoint)
+        with django_assert_max_num_queries(6):
+            result = check_contract_status()
+
+        assert result["updated_count"] == 5
+        assert result["expired_count"] == 4
+        assert result["about_to_expire_count"] == 1
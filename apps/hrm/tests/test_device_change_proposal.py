@@ -1,4 +1,4 @@
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from django.test import TestCase
 from rest_framework import status
@@ -124,14 +124,8 @@ class DeviceChangeProposalApprovalTestCase(TestCase):
         )
 
     @patch("apps.notifications.utils.trigger_send_notification")
-    @patch("apps.core.utils.jwt.OutstandingToken")
-    @patch("apps.core.utils.jwt.BlacklistedToken")
-    def test_approve_device_change_simple(self, mock_blacklisted, mock_outstanding, mock_notify):
+    def test_approve_device_change_simple(self, mock_notify):
         """Test approving device change proposal with new device."""
-        # Mock JWT token blacklisting
-        mock_outstanding.objects.filter.return_value = []
-        mock_blacklisted.objects.get_or_create = MagicMock()
-
         # Create proposal
         new_device_id = "brand_new_device_789"
         proposal = self._create_device_change_proposal(new_device_id)
@@ -169,14 +163,8 @@ class DeviceChangeProposalApprovalTestCase(TestCase):
         self.assertEqual(self.requester_user.mobile_token_version, 2)
 
     @patch("apps.notifications.utils.trigger_send_notification")
-    @patch("apps.core.utils.jwt.OutstandingToken")
-    @patch("apps.core.utils.jwt.BlacklistedToken")
-    def test_approve_device_change_with_reassignment(self, mock_blacklisted, mock_outstanding, mock_notify):
+    def test_approve_device_change_with_reassignment(self, mock_notify):
         """Test approving device change when new device belongs to another user."""
-        # Mock JWT token blacklisting
-        mock_outstanding.objects.filter.return_value = []
-        mock_blacklisted.objects.get_or_create = MagicMock()
-
         # Create proposal requesting device that belongs to other_user
         proposal = self._create_device_change_proposal(self.conflicting_device_id)
 
@@ -948,6 +948,64 @@ class TestEmployeeAPI:
         assert count >= 1
         assert any(item.get("citizen_id") == "987654321" for item in results)
 
+    def test_search_employees_ignores_accents(self, branch, department):
+        Employee.objects.create(
+            fullname="Nguyễn Văn Đức",
+            username="nguyenvanduc",
+            email="duc@example.com",
+            phone="0987650001",
+            citizen_id="111222333",
+            start_date=date.today(),
+            branch=branch,
+            department=department,
+        )
+
+        url = reverse("hrm:employee-list")
+        response = self.client.get(url, {"search": "nguyen van duc"})
+
+        assert response.status_code == status.HTTP_200_OK
+        results, count = self.normalize_list_response(self.get_response_data(response))
+        assert count == 1
+        assert results[0]["fullname"] == "Nguyễn Văn Đức"
+
+    def test_search_employees_ranks_prefix_matches_first(self, branch, department):
+        for index, fullname in enumerate(["Trần Anh", "Anh Trần", "Lê Thị Anh"]):
+            Employee.objects.create(
+                fullname=fullname,
+                username=f"rank{index}",
+                email=f"rank{index}@example.com",
+                personal_email=f"rank{index}.personal@example.com",
+                phone=f"098765100{index}",
+                citizen_id=f"22233344{index}",
+                start_date=date.today(),
+                branch=branch,
+                department=department,
+            )
+
+        url = reverse("hrm:employee-list")
+        response = self.client.get(url, {"search": "anh"})
+
+        assert response.status_code == status.HTTP_200_OK
+        results, _ = self.normalize_list_response(self.get_response_data(response))
+        assert results[0]["fullname"] == "Anh Trần"
+
+        response = self.client.get(url, {"search": "anh", "ordering": "-fullname"})
+
+        results, _ = self.normalize_list_response(self.get_response_data(response))
+        assert [result["fullname"] for result in results] == ["Trần Anh", "Lê Thị Anh", "Anh Trần"]
+
+    def test_refresh_search_text_after_queryset_update(self, employees):
+        emp1 = employees[0]
+        Employee.objects.filter(pk=emp1.pk).update(fullname="Phạm Minh Hoàng")
+        Employee.refresh_search_text(Employee.objects.filter(pk=emp1.pk))
+
+        url = reverse("hrm:employee-list")
+        response = self.client.get(url, {"search": "pham minh hoang"})
+
+        results, count = self.normalize_list_response(self.get_response_data(response))
+        assert count == 1
+        assert results[0]["id"] == emp1.id
+
     def test_list_employees_pagination(self, employees):
         url = reverse("hrm:employee-list")
         response = self.client.get(url, {"page": 1, "page_size": 2})
@@ -11,6 +11,7 @@ from rest_framework.test import APIClient
 from apps.core.models import AdministrativeUnit, Province
 from apps.hrm.constants import CertificateType
 from apps.hrm.models import Block, Branch, Department, Employee, EmployeeCertificate, Position
+from apps.hrm.tasks import update_certificate_statuses
 
 User = get_user_model()
 
@@ -352,6 +353,47 @@ class EmployeeCertificateModelTest(TestCase):
         )
         self.assertEqual(certificate.issuing_organization, "")
 
+    def test_update_certificate_statuses_task_applies_crossed_thresholds(self):
+        """Test the nightly task only changes certificates whose expiry crossed a threshold"""
+        near_expiry = EmployeeCertificate.objects.create(
+            employee=self.employee,
+            certificate_type=CertificateType.FOREIGN_LANGUAGE,
+            certificate_name="IELTS 7.0",
+            issue_date=date.today() - timedelta(days=300),
+            expiry_date=date.today() + timedelta(days=10),
+        )
+        expired = EmployeeCertificate.objects.create(
+            employee=self.employee,
+            certificate_type=CertificateType.COMPUTER,
+            certificate_name="ICDL",
+            issue_date=date.today() - timedelta(days=300),
+            expiry_date=date.today() - timedelta(days=1),
+        )
+        unchanged = EmployeeCertificate.objects.create(
+            employee=self.employee,
+            certificate_type=CertificateType.COMPUTER,
+            certificate_name="MOS",
+            issue_date=date.today(),
+        )
+        # Simulate statuses computed on an earlier day
+        EmployeeCertificate.objects.filter(pk__in=[near_expiry.pk, expired.pk]).update(
+            status=EmployeeCertificate.Status.VALID
+        )
+
+        result = update_certificate_statuses()
+
+        near_expiry.refresh_from_db()
+        expired.refresh_from_db()
+        unchanged.refresh_from_db()
+        self.assertEqual(near_expiry.status, EmployeeCertificate.Status.NEAR_EXPIRY)
+        self.assertEqual(expired.status, EmployeeCertificate.Status.EXPIRED)
+        self.assertEqual(unchanged.status, EmployeeCertificate.Status.VALID)
+        self.assertEqual(result["total_certificates"], 3)
+        self.assertEqual(result["updated_count"], 2)
+        self.assertEqual(result["near_expiry_count"], 1)
+        self.assertEqual(result["expired_count"], 1)
+        self.assertEqual(result["valid_count"], 0)
+
 
 class EmployeeCertificateAPITest(TestCase):
     """Test cases for EmployeeCertificate API"""
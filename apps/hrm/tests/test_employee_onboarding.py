@@ -0,0 +1,395 @@
+import sqlite3
+from calendar import monthrange
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from apps.core.models import Role
+from apps.files.models import FileModel
+from apps.hrm.import_handlers.employee import COLUMN_MAPPING, _defer_onboarding, on_import_end
+from apps.hrm.models import Employee, EmployeeMonthlyTimesheet, EmployeeWorkHistory, TimeSheetEntry
+from apps.hrm.services.employee import bulk_onboard_employees, complete_onboarding
+from apps.imports.constants import STATUS_CANCELLED, STATUS_FAILED, STATUS_QUEUED, STATUS_SUCCEEDED
+from apps.imports.models import ImportJob
+from apps.imports.tasks import import_job_task
+from apps.imports.utils import StreamingReader
+from apps.payroll.models import EmployeeKPIAssessment, KPIAssessmentPeriod, KPICriterion, PayrollSlip, SalaryPeriod
+from apps.payroll.services.payroll_calculation import PayrollCalculationService
+
+IMPORT_COLUMNS = [
+    "code",
+    "fullname",
+    "status",
+    "branch",
+    "block",
+    "department",
+    "phone",
+    "email",
+    "personal_email",
+    "citizen_id",
+    "attendance_code",
+]
+IMPORT_HEADERS = [next(header for header, field in COLUMN_MAPPING.items() if field == name) for name in IMPORT_COLUMNS]
+
+
+def _new_employee(index, department, **kwargs):
+    data = {
+        "fullname": f"Seasonal Staff {index}",
+        "username": f"seasonal{index}",
+        "email": f"seasonal{index}@example.com",
+        "personal_email": f"seasonal{index}@personal.example.com",
+        "phone": f"09{index:08d}",
+        "attendance_code": f"{index:06d}",
+        "citizen_id": f"{index:012d}",
+        "start_date": date.today(),
+        "status": Employee.Status.ONBOARDING,
+        "department": department,
+    }
+    data.update(kwargs)
+    return Employee(**data)
+
+
+def _onboarding_query_counts(department):
+    """Count the queries of onboarding 1 then 30 hires, after a first warm-up hire."""
+    bulk_onboard_employees([_new_employee(1, department)])
+
+    # Django caps SQLite statements at 999 parameters. Use the actual SQLite limit so
+    # that bulk writes are batched by 1000 rows like on PostgreSQL; 30 hires fit in one batch
+    connection.ensure_connection()
+    max_query_params = connection.connection.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+    query_counts = {}
+    with patch.object(connection.features, "max_query_params", max_query_params):
+        for start, hires in ((2, 1), (3, 30)):
+            with CaptureQueriesContext(connection) as queries:
+                bulk_onboard_employees([_new_employee(i, department) for i in range(start, start + hires)])
+            query_counts[hires] = len(queries)
+    return query_counts
+
+
+@pytest.fixture
+def default_role(db):
+    return Role.objects.create(code="VT_ONBOARD", name="Onboarding default", is_default_role=True)
+
+
+@pytest.fixture
+def report_task():
+    with patch("apps.hrm.services.employee.onboarding.aggregate_hr_reports_for_org_units.delay") as mock_delay:
+        yield mock_delay
+
+
+@pytest.mark.django_db
+class TestBulkOnboardEmployees:
+    def test_creates_employees_with_users_codes_and_history(self, department, default_role, report_task):
+        employees = bulk_onboard_employees([_new_employee(i, department) for i in range(1, 4)], note="Seasonal")
+
+        saved = Employee.objects.filter(pk__in=[e.pk for e in employees]).select_related("user")
+        assert saved.count() == 3
+        for employee in saved:
+            assert employee.code == f"{employee.code_type}{employee.pk:09d}"
+            assert employee.branch_id == department.branch_id
+            assert employee.block_id == department.block_id
+            assert employee.code.lower() in employee.search_text
+            assert employee.user.username == employee.username
+            assert employee.user.role == default_role
+            assert not employee.user.has_usable_password()
+
+        histories = EmployeeWorkHistory.objects.filter(employee__in=employees)
+        assert histories.count() == 3
+        for history in histories:
+            assert history.note == "Seasonal"
+            assert history.previous_data == {"status": None}
+            assert history.department_id == department.id
+
+    def test_creates_month_timesheets_and_one_report_refresh(
+        self, department, default_role, report_task, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            employees = bulk_onboard_employees([_new_employee(i, department) for i in range(1, 4)])
+
+        today = date.today()
+        days_in_month = monthrange(today.year, today.month)[1]
+        assert TimeSheetEntry.objects.filter(employee__in=employees).count() == 3 * days_in_month
+        assert (
+            EmployeeMonthlyTimesheet.objects.filter(
+                employee__in=employees, month_key=f"{today.year:04d}{today.month:02d}"
+            ).count()
+            == 3
+        )
+        report_task.assert_called_once_with(
+            [[today.isoformat(), department.branch_id, department.block_id, department.id]]
+        )
+
+    def test_query_count_does_not_grow_with_hires(self, department, default_role, report_task):
+        query_counts = _onboarding_query_counts(department)
+
+        assert query_counts[30] == query_counts[1]
+
+    def test_invalid_employee_saves_nothing(self, department, default_role, report_task):
+        employees = [
+            _new_employee(1, department),
+            _new_employee(2, department, status=Employee.Status.RESIGNED),
+        ]
+
+        with pytest.raises(ValidationError):
+            bulk_onboard_employees(employees)
+
+        assert not Employee.objects.filter(username__startswith="seasonal").exists()
+
+
+@pytest.fixture
+def kpi_period(db):
+    KPICriterion.objects.create(
+        target="sales",
+        criterion="Revenue",
+        evaluation_type="work_performance",
+        component_total_score=60,
+        group_number=1,
+        order=1,
+        active=True,
+    )
+    KPICriterion.objects.create(
+        target="sales",
+        criterion="Attitude",
+        evaluation_type="discipline",
+        component_total_score=40,
+        group_number=1,
+        order=2,
+        active=True,
+    )
+    return KPIAssessmentPeriod.objects.create(month=date.today().replace(day=1), kpi_config_snapshot={})
+
+
+@pytest.mark.django_db
+class TestOnboardingPayrollRecords:
+    def test_creates_assessments_and_calculated_slips(self, department, default_role, report_task, kpi_period):
+        salary_period = SalaryPeriod.objects.create(month=kpi_period.month, salary_config_snapshot={})
+
+        with patch.object(PayrollCalculationService, "calculate", autospec=True) as calculate:
+            employees = bulk_onboard_employees([_new_employee(i, department) for i in range(1, 4)])
+
+        assessments = EmployeeKPIAssessment.objects.filter(period=kpi_period).prefetch_related("items")
+        assert {assessment.employee_id for assessment in assessments} == {employee.pk for employee in employees}
+        for assessment in assessments:
+            assert assessment.department_snapshot_id == department.id
+            assert assessment.total_possible_score == 100
+            assert [item.criterion for item in assessment.items.order_by("order")] == ["Revenue", "Attitude"]
+
+        slips = PayrollSlip.objects.filter(salary_period=salary_period)
+        assert {slip.employee_id for slip in slips} == {employee.pk for employee in employees}
+        for slip in slips:
+            assert slip.code == f"PS_{salary_period.month:%Y%m}_{slip.pk:04d}"
+        assert {call.args[0].slip.pk for call in calculate.call_args_list} == {slip.pk for slip in slips}
+        salary_period.refresh_from_db()
+        assert salary_period.total_employees == 3
+
+    def test_assessments_query_count_does_not_grow_with_hires(self, department, default_role, report_task, kpi_period):
+        query_counts = _onboarding_query_counts(department)
+
+        assert query_counts[30] == query_counts[1]
+        assert EmployeeKPIAssessment.objects.filter(period=kpi_period).count() == 32
+
+
+@pytest.mark.django_db
+class TestImportDeferredOnboarding:
+    def test_deferred_employee_is_completed_on_import_end(
+        self, department, default_role, report_task, django_capture_on_commit_callbacks
+    ):
+        employee = _new_employee(1, department, code="MV900000001", status=Employee.Status.ACTIVE)
+        employee._defer_onboarding = True
+        with patch("apps.hrm.signals.employee.prepare_monthly_timesheets.apply_async") as mock_prepare:
+            employee.save(force_insert=True)
+
+        employee.refresh_from_db()
+        assert employee.user_id is None
+        mock_prepare.assert_not_called()
+
+        options = {}
+        _defer_onboarding(employee, options)
+        with django_capture_on_commit_callbacks(execute=True):
+            on_import_end("job-id", options)
+
+        employee.refresh_from_db()
+        assert employee.user is not None
+        assert EmployeeWorkHistory.objects.filter(employee=employee).count() == 1
+        assert TimeSheetEntry.objects.filter(employee=employee).exists()
+        report_task.assert_called_once()
+        assert "_pending_onboarding_ids" not in options
+
+
+class FakeReader(StreamingReader):
+    """Reader yielding the given rows; an exception in the rows is raised instead."""
+
+    def __init__(self, rows):
+        super().__init__("employees.csv")
+        self.rows = rows
+
+    def __enter__(self):
+        return self
+
+    def read_rows(self, skip_rows: int = 1):
+        for row in self.rows:
+            if isinstance(row, Exception):
+                raise row
+            yield row() if callable(row) else row
+
+
+@pytest.mark.django_db
+class TestEmployeeImportJobOnboarding:
+    @pytest.fixture
+    def import_job(self, superuser):
+        file = FileModel.objects.create(
+            purpose="employee_import",
+            file_name="employees.csv",
+            file_path="imports/employees.csv",
+            is_confirmed=True,
+            uploaded_by=superuser,
+        )
+        return ImportJob.objects.create(
+            file=file,
+            created_by=superuser,
+            status=STATUS_QUEUED,
+            options={
+                "handler_path": "apps.hrm.import_handlers.employee.import_handler",
+                "count_total_first": False,
+                "create_result_file_records": False,
+            },
+        )
+
+    def _row(self, index, department, **kwargs):
+        values = {
+            "code": f"MV{900000000 + index}",
+            "fullname": f"Imported Staff {index}",
+            "status": "W",
+            "branch": department.branch.name,
+            "block": department.block.name,
+            "department": department.name,
+            "phone": f"09{index:08d}",
+            "email": f"imported{index}@example.com",
+            "personal_email": f"imported{index}@personal.example.com",
+            "citizen_id": f"{900000000 + index:012d}",
+            "attendance_code": f"{900000 + index}",
+        }
+        values.update(kwargs)
+        return [values[name] for name in IMPORT_COLUMNS]
+
+    def _run(self, import_job, rows, django_capture_on_commit_callbacks):
+        with (
+            patch("apps.imports.tasks.read_headers", return_value=IMPORT_HEADERS),
+            patch("apps.imports.tasks.get_streaming_reader", return_value=FakeReader(rows)),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            import_job_task.apply(args=[str(import_job.id)])
+        import_job.refresh_from_db()
+        return Employee.objects.filter(code__startswith="MV9").select_related("user").order_by("code")
+
+    def _cancel(self, import_job, row):
+        def cancel_then_read():
+            ImportJob.objects.filter(pk=import_job.pk).update(status=STATUS_CANCELLED)
+            return row
+
+        return cancel_then_read
+
+    @pytest.mark.parametrize(
+        "failure, expected_status",
+        [
+            ("row", STATUS_SUCCEEDED),
+            ("file", STATUS_FAILED),
+            ("cancel", STATUS_CANCELLED),
+        ],
+    )
+    def test_employees_committed_before_a_failure_are_onboarded(
+        self,
+        import_job,
+        department,
+        default_role,
+        report_task,
+        django_capture_on_commit_callbacks,
+        failure,
+        expected_status,
+    ):
+        rows = [self._row(1, department), self._row(2, department)]
+        if failure == "row":
+            # Rejected by the handler: the personal email is already used
+            rows.append(self._row(3, department, personal_email="imported1@personal.example.com"))
+        elif failure == "file":
+            rows.append(ValueError("Corrupted row"))
+        else:
+            rows.append(self._cancel(import_job, self._row(3, department)))
+
+        employees = self._run(import_job, rows, django_capture_on_commit_callbacks)
+
+        assert import_job.status == expected_status
+        assert [employee.code for employee in employees] == ["MV900000001", "MV900000002"]
+        for employee in employees:
+            assert employee.user is not None
+            assert TimeSheetEntry.objects.filter(employee=employee).exists()
+            assert EmployeeWorkHistory.objects.filter(employee=employee).exists()
+
+    def test_onboarding_error_fails_the_job(
+        self, import_job, department, default_role, report_task, django_capture_on_commit_callbacks
+    ):
+        with patch(
+            "apps.hrm.import_handlers.employee.complete_onboarding", side_effect=RuntimeError("Onboarding failed")
+        ):
+            employees = self._run(import_job, [self._row(1, department)], django_capture_on_commit_callbacks)
+
+        assert import_job.status == STATUS_FAILED
+        assert "Onboarding failed" in import_job.error_message
+        assert employees.get().user is None
+
+    @pytest.mark.parametrize(
+        "failure, expected_status",
+        [
+            ("file", STATUS_FAILED),
+            ("cancel", STATUS_CANCELLED),
+        ],
+    )
+    def test_onboarding_error_does_not_replace_the_import_outcome(
+        self,
+        import_job,
+        department,
+        default_role,
+        report_task,
+        django_capture_on_commit_callbacks,
+        failure,
+        expected_status,
+    ):
+        rows = [self._row(1, department)]
+        if failure == "file":
+            rows.append(ValueError("Corrupted row"))
+        else:
+            rows.append(self._cancel(import_job, self._row(2, department)))
+
+        with patch(
+            "apps.hrm.import_handlers.employee.complete_onboarding", side_effect=RuntimeError("Onboarding failed")
+        ):
+            self._run(import_job, rows, django_capture_on_commit_callbacks)
+
+        assert import_job.status == expected_status
+        assert "Onboarding failed" not in (import_job.error_message or "")
+
+    def test_failed_batch_is_completed_when_the_import_ends(
+        self, import_job, department, default_role, report_task, django_capture_on_commit_callbacks
+    ):
+        calls = []
+
+        def fail_first_batch(employees, note=""):
+            calls.append(sorted(employee.code for employee in employees))
+            if len(calls) == 1:
+                raise RuntimeError("Onboarding failed")
+            complete_onboarding(employees, note=note)
+
+        rows = [self._row(index, department) for index in range(1, 4)]
+        with (
+            patch("apps.hrm.import_handlers.employee.ONBOARDING_BATCH_SIZE", 2),
+            patch("apps.hrm.import_handlers.employee.complete_onboarding", side_effect=fail_first_batch),
+        ):
+            employees = self._run(import_job, rows, django_capture_on_commit_callbacks)
+
+        assert import_job.status == STATUS_SUCCEEDED
+        assert calls == [["MV900000001", "MV900000002"], ["MV900000001", "MV900000002", "MV900000003"]]
+        assert all(employee.user is not None for employee in employees)
@@ -1,5 +1,6 @@
 from datetime import date, datetime, time
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from django.urls import reverse
@@ -18,12 +19,13 @@ from apps.hrm.api.views.proposal import (
     ProposalLateExemptionViewSet,
     ProposalPaidLeaveViewSet,
 )
-from apps.hrm.constants import ProposalStatus, ProposalType, TimesheetStatus
+from apps.hrm.constants import ProposalStatus, ProposalType, TimesheetReason, TimesheetStatus
 from apps.hrm.models import (
     Block,
     Branch,
     Department,
     Employee,
+    EmployeeMonthlyTimesheet,
     Position,
     Proposal,
     ProposalAsset,
@@ -31,6 +33,7 @@ from apps.hrm.models import (
     ProposalTimeSheetEntry,
     TimeSheetEntry,
 )
+from apps.notifications.models import Notification
 
 pytestmark = pytest.mark.django_db
 
@@ -1923,3 +1926,137 @@ class TestProposalExportXLSX:
         response = api_client.get(url, {"delivery": "direct", "proposal_status": ProposalStatus.PENDING})
 
         assert response.status_code == status.HTTP_206_PARTIAL_CONTENT
+
+
+class TestBulkApproveProposalAPI:
+    """Tests for bulk approving and rejecting proposals."""
+
+    url = "hrm:proposal-bulk-approve"
+
+    def _create_unpaid_leave(self, employee, code, day, **kwargs):
+        return Proposal.objects.create(
+            code=code,
+            proposal_type=ProposalType.UNPAID_LEAVE,
+            proposal_status=kwargs.pop("proposal_status", ProposalStatus.PENDING),
+            unpaid_leave_start_date=date(2025, 3, day),
+            unpaid_leave_end_date=date(2025, 3, day),
+            unpaid_leave_shift="full_day",
+            created_by=employee,
+            **kwargs,
+        )
+
+    def test_bulk_approve_returns_result_per_id(self, api_client, superuser, test_employee):
+        first = self._create_unpaid_leave(test_employee, "DX_BULK_001", 10)
+        second = self._create_unpaid_leave(test_employee, "DX_BULK_002", 11)
+        processed = self._create_unpaid_leave(
+            test_employee, "DX_BULK_003", 12, proposal_status=ProposalStatus.REJECTED, approval_note="No"
+        )
+
+        response = api_client.post(
+            reverse(self.url),
+            {"ids": [first.id, second.id, processed.id, 999999], "is_approve": True},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["data"]
+        assert [(item["id"], item["success"]) for item in results] == [
+            (first.id, True),
+            (second.id, True),
+            (processed.id, False),
+            (999999, False),
+        ]
+        assert results[2]["error"] == "Proposal has already been approved/rejected"
+        assert results[3]["error"] == "Proposal not found"
+
+        for proposal in (first, second):
+            proposal.refresh_from_db()
+            assert proposal.proposal_status == ProposalStatus.APPROVED
+            assert proposal.approved_at is not None
+        for day in (10, 11):
+            entry = TimeSheetEntry.objects.get(employee=test_employee, date=date(2025, 3, day))
+            assert entry.absent_reason == TimesheetReason.UNPAID_LEAVE
+
+    def test_bulk_approve_issues_downstream_effects_once_per_employee_month(
+        self, api_client, superuser, test_employee, django_capture_on_commit_callbacks
+    ):
+        proposals = [self._create_unpaid_leave(test_employee, f"DX_BULK_1{day:02d}", day) for day in range(10, 15)]
+        EmployeeMonthlyTimesheet.objects.get_or_create(
+            employee=test_employee, month_key="202503", defaults={"report_date": date(2025, 3, 1)}
+        )
+
+        with (
+            patch("apps.payroll.tasks.recalculate_payroll_slip_task.delay") as recalculate,
+            patch("apps.hrm.services.proposal_bulk.process_employee_proposal_changes") as process_changes,
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            response = api_client.post(
+                reverse(self.url),
+                {"ids": [proposal.id for proposal in proposals], "is_approve": True},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert all(item["success"] for item in response.json()["data"])
+        recalculate.assert_called_once_with(str(test_employee.id), "2025-03-01")
+        process_changes.delay.assert_called_once_with([proposal.id for proposal in proposals])
+
+        notifications = Notification.objects.filter(recipient=test_employee.user)
+        assert notifications.count() == 1
+        assert notifications.get().extra_data["proposal_ids"] == [proposal.id for proposal in proposals]
+
+    def test_bulk_reject_requires_note(self, api_client, superuser, test_employee):
+        proposal = self._create_unpaid_leave(test_employee, "DX_BULK_201", 10)
+
+        response = api_client.post(reverse(self.url), {"ids": [proposal.id], "is_approve": False}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = response.json()["error"]["errors"]
+        assert any(error.get("attr") == "approval_note" for error in errors)
+        proposal.refresh_from_db()
+        assert proposal.proposal_status == ProposalStatus.PENDING
+
+    def test_bulk_reject_does_not_touch_timesheets(self, api_client, superuser, test_employee):
+        proposal = self._create_unpaid_leave(test_employee, "DX_BULK_301", 10)
+
+        response = api_client.post(
+            reverse(self.url),
+            {"ids": [proposal.id], "is_approve": False, "approval_note": "Busy month"},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == [{"id": proposal.id, "success": True, "error": None}]
+        proposal.refresh_from_db()
+        assert proposal.proposal_status == ProposalStatus.REJECTED
+        assert proposal.approval_note == "Busy month"
+        assert not TimeSheetEntry.objects.filter(employee=test_employee, date=date(2025, 3, 10)).exists()
+
+    def test_bulk_approve_complaint_requires_approved_times(self, api_client, superuser, test_employee):
+        entry = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 3, 10))
+        proposal = Proposal.objects.create(
+            code="DX_BULK_401",
+            proposal_type=ProposalType.TIMESHEET_ENTRY_COMPLAINT,
+            proposal_status=ProposalStatus.PENDING,
+            timesheet_entry_complaint_complaint_reason="Forgot to check in",
+            timesheet_entry_complaint_complaint_date=date(2025, 3, 10),
+            timesheet_entry_complaint_proposed_check_in_time=time(8, 0),
+            timesheet_entry_complaint_proposed_check_out_time=time(17, 0),
+            created_by=test_employee,
+        )
+
+        response = api_client.post(
+            reverse("hrm:proposal-timesheet-entry-complaint-bulk-approve"),
+            {"ids": [proposal.id], "is_approve": True},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == [
+            {"id": proposal.id, "success": False, "error": "Approved check-in and check-out times are required"}
+        ]
+        proposal.refresh_from_db()
+        assert proposal.proposal_status == ProposalStatus.PENDING
+        assert proposal.timesheet_entry_complaint_approved_check_in_time is None
+        entry.refresh_from_db()
+        assert entry.is_manually_corrected is False
@@ -2,6 +2,8 @@ from datetime import date, time
 from unittest.mock import patch
 
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 
 from apps.hrm.constants import ProposalStatus, ProposalType, TimesheetReason, TimesheetStatus
@@ -11,6 +13,7 @@ from apps.hrm.models import (
     Branch,
     Department,
     Employee,
+    EmployeeMonthlyTimesheet,
     Position,
     Proposal,
     ProposalOvertimeEntry,
@@ -214,6 +217,40 @@ class TestMaternityLeaveProposal:
         test_employee.refresh_from_db()
         assert test_employee.status == Employee.Status.ACTIVE
 
+    def test_execute_long_maternity_leave_in_bulk(self, test_employee):
+        """Test a six-month maternity leave is written in bulk and refreshes each month once."""
+        existing = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 2, 3))
+        proposal = Proposal.objects.create(
+            code="DX_LEAVE_007",
+            proposal_type=ProposalType.MATERNITY_LEAVE,
+            proposal_status=ProposalStatus.APPROVED,
+            maternity_leave_start_date=date(2025, 1, 1),
+            maternity_leave_end_date=date(2025, 6, 30),
+            created_by=test_employee,
+        )
+        EmployeeMonthlyTimesheet.objects.filter(employee=test_employee).update(need_refresh=False)
+
+        with CaptureQueriesContext(connection) as ctx:
+            ProposalService.execute_approved_proposal(proposal)
+
+        entries = TimeSheetEntry.objects.filter(
+            employee=test_employee, date__range=(date(2025, 1, 1), date(2025, 6, 30))
+        )
+        assert entries.count() == 181
+        assert set(entries.values_list("absent_reason", flat=True)) == {TimesheetReason.MATERNITY_LEAVE}
+        assert set(entries.values_list("official_hours", flat=True)) == {0}
+        assert entries.filter(pk=existing.pk).exists()
+
+        refreshed_months = set(
+            EmployeeMonthlyTimesheet.objects.filter(employee=test_employee, need_refresh=True).values_list(
+                "month_key", flat=True
+            )
+        )
+        assert refreshed_months == {f"2025{month:02d}" for month in range(1, 7)}
+        # Apart from the cached work schedule lookups, queries must not grow with the number of days
+        queries = [q for q in ctx.captured_queries if "hrm_work_schedule" not in q["sql"]]
+        assert len(queries) < 60
+
 
 class TestComplaintProposalCorrection:
     """Tests for TIMESHEET_ENTRY_COMPLAINT proposal execution (correction case)."""
@@ -8,8 +8,8 @@ from django.urls import reverse
 from rest_framework import status
 
 from apps.core.models import AdministrativeUnit, Province
-from apps.hrm.constants import TimesheetStatus
-from apps.hrm.models import Block, Branch, Department, Employee, Position, WorkSchedule
+from apps.hrm.constants import ProposalStatus, ProposalType, TimesheetStatus
+from apps.hrm.models import Block, Branch, Department, Employee, Position, Proposal, WorkSchedule
 from apps.hrm.models.monthly_timesheet import EmployeeMonthlyTimesheet
 from apps.hrm.models.timesheet import TimeSheetEntry
 from apps.hrm.services.timesheets import create_entries_for_employee_month
@@ -333,3 +333,72 @@ def test_create_entries_for_employee_month_sends_post_save(db):
     assert kwargs["sender"] == TimeSheetEntry
     assert kwargs["created"] is True
     assert isinstance(kwargs["instance"], TimeSheetEntry)
+
+
+def test_list_timesheets_compact_layout_returns_columnar_grid(db, api_client, employee):
+    cache.clear()
+    TimeSheetEntry.objects.create(employee=employee, date=date(2025, 3, 3), morning_hours=4, afternoon_hours=4)
+    EmployeeMonthlyTimesheet.refresh_for_employee_month(employee.id, 2025, 3, fields=[])
+
+    url = reverse("hrm:employee-timesheet-list")
+    resp = api_client.get(url, {"month": "03/2025", "layout": "compact"})
+
+    assert resp.status_code == status.HTTP_200_OK
+    data = resp.json()["data"]
+    assert data["count"] >= 1
+    assert len(data["dates"]) == 31
+    assert data["dates"][0] == "2025-03-01"
+    assert data["entry_columns"][0] == "id"
+    assert "total_work_days" in data["summary_columns"]
+
+    row = next(r for r in data["results"] if r["employee"][0] == employee.id)
+    assert row["employee"][1] == employee.code
+    assert len(row["entries"]) == 31
+    assert row["entries"][0] is None
+    entry_cell = dict(zip(data["entry_columns"], row["entries"][2], strict=True))
+    assert entry_cell["has_complaint"] is False
+    assert len(row["summary"]) == len(data["summary_columns"])
+
+
+def test_list_timesheets_compact_layout_cache_invalidated_by_entry_change(db, api_client, employee):
+    cache.clear()
+    url = reverse("hrm:employee-timesheet-list")
+    params = {"month": "03/2025", "layout": "compact"}
+
+    first = api_client.get(url, params).json()["data"]
+    row = next(r for r in first["results"] if r["employee"][0] == employee.id)
+    assert row["entries"][4] is None
+
+    entry = TimeSheetEntry.objects.create(employee=employee, date=date(2025, 3, 5))
+
+    second = api_client.get(url, params).json()["data"]
+    row = next(r for r in second["results"] if r["employee"][0] == employee.id)
+    assert row["entries"][4][0] == entry.id
+
+
+def test_list_timesheets_compact_layout_cache_invalidated_by_complaint_status_change(
+    db, api_client, employee, django_capture_on_commit_callbacks
+):
+    cache.clear()
+    url = reverse("hrm:employee-timesheet-list")
+    params = {"month": "03/2025", "layout": "compact"}
+    TimeSheetEntry.objects.create(employee=employee, date=date(2025, 3, 5))
+    proposal = Proposal.objects.create(
+        proposal_type=ProposalType.TIMESHEET_ENTRY_COMPLAINT,
+        created_by=employee,
+        timesheet_entry_complaint_complaint_date=date(2025, 3, 5),
+    )
+
+    def has_complaint():
+        data = api_client.get(url, params).json()["data"]
+        row = next(r for r in data["results"] if r["employee"][0] == employee.id)
+        return dict(zip(data["entry_columns"], row["entries"][4], strict=True))["has_complaint"]
+
+    assert has_complaint() is True
+
+    with django_capture_on_commit_callbacks(execute=True):
+        proposal.proposal_status = ProposalStatus.REJECTED
+        proposal.approval_note = "Not needed"
+        proposal.save()
+
+    assert has_complaint() is False
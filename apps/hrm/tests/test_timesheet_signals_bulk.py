@@ -1,11 +1,11 @@
 from datetime import date
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 from django.db.models.signals import post_save
 
 from apps.core.models import AdministrativeUnit, Province
-from apps.hrm.constants import ProposalStatus, ProposalType
+from apps.hrm.constants import ProposalStatus, ProposalType, TimesheetDayType
 from apps.hrm.models import (
     AttendanceExemption,
     Block,
@@ -15,6 +15,7 @@ from apps.hrm.models import (
     Department,
     Employee,
     EmployeeMonthlyTimesheet,
+    Holiday,
     Position,
     Proposal,
     TimeSheetEntry,
@@ -22,6 +23,7 @@ from apps.hrm.models import (
 from apps.hrm.tasks.timesheet_triggers import (
     process_calendar_change,
     process_contract_change,
+    process_employee_proposal_changes,
     process_exemption_change,
     process_proposal_change,
 )
@@ -145,6 +147,55 @@ def test_calendar_change_triggers_refresh(test_employee):
     assert report.need_refresh is True
 
 
+@pytest.mark.django_db
+def test_calendar_change_recalculates_only_changed_entries(test_employee):
+    """Test that process_calendar_change skips entries whose day type already follows the calendar."""
+    Holiday.objects.create(name="Tet", start_date=date(2025, 1, 28), end_date=date(2025, 1, 30))
+    changed = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 1, 28))
+    TimeSheetEntry.objects.filter(pk=changed.pk).update(day_type=TimesheetDayType.OFFICIAL)
+    unchanged = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 1, 29))
+    TimeSheetEntry.objects.filter(pk=unchanged.pk).update(day_type=TimesheetDayType.HOLIDAY)
+    outside = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 1, 31))
+    TimeSheetEntry.objects.filter(pk=outside.pk).update(day_type=TimesheetDayType.HOLIDAY)
+
+    assert process_calendar_change(date(2025, 1, 28), date(2025, 1, 30)) == 1
+
+    changed.refresh_from_db()
+    outside.refresh_from_db()
+    assert changed.day_type == TimesheetDayType.HOLIDAY
+    assert outside.day_type == TimesheetDayType.HOLIDAY
+
+
+@pytest.mark.django_db
+def test_calendar_change_resets_removed_holiday(test_employee):
+    """Test that dates no longer covered by a holiday are recalculated as regular days."""
+    entry = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 2, 3))
+    TimeSheetEntry.objects.filter(pk=entry.pk).update(day_type=TimesheetDayType.HOLIDAY)
+
+    assert process_calendar_change(date(2025, 2, 3), date(2025, 2, 3)) == 1
+
+    entry.refresh_from_db()
+    assert entry.day_type == TimesheetDayType.OFFICIAL
+
+
+@pytest.mark.django_db
+def test_holiday_save_queues_one_job_without_updating_entries(test_employee, django_capture_on_commit_callbacks):
+    """Test that saving a Holiday only queues the calendar job, covering its previous dates."""
+    entry = TimeSheetEntry.objects.create(employee=test_employee, date=date(2025, 4, 30))
+    holiday = Holiday.objects.create(name="Reunification", start_date=date(2025, 4, 30), end_date=date(2025, 5, 1))
+
+    with patch("apps.hrm.signals.timesheet_triggers.process_calendar_change.delay") as mock_delay:
+        with django_capture_on_commit_callbacks(execute=True):
+            holiday = Holiday.objects.get(pk=holiday.pk)
+            holiday.start_date = date(2025, 5, 1)
+            holiday.end_date = date(2025, 5, 2)
+            holiday.save()
+
+    mock_delay.assert_called_once_with(date(2025, 4, 30), date(2025, 5, 2))
+    entry.refresh_from_db()
+    assert entry.day_type != TimesheetDayType.HOLIDAY
+
+
 @pytest.mark.django_db
 def test_exemption_change_triggers_refresh(test_employee):
     """Test that process_exemption_change triggers refresh."""
@@ -185,3 +236,28 @@ def test_proposal_change_triggers_refresh(test_employee):
     report = EmployeeMonthlyTimesheet.objects.filter(employee=test_employee, month_key="202506").first()
     assert report is not None
     assert report.need_refresh is True
+
+
+@pytest.mark.django_db
+def test_employee_proposal_changes_refresh_each_month_once(test_employee):
+    """Test that process_employee_proposal_changes marks each affected month once."""
+    dates = [date(2025, 6, 16), date(2025, 6, 17), date(2025, 7, 1)]
+    for date_obj in dates:
+        TimeSheetEntry.objects.create(employee=test_employee, date=date_obj)
+
+    proposals = [
+        Proposal.objects.create(
+            created_by=test_employee,
+            proposal_type=ProposalType.PAID_LEAVE,
+            proposal_status=ProposalStatus.APPROVED,
+            paid_leave_start_date=date_obj,
+            paid_leave_end_date=date_obj,
+        )
+        for date_obj in dates
+    ]
+    EmployeeMonthlyTimesheet.objects.filter(employee=test_employee).update(need_refresh=False)
+
+    with patch.object(EmployeeMonthlyTimesheet, "mark_refresh", autospec=True) as mark_refresh:
+        process_employee_proposal_changes([proposal.id for proposal in proposals])
+
+    assert sorted(call.args[0].month_key for call in mark_refresh.call_args_list) == ["202506", "202507"]
@@ -0,0 +1,90 @@
+"""Cached registries used by the quick mobile check-in endpoints.
+
+At shift start most employees punch within a few minutes, and every punch used
+to look up the user's device, the employee and the WiFi device in the database.
+This module caches those lookups:
+
+- Per user: the employee id and the active devices (device_id -> client).
+- Globally: every WiFi device keyed by BSSID with its id and state.
+
+The per-user entry is dropped whenever a UserDevice or Employee of that user is
+saved or deleted, and the WiFi registry whenever an AttendanceWifiDevice is saved
+or deleted. Both also expire after a short timeout as a safety net for bulk
+updates that bypass signals.
+"""
+
+import logging
+
+from django.apps import apps
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+ATTENDANCE_USER_REGISTRY_KEY = "attendance:registry:user:{user_id}"
+ATTENDANCE_WIFI_REGISTRY_KEY = "attendance:registry:wifi"
+ATTENDANCE_REGISTRY_CACHE_TIMEOUT = 60 * 10  # 10 minutes
+
+
+def get_attendance_user_registry(user_id: int) -> dict:
+    """Get the attendance registry entry of a user.
+
+    Args:
+        user_id: ID of the user
+
+    Returns:
+        Dict with `employee_id` (None when the user has no employee profile) and
+        `devices` (mapping of active device_id to client).
+    """
+    key = ATTENDANCE_USER_REGISTRY_KEY.format(user_id=user_id)
+    registry = cache.get(key)
+    if registry is not None:
+        return registry
+
+    UserDevice = apps.get_model("core", "UserDevice")
+    Employee = apps.get_model("hrm", "Employee")
+    devices = dict(
+        UserDevice.objects.filter(user_id=user_id, state=UserDevice.State.ACTIVE).values_list("device_id", "client")
+    )
+    employee_id = Employee.objects.filter(user_id=user_id).values_list("id", flat=True).first()
+
+    registry = {"employee_id": employee_id, "devices": devices}
+    cache.set(key, registry, ATTENDANCE_REGISTRY_CACHE_TIMEOUT)
+    return registry
+
+
+def invalidate_attendance_user_registry(user_id: int):
+    """Invalidate the attendance registry entry of a user.
+
+    This should be called whenever the user's devices or employee profile change.
+    """
+    cache.delete(ATTENDANCE_USER_REGISTRY_KEY.format(user_id=user_id))
+    logger.debug("Invalidated attendance registry for user %s", user_id)
+
+
+def get_wifi_registry() -> dict[str, tuple[int, str]]:
+    """Get all WiFi devices keyed by BSSID.
+
+    Returns:
+        Dict mapping BSSID to (wifi_device_id, state).
+    """
+    registry = cache.get(ATTENDANCE_WIFI_REGISTRY_KEY)
+    if registry is not None:
+        return registry
+
+    AttendanceWifiDevice = apps.get_model("hrm", "AttendanceWifiDevice")
+    registry = {
+        bssid: (wifi_device_id, state)
+        for wifi_device_id, bssid, state in AttendanceWifiDevice.objects.values_list("id", "bssid", "state")
+    }
+    cache.set(ATTENDANCE_WIFI_REGISTRY_KEY, registry, ATTENDANCE_REGISTRY_CACHE_TIMEOUT)
+    return registry
+
+
+def invalidate_wifi_registry():
+    """Invalidate the WiFi registry.
+
+    This should be called whenever AttendanceWifiDevice records are created, updated, or deleted.
+    """
+    cache.delete(ATTENDANCE_WIFI_REGISTRY_KEY)
+    logger.debug("Invalidated attendance WiFi registry")
@@ -2,6 +2,7 @@ from django.utils.translation import gettext as _
 from rest_framework.exceptions import ValidationError
 
 from apps.core.models.device import UserDevice
+from apps.hrm.utils.attendance_registry import get_attendance_user_registry
 
 
 def validate_attendance_device(request):
@@ -42,3 +43,40 @@ def validate_attendance_device(request):
         raise ValidationError(_("Attendance is only allowed from mobile devices."))
 
     return user_device
+
+
+def validate_attendance_device_cached(request) -> int:
+    """
+    Validates the request device like `validate_attendance_device`, using the cached attendance registry.
+
+    Args:
+        request: The DRF request object.
+
+    Returns:
+        int: ID of the employee linked to the requesting user.
+
+    Raises:
+        ValidationError: If device_id is missing, user device is not found, platform is not mobile,
+            or the user has no employee profile.
+    """
+    if not request.auth or not hasattr(request.auth, "get"):
+        raise ValidationError(_("Authentication token with device_id is required."))
+
+    device_id = request.auth.get("device_id")
+
+    if not device_id:
+        raise ValidationError(_("Token does not contain device_id."))
+
+    registry = get_attendance_user_registry(request.user.id)
+    client = registry["devices"].get(device_id)
+
+    if client is None:
+        raise ValidationError(_("User device not found."))
+
+    if client != UserDevice.Client.MOBILE:
+        raise ValidationError(_("Attendance is only allowed from mobile devices."))
+
+    if registry["employee_id"] is None:
+        raise ValidationError(_("Employee profile not found."))
+
+    return registry["employee_id"]
@@ -0,0 +1,143 @@
+"""Spatial index of active attendance geolocations.
+
+This module resolves the attendance geolocation (geofence) that contains a
+coordinate without the client sending a geolocation id. Active geolocations are
+bucketed into a fixed lat/lon grid; each site is registered in every cell its
+radius overlaps, so a lookup only measures the distance to the few sites
+registered in the cell of the coordinate.
+
+The built index is shared through the cache and memoized per process. The cache
+version is dropped whenever an AttendanceGeolocation is saved or deleted, which
+forces the next lookup to rebuild it.
+"""
+
+import logging
+import math
+import uuid
+from decimal import Decimal
+from typing import NamedTuple
+
+from django.apps import apps
+from django.core.cache import cache
+
+from apps.hrm.utils.geolocation import haversine_distance
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+GEOFENCE_INDEX_VERSION_KEY = "geofence:index:version"
+GEOFENCE_INDEX_KEY = "geofence:index:{version}"
+GEOFENCE_INDEX_CACHE_TIMEOUT = 60 * 60 * 24  # 1 day
+
+# Grid cell size in degrees (about 1.1 km of latitude)
+GRID_CELL_DEGREES = 0.01
+METERS_PER_DEGREE_LATITUDE = 111_320
+
+# Process-local copy of the last index read from cache: (version, index)
+_local_index: tuple[str | None, dict | None] = (None, None)
+
+
+class GeofenceMatch(NamedTuple):
+    geolocation_id: int
+    distance_m: float
+
+
+def _get_attendance_geolocation_model():
+    """Get AttendanceGeolocation model using lazy loading to avoid circular imports."""
+    return apps.get_model("hrm", "AttendanceGeolocation")
+
+
+def _cell_of(latitude: float, longitude: float) -> tuple[int, int]:
+    return math.floor(latitude / GRID_CELL_DEGREES), math.floor(longitude / GRID_CELL_DEGREES)
+
+
+def build_geofence_index() -> dict:
+    """Build the grid index of all active, non-deleted attendance geolocations.
+
+    Returns:
+        Dict with `sites` (list of (id, latitude, longitude, radius_m) tuples) and
+        `cells` (mapping of grid cell to indexes into `sites`).
+    """
+    AttendanceGeolocation = _get_attendance_geolocation_model()
+    rows = AttendanceGeolocation.objects.filter(deleted=False, status=AttendanceGeolocation.Status.ACTIVE).values_list(
+        "id", "latitude", "longitude", "radius_m"
+    )
+
+    sites: list[tuple[int, float, float, int]] = []
+    cells: dict[tuple[int, int], list[int]] = {}
+    for geolocation_id, latitude, longitude, radius_m in rows:
+        latitude = float(latitude)
+        longitude = float(longitude)
+        site_index = len(sites)
+        sites.append((geolocation_id, latitude, longitude, radius_m))
+
+        # Bounding box of the geofence circle in degrees
+        delta_lat = radius_m / METERS_PER_DEGREE_LATITUDE
+        cos_lat = max(math.cos(math.radians(latitude)), 1e-6)
+        delta_lon = radius_m / (METERS_PER_DEGREE_LATITUDE * cos_lat)
+        min_row, min_col = _cell_of(latitude - delta_lat, longitude - delta_lon)
+        max_row, max_col = _cell_of(latitude + delta_lat, longitude + delta_lon)
+        for row in range(min_row, max_row + 1):
+            for col in range(min_col, max_col + 1):
+                cells.setdefault((row, col), []).append(site_index)
+
+    return {"sites": sites, "cells": cells}
+
+
+def get_geofence_index() -> dict:
+    """Get the geofence index, using the process-local copy or the cache when possible.
+
+    Returns:
+        Index dict as built by `build_geofence_index`.
+    """
+    global _local_index
+
+    version = cache.get(GEOFENCE_INDEX_VERSION_KEY)
+    local_version, local_index = _local_index
+    if version is not None and version == local_version and local_index is not None:
+        return local_index
+
+    index = cache.get(GEOFENCE_INDEX_KEY.format(version=version)) if version is not None else None
+    if index is None:
+        index = build_geofence_index()
+        version = uuid.uuid4().hex
+        cache.set(GEOFENCE_INDEX_KEY.format(version=version), index, GEOFENCE_INDEX_CACHE_TIMEOUT)
+        cache.set(GEOFENCE_INDEX_VERSION_KEY, version, GEOFENCE_INDEX_CACHE_TIMEOUT)
+        logger.debug("Rebuilt geofence index with %s sites", len(index["sites"]))
+
+    _local_index = (version, index)
+    return index
+
+
+def find_matching_geofence(latitude: Decimal | float, longitude: Decimal | float) -> GeofenceMatch | None:
+    """Find the nearest active geolocation whose radius contains the coordinate.
+
+    Args:
+        latitude: Latitude in degrees
+        longitude: Longitude in degrees
+
+    Returns:
+        GeofenceMatch with the geolocation id and distance in meters, or None when
+        the coordinate is outside every active geolocation.
+    """
+    index = get_geofence_index()
+    candidates = index["cells"].get(_cell_of(float(latitude), float(longitude)), [])
+
+    best: GeofenceMatch | None = None
+    for site_index in candidates:
+        geolocation_id, site_latitude, site_longitude, radius_m = index["sites"][site_index]
+        distance = haversine_distance(latitude, longitude, site_latitude, site_longitude)
+        if distance <= radius_m and (best is None or distance < best.distance_m):
+            best = GeofenceMatch(geolocation_id, distance)
+    return best
+
+
+def invalidate_geofence_index():
+    """Invalidate the geofence index.
+
+    This should be called whenever AttendanceGeolocation records are created, updated, or deleted.
+    """
+    global _local_index
+
+    cache.delete(GEOFENCE_INDEX_VERSION_KEY)
+    _local_index = (None, None)
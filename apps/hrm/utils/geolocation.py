@@ -8,7 +8,9 @@ import math
 from decimal import Decimal
 
 
-def haversine_distance(lat1: Decimal, lon1: Decimal, lat2: Decimal, lon2: Decimal) -> float:
+def haversine_distance(
+    lat1: Decimal | float, lon1: Decimal | float, lat2: Decimal | float, lon2: Decimal | float
+) -> float:
     """Calculate the great-circle distance between two points on Earth.
 
     Uses the Haversine formula to calculate the distance between two points
@@ -0,0 +1,88 @@
+"""Timesheet grid caching utilities.
+
+This module caches the compact (columnar) monthly timesheet grid per
+(employee page, month). Every month has a version counter that is bumped
+whenever a daily entry of that month changes, a complaint about one of its
+entries changes or the monthly timesheet refresh runs, which invalidates
+every cached page of that month at once.
+"""
+
+import hashlib
+import logging
+from typing import Iterable
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+TIMESHEET_GRID_VERSION_KEY = "timesheet:grid:version:{month_key}"
+TIMESHEET_GRID_CACHE_KEY = "timesheet:grid:{month_key}:v{version}:{digest}"
+TIMESHEET_GRID_CACHE_TIMEOUT = 60 * 30  # 30 minutes
+
+
+def get_timesheet_grid_version(month_key: str) -> int:
+    """Get the current cache version of the timesheet grid for a month.
+
+    Args:
+        month_key: Month in YYYYMM format.
+
+    Returns:
+        Current version number (0 if the month was never invalidated).
+    """
+    return cache.get(TIMESHEET_GRID_VERSION_KEY.format(month_key=month_key)) or 0
+
+
+def invalidate_timesheet_grid_cache(month_key: str):
+    """Invalidate all cached timesheet grid pages of a month.
+
+    This should be called whenever data shown in the grid is modified:
+    - TimeSheetEntry created/updated, including the bulk paths, which either
+      send post_save or mark the monthly timesheets for refresh
+    - Complaint proposal created/changed/deleted, or linked to other entries
+    - EmployeeMonthlyTimesheet refreshed
+    """
+    key = TIMESHEET_GRID_VERSION_KEY.format(month_key=month_key)
+    cache.add(key, 0, None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # The key was evicted between add() and incr(); start a new version sequence
+        cache.set(key, 1, None)
+    logger.debug("Invalidated timesheet grid cache for month %s", month_key)
+
+
+def build_timesheet_grid_cache_key(month_key: str, employee_ids: Iterable[int], *parts: str) -> str:
+    """Build the cache key of one grid page.
+
+    Args:
+        month_key: Month in YYYYMM format.
+        employee_ids: Ordered employee ids of the page.
+        parts: Extra request-dependent parts (filters, language) the payload depends on.
+
+    Returns:
+        Cache key bound to the current month version.
+    """
+    raw = ",".join(str(employee_id) for employee_id in employee_ids) + "|" + "|".join(parts)
+    digest = hashlib.sha256(raw.encode()).hexdigest()
+    version = get_timesheet_grid_version(month_key)
+    return TIMESHEET_GRID_CACHE_KEY.format(month_key=month_key, version=version, digest=digest)
+
+
+def get_timesheet_grid_cache(cache_key: str):
+    """Get a cached grid page.
+
+    Returns:
+        Cached payload dict or None if not found.
+    """
+    return cache.get(cache_key)
+
+
+def set_timesheet_grid_cache(cache_key: str, data: dict):
+    """Set a grid page in cache.
+
+    Args:
+        cache_key: Key built by `build_timesheet_grid_cache_key`.
+        data: Grid payload to cache.
+    """
+    cache.set(cache_key, data, TIMESHEET_GRID_CACHE_TIMEOUT)
@@ -12,6 +12,8 @@ WORK_SCHEDULE_CACHE_KEY = "work_schedule:all"
 WORK_SCHEDULE_BY_WEEKDAY_KEY = "work_schedule:weekday:{weekday}"
 WORK_SCHEDULE_CACHE_TIMEOUT = 60 * 60 * 24 * 365  # 1 year
 
+_NOT_CACHED = object()
+
 
 def _get_work_schedule_model():
     """Get WorkSchedule model using lazy loading to avoid circular imports."""
@@ -57,13 +59,14 @@ def get_work_schedule_by_weekday(weekday: int, use_cache: bool = True):
         return WorkSchedule.objects.filter(weekday=weekday).first()
 
     cache_key = WORK_SCHEDULE_BY_WEEKDAY_KEY.format(weekday=weekday)
-    cached_schedule = cache.get(cache_key)
-    if cached_schedule is not None:
+    cached_schedule = cache.get(cache_key, _NOT_CACHED)
+    if cached_schedule is not _NOT_CACHED:
         return cached_schedule
 
+    # Days without a schedule (e.g. Sunday) are cached as None too, so timesheet
+    # calculations over a month do not query them once per entry
     schedule = WorkSchedule.objects.filter(weekday=weekday).first()
-    if schedule:
-        cache.set(cache_key, schedule, WORK_SCHEDULE_CACHE_TIMEOUT)
+    cache.set(cache_key, schedule, WORK_SCHEDULE_CACHE_TIMEOUT)
     return schedule
 
 
@@ -7,6 +7,11 @@ Handler Hooks:
     pre_import_initialize(import_job_id, options):
         Called before processing starts. Use for one-time setup tasks.
 
+    on_import_end(import_job_id, options):
+        Called once the rows are processed, also when the import failed or was
+        cancelled. Use to complete work deferred across rows. Errors fail the
+        job, unless it already failed or was cancelled.
+
     on_import_complete(import_job_id, options):
         Called after successful import completion. Use for post-processing
         tasks like triggering aggregations or notifications.
@@ -105,6 +110,23 @@ def resolve_handler(handler_path: str) -> Callable:
         raise ImportError(ERROR_HANDLER_NOT_FOUND.format(handler_path=handler_path)) from e
 
 
+def call_handler_hook(handler_module: str, hook_name: str, import_job_id: str, options: dict) -> None:
+    """
+    Call a hook of the handler module, if the module defines it.
+
+    Args:
+        handler_module: Dotted path of the handler module
+        hook_name: Name of the hook function (e.g. "on_import_end")
+        import_job_id: UUID of the ImportJob
+        options: Import options dictionary
+    """
+    module = importlib.import_module(handler_module)
+    hook = getattr(module, hook_name, None)
+    if hook is not None:
+        logger.info(f"Import job {import_job_id}: Calling {hook_name}")
+        hook(import_job_id, options)
+
+
 @shared_task(bind=True, name="imports.process_import_job")
 def import_job_task(self, import_job_id: str) -> dict:  # noqa: C901
     """
@@ -254,86 +276,98 @@ def import_job_task(self, import_job_id: str) -> dict:  # noqa: C901
         reader = get_streaming_reader(file_path, file_extension)
         batch_count = 0
 
-        with reader, success_writer, failed_writer:
-            # Write headers
-            # For failed file, add import_error column
-            headers_written = False
-
-            for row_index, row in enumerate(reader.read_rows(skip_rows=header_rows), start=1):
-                # Check for cancellation
-                # Reload job from DB to check if it was cancelled
-                job.refresh_from_db()
-                if job.status == STATUS_CANCELLED:
-                    logger.info(f"Import job {import_job_id} was cancelled")
-                    raise ImportCancelled()
-
-                # Invoke handler
-                try:
-                    result = handler(
-                        row_index=row_index,
-                        row=row,
-                        import_job_id=str(import_job_id),
-                        options=options,
-                    )
-
-                    # Write headers on first row
-                    if not headers_written:
-                        # Use original headers from file if available
-                        if headers and len(headers) >= len(row):
-                            success_headers = headers[: len(row)]
-                            failed_headers = success_headers + ["Import Error"]
+        try:
+            with reader, success_writer, failed_writer:
+                # Write headers
+                # For failed file, add import_error column
+                headers_written = False
+
+                for row_index, row in enumerate(reader.read_rows(skip_rows=header_rows), start=1):
+                    # Check for cancellation
+                    # Reload job from DB to check if it was cancelled
+                    job.refresh_from_db()
+                    if job.status == STATUS_CANCELLED:
+                        logger.info(f"Import job {import_job_id} was cancelled")
+                        raise ImportCancelled()
+
+                    # Invoke handler
+                    try:
+                        result = handler(
+                            row_index=row_index,
+                            row=row,
+                            import_job_id=str(import_job_id),
+                            options=options,
+                        )
+
+                        # Write headers on first row
+                        if not headers_written:
+                            # Use original headers from file if available
+                            if headers and len(headers) >= len(row):
+                                success_headers = headers[: len(row)]
+                                failed_headers = success_headers + ["Import Error"]
+                            else:
+                                # Fallback to generic headers if original not available
+                                success_headers = [f"Column {i + 1}" for i in range(len(row))]
+                                failed_headers = success_headers + ["Import Error"]
+
+                            success_writer.write_header(success_headers)
+                            failed_writer.write_header(failed_headers)
+                            headers_written = True
+
+                        if result.get("ok"):
+                            # Success
+                            success_writer.write_row(row)
+                            progress_tracker.update(success_increment=1)
                         else:
-                            # Fallback to generic headers if original not available
-                            success_headers = [f"Column {i + 1}" for i in range(len(row))]
-                            failed_headers = success_headers + ["Import Error"]
-
-                        success_writer.write_header(success_headers)
-                        failed_writer.write_header(failed_headers)
-                        headers_written = True
-
-                    if result.get("ok"):
-                        # Success
-                        success_writer.write_row(row)
-                        progress_tracker.update(success_increment=1)
-                    else:
-                        # Failure - sanitize error message
-                        error_msg = sanitize_error_message(result.get("error", "Unknown error"))
+                            # Failure - sanitize error message
+                            error_msg = sanitize_error_message(result.get("error", "Unknown error"))
+                            failed_row = list(row) + [error_msg]
+                            failed_writer.write_row(failed_row)
+                            progress_tracker.update(failure_increment=1)
+
+                    except Exception as e:
+                        # Handler exception
+                        logger.error(f"Import job {import_job_id} handler error at row {row_index}: {e}")
+                        if not headers_written:
+                            # Use original headers from file if available
+                            if headers and len(headers) >= len(row):
+                                success_headers = headers[: len(row)]
+                                failed_headers = success_headers + ["Import Error"]
+                            else:
+                                # Fallback to generic headers
+                                success_headers = [f"Column {i + 1}" for i in range(len(row))]
+                                failed_headers = success_headers + ["Import Error"]
+
+                            success_writer.write_header(success_headers)
+                            failed_writer.write_header(failed_headers)
+                            headers_written = True
+
+                        # Sanitize exception message
+                        error_msg = sanitize_error_message(str(e))
                         failed_row = list(row) + [error_msg]
                         failed_writer.write_row(failed_row)
                         progress_tracker.update(failure_increment=1)
 
-                except Exception as e:
-                    # Handler exception
-                    logger.error(f"Import job {import_job_id} handler error at row {row_index}: {e}")
-                    if not headers_written:
-                        # Use original headers from file if available
-                        if headers and len(headers) >= len(row):
-                            success_headers = headers[: len(row)]
-                            failed_headers = success_headers + ["Import Error"]
-                        else:
-                            # Fallback to generic headers
-                            success_headers = [f"Column {i + 1}" for i in range(len(row))]
-                            failed_headers = success_headers + ["Import Error"]
-
-                        success_writer.write_header(success_headers)
-                        failed_writer.write_header(failed_headers)
-                        headers_written = True
-
-                    # Sanitize exception message
-                    error_msg = sanitize_error_message(str(e))
-                    failed_row = list(row) + [error_msg]
-                    failed_writer.write_row(failed_row)
-                    progress_tracker.update(failure_increment=1)
-
-                # Flush progress to DB periodically
-                batch_count += 1
-                if batch_count >= batch_size * db_flush_every_n:
-                    job.processed_rows = progress_tracker.processed_rows
-                    job.success_count = progress_tracker.success_count
-                    job.failure_count = progress_tracker.failure_count
-                    job.calculate_percentage()
-                    job.save(update_fields=["processed_rows", "success_count", "failure_count", "percentage"])
-                    batch_count = 0
+                    # Flush progress to DB periodically
+                    batch_count += 1
+                    if batch_count >= batch_size * db_flush_every_n:
+                        job.processed_rows = progress_tracker.processed_rows
+                        job.success_count = progress_tracker.success_count
+                        job.failure_count = progress_tracker.failure_count
+                        job.calculate_percentage()
+                        job.save(update_fields=["processed_rows", "success_count", "failure_count", "percentage"])
+                        batch_count = 0
+        except Exception:
+            # The processed rows are committed, so the handler completes the work it
+            # deferred across rows even when the import failed or was cancelled. Its
+            # errors are only logged so that they do not replace the original one.
+            try:
+                call_handler_hook(handler_module, "on_import_end", import_job_id, options)
+            except Exception as e:  # noqa: BLE001
+                logger.error(f"Import job {import_job_id}: on_import_end failed: {e}")
+            raise
+
+        call_handler_hook(handler_module, "on_import_end", import_job_id, options)
 
         # Upload result files if enabled
         result_success_file = None
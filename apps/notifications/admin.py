@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 
+from .counters import invalidate_notification_counters
 from .models import Notification
 
 
@@ -87,3 +88,11 @@ class NotificationAdmin(admin.ModelAdmin):
         """Optimize queries by selecting related objects."""
         queryset = super().get_queryset(request)
         return queryset.select_related("actor", "recipient", "target_content_type")
+
+    def delete_model(self, request, obj):
+        invalidate_notification_counters([obj.recipient_id])
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        invalidate_notification_counters(queryset.values_list("recipient_id", flat=True))
+        super().delete_queryset(request, queryset)
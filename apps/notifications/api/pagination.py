@@ -0,0 +1,41 @@
+from functools import partial
+
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
+
+from apps.notifications.counters import get_total_count
+from libs.drf.pagination import KeysetPagination, PageNumberOrKeysetPagination
+
+
+class KnownCountPaginator(Paginator):
+    """Paginator using a count known in advance instead of a COUNT query."""
+
+    def __init__(self, object_list, per_page, *, count: int, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self._known_count = count
+
+    @cached_property
+    def count(self):
+        return self._known_count
+
+
+class NotificationKeysetPagination(KeysetPagination):
+    """Keyset pagination of a user's notifications, estimating their count from the cached total."""
+
+    def get_estimated_count(self, queryset):
+        return get_total_count(self.request.user.pk)
+
+
+class NotificationPagination(PageNumberOrKeysetPagination):
+    """Page number pagination of a user's notifications using their cached total count.
+
+    The notification list is not filtered, so its count is the recipient's total
+    number of notifications, which is kept in the cache (see `apps.notifications.counters`).
+    Requests with a `cursor` are paginated by keyset (see `KeysetPagination`).
+    """
+
+    keyset_pagination_class = NotificationKeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.django_paginator_class = partial(KnownCountPaginator, count=get_total_count(request.user.pk))
+        return super().paginate_queryset(queryset, request, view)
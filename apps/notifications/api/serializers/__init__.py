@@ -1,5 +1,7 @@
 from .notification import (
     BulkMarkAsReadSerializer,
+    NotificationChangesParameterSerializer,
+    NotificationChangesSerializer,
     NotificationResponseSerializer,
     NotificationSerializer,
 )
@@ -8,4 +10,6 @@ __all__ = [
     "NotificationSerializer",
     "BulkMarkAsReadSerializer",
     "NotificationResponseSerializer",
+    "NotificationChangesParameterSerializer",
+    "NotificationChangesSerializer",
 ]
@@ -1,7 +1,12 @@
+from django.utils.translation import gettext as _
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from apps.notifications.models import Notification
+from apps.notifications.utils import decode_changes_cursor
+
+CHANGES_DEFAULT_LIMIT = 100
+CHANGES_MAX_LIMIT = 500
 
 
 class ActorSerializer(serializers.Serializer):
@@ -72,3 +77,36 @@ class NotificationResponseSerializer(serializers.Serializer):
 
     message = serializers.CharField()
     count = serializers.IntegerField(required=False)
+
+
+class NotificationChangesParameterSerializer(serializers.Serializer):
+    """Query parameters of the notification changes feed."""
+
+    since = serializers.CharField(
+        required=False,
+        help_text="Cursor returned by the previous call; omit to start from the oldest notification",
+    )
+    limit = serializers.IntegerField(
+        required=False,
+        default=CHANGES_DEFAULT_LIMIT,
+        min_value=1,
+        max_value=CHANGES_MAX_LIMIT,
+        help_text="Maximum number of notifications to return",
+    )
+
+    def validate_since(self, value):
+        try:
+            return decode_changes_cursor(value)
+        except ValueError as e:
+            raise serializers.ValidationError(_("Invalid cursor")) from e
+
+
+class NotificationChangesSerializer(serializers.Serializer):
+    """Response serializer of the notification changes feed."""
+
+    results = NotificationSerializer(many=True)
+    next_cursor = serializers.CharField(
+        allow_null=True, help_text="Cursor to pass as `since` in the next call (null while the feed is empty)"
+    )
+    has_more = serializers.BooleanField(help_text="Whether more changes are available right away")
+    unread_count = serializers.IntegerField()
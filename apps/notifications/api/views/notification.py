@@ -1,3 +1,4 @@
+from django.utils import timezone
 from django.utils.translation import gettext as _
 from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
 from rest_framework import status, viewsets
@@ -5,10 +6,15 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
+from apps.notifications.counters import adjust_notification_counters, get_unread_count
 from apps.notifications.models import Notification
+from apps.notifications.utils import encode_changes_cursor, get_notification_changes
 
+from ..pagination import NotificationPagination
 from ..serializers import (
     BulkMarkAsReadSerializer,
+    NotificationChangesParameterSerializer,
+    NotificationChangesSerializer,
     NotificationResponseSerializer,
     NotificationSerializer,
 )
@@ -23,10 +29,12 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     - Marking notifications as read/unread
     - Bulk marking notifications as read
     - Marking all notifications as read
+    - Getting the unread count and the notifications changed since a cursor
     """
 
     permission_classes = [IsAuthenticated]
     serializer_class = NotificationSerializer
+    pagination_class = NotificationPagination
     queryset = Notification.objects.select_related("actor", "target_content_type")
 
     def get_queryset(self):
@@ -225,7 +233,8 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
         # Filter by recipient to ensure user can only mark their own notifications
         updated_count = Notification.objects.filter(
             id__in=notification_ids, recipient=request.user, read=False
-        ).update(read=True)
+        ).update(read=True, updated_at=timezone.now())
+        adjust_notification_counters(unread={request.user.pk: -updated_count})
 
         return Response(
             {
@@ -255,7 +264,10 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["post"], url_path="mark-all-as-read")
     def mark_all_as_read(self, request):
         """Mark all notifications as read for the authenticated user."""
-        updated_count = Notification.objects.filter(recipient=request.user, read=False).update(read=True)
+        updated_count = Notification.objects.filter(recipient=request.user, read=False).update(
+            read=True, updated_at=timezone.now()
+        )
+        adjust_notification_counters(unread={request.user.pk: -updated_count})
 
         return Response(
             {
@@ -284,7 +296,7 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
     @action(detail=False, methods=["get"], url_path="unread-count")
     def unread_count(self, request):
         """Get the count of unread notifications."""
-        count = Notification.objects.filter(recipient=request.user, read=False).count()
+        count = get_unread_count(request.user.pk)
 
         return Response(
             {
@@ -293,3 +305,69 @@ class NotificationViewSet(viewsets.ReadOnlyModelViewSet):
             },
             status=status.HTTP_200_OK,
         )
+
+    @extend_schema(
+        summary="Get notification changes",
+        description=(
+            "Get the notifications created or changed (e.g. read or unread) after the `since` cursor, "
+            "oldest change first, together with the current unread count. Pass the returned `next_cursor` "
+            "as `since` in the next call to receive only the later changes."
+        ),
+        tags=["0.5: Notifications"],
+        parameters=[NotificationChangesParameterSerializer],
+        responses={
+            200: NotificationChangesSerializer,
+            400: OpenApiResponse(description="Invalid cursor or limit"),
+        },
+        examples=[
+            OpenApiExample(
+                "Notification changes success",
+                description="Example response with one changed notification",
+                value={
+                    "success": True,
+                    "data": {
+                        "results": [
+                            {
+                                "id": 42,
+                                "actor": {"id": "user-uuid-1", "username": "john_doe", "full_name": "John Doe"},
+                                "recipient": "user-uuid-2",
+                                "verb": "commented on your post",
+                                "target_type": "blog.post",
+                                "target_id": "post-uuid-123",
+                                "message": "",
+                                "read": True,
+                                "extra_data": {},
+                                "delivery_method": "firebase",
+                                "created_at": "2025-10-13T10:30:00Z",
+                                "updated_at": "2025-10-13T11:00:00Z",
+                            }
+                        ],
+                        "next_cursor": "eyJhdCI6IjIwMjUtMTAtMTNUMTE6MDA6MDArMDA6MDAiLCJpZCI6NDJ9",
+                        "has_more": False,
+                        "unread_count": 4,
+                    },
+                },
+                response_only=True,
+            )
+        ],
+    )
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request):
+        """Get the notifications created or changed after a cursor."""
+        params = NotificationChangesParameterSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        notifications, has_more = get_notification_changes(
+            request.user, since=params.validated_data.get("since"), limit=params.validated_data["limit"]
+        )
+        next_cursor = encode_changes_cursor(notifications[-1]) if notifications else request.query_params.get("since")
+
+        return Response(
+            {
+                "results": NotificationSerializer(notifications, many=True).data,
+                "next_cursor": next_cursor,
+                "has_more": has_more,
+                "unread_count": get_unread_count(request.user.pk),
+            },
+            status=status.HTTP_200_OK,
+        )
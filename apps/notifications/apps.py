@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class NotificationsConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.notifications"
+    verbose_name = "Notifications"
+
+    def ready(self):
+        """Import signal handlers when the app is ready."""
+        import apps.notifications.signals  # noqa: F401
@@ -0,0 +1,150 @@
+"""Cached per-user notification counters.
+
+The unread count and the total count of each user's notifications are kept in
+the cache and adjusted atomically (`incr`/`decr`, atomic on Redis) when
+notifications are created, read, unread or marked read in bulk, so badge
+refreshes and list pages no longer count the user's whole notification history.
+
+A counter that is not cached is computed from the database on the next read.
+Counters that drifted (e.g. after a write bypassing these helpers) are corrected
+by `reconcile_notification_counters` and expire after `COUNTER_TIMEOUT`.
+"""
+
+import logging
+from collections import Counter
+from typing import Iterable, Mapping
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import Notification
+
+logger = logging.getLogger(__name__)
+
+# Cache keys
+UNREAD_COUNT_KEY = "notifications:unread:{user_id}"
+TOTAL_COUNT_KEY = "notifications:total:{user_id}"
+COUNTER_TIMEOUT = 60 * 60 * 24  # 1 day
+
+
+def _get_count(key: str, queryset) -> int:
+    count = cache.get(key)
+    if count is None:
+        count = queryset.count()
+        # add() keeps a value cached concurrently by another request
+        cache.add(key, count, COUNTER_TIMEOUT)
+    return count
+
+
+def get_unread_count(user_id: int) -> int:
+    """Get the number of unread notifications of a user."""
+    return _get_count(
+        UNREAD_COUNT_KEY.format(user_id=user_id),
+        Notification.objects.filter(recipient_id=user_id, read=False),
+    )
+
+
+def get_total_count(user_id: int) -> int:
+    """Get the number of notifications of a user."""
+    return _get_count(
+        TOTAL_COUNT_KEY.format(user_id=user_id),
+        Notification.objects.filter(recipient_id=user_id),
+    )
+
+
+def _apply_delta(key: str, delta: int) -> None:
+    if not delta:
+        return
+    try:
+        value = cache.incr(key, delta)
+    except ValueError:
+        # Not cached: the next read computes it from the database
+        return
+    if value < 0:
+        logger.warning("Notification counter %s dropped to %d, recomputing on next read", key, value)
+        cache.delete(key)
+
+
+def adjust_notification_counters(
+    unread: Mapping[int, int] | None = None,
+    total: Mapping[int, int] | None = None,
+) -> None:
+    """Adjust cached counters by per-user deltas once the current transaction commits.
+
+    Args:
+        unread: Change of the unread count by user id
+        total: Change of the total count by user id
+    """
+    unread = {user_id: delta for user_id, delta in (unread or {}).items() if delta}
+    total = {user_id: delta for user_id, delta in (total or {}).items() if delta}
+    if not unread and not total:
+        return
+
+    def _apply():
+        for user_id, delta in unread.items():
+            _apply_delta(UNREAD_COUNT_KEY.format(user_id=user_id), delta)
+        for user_id, delta in total.items():
+            _apply_delta(TOTAL_COUNT_KEY.format(user_id=user_id), delta)
+
+    transaction.on_commit(_apply)
+
+
+def count_new_notifications(notifications: Iterable[Notification]) -> None:
+    """Count notifications created without the post_save signal (e.g. `bulk_create`)."""
+    unread = Counter()
+    total = Counter()
+    for notification in notifications:
+        total[notification.recipient_id] += 1
+        if not notification.read:
+            unread[notification.recipient_id] += 1
+    adjust_notification_counters(unread=unread, total=total)
+
+
+def invalidate_notification_counters(user_ids: Iterable[int]) -> None:
+    """Drop the cached counters of users, e.g. after deleting notifications."""
+    keys = []
+    for user_id in set(user_ids):
+        keys.append(UNREAD_COUNT_KEY.format(user_id=user_id))
+        keys.append(TOTAL_COUNT_KEY.format(user_id=user_id))
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def reconcile_notification_counters(user_ids: Iterable[int]) -> int:
+    """Recompute the cached counters of users from the database.
+
+    Only counters that are currently cached are refreshed; the others are
+    computed on their next read anyway.
+
+    Returns:
+        Number of counters that were corrected
+    """
+    keys_by_user = {
+        user_id: (UNREAD_COUNT_KEY.format(user_id=user_id), TOTAL_COUNT_KEY.format(user_id=user_id))
+        for user_id in set(user_ids)
+    }
+    cached = cache.get_many([key for keys in keys_by_user.values() for key in keys])
+    cached_users = [user_id for user_id, keys in keys_by_user.items() if any(key in cached for key in keys)]
+    if not cached_users:
+        return 0
+
+    rows = (
+        Notification.objects.filter(recipient_id__in=cached_users)
+        .order_by()
+        .values("recipient_id")
+        .annotate(total=Count("id"), unread=Count("id", filter=Q(read=False)))
+    )
+    counts = {row["recipient_id"]: (row["unread"], row["total"]) for row in rows}
+
+    corrected = {}
+    for user_id in cached_users:
+        unread_key, total_key = keys_by_user[user_id]
+        unread, total = counts.get(user_id, (0, 0))
+        for key, value in ((unread_key, unread), (total_key, total)):
+            if key in cached and cached[key] != value:
+                corrected[key] = value
+    if corrected:
+        cache.set_many(corrected, COUNTER_TIMEOUT)
+        logger.info("Corrected %d drifted notification counter(s)", len(corrected))
+    return len(corrected)
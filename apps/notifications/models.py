@@ -4,16 +4,18 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 
 from apps.core.models.device import UserDevice
-from libs.models import BaseModel
+from libs.models import BaseModel, FieldTrackerMixin
 
 
-class Notification(BaseModel):
+class Notification(FieldTrackerMixin, BaseModel):
     """Model representing a notification for a user.
 
     Notifications track events that users should be aware of, with support
     for various notification types through a generic foreign key to the target object.
     """
 
+    TRACKED_FIELDS = ("read",)
+
     # Delivery method
     class DeliveryMethod(models.TextChoices):
         FIREBASE = "firebase", _("Firebase")
@@ -110,6 +112,7 @@ class Notification(BaseModel):
         indexes = [
             models.Index(fields=["recipient", "-created_at"]),
             models.Index(fields=["recipient", "read", "-created_at"]),
+            models.Index(fields=["recipient", "updated_at", "id"]),
         ]
 
     def __str__(self):
@@ -1,5 +1,7 @@
+from django.db.models.signals import post_save, pre_save
 from django.dispatch import Signal, receiver
 
+from .counters import adjust_notification_counters
 from .models import Notification
 from .tasks import send_notification_email_task, send_push_notification_task
 
@@ -46,3 +48,26 @@ def handle_send_notification(sender, **kwargs) -> None:
         [send_notification_email_task.delay(notification_id) for notification_id in notification_ids]
     if method in [Notification.DeliveryMethod.FIREBASE, Notification.DeliveryMethod.BOTH]:
         [send_push_notification_task.delay(notification_id) for notification_id in notification_ids]
+
+
+@receiver(pre_save, sender=Notification)
+def remember_read_change(sender, instance: Notification, update_fields=None, **kwargs) -> None:
+    """Remember how a save changes the unread count; the original value is replaced by the save."""
+    if instance._state.adding or (update_fields is not None and "read" not in update_fields):
+        return
+    if instance.has_tracked_change("read"):
+        instance._unread_delta = -1 if instance.read else 1
+
+
+@receiver(post_save, sender=Notification)
+def update_notification_counters(sender, instance: Notification, created: bool, **kwargs) -> None:
+    """Keep the cached counters of the recipient in step with the saved notification."""
+    if created:
+        adjust_notification_counters(
+            unread={instance.recipient_id: 0 if instance.read else 1},
+            total={instance.recipient_id: 1},
+        )
+        return
+    delta = instance.__dict__.pop("_unread_delta", 0)
+    if delta:
+        adjust_notification_counters(unread={instance.recipient_id: delta})
@@ -1,6 +1,7 @@
 """Celery tasks for sending notifications."""
 
 import logging
+from datetime import timedelta
 
 import sentry_sdk
 from celery import shared_task
@@ -10,6 +11,7 @@ from django.template.loader import render_to_string
 from django.utils import timezone
 from django.utils.translation import gettext as _
 
+from .counters import reconcile_notification_counters
 from .fcm_service import FCMService
 from .models import Notification
 
@@ -135,3 +137,24 @@ def send_push_notification_task(self, notification_id: int):
         logger.error(f"Error sending push notification for {notification_id}: {exc}")
         # Retry with exponential backoff: 60s, 120s, 240s
         raise self.retry(exc=exc, countdown=60 * (2**self.request.retries))
+
+
+# Notifications changed within this window have their recipients' counters reconciled
+COUNTER_RECONCILE_WINDOW = timedelta(minutes=30)
+
+
+@shared_task
+def reconcile_notification_counters_task() -> int:
+    """Correct the cached counters of users whose notifications changed recently.
+
+    Returns:
+        Number of counters that were corrected
+    """
+    changed_since = timezone.now() - COUNTER_RECONCILE_WINDOW
+    user_ids = (
+        Notification.objects.filter(updated_at__gte=changed_since)
+        .order_by()
+        .values_list("recipient_id", flat=True)
+        .distinct()
+    )
+    return reconcile_notification_counters(user_ids)
@@ -0,0 +1,12 @@
+"""Shared pytest fixtures for notification tests."""
+
+import pytest
+from django.core.cache import cache
+
+
+@pytest.fixture(autouse=True)
+def clear_notification_counters():
+    """Start every test without counters cached by a previous test (user ids are reused)."""
+    cache.clear()
+    yield
+    cache.clear()
@@ -0,0 +1,204 @@
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.core.models import User
+from apps.notifications.counters import (
+    UNREAD_COUNT_KEY,
+    get_total_count,
+    get_unread_count,
+    reconcile_notification_counters,
+)
+from apps.notifications.models import Notification
+from apps.notifications.utils import create_bulk_notifications
+
+
+@pytest.fixture
+def user(db):
+    return User.objects.create_superuser(username="reader", email="reader@example.com", password="password123")
+
+
+@pytest.fixture
+def actor(db):
+    return User.objects.create_superuser(username="actor", email="actor@example.com", password="password123")
+
+
+@pytest.fixture
+def api_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _notify(actor, recipient, count=1, **kwargs):
+    return [
+        Notification.objects.create(actor=actor, recipient=recipient, verb=f"event {i}", **kwargs)
+        for i in range(count)
+    ]
+
+
+@pytest.mark.django_db
+class TestNotificationCounters:
+    def test_counters_are_read_from_cache(self, user, actor, django_assert_num_queries):
+        _notify(actor, user, 3)
+        _notify(actor, user, 1, read=True)
+
+        assert get_unread_count(user.pk) == 3
+        assert get_total_count(user.pk) == 4
+        with django_assert_num_queries(0):
+            assert get_unread_count(user.pk) == 3
+            assert get_total_count(user.pk) == 4
+
+    def test_create_read_and_unread_adjust_counters(self, user, actor, django_capture_on_commit_callbacks):
+        assert get_unread_count(user.pk) == 0
+        assert get_total_count(user.pk) == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first, second = _notify(actor, user, 2)
+        assert (get_unread_count(user.pk), get_total_count(user.pk)) == (2, 2)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first.mark_as_read()
+            first.mark_as_read()
+        assert get_unread_count(user.pk) == 1
+
+        with django_capture_on_commit_callbacks(execute=True):
+            first.mark_as_unread()
+            second.message = "edited"
+            second.save()
+        assert get_unread_count(user.pk) == 2
+        assert get_total_count(user.pk) == 2
+
+    def test_bulk_created_notifications_are_counted(self, user, actor, django_capture_on_commit_callbacks):
+        other = User.objects.create_user(username="other", email="other@example.com", password="password123")
+        get_unread_count(user.pk)
+        get_unread_count(other.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_bulk_notifications(actor=actor, recipients=[user, other], verb="announced")
+
+        assert get_unread_count(user.pk) == 1
+        assert get_unread_count(other.pk) == 1
+
+    def test_adjustments_wait_for_commit(self, user, actor, django_capture_on_commit_callbacks):
+        get_unread_count(user.pk)
+
+        with django_capture_on_commit_callbacks(execute=False) as callbacks:
+            _notify(actor, user, 1)
+        assert get_unread_count(user.pk) == 0
+
+        for callback in callbacks:
+            callback()
+        assert get_unread_count(user.pk) == 1
+
+    def test_reconcile_corrects_drifted_counters(self, user, actor):
+        _notify(actor, user, 2)
+        get_unread_count(user.pk)
+        cache.set(UNREAD_COUNT_KEY.format(user_id=user.pk), 7)
+
+        assert reconcile_notification_counters([user.pk, actor.pk]) == 1
+        assert get_unread_count(user.pk) == 2
+        # Counters of users that were not cached stay uncached
+        assert cache.get(UNREAD_COUNT_KEY.format(user_id=actor.pk)) is None
+
+
+@pytest.mark.django_db
+class TestNotificationCounterAPI:
+    def test_mark_all_as_read_resets_unread_count(self, api_client, user, actor, django_capture_on_commit_callbacks):
+        _notify(actor, user, 3)
+        url = reverse("notifications:notification-unread-count")
+        assert api_client.get(url).json()["data"]["count"] == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(reverse("notifications:notification-mark-all-as-read"))
+
+        assert api_client.get(url).json()["data"]["count"] == 0
+
+    def test_bulk_mark_as_read_decrements_unread_count(
+        self, api_client, user, actor, django_capture_on_commit_callbacks
+    ):
+        notifications = _notify(actor, user, 3)
+        assert get_unread_count(user.pk) == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(
+                reverse("notifications:notification-bulk-mark-as-read"),
+                {"notification_ids": [notifications[0].id, notifications[1].id]},
+                format="json",
+            )
+
+        assert get_unread_count(user.pk) == 1
+
+    def test_list_uses_cached_total(self, api_client, user, actor, django_assert_num_queries):
+        _notify(actor, user, 3)
+        get_total_count(user.pk)
+
+        with django_assert_num_queries(1):
+            response = api_client.get(reverse("notifications:notification-list"), {"page_size": 2})
+
+        data = response.json()["data"]
+        assert data["count"] == 3
+        assert len(data["results"]) == 2
+        assert data["next"] is not None
+
+    def test_cursor_list_uses_cached_total_as_estimate(self, api_client, user, actor, django_assert_num_queries):
+        notifications = _notify(actor, user, 3)
+        get_total_count(user.pk)
+        url = reverse("notifications:notification-list")
+
+        with django_assert_num_queries(1):
+            first = api_client.get(url, {"cursor": "", "page_size": 2}).json()["data"]
+        second = api_client.get(first["next"]).json()["data"]
+
+        assert (first["count"], first["estimated_count"]) == (None, 3)
+        newest_first = [notification.id for notification in reversed(notifications)]
+        assert [row["id"] for row in first["results"] + second["results"]] == newest_first
+        assert second["next"] is None
+
+
+@pytest.mark.django_db
+class TestNotificationChangesAPI:
+    url = reverse("notifications:notification-changes")
+
+    def test_feed_returns_only_later_changes(self, api_client, user, actor):
+        first, second, third = _notify(actor, user, 3)
+        _notify(user, actor, 1)
+
+        response = api_client.get(self.url, {"limit": 2})
+        data = response.json()["data"]
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in data["results"]] == [first.id, second.id]
+        assert data["has_more"] is True
+        assert data["unread_count"] == 3
+
+        data = api_client.get(self.url, {"since": data["next_cursor"]}).json()["data"]
+        assert [item["id"] for item in data["results"]] == [third.id]
+        assert data["has_more"] is False
+        cursor = data["next_cursor"]
+
+        # Nothing changed: the cursor is handed back unchanged
+        data = api_client.get(self.url, {"since": cursor}).json()["data"]
+        assert data["results"] == []
+        assert data["next_cursor"] == cursor
+
+        first.mark_as_read()
+        data = api_client.get(self.url, {"since": cursor}).json()["data"]
+        assert [(item["id"], item["read"]) for item in data["results"]] == [(first.id, True)]
+        assert data["unread_count"] == get_unread_count(user.pk)
+
+    def test_mark_all_as_read_shows_in_feed(self, api_client, user, actor):
+        _notify(actor, user, 2)
+        cursor = api_client.get(self.url).json()["data"]["next_cursor"]
+
+        api_client.post(reverse("notifications:notification-mark-all-as-read"))
+
+        data = api_client.get(self.url, {"since": cursor}).json()["data"]
+        assert len(data["results"]) == 2
+        assert all(item["read"] for item in data["results"])
+
+    def test_invalid_cursor_is_rejected(self, api_client):
+        response = api_client.get(self.url, {"since": "not-a-cursor"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -1,12 +1,18 @@
 """Utility functions for creating and managing notifications."""
 
+import base64
+import binascii
+import json
+from datetime import datetime
 from typing import Optional
 
 from django.contrib.contenttypes.models import ContentType
 from django.db import models
+from django.db.models import Q
 
 from apps.core.models import User
 
+from .counters import count_new_notifications
 from .models import Notification
 from .signals import trigger_send_notification, trigger_send_notifications
 
@@ -137,6 +143,7 @@ def create_bulk_notifications(
         )
 
     created_notifications = Notification.objects.bulk_create(notification_objects)
+    count_new_notifications(created_notifications)
 
     trigger_send_notifications(created_notifications, delivery_method)
 
@@ -197,3 +204,52 @@ def notify_user(
         delivery_method=delivery_method,
         target_client=target_client,
     )
+
+
+def encode_changes_cursor(notification: Notification) -> str:
+    """Encode the position of a notification in the changes feed into an opaque cursor."""
+    payload = json.dumps({"at": notification.updated_at.isoformat(), "id": notification.pk}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_changes_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor from `encode_changes_cursor`.
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        updated_at, notification_id = datetime.fromisoformat(payload["at"]), payload["id"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid changes cursor") from e
+    if not isinstance(notification_id, int) or updated_at.tzinfo is None:
+        raise ValueError("Invalid changes cursor")
+    return updated_at, notification_id
+
+
+def get_notification_changes(
+    recipient: User, since: Optional[tuple[datetime, int]] = None, limit: int = 100
+) -> tuple[list[Notification], bool]:
+    """Get the notifications of a user created or changed after a feed position.
+
+    Notifications are ordered by `(updated_at, id)`, so the position of the last
+    returned notification (`encode_changes_cursor`) resumes the feed without
+    gaps or repeats.
+
+    Args:
+        recipient: The user whose notifications are returned
+        since: Decoded cursor of the last notification already received, None to start from the oldest
+        limit: Maximum number of notifications to return
+
+    Returns:
+        The notifications and whether more changes follow them
+    """
+    queryset = Notification.objects.filter(recipient=recipient)
+    if since is not None:
+        updated_at, notification_id = since
+        queryset = queryset.filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, id__gt=notification_id))
+    notifications = list(
+        queryset.select_related("actor", "target_content_type").order_by("updated_at", "id")[: limit + 1]
+    )
+    return notifications[:limit], len(notifications) > limit
@@ -10,13 +10,14 @@ from .employee_kpi_assessment import (
     EmployeeKPIAssessmentUpdateSerializer,
     EmployeeKPIItemSerializer,
     EmployeeKPIItemUpdateSerializer,
+    EmployeeSelfAssessmentItemScoresRequestSerializer,
     EmployeeSelfAssessmentSerializer,
     EmployeeSelfAssessmentUpdateRequestSerializer,
     ManagerAssessmentSerializer,
     ManagerAssessmentUpdateRequestSerializer,
+    ManagerBulkItemScoresRequestSerializer,
 )
 from .kpi_assessment_period import (
-    KPIAssessmentPeriodFinalizeResponseSerializer,
     KPIAssessmentPeriodGenerateResponseSerializer,
     KPIAssessmentPeriodGenerateSerializer,
     KPIAssessmentPeriodSerializer,
@@ -51,6 +52,7 @@ from .salary_period import (
     SalaryPeriodCreateSerializer,
     SalaryPeriodListSerializer,
     SalaryPeriodRecalculateResponseSerializer,
+    SalaryPeriodRegisterTotalsSerializer,
     SalaryPeriodSerializer,
     SalaryPeriodUpdateDeadlinesSerializer,
     TaskStatusSerializer,
@@ -84,7 +86,6 @@ __all__ = [
     "KPIAssessmentPeriodSerializer",
     "KPIAssessmentPeriodGenerateSerializer",
     "KPIAssessmentPeriodGenerateResponseSerializer",
-    "KPIAssessmentPeriodFinalizeResponseSerializer",
     "KPIAssessmentPeriodSummarySerializer",
     "EmployeeKPIAssessmentSerializer",
     "EmployeeKPIAssessmentListSerializer",
@@ -94,8 +95,10 @@ __all__ = [
     "EmployeeKPIItemUpdateSerializer",
     "EmployeeSelfAssessmentSerializer",
     "EmployeeSelfAssessmentUpdateRequestSerializer",
+    "EmployeeSelfAssessmentItemScoresRequestSerializer",
     "ManagerAssessmentSerializer",
     "ManagerAssessmentUpdateRequestSerializer",
+    "ManagerBulkItemScoresRequestSerializer",
     "DepartmentKPIAssessmentSerializer",
     "DepartmentKPIAssessmentListSerializer",
     "DepartmentKPIAssessmentUpdateSerializer",
@@ -116,6 +119,7 @@ __all__ = [
     "SalaryPeriodCreateAsyncSerializer",
     "SalaryPeriodCreateResponseSerializer",
     "SalaryPeriodRecalculateResponseSerializer",
+    "SalaryPeriodRegisterTotalsSerializer",
     "SalaryPeriodUpdateDeadlinesSerializer",
     "TaskStatusSerializer",
     "PayrollSlipSerializer",
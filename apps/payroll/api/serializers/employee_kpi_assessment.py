@@ -8,70 +8,98 @@ from apps.payroll.api.serializers.common_nested import (
     KPIAssessmentPeriodNestedSerializer,
 )
 from apps.payroll.models import EmployeeKPIAssessment, EmployeeKPIItem
+from apps.payroll.utils import write_item_scores
 from libs import ColoredValueSerializer
 
 
 class EmployeeKPIItemScoreSerializer(serializers.Serializer):
-    """Serializer for updating KPI item scores in batch."""
+    """Serializer for updating KPI item scores in batch.
+
+    The items are checked against the assessment by the parent serializer
+    (see `KPIItemScoresMixin`), so a batch is validated with a single query.
+    """
 
     item_id = serializers.IntegerField(help_text="ID of the KPI item to update")
     score = serializers.DecimalField(
         max_digits=5,
         decimal_places=2,
+        min_value=0,
         help_text="Score value (must not exceed component_total_score)",
     )
 
-    def validate(self, data):
-        """Validate that score doesn't exceed component_total_score."""
-        item_id = data.get("item_id")
-        score = data.get("score")
 
-        # Get assessment from context
+def validate_item_scores(assessment, items_data):
+    """Validate item scores against the items of an assessment.
+
+    Returns:
+        A list of errors aligned with `items_data`, empty dicts for valid entries
+    """
+    items = {item.id: item for item in assessment.items.all()}
+    errors = []
+    seen = set()
+    for item_data in items_data:
+        item_id = item_data["item_id"]
+        score = item_data["score"]
+        item = items.get(item_id)
+
+        if item is None:
+            errors.append({"item_id": [f"Item with ID {item_id} not found in this assessment"]})
+        elif item_id in seen:
+            errors.append({"item_id": [f"Item with ID {item_id} is scored more than once"]})
+        elif score > item.component_total_score:
+            errors.append(
+                {"score": [f"Score {score} cannot exceed component total score {item.component_total_score}"]}
+            )
+        else:
+            errors.append({})
+        seen.add(item_id)
+    return errors
+
+
+class KPIItemScoresMixin:
+    """Validate and write the `items` scores of one assessment taken from the context."""
+
+    score_field = None
+
+    def validate_items(self, value):
+        """Validate all item scores against the assessment items at once."""
         assessment = self.context.get("assessment")
         if not assessment:
-            return data
+            return value
 
-        # Check if item exists and belongs to this assessment
-        try:
-            item = assessment.items.get(id=item_id)
-        except EmployeeKPIItem.DoesNotExist:
-            raise serializers.ValidationError({"item_id": f"Item with ID {item_id} not found in this assessment"})
+        errors = validate_item_scores(assessment, value)
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return value
 
-        # Validate score doesn't exceed component_total_score
-        if score > item.component_total_score:
-            raise serializers.ValidationError(
-                {"score": f"Score {score} cannot exceed component total score {item.component_total_score}"}
+    def update_items(self, assessment, validated_data):
+        """Write item scores from validated data with one bulk update."""
+        scores = {item_data["item_id"]: item_data["score"] for item_data in validated_data.get("items", [])}
+        if scores:
+            request = self.context.get("request")
+            write_item_scores(
+                [assessment], scores, self.score_field, user=getattr(request, "user", None), request=request
             )
-
-        return data
+        return assessment
 
 
-class EmployeeSelfAssessmentUpdateRequestSerializer(serializers.Serializer):
-    """Request serializer for employee self-assessment batch update.
+class EmployeeSelfAssessmentItemScoresRequestSerializer(KPIItemScoresMixin, serializers.Serializer):
+    """Request serializer for scoring several self-assessment items at once.
 
     Example request:
     {
-        "plan_tasks": "Complete Q4 targets",
-        "extra_tasks": "Handle urgent requests",
-        "proposal": "Improve workflow automation",
         "items": [
             {"item_id": 1, "score": "65.00"},
-            {"item_id": 2, "score": "28.50"},
-            {"item_id": 3, "score": "90.00"}
+            {"item_id": 2, "score": "28.50"}
         ]
     }
-
-    The 'items' field is a list of objects where each object contains:
-    - item_id: ID of the KPI item to update
-    - score: Employee's score for that item
     """
 
-    plan_tasks = serializers.CharField(required=False, allow_blank=True, help_text="Planned tasks for the period")
-    extra_tasks = serializers.CharField(required=False, allow_blank=True, help_text="Extra tasks handled")
-    proposal = serializers.CharField(required=False, allow_blank=True, help_text="Employee's proposals")
+    score_field = "employee_score"
+
     items = serializers.ListField(
         child=EmployeeKPIItemScoreSerializer(),
-        required=False,
+        allow_empty=False,
         help_text="List of item updates with item_id and score",
     )
 
@@ -83,37 +111,46 @@ class EmployeeSelfAssessmentUpdateRequestSerializer(serializers.Serializer):
 
         # Check if finalized
         if assessment.finalized:
-            from django.utils.translation import gettext as _
-
             raise serializers.ValidationError(_("Cannot update finalized assessment"))
 
         # Check if manager has already graded
         if assessment.grade_manager is not None:
-            from django.utils.translation import gettext as _
-
             raise serializers.ValidationError(_("Cannot update assessment that has been assessed by manager"))
 
         return data
 
-    def update_items(self, assessment, validated_data):
-        """Update item scores from validated data."""
-        items_data = validated_data.get("items", [])
 
-        for item_data in items_data:
-            item_id = item_data["item_id"]
-            score = item_data["score"]
+class EmployeeSelfAssessmentUpdateRequestSerializer(EmployeeSelfAssessmentItemScoresRequestSerializer):
+    """Request serializer for employee self-assessment batch update.
 
-            try:
-                item = assessment.items.get(id=item_id)
-                item.employee_score = score
-                item.save()
-            except EmployeeKPIItem.DoesNotExist:
-                continue
+    Example request:
+    {
+        "plan_tasks": "Complete Q4 targets",
+        "extra_tasks": "Handle urgent requests",
+        "proposal": "Improve workflow automation",
+        "items": [
+            {"item_id": 1, "score": "65.00"},
+            {"item_id": 2, "score": "28.50"},
+            {"item_id": 3, "score": "90.00"}
+        ]
+    }
 
-        return assessment
+    The 'items' field is a list of objects where each object contains:
+    - item_id: ID of the KPI item to update
+    - score: Employee's score for that item
+    """
+
+    plan_tasks = serializers.CharField(required=False, allow_blank=True, help_text="Planned tasks for the period")
+    extra_tasks = serializers.CharField(required=False, allow_blank=True, help_text="Extra tasks handled")
+    proposal = serializers.CharField(required=False, allow_blank=True, help_text="Employee's proposals")
+    items = serializers.ListField(
+        child=EmployeeKPIItemScoreSerializer(),
+        required=False,
+        help_text="List of item updates with item_id and score",
+    )
 
 
-class ManagerAssessmentUpdateRequestSerializer(serializers.Serializer):
+class ManagerAssessmentUpdateRequestSerializer(KPIItemScoresMixin, serializers.Serializer):
     """Request serializer for manager assessment batch update.
 
     Example request:
@@ -132,6 +169,8 @@ class ManagerAssessmentUpdateRequestSerializer(serializers.Serializer):
     - score: Manager's score for that item
     """
 
+    score_field = "manager_score"
+
     manager_assessment = serializers.CharField(
         required=False,
         allow_blank=True,
@@ -156,28 +195,70 @@ class ManagerAssessmentUpdateRequestSerializer(serializers.Serializer):
 
         # Check if finalized
         if assessment.finalized:
-            from django.utils.translation import gettext as _
-
             raise serializers.ValidationError(_("Cannot update finalized assessment"))
 
         return data
 
-    def update_items(self, assessment, validated_data):
-        """Update item scores from validated data."""
-        items_data = validated_data.get("items", [])
 
-        for item_data in items_data:
-            item_id = item_data["item_id"]
-            score = item_data["score"]
+class ManagerAssessmentItemScoresSerializer(serializers.Serializer):
+    """Item scores of one assessment in a manager bulk scoring request."""
+
+    assessment_id = serializers.IntegerField(help_text="ID of the assessment to score")
+    items = serializers.ListField(
+        child=EmployeeKPIItemScoreSerializer(),
+        allow_empty=False,
+        help_text="List of item updates with item_id and score",
+    )
+
 
-            try:
-                item = assessment.items.get(id=item_id)
-                item.manager_score = score
-                item.save()
-            except EmployeeKPIItem.DoesNotExist:
-                continue
+class ManagerBulkItemScoresRequestSerializer(serializers.Serializer):
+    """Request serializer for scoring the items of several assessments at once.
 
-        return assessment
+    The assessments are looked up in the `queryset` from the context (the
+    manager's own assessments) with their items in two queries. Validated
+    entries carry the loaded instance under `assessment`.
+
+    Example request:
+    {
+        "assessments": [
+            {"assessment_id": 1, "items": [{"item_id": 1, "score": "60.00"}]},
+            {"assessment_id": 2, "items": [{"item_id": 7, "score": "25.00"}]}
+        ]
+    }
+    """
+
+    assessments = serializers.ListField(
+        child=ManagerAssessmentItemScoresSerializer(),
+        allow_empty=False,
+        help_text="List of assessments with their item scores",
+    )
+
+    def validate_assessments(self, value):
+        """Validate every assessment and its item scores in one pass."""
+        assessment_ids = [entry["assessment_id"] for entry in value]
+        assessments = self.context["queryset"].prefetch_related("items").in_bulk(assessment_ids)
+
+        errors = []
+        seen = set()
+        for entry in value:
+            assessment_id = entry["assessment_id"]
+            assessment = assessments.get(assessment_id)
+
+            if assessment is None:
+                errors.append({"assessment_id": [f"Assessment with ID {assessment_id} not found"]})
+            elif assessment_id in seen:
+                errors.append({"assessment_id": [f"Assessment with ID {assessment_id} is listed more than once"]})
+            elif assessment.finalized:
+                errors.append({"assessment_id": [_("Cannot update finalized assessment")]})
+            else:
+                item_errors = validate_item_scores(assessment, entry["items"])
+                errors.append({"items": item_errors} if any(item_errors) else {})
+                entry["assessment"] = assessment
+            seen.add(assessment_id)
+
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        return value
 
 
 class BaseEmployeeKPIAssessmentSerializer(serializers.ModelSerializer):
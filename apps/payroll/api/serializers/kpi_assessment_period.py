@@ -24,15 +24,6 @@ class KPIAssessmentPeriodGenerateResponseSerializer(serializers.Serializer):
     department_assessments_created = serializers.IntegerField(help_text="Number of department assessments created")
 
 
-class KPIAssessmentPeriodFinalizeResponseSerializer(serializers.Serializer):
-    """Response serializer for finalize action."""
-
-    message = serializers.CharField(help_text="Success message")
-    employees_set_to_c = serializers.IntegerField(help_text="Number of employees set to grade C")
-    departments_validated = serializers.IntegerField(help_text="Number of departments with valid unit control")
-    departments_invalid = serializers.IntegerField(help_text="Number of departments with invalid unit control")
-
-
 class KPIAssessmentPeriodSummarySerializer(serializers.Serializer):
     """Response serializer for summary action."""
 
@@ -258,3 +258,25 @@ class SalaryPeriodRecalculateResponseSerializer(serializers.Serializer):
     task_id = serializers.CharField(help_text="Celery task ID for tracking the recalculation process")
     status = serializers.CharField(help_text="Task creation status")
     message = serializers.CharField(help_text="Human-readable message about the task")
+
+
+class SalaryPeriodRegisterTotalsSerializer(serializers.ModelSerializer):
+    """Totals of the frozen payroll register of a completed salary period."""
+
+    month = serializers.SerializerMethodField()
+    payment_count = serializers.IntegerField(source="register_snapshot.payment_count", read_only=True)
+    deferred_count = serializers.IntegerField(source="register_snapshot.deferred_count", read_only=True)
+    totals = serializers.JSONField(
+        source="register_snapshot.totals",
+        read_only=True,
+        help_text="Sums of the amount columns by table ('payment' and 'deferred'), as decimal strings",
+    )
+
+    class Meta:
+        model = SalaryPeriod
+        fields = ["id", "code", "month", "payment_count", "deferred_count", "totals"]
+        read_only_fields = fields
+
+    def get_month(self, obj):
+        """Return month in n/YYYY format (month without leading zero)."""
+        return obj.month.strftime("%-m/%Y")
@@ -1,3 +1,5 @@
+from django.db import transaction
+from django.utils import timezone
 from django.utils.translation import gettext as _
 from django_filters.rest_framework import DjangoFilterBackend
 from drf_spectacular.utils import OpenApiExample, extend_schema, extend_schema_view
@@ -16,13 +18,15 @@ from apps.payroll.api.serializers import (
     EmployeeKPIAssessmentSerializer,
     EmployeeKPIAssessmentUpdateSerializer,
     EmployeeKPIItemSerializer,
+    EmployeeSelfAssessmentItemScoresRequestSerializer,
     EmployeeSelfAssessmentSerializer,
     EmployeeSelfAssessmentUpdateRequestSerializer,
     ManagerAssessmentSerializer,
     ManagerAssessmentUpdateRequestSerializer,
+    ManagerBulkItemScoresRequestSerializer,
 )
 from apps.payroll.models import EmployeeKPIAssessment, EmployeeKPIItem
-from apps.payroll.utils import recalculate_assessment_scores
+from apps.payroll.utils import apply_item_scores, recalculate_assessment_scores
 from libs import BaseModelViewSet
 from libs.drf.filtersets.search import PhraseSearchFilter
 from libs.export_xlsx import ExportXLSXMixin
@@ -238,8 +242,6 @@ class EmployeeKPIAssessmentViewSet(ExportXLSXMixin, AuditLoggingMixin, BaseModel
 
     def perform_update(self, serializer):
         """Set updated_by and hrm_assessment_date when updating."""
-        from django.utils import timezone
-
         # Set hrm_assessment_date if grade_hrm is being set
         if "grade_hrm" in serializer.validated_data:
             serializer.validated_data["hrm_assessed"] = True
@@ -434,6 +436,10 @@ class EmployeeSelfAssessmentViewSet(BaseModelViewSet):
             "name_template": _("Update Self Assessment Item Score"),
             "description_template": _("Permission to update self-assessment item scores"),
         },
+        "update_item_scores": {
+            "name_template": _("Update Self Assessment Item Scores In Batch"),
+            "description_template": _("Permission to update several self-assessment item scores at once"),
+        },
     }
 
     def get_queryset(self):
@@ -477,7 +483,7 @@ class EmployeeSelfAssessmentViewSet(BaseModelViewSet):
 
         # Create request serializer with assessment context for validation
         request_serializer = EmployeeSelfAssessmentUpdateRequestSerializer(
-            data=self.request.data, context={"assessment": assessment}
+            data=self.request.data, context={"assessment": assessment, "request": self.request}
         )
         request_serializer.is_valid(raise_exception=True)
 
@@ -569,6 +575,39 @@ class EmployeeSelfAssessmentViewSet(BaseModelViewSet):
         serializer = EmployeeKPIItemSerializer(item)
         return Response(serializer.data)
 
+    @extend_schema(
+        summary="Update employee scores for several items",
+        description=(
+            "Update employee's self-scores for several KPI items of an assessment at once. "
+            "All scores are validated together, written in one update and the totals are recalculated once."
+        ),
+        tags=["8.5: Employee Self-Assessment"],
+        request=EmployeeSelfAssessmentItemScoresRequestSerializer,
+        responses={200: EmployeeSelfAssessmentSerializer},
+        examples=[
+            OpenApiExample(
+                "Request",
+                value={"items": [{"item_id": 1, "score": "65.00"}, {"item_id": 2, "score": "28.50"}]},
+                request_only=True,
+            ),
+        ],
+    )
+    @action(detail=True, methods=["patch"], url_path="items/scores")
+    def update_item_scores(self, request, pk=None):
+        """Update employee scores for several items of an assessment."""
+        assessment = self.get_object()
+
+        request_serializer = EmployeeSelfAssessmentItemScoresRequestSerializer(
+            data=request.data, context={"assessment": assessment}
+        )
+        request_serializer.is_valid(raise_exception=True)
+
+        scores = {item["item_id"]: item["score"] for item in request_serializer.validated_data["items"]}
+        apply_item_scores([assessment], scores, "employee_score", user=request.user, request=request)
+
+        serializer = self.get_serializer(self.get_object())
+        return Response(serializer.data)
+
 
 @extend_schema_view(
     list=extend_schema(
@@ -802,7 +841,11 @@ class ManagerAssessmentViewSet(BaseModelViewSet):
         "current_assessments": {
             "name_template": _("View Current Assessments"),
             "description_template": _("Permission to view current unfinalized assessments for department employees"),
-        }
+        },
+        "bulk_update_item_scores": {
+            "name_template": _("Update Manager Item Scores In Batch"),
+            "description_template": _("Permission to update item scores of several employee assessments at once"),
+        },
     }
 
     def get_queryset(self):
@@ -829,13 +872,11 @@ class ManagerAssessmentViewSet(BaseModelViewSet):
 
     def perform_update(self, serializer):
         """Save the updated assessment and handle batch item updates using serializer validation."""
-        from django.utils import timezone
-
         assessment = self.get_object()
 
         # Create request serializer with assessment context for validation
         request_serializer = ManagerAssessmentUpdateRequestSerializer(
-            data=self.request.data, context={"assessment": assessment}
+            data=self.request.data, context={"assessment": assessment, "request": self.request}
         )
         request_serializer.is_valid(raise_exception=True)
 
@@ -931,3 +972,51 @@ class ManagerAssessmentViewSet(BaseModelViewSet):
 
         serializer = self.get_serializer(queryset, many=True)
         return Response(serializer.data)
+
+    @extend_schema(
+        summary="Update manager scores for several assessments",
+        description=(
+            "Update manager scores of KPI items for several employee assessments at once. "
+            "The request is validated as a whole and applied in one transaction; each assessment "
+            "is recalculated once, which triggers a single payroll recalculation per employee."
+        ),
+        tags=["8.7: Manager Assessment"],
+        request=ManagerBulkItemScoresRequestSerializer,
+        responses={200: ManagerAssessmentSerializer(many=True)},
+        examples=[
+            OpenApiExample(
+                "Request",
+                value={
+                    "assessments": [
+                        {"assessment_id": 1, "items": [{"item_id": 1, "score": "60.00"}]},
+                        {"assessment_id": 2, "items": [{"item_id": 7, "score": "25.00"}]},
+                    ]
+                },
+                request_only=True,
+            ),
+        ],
+    )
+    @action(detail=False, methods=["patch"], url_path="items/scores")
+    def bulk_update_item_scores(self, request):
+        """Update manager scores for the items of several assessments."""
+        request_serializer = ManagerBulkItemScoresRequestSerializer(
+            data=request.data, context={"queryset": self.get_queryset()}
+        )
+        request_serializer.is_valid(raise_exception=True)
+
+        entries = request_serializer.validated_data["assessments"]
+        assessments = [entry["assessment"] for entry in entries]
+        scores = {item["item_id"]: item["score"] for entry in entries for item in entry["items"]}
+
+        with transaction.atomic():
+            now = timezone.now()
+            EmployeeKPIAssessment.objects.filter(id__in=[assessment.id for assessment in assessments]).update(
+                manager_assessment_date=now
+            )
+            for assessment in assessments:
+                assessment.manager_assessment_date = now
+            apply_item_scores(assessments, scores, "manager_score", user=request.user, request=request)
+
+        queryset = self.get_queryset().filter(id__in=[assessment.id for assessment in assessments])
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
@@ -1,7 +1,6 @@
 from datetime import date
 
-from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Q
 from django.utils.translation import gettext as _
 from drf_spectacular.utils import OpenApiExample, extend_schema, extend_schema_view
 from rest_framework import status
@@ -9,7 +8,6 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from apps.payroll.api.serializers import (
-    KPIAssessmentPeriodFinalizeResponseSerializer,
     KPIAssessmentPeriodGenerateSerializer,
     KPIAssessmentPeriodSerializer,
     KPIAssessmentPeriodSummarySerializer,
@@ -20,7 +18,6 @@ from apps.payroll.models import (
     KPIAssessmentPeriod,
     KPIConfig,
 )
-from apps.payroll.utils import update_department_assessment_status
 from libs import BaseReadOnlyModelViewSet
 from libs.drf.filtersets.search import PhraseSearchFilter
 
@@ -249,25 +246,36 @@ from libs.drf.filtersets.search import PhraseSearchFilter
         ],
     ),
     finalize=extend_schema(
-        summary="Finalize KPI assessment period",
-        description="Finalize all assessments in this period. Sets grade_hrm='C' for unassessed employees and validates unit control for departments.",
+        summary="Finalize KPI assessment period (async)",
+        description=(
+            "Finalize all assessments in this period asynchronously. Sets grade_hrm='C' for unassessed employees "
+            "and validates unit control for departments.\n\n"
+            "Returns a task_id that can be used to check the finalization progress via the task-status endpoint. "
+            "The task result contains employees_set_to_c, departments_validated and departments_invalid."
+        ),
         tags=["8.6: KPI Assessment Periods"],
         request=None,
         responses={
-            200: KPIAssessmentPeriodFinalizeResponseSerializer,
+            202: {
+                "type": "object",
+                "properties": {
+                    "task_id": {"type": "string"},
+                    "status": {"type": "string"},
+                    "message": {"type": "string"},
+                },
+            },
             400: {"type": "object", "properties": {"detail": {"type": "string"}}},
         },
         examples=[
             OpenApiExample(
-                "Success Response",
+                "Success - Task Created",
                 value={
-                    "message": "Period finalized successfully",
-                    "employees_set_to_c": 5,
-                    "departments_validated": 10,
-                    "departments_invalid": 2,
+                    "task_id": "abc123-def456-ghi789",
+                    "status": "Task created",
+                    "message": "KPI assessment period finalization started. Use task_status endpoint to check progress.",
                 },
                 response_only=True,
-                status_codes=["200"],
+                status_codes=["202"],
             ),
             OpenApiExample(
                 "Error - Already finalized",
@@ -340,6 +348,9 @@ class KPIAssessmentPeriodViewSet(BaseReadOnlyModelViewSet):
     def get_queryset(self):
         """Optimize queryset with annotations."""
         queryset = super().get_queryset()
+        if self.action in ("finalize", "summary"):
+            # These actions only need the period itself
+            return queryset
 
         queryset = queryset.annotate(
             employee_assessments_count=Count("employee_assessments", distinct=True),
@@ -423,7 +434,7 @@ class KPIAssessmentPeriodViewSet(BaseReadOnlyModelViewSet):
 
     @action(detail=True, methods=["post"], url_path="finalize")
     def finalize(self, request, pk=None):
-        """Finalize all assessments in this period."""
+        """Finalize all assessments in this period asynchronously."""
         period = self.get_object()
 
         if period.finalized:
@@ -432,70 +443,18 @@ class KPIAssessmentPeriodViewSet(BaseReadOnlyModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        with transaction.atomic():
-            # Process employee assessments - set default grade for ungraded employees
-            employees_set_to_c = 0
-            employee_assessments = EmployeeKPIAssessment.objects.filter(period=period)
-
-            # First pass: set default grades without triggering signals
-            employees_to_update = []
-            for assessment in employee_assessments:
-                # If not assessed (no scores), set grade_hrm = 'C'
-                if (
-                    assessment.total_employee_score is None
-                    and assessment.total_manager_score is None
-                    and not assessment.grade_hrm
-                    and not assessment.grade_manager
-                ):
-                    assessment.grade_hrm = "C"
-                    employees_set_to_c += 1
-                    employees_to_update.append(assessment)
-
-            # Bulk update to avoid triggering signal for each save
-            if employees_to_update:
-                EmployeeKPIAssessment.objects.bulk_update(employees_to_update, ["grade_hrm"], batch_size=100)
-
-            # Second pass: finalize all employee assessments
-            for assessment in employee_assessments:
-                assessment.finalized = True
-
-            EmployeeKPIAssessment.objects.bulk_update(employee_assessments, ["finalized"], batch_size=100)
-
-            # Process department assessments - update all department statuses
-            departments_validated = 0
-            departments_invalid = 0
-            department_assessments = DepartmentKPIAssessment.objects.filter(period=period)
-
-            for dept_assessment in department_assessments:
-                # Update department status (is_finished and is_valid_unit_control)
-                # This will check all employees in the department and validate unit control
-                update_department_assessment_status(dept_assessment)
-
-                # Refresh from db to get updated values
-                dept_assessment.refresh_from_db()
-
-                # Finalize the department assessment
-                dept_assessment.finalized = True
-                dept_assessment.save(update_fields=["finalized"])
-
-                if dept_assessment.is_valid_unit_control:
-                    departments_validated += 1
-                else:
-                    departments_invalid += 1
-
-            # Finalize the period
-            period.finalized = True
-            period.updated_by = request.user
-            period.save()
+        # Launch async task
+        from apps.payroll.tasks import finalize_kpi_period_task
+
+        task = finalize_kpi_period_task.delay(period.id, request.user.id)
 
         return Response(
             {
-                "message": _("Period finalized successfully"),
-                "employees_set_to_c": employees_set_to_c,
-                "departments_validated": departments_validated,
-                "departments_invalid": departments_invalid,
+                "task_id": task.id,
+                "status": "Task created",
+                "message": "KPI assessment period finalization started. Use task_status endpoint to check progress.",
             },
-            status=status.HTTP_200_OK,
+            status=status.HTTP_202_ACCEPTED,
         )
 
     @action(detail=True, methods=["get"], url_path="summary")
@@ -503,38 +462,26 @@ class KPIAssessmentPeriodViewSet(BaseReadOnlyModelViewSet):
         """Get summary statistics for the assessment period."""
         period = self.get_object()
 
-        # Get all department assessments for this period
-        department_assessments = DepartmentKPIAssessment.objects.filter(period=period)
-
-        total_departments = department_assessments.count()
-
-        # Count departments with at least one employee assessed by manager
-        departments_with_manager_assessment = set()
-        departments_without_manager_assessment = set()
-
-        for dept_assessment in department_assessments:
-            # Check if at least one employee in this department has grade_manager
-            has_manager_grade = EmployeeKPIAssessment.objects.filter(
+        # A department counts as finished once at least one of its employees was graded by a manager
+        has_manager_grade = Exists(
+            EmployeeKPIAssessment.objects.filter(
                 period=period,
-                department_snapshot=dept_assessment.department,
+                department_snapshot=OuterRef("department"),
                 grade_manager__isnull=False,
-            ).exists()
-
-            if has_manager_grade:
-                departments_with_manager_assessment.add(dept_assessment.id)
-            else:
-                departments_without_manager_assessment.add(dept_assessment.id)
-
-        departments_finished = len(departments_with_manager_assessment)
-        departments_not_finished = len(departments_without_manager_assessment)
-        departments_not_valid_control = department_assessments.filter(is_valid_unit_control=False).count()
+            )
+        )
+        counts = DepartmentKPIAssessment.objects.filter(period=period).aggregate(
+            total_departments=Count("id"),
+            departments_finished=Count("id", filter=has_manager_grade),
+            departments_not_valid_control=Count("id", filter=Q(is_valid_unit_control=False)),
+        )
 
         return Response(
             {
-                "total_departments": total_departments,
-                "departments_finished": departments_finished,
-                "departments_not_finished": departments_not_finished,
-                "departments_not_valid_control": departments_not_valid_control,
+                "total_departments": counts["total_departments"],
+                "departments_finished": counts["departments_finished"],
+                "departments_not_finished": counts["total_departments"] - counts["departments_finished"],
+                "departments_not_valid_control": counts["departments_not_valid_control"],
             },
             status=status.HTTP_200_OK,
         )
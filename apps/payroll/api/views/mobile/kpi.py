@@ -102,7 +102,7 @@ class MyKPIAssessmentViewSet(BaseModelViewSet):
         assessment = self.get_object()
 
         request_serializer = EmployeeSelfAssessmentUpdateRequestSerializer(
-            data=self.request.data, context={"assessment": assessment}
+            data=self.request.data, context={"assessment": assessment, "request": self.request}
         )
         request_serializer.is_valid(raise_exception=True)
 
@@ -252,7 +252,7 @@ class MyTeamKPIAssessmentViewSet(BaseModelViewSet):
         assessment = self.get_object()
 
         request_serializer = ManagerAssessmentUpdateRequestSerializer(
-            data=self.request.data, context={"assessment": assessment}
+            data=self.request.data, context={"assessment": assessment, "request": self.request}
         )
         request_serializer.is_valid(raise_exception=True)
 
@@ -19,11 +19,13 @@ from apps.payroll.api.serializers import (
     SalaryPeriodCreateResponseSerializer,
     SalaryPeriodListSerializer,
     SalaryPeriodRecalculateResponseSerializer,
+    SalaryPeriodRegisterTotalsSerializer,
     SalaryPeriodSerializer,
     SalaryPeriodUpdateDeadlinesSerializer,
     TaskStatusSerializer,
 )
 from apps.payroll.models import PayrollSlip, SalaryPeriod
+from apps.payroll.services.payroll_register import SHEET_DEFERRED, SHEET_PAYMENT, get_payroll_register
 from libs import BaseModelViewSet, BaseReadOnlyModelViewSet
 from libs.drf.filtersets.search import PhraseSearchFilter
 from libs.drf.pagination import PageNumberWithSizePagination
@@ -317,6 +319,8 @@ class SalaryPeriodViewSet(AuditLoggingMixin, BaseModelViewSet):
             return SalaryPeriodUpdateDeadlinesSerializer
         elif self.action == "task_status":
             return TaskStatusSerializer
+        elif self.action == "register_totals":
+            return SalaryPeriodRegisterTotalsSerializer
         return SalaryPeriodSerializer
 
     @extend_schema(
@@ -503,6 +507,62 @@ class SalaryPeriodViewSet(AuditLoggingMixin, BaseModelViewSet):
             }
         )
 
+    @extend_schema(
+        summary="Payroll register totals of completed periods",
+        description=(
+            "Compare the payroll register totals (payment and deferred tables) of completed salary periods. "
+            "Totals are read from the register frozen when each period was completed. "
+            "Supports the same filtering and ordering as the salary period list."
+        ),
+        tags=["10.6: Salary Periods"],
+        responses={200: SalaryPeriodRegisterTotalsSerializer(many=True)},
+        examples=[
+            OpenApiExample(
+                "Success - Register totals",
+                value={
+                    "success": True,
+                    "data": {
+                        "count": 1,
+                        "next": None,
+                        "previous": None,
+                        "results": [
+                            {
+                                "id": 1,
+                                "code": "SP-202401",
+                                "month": "1/2024",
+                                "payment_count": 45,
+                                "deferred_count": 3,
+                                "totals": {
+                                    "payment": {"gross_income": "650000000", "net_salary": "580000000"},
+                                    "deferred": {"gross_income": "42000000", "net_salary": "37000000"},
+                                },
+                            }
+                        ],
+                    },
+                    "error": None,
+                },
+                response_only=True,
+            ),
+        ],
+    )
+    @action(detail=False, methods=["get"], url_path="register-totals")
+    def register_totals(self, request):
+        """List the frozen payroll register totals of completed periods."""
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .filter(status=SalaryPeriod.Status.COMPLETED, register_snapshot__isnull=False)
+            .select_related("register_snapshot")
+            .defer("register_snapshot__data")
+        )
+
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        serializer = self.get_serializer(queryset, many=True)
+        return Response(serializer.data)
+
     @extend_schema(
         summary="Send email notifications",
         description="Send payroll slip emails to employees asynchronously. Returns task ID for tracking progress.",
@@ -876,42 +936,13 @@ class SalaryPeriodViewSet(AuditLoggingMixin, BaseModelViewSet):
             "bank_account",  # BB
         ]
 
-        # Sheet 1: Ready slips (based on SalaryPeriodReadySlipsViewSet logic)
-        if period.status == SalaryPeriod.Status.ONGOING:
-            ready_slips = (
-                PayrollSlip.objects.filter(status=PayrollSlip.Status.READY)
-                .select_related("employee", "salary_period")
-                .prefetch_related("employee__bank_accounts")
-            )
-        else:  # COMPLETED
-            ready_slips = (
-                PayrollSlip.objects.filter(payment_period=period, status=PayrollSlip.Status.DELIVERED)
-                .select_related("employee", "salary_period")
-                .prefetch_related("employee__bank_accounts")
-            )
-
-        # Sheet 2: Not ready slips (based on SalaryPeriodNotReadySlipsViewSet logic)
-        if period.status == SalaryPeriod.Status.ONGOING:
-            not_ready_slips = (
-                PayrollSlip.objects.filter(
-                    salary_period=period, status__in=[PayrollSlip.Status.PENDING, PayrollSlip.Status.HOLD]
-                )
-                .select_related("employee", "salary_period")
-                .prefetch_related("employee__bank_accounts")
-            )
-        else:  # COMPLETED
-            not_ready_slips = (
-                PayrollSlip.objects.filter(
-                    salary_period=period,
-                    status__in=[PayrollSlip.Status.PENDING, PayrollSlip.Status.HOLD, PayrollSlip.Status.READY],
-                )
-                .select_related("employee", "salary_period")
-                .prefetch_related("employee__bank_accounts")
-            )
+        # Sheet 1: payment table, Sheet 2: deferred table. Completed periods are
+        # read from their frozen register snapshot instead of the live slips.
+        register = get_payroll_register(period)
 
         # Build data for both sheets
         def build_sheet_data(slips):
-            """Build sheet data with Excel formulas for calculated fields."""
+            """Build sheet data with Excel formulas for calculated fields from register rows."""
             data = []
 
             # Get insurance config percentages from period's salary config
@@ -945,45 +976,45 @@ class SalaryPeriodViewSet(AuditLoggingMixin, BaseModelViewSet):
                     # A: STT
                     "stt": idx,
                     # B: Employee code
-                    "employee_code": slip.employee_code or "",
+                    "employee_code": slip["employee_code"] or "",
                     # C: Full name
-                    "employee_name": slip.employee_name or "",
+                    "employee_name": slip["employee_name"] or "",
                     # D: Department
-                    "department_name": slip.department_name or "",
+                    "department_name": slip["department_name"] or "",
                     # E: Position
-                    "position_name": slip.position_name or "",
+                    "position_name": slip["position_name"] or "",
                     # F: Employment status
-                    "employment_status": slip.employment_status or "",
+                    "employment_status": slip["employment_status"] or "",
                     # G: Email
-                    "employee_email": slip.employee_email or "",
+                    "employee_email": slip["employee_email"] or "",
                     # H: Sales revenue
-                    "sales_revenue": slip.sales_revenue or 0,
+                    "sales_revenue": slip["sales_revenue"] or 0,
                     # I: Transaction count
-                    "sales_transaction_count": slip.sales_transaction_count or 0,
+                    "sales_transaction_count": slip["sales_transaction_count"] or 0,
                     # Position income (J-R)
-                    "base_salary": slip.base_salary or 0,  # J
-                    "lunch_allowance": slip.lunch_allowance or 0,  # K
-                    "phone_allowance": slip.phone_allowance or 0,  # L
-                    "travel_expense_by_working_days": slip.travel_expense_by_working_days or 0,  # M
-                    "kpi_salary": slip.kpi_salary or 0,  # N
-                    "kpi_grade": slip.kpi_grade or "",  # O
-                    "kpi_bonus": slip.kpi_bonus or 0,  # P
-                    "business_progressive_salary": slip.business_progressive_salary or 0,  # Q
+                    "base_salary": slip["base_salary"] or 0,  # J
+                    "lunch_allowance": slip["lunch_allowance"] or 0,  # K
+                    "phone_allowance": slip["phone_allowance"] or 0,  # L
+                    "travel_expense_by_working_days": slip["travel_expense_by_working_days"] or 0,  # M
+                    "kpi_salary": slip["kpi_salary"] or 0,  # N
+                    "kpi_grade": slip["kpi_grade"] or "",  # O
+                    "kpi_bonus": slip["kpi_bonus"] or 0,  # P
+                    "business_progressive_salary": slip["business_progressive_salary"] or 0,  # Q
                     # R: Total position income = J+K+L+M+N+P+Q
                     "total_position_income": f"=J{excel_row}+K{excel_row}+L{excel_row}+M{excel_row}+N{excel_row}+P{excel_row}+Q{excel_row}",
                     # Working days (S-V)
-                    "standard_working_days": slip.standard_working_days or 0,  # S
-                    "total_working_days": slip.total_working_days or 0,  # T
-                    "probation_working_days": slip.probation_working_days or 0,  # U
-                    "official_working_days": slip.official_working_days or 0,  # V
+                    "standard_working_days": slip["standard_working_days"] or 0,  # S
+                    "total_working_days": slip["total_working_days"] or 0,  # T
+                    "probation_working_days": slip["probation_working_days"] or 0,  # U
+                    "official_working_days": slip["official_working_days"] or 0,  # V
                     # W: Actual working days income
                     # Formula: IF(E{row}="NVKD",(V{row}*R{row}+U{row}*R{row})/S{row},(V{row}*R{row}+U{row}*R{row}*0.85)/S{row})
                     "actual_working_days_income": f'=IF(E{excel_row}="NVKD",(V{excel_row}*R{excel_row}+U{excel_row}*R{excel_row})/S{excel_row},(V{excel_row}*R{excel_row}+U{excel_row}*R{excel_row}*0.85)/S{excel_row})',
                     # Overtime (X-AG)
-                    "tc1_overtime_hours": slip.tc1_overtime_hours or 0,  # X
-                    "tc2_overtime_hours": slip.tc2_overtime_hours or 0,  # Y
-                    "tc3_overtime_hours": slip.tc3_overtime_hours or 0,  # Z
-                    "total_overtime_hours": slip.total_overtime_hours or 0,  # AA - fill data, not formula
+                    "tc1_overtime_hours": slip["tc1_overtime_hours"] or 0,  # X
+                    "tc2_overtime_hours": slip["tc2_overtime_hours"] or 0,  # Y
+                    "tc3_overtime_hours": slip["tc3_overtime_hours"] or 0,  # Z
+                    "total_overtime_hours": slip["total_overtime_hours"] or 0,  # AA - fill data, not formula
                     # AB: Hourly rate = IF(F="PROBATION",R*0.85/S/8,R/S/8)
                     "hourly_rate": f'=IF(F{excel_row}="{probation_status}",R{excel_row}*0.85/S{excel_row}/8,R{excel_row}/S{excel_row}/8)',
                     # AC: Reference overtime pay = (X*1.5+Y*2+Z*3)*AB
@@ -1012,8 +1043,8 @@ class SalaryPeriodViewSet(AuditLoggingMixin, BaseModelViewSet):
                     "employee_unemployment_insurance": f"=AI{excel_row}*{employee_ui_rate}",  # AQ
                     "employee_union_fee": f"=AI{excel_row}*{employee_uf_rate}",  # AR
                     # Tax information (AS-AX)
-                    "tax_code": slip.tax_code or "",  # AS
-                    "dependent_count": slip.dependent_count or 0,  # AT
+                    "tax_code": slip["tax_code"] or "",  # AS
+                    "dependent_count": slip["dependent_count"] or 0,  # AT
                     # AU: Total deduction = personal_deduction + dependent_count * dependent_deduction
                     "total_deduction": f"={personal_deduction}+AT{excel_row}*{dependent_deduction}",
                     # AV: Non-taxable allowance = SUM(K:L)/S*(U*0.85+V)
@@ -1027,22 +1058,18 @@ class SalaryPeriodViewSet(AuditLoggingMixin, BaseModelViewSet):
                     # Else: =IF(AW>=2000000,AW*10%,0)
                     "personal_income_tax": f'=IF(F{excel_row}="{official_status}",IF(AW{excel_row}<=5000000,AW{excel_row}*0.05,IF(AW{excel_row}<=10000000,AW{excel_row}*0.1-250000,IF(AW{excel_row}<=18000000,AW{excel_row}*0.15-750000,IF(AW{excel_row}<=32000000,AW{excel_row}*0.2-1650000,IF(AW{excel_row}<=52000000,AW{excel_row}*0.25-3250000,IF(AW{excel_row}<=80000000,AW{excel_row}*0.3-5850000,AW{excel_row}*0.35-9850000)))))),IF(AW{excel_row}>=2000000,AW{excel_row}*0.1,0))',
                     # Adjustments (AY-AZ)
-                    "back_pay_amount": slip.back_pay_amount or 0,  # AY
-                    "recovery_amount": slip.recovery_amount or 0,  # AZ
+                    "back_pay_amount": slip["back_pay_amount"] or 0,  # AY
+                    "recovery_amount": slip["recovery_amount"] or 0,  # AZ
                     # BA: Net salary = ROUND(AH-SUM(AO:AQ)-AR+AY-AZ-AX,0)
                     "net_salary": f"=ROUND(AH{excel_row}-SUM(AO{excel_row}:AQ{excel_row})-AR{excel_row}+AY{excel_row}-AZ{excel_row}-AX{excel_row},0)",
                     # BB: Bank account
-                    "bank_account": (
-                        slip.employee.default_bank_account.account_number
-                        if slip.employee and slip.employee.default_bank_account
-                        else ""
-                    ),
+                    "bank_account": slip["bank_account"] or "",
                 }
                 data.append(row)
             return data
 
-        ready_data = build_sheet_data(ready_slips)
-        not_ready_data = build_sheet_data(not_ready_slips)
+        ready_data = build_sheet_data(register[SHEET_PAYMENT])
+        not_ready_data = build_sheet_data(register[SHEET_DEFERRED])
 
         # Create schema with 2 sheets
         schema = {
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-18 23:10
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payroll", "0008_add_employee_official_date_to_payroll_slip"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PayrollRegisterSnapshot",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                ("updated_at", models.DateTimeField(auto_now=True, db_index=True)),
+                ("data", models.BinaryField(help_text="Parquet encoded register rows", verbose_name="Data")),
+                ("format_version", models.PositiveSmallIntegerField(default=1, verbose_name="Format version")),
+                ("payment_count", models.PositiveIntegerField(default=0, verbose_name="Payment count")),
+                ("deferred_count", models.PositiveIntegerField(default=0, verbose_name="Deferred count")),
+                ("totals", models.JSONField(default=dict, verbose_name="Totals")),
+                (
+                    "salary_period",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="register_snapshot",
+                        to="payroll.salaryperiod",
+                        verbose_name="Salary period",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Payroll Register Snapshot",
+                "verbose_name_plural": "Payroll Register Snapshots",
+                "db_table": "payroll_payroll_register_snapshot",
+            },
+        ),
+    ]
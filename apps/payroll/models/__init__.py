@@ -3,6 +3,7 @@ from .employee_kpi_assessment import EmployeeKPIAssessment, EmployeeKPIItem
 from .kpi_assessment_period import KPIAssessmentPeriod
 from .kpi_config import KPIConfig
 from .kpi_criterion import KPICriterion
+from .payroll_register_snapshot import PayrollRegisterSnapshot
 from .payroll_slip import PayrollSlip
 from .penalty_ticket import PenaltyTicket
 from .recovery_voucher import RecoveryVoucher
@@ -19,6 +20,7 @@ __all__ = [
     "SalaryConfig",
     "SalaryPeriod",
     "PayrollSlip",
+    "PayrollRegisterSnapshot",
     "EmployeeKPIAssessment",
     "EmployeeKPIItem",
     "DepartmentKPIAssessment",
@@ -0,0 +1,45 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from libs.models import BaseModel
+
+from .salary_period import SalaryPeriod
+
+
+class PayrollRegisterSnapshot(BaseModel):
+    """Frozen payroll register of a completed salary period.
+
+    The register (payment and deferred slips with the values used by the
+    payroll export) is captured when the period is completed and stored as a
+    Parquet file, so exports and totals of completed periods no longer query
+    the live payroll slips. The snapshot is deleted when the period is
+    uncompleted. See `apps.payroll.services.payroll_register`.
+
+    Attributes:
+        salary_period: The completed salary period
+        data: Parquet encoded register rows
+        format_version: Version of the register columns the data was written with
+        payment_count: Number of slips paid in the period
+        deferred_count: Number of slips deferred to a later period
+        totals: Sums of the amount columns by sheet, as decimal strings
+    """
+
+    salary_period = models.OneToOneField(
+        SalaryPeriod,
+        on_delete=models.CASCADE,
+        related_name="register_snapshot",
+        verbose_name=_("Salary period"),
+    )
+    data = models.BinaryField(verbose_name=_("Data"), help_text=_("Parquet encoded register rows"))
+    format_version = models.PositiveSmallIntegerField(default=1, verbose_name=_("Format version"))
+    payment_count = models.PositiveIntegerField(default=0, verbose_name=_("Payment count"))
+    deferred_count = models.PositiveIntegerField(default=0, verbose_name=_("Deferred count"))
+    totals = models.JSONField(default=dict, verbose_name=_("Totals"))
+
+    class Meta:
+        verbose_name = _("Payroll Register Snapshot")
+        verbose_name_plural = _("Payroll Register Snapshots")
+        db_table = "payroll_payroll_register_snapshot"
+
+    def __str__(self):
+        return f"Payroll register {self.salary_period_id}"
@@ -1,7 +1,7 @@
 """SalaryPeriod model for monthly salary periods."""
 
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
 
 from apps.audit_logging.decorators import audit_logging_register
@@ -303,33 +303,40 @@ class SalaryPeriod(AutoCodeMixin, ColoredValueMixin, BaseModel):
         1. All READY slips (from any period) -> DELIVERED status with payment_period = this
         2. All PENDING/HOLD slips remain (deferred to Table 2)
         3. Update statistics
+        4. Freeze the payroll register (both tables) into a snapshot
 
         Args:
             user: User completing the period
         """
         from django.utils import timezone
 
+        from apps.payroll.services.payroll_register import freeze_payroll_register
+
         from .payroll_slip import PayrollSlip
 
         now = timezone.now()
 
-        # Update ALL READY slips to DELIVERED and set payment_period to this period
-        # This includes carry-over slips from previous periods
-        PayrollSlip.objects.filter(status=PayrollSlip.Status.READY).update(
-            status=PayrollSlip.Status.DELIVERED,
-            delivered_at=now,
-            delivered_by=user,
-            payment_period=self,  # Payment period = this period
-        )
+        with transaction.atomic():
+            # Update ALL READY slips to DELIVERED and set payment_period to this period
+            # This includes carry-over slips from previous periods
+            PayrollSlip.objects.filter(status=PayrollSlip.Status.READY).update(
+                status=PayrollSlip.Status.DELIVERED,
+                delivered_at=now,
+                delivered_by=user,
+                payment_period=self,  # Payment period = this period
+            )
+
+            # Mark period as completed
+            self.status = self.Status.COMPLETED
+            self.completed_at = now
+            self.completed_by = user
+            self.save(update_fields=["status", "completed_at", "completed_by", "updated_at"])
 
-        # Mark period as completed
-        self.status = self.Status.COMPLETED
-        self.completed_at = now
-        self.completed_by = user
-        self.save(update_fields=["status", "completed_at", "completed_by", "updated_at"])
+            # Update statistics (including deferred count)
+            self.update_statistics()
 
-        # Update statistics (including deferred count)
-        self.update_statistics()
+            # Exports and totals of the completed period read this snapshot
+            freeze_payroll_register(self)
 
     def can_uncomplete(self) -> tuple[bool, str]:
         """Check if period can be uncompleted.
@@ -355,6 +362,7 @@ class SalaryPeriod(AutoCodeMixin, ColoredValueMixin, BaseModel):
         2. Status changes to ONGOING
         3. Payroll slip statuses remain unchanged (DELIVERED stays DELIVERED)
         4. Future CRUD on related objects will trigger recalculation
+        5. The frozen payroll register snapshot is deleted
 
         Args:
             user: User uncompleting the period
@@ -365,10 +373,15 @@ class SalaryPeriod(AutoCodeMixin, ColoredValueMixin, BaseModel):
         from django.core.exceptions import ValidationError
         from django.utils import timezone
 
+        from apps.payroll.services.payroll_register import invalidate_payroll_register
+
         can, reason = self.can_uncomplete()
         if not can:
             raise ValidationError(reason)
 
+        # The register can change again once the period is reopened
+        invalidate_payroll_register(self)
+
         # Change status to ONGOING
         self.status = self.Status.ONGOING
         self.uncompleted_at = timezone.now()
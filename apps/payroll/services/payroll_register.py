@@ -0,0 +1,242 @@
+"""Payroll register of salary periods and its frozen snapshot.
+
+The payroll register lists the slips paid in a period (payment table) and the
+slips deferred to a later period (deferred table) with the values used by the
+payroll export. Once a period is completed these slips no longer change, so
+`SalaryPeriod.complete()` freezes the register into a `PayrollRegisterSnapshot`
+(Parquet encoded with pyarrow) and exports and totals of completed periods are
+read from it instead of the live payroll slips. Uncompleting the period deletes
+the snapshot.
+"""
+
+import io
+import logging
+from decimal import Decimal
+from typing import Dict, List
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from django.db import models
+
+from apps.hrm.models import BankAccount
+from apps.payroll.models import PayrollRegisterSnapshot, PayrollSlip, SalaryPeriod
+
+logger = logging.getLogger(__name__)
+
+SHEET_PAYMENT = "payment"
+SHEET_DEFERRED = "deferred"
+SHEETS = (SHEET_PAYMENT, SHEET_DEFERRED)
+
+# Bump when REGISTER_FIELDS change: older snapshots are then rebuilt on read
+REGISTER_FORMAT_VERSION = 1
+
+# PayrollSlip fields captured in the register
+REGISTER_FIELDS = (
+    "code",
+    "employee_code",
+    "employee_name",
+    "department_name",
+    "position_name",
+    "employment_status",
+    "employee_email",
+    "tax_code",
+    "sales_revenue",
+    "sales_transaction_count",
+    "base_salary",
+    "lunch_allowance",
+    "phone_allowance",
+    "travel_expense_by_working_days",
+    "kpi_salary",
+    "kpi_grade",
+    "kpi_bonus",
+    "business_progressive_salary",
+    "total_position_income",
+    "standard_working_days",
+    "total_working_days",
+    "probation_working_days",
+    "official_working_days",
+    "actual_working_days_income",
+    "tc1_overtime_hours",
+    "tc2_overtime_hours",
+    "tc3_overtime_hours",
+    "total_overtime_hours",
+    "hourly_rate",
+    "overtime_pay",
+    "overtime_progress_allowance",
+    "taxable_overtime_salary",
+    "non_taxable_overtime_salary",
+    "gross_income",
+    "social_insurance_base",
+    "employer_social_insurance",
+    "employer_health_insurance",
+    "employer_accident_insurance",
+    "employer_unemployment_insurance",
+    "employer_union_fee",
+    "employee_social_insurance",
+    "employee_health_insurance",
+    "employee_unemployment_insurance",
+    "employee_union_fee",
+    "dependent_count",
+    "total_family_deduction",
+    "non_taxable_allowance",
+    "taxable_income",
+    "personal_income_tax",
+    "back_pay_amount",
+    "recovery_amount",
+    "net_salary",
+)
+
+# Amount columns summed in the snapshot totals
+TOTAL_FIELDS = (
+    "total_position_income",
+    "gross_income",
+    "employer_social_insurance",
+    "employer_health_insurance",
+    "employer_accident_insurance",
+    "employer_unemployment_insurance",
+    "employer_union_fee",
+    "employee_social_insurance",
+    "employee_health_insurance",
+    "employee_unemployment_insurance",
+    "employee_union_fee",
+    "personal_income_tax",
+    "back_pay_amount",
+    "recovery_amount",
+    "net_salary",
+)
+
+
+def _arrow_type(field: models.Field) -> pa.DataType:
+    if isinstance(field, models.DecimalField):
+        return pa.decimal128(field.max_digits, field.decimal_places)
+    if isinstance(field, models.BigIntegerField):
+        return pa.int64()
+    if isinstance(field, models.IntegerField):
+        return pa.int32()
+    return pa.string()
+
+
+REGISTER_SCHEMA = pa.schema(
+    [pa.field("sheet", pa.string(), nullable=False)]
+    + [pa.field(name, _arrow_type(PayrollSlip._meta.get_field(name))) for name in REGISTER_FIELDS]
+    + [pa.field("bank_account", pa.string())]
+)
+
+
+def get_register_querysets(period: SalaryPeriod) -> Dict[str, models.QuerySet]:
+    """Get the payroll slips of the payment and deferred tables of a period.
+
+    For an ONGOING period the payment table holds every READY slip (including
+    carry-overs from previous periods); for a COMPLETED period it holds the
+    slips DELIVERED in it. The deferred table holds the period's slips that
+    were not paid.
+    """
+    if period.status == SalaryPeriod.Status.ONGOING:
+        payment = PayrollSlip.objects.filter(status=PayrollSlip.Status.READY)
+        deferred_statuses = [PayrollSlip.Status.PENDING, PayrollSlip.Status.HOLD]
+    else:
+        payment = PayrollSlip.objects.filter(payment_period=period, status=PayrollSlip.Status.DELIVERED)
+        deferred_statuses = [PayrollSlip.Status.PENDING, PayrollSlip.Status.HOLD, PayrollSlip.Status.READY]
+
+    return {
+        SHEET_PAYMENT: payment,
+        SHEET_DEFERRED: PayrollSlip.objects.filter(salary_period=period, status__in=deferred_statuses),
+    }
+
+
+def build_payroll_register(period: SalaryPeriod) -> Dict[str, List[dict]]:
+    """Build the register rows of a period from the live payroll slips.
+
+    Returns:
+        Rows by sheet, each row holding the `REGISTER_FIELDS` and `bank_account`
+    """
+    register = {
+        sheet: list(queryset.values("employee_id", *REGISTER_FIELDS))
+        for sheet, queryset in get_register_querysets(period).items()
+    }
+
+    employee_ids = {row["employee_id"] for rows in register.values() for row in rows}
+    bank_accounts = dict(
+        BankAccount.objects.filter(employee_id__in=employee_ids, is_primary=True).values_list(
+            "employee_id", "account_number"
+        )
+    )
+    for rows in register.values():
+        for row in rows:
+            row["bank_account"] = bank_accounts.get(row.pop("employee_id"), "")
+    return register
+
+
+def _register_table(register: Dict[str, List[dict]]) -> pa.Table:
+    rows = [{"sheet": sheet, **row} for sheet in SHEETS for row in register[sheet]]
+    return pa.Table.from_pylist(rows, schema=REGISTER_SCHEMA)
+
+
+def _register_totals(table: pa.Table) -> Dict[str, Dict[str, str]]:
+    totals = {}
+    for sheet in SHEETS:
+        rows = table.filter(pc.equal(table["sheet"], sheet))
+        totals[sheet] = {name: str(pc.sum(rows[name]).as_py() or Decimal(0)) for name in TOTAL_FIELDS}
+    return totals
+
+
+def freeze_payroll_register(period: SalaryPeriod) -> PayrollRegisterSnapshot:
+    """Store the current register of a completed period as its snapshot.
+
+    An existing snapshot of the period is replaced.
+    """
+    register = build_payroll_register(period)
+    table = _register_table(register)
+
+    buffer = io.BytesIO()
+    pq.write_table(table, buffer, compression="zstd")
+
+    snapshot, _ = PayrollRegisterSnapshot.objects.update_or_create(
+        salary_period=period,
+        defaults={
+            "data": buffer.getvalue(),
+            "format_version": REGISTER_FORMAT_VERSION,
+            "payment_count": len(register[SHEET_PAYMENT]),
+            "deferred_count": len(register[SHEET_DEFERRED]),
+            "totals": _register_totals(table),
+        },
+    )
+    logger.info(
+        "Froze payroll register of salary period %s: %d payment and %d deferred slip(s), %d bytes",
+        period.code,
+        snapshot.payment_count,
+        snapshot.deferred_count,
+        len(snapshot.data),
+    )
+    return snapshot
+
+
+def invalidate_payroll_register(period: SalaryPeriod) -> None:
+    """Delete the register snapshot of a period, e.g. when it is uncompleted."""
+    PayrollRegisterSnapshot.objects.filter(salary_period=period).delete()
+
+
+def read_payroll_register(snapshot: PayrollRegisterSnapshot) -> Dict[str, List[dict]]:
+    """Decode the register rows by sheet stored in a snapshot."""
+    table = pq.read_table(pa.BufferReader(bytes(snapshot.data)))
+    return {
+        sheet: table.filter(pc.equal(table["sheet"], sheet)).drop_columns(["sheet"]).to_pylist() for sheet in SHEETS
+    }
+
+
+def get_payroll_register(period: SalaryPeriod) -> Dict[str, List[dict]]:
+    """Get the register rows of a period by sheet.
+
+    Completed periods are read from their snapshot, which is created first if
+    it is missing (e.g. periods completed before snapshots existed) or was
+    written with older register columns. Other periods are built from the
+    live payroll slips.
+    """
+    if period.status != SalaryPeriod.Status.COMPLETED:
+        return build_payroll_register(period)
+
+    snapshot = PayrollRegisterSnapshot.objects.filter(salary_period=period).first()
+    if snapshot is None or snapshot.format_version != REGISTER_FORMAT_VERSION:
+        snapshot = freeze_payroll_register(period)
+    return read_payroll_register(snapshot)
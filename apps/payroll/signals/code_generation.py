@@ -127,12 +127,14 @@ register_auto_code_signal(
     SalaryPeriod,
     temp_code_prefix="TEMP_",
     custom_generate_code=generate_salary_period_code,
+    assign_before_insert=True,
 )
 
 register_auto_code_signal(
     PayrollSlip,
     temp_code_prefix="TEMP_",
     custom_generate_code=generate_payroll_slip_code,
+    assign_before_insert=True,
 )
 
 register_auto_code_signal(
@@ -43,6 +43,10 @@ def create_assessments_for_new_employee(sender, instance, created, **kwargs):  #
         recalculate_assessment_scores,
     )
 
+    # Deferred hires are handled in bulk by complete_onboarding
+    if created and getattr(instance, "_defer_onboarding", False):
+        return
+
     # Only process if employee has a start_date
     if not instance.start_date:
         return
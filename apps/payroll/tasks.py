@@ -634,8 +634,43 @@ def generate_kpi_assessment_period_task():
         }
 
 
+@shared_task(bind=True)
+def finalize_kpi_period_task(self, period_id: int, user_id: int | None = None):
+    """Finalize a KPI assessment period asynchronously.
+
+    This task is called from the finalize API action.
+
+    Args:
+        self: Task instance (bind=True)
+        period_id: ID of the KPIAssessmentPeriod to finalize
+        user_id: ID of the user who requested the finalization
+
+    Returns:
+        dict: Result with the finalization statistics
+    """
+    from apps.core.models import User
+    from apps.payroll.utils import finalize_kpi_assessment_period
+
+    try:
+        user = User.objects.filter(pk=user_id).first() if user_id else None
+        if self.request.id:
+            self.update_state(state="PROGRESS", meta={"status": "Finalizing assessments"})
+
+        result = finalize_kpi_assessment_period(period_id, updated_by=user)
+        if result is None:
+            return {"period_id": period_id, "status": "skipped", "message": "Period is already finalized"}
+
+        return {"period_id": period_id, "status": "completed", **result}
+
+    except Exception as e:
+        import sentry_sdk
+
+        sentry_sdk.capture_exception(e)
+        return {"error": str(e)}
+
+
 @shared_task
-def check_kpi_assessment_deadline_and_finalize_task():  # noqa: C901
+def check_kpi_assessment_deadline_and_finalize_task():
     """Check if any salary period has KPI assessment deadline yesterday and finalize corresponding KPI periods.
 
     This task should be scheduled to run daily. It checks if the current or most recent
@@ -645,8 +680,8 @@ def check_kpi_assessment_deadline_and_finalize_task():  # noqa: C901
     Returns:
         dict: Result with status, message, and details
     """
-    from apps.payroll.models import DepartmentKPIAssessment, EmployeeKPIAssessment, KPIAssessmentPeriod, SalaryPeriod
-    from apps.payroll.utils import update_department_assessment_status
+    from apps.payroll.models import KPIAssessmentPeriod, SalaryPeriod
+    from apps.payroll.utils import finalize_kpi_assessment_period
 
     today = date.today()
     yesterday = today - timedelta(days=1)
@@ -678,8 +713,9 @@ def check_kpi_assessment_deadline_and_finalize_task():  # noqa: C901
                 )
                 continue
 
-            # Check if already finalized
-            if kpi_period.finalized:
+            # System-finalized (None if the period is already finalized)
+            result = finalize_kpi_assessment_period(kpi_period.id)
+            if result is None:
                 processed_periods.append(
                     {
                         "month": salary_period.month.strftime("%Y-%m"),
@@ -689,69 +725,11 @@ def check_kpi_assessment_deadline_and_finalize_task():  # noqa: C901
                 )
                 continue
 
-            # Finalize the KPI period (replicate the logic from the API view)
-            with transaction.atomic():
-                # Process employee assessments - set default grade for ungraded employees
-                employees_set_to_c = 0
-                employee_assessments = EmployeeKPIAssessment.objects.filter(period=kpi_period)
-
-                # First pass: set default grades without triggering signals
-                employees_to_update = []
-                for assessment in employee_assessments:
-                    # If not assessed (no scores), set grade_hrm = 'C'
-                    if (
-                        assessment.total_employee_score is None
-                        and assessment.total_manager_score is None
-                        and not assessment.grade_hrm
-                        and not assessment.grade_manager
-                    ):
-                        assessment.grade_hrm = "C"
-                        employees_set_to_c += 1
-                        employees_to_update.append(assessment)
-
-                # Bulk update to avoid triggering signal for each save
-                if employees_to_update:
-                    EmployeeKPIAssessment.objects.bulk_update(employees_to_update, ["grade_hrm"], batch_size=100)
-
-                # Second pass: finalize all employee assessments
-                for assessment in employee_assessments:
-                    assessment.finalized = True
-
-                EmployeeKPIAssessment.objects.bulk_update(employee_assessments, ["finalized"], batch_size=100)
-
-                # Process department assessments - update all department statuses
-                departments_validated = 0
-                departments_invalid = 0
-                department_assessments = DepartmentKPIAssessment.objects.filter(period=kpi_period)
-
-                for dept_assessment in department_assessments:
-                    # Update department status (is_finished and is_valid_unit_control)
-                    update_department_assessment_status(dept_assessment)
-
-                    # Refresh from db to get updated values
-                    dept_assessment.refresh_from_db()
-
-                    # Finalize the department assessment
-                    dept_assessment.finalized = True
-                    dept_assessment.save(update_fields=["finalized"])
-
-                    if dept_assessment.is_valid_unit_control:
-                        departments_validated += 1
-                    else:
-                        departments_invalid += 1
-
-                # Finalize the period
-                kpi_period.finalized = True
-                kpi_period.updated_by = None  # System-finalized
-                kpi_period.save()
-
             processed_periods.append(
                 {
                     "month": salary_period.month.strftime("%Y-%m"),
                     "status": "finalized",
-                    "employees_set_to_c": employees_set_to_c,
-                    "departments_validated": departments_validated,
-                    "departments_invalid": departments_invalid,
+                    **result,
                 }
             )
 
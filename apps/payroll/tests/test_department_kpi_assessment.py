@@ -4,7 +4,7 @@ from datetime import date
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -240,9 +240,10 @@ class DepartmentKPIAssessmentAPITest(TestCase):
         """Test that department assessments are finalized through period finalization."""
         # Department assessments don't have individual finalize action
         # They are finalized when the period is finalized
-        response = self.client.post(f"/api/payroll/kpi-periods/{self.period.id}/finalize/")
+        with override_settings(CELERY_TASK_ALWAYS_EAGER=True):
+            response = self.client.post(f"/api/payroll/kpi-periods/{self.period.id}/finalize/")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
 
         # Verify the period and its assessments are finalized
         self.assessment.refresh_from_db()
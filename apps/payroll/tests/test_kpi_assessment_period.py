@@ -5,7 +5,7 @@ from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework import status
 from rest_framework.test import APIClient
 
@@ -235,9 +235,10 @@ class KPIAssessmentPeriodAPITest(TestCase):
 
     def test_finalize_period(self):
         """Test finalizing a period."""
-        response = self.client.post(f"/api/payroll/kpi-periods/{self.period.id}/finalize/")
+        with override_settings(CELERY_TASK_ALWAYS_EAGER=True):
+            response = self.client.post(f"/api/payroll/kpi-periods/{self.period.id}/finalize/")
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
 
         # Verify period is finalized
         self.period.refresh_from_db()
@@ -0,0 +1,269 @@
+"""Tests for scoring several KPI items with a single recalculation per assessment."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.audit_logging import LogAction
+from apps.hrm.models import Employee
+from apps.payroll.models import EmployeeKPIAssessment, EmployeeKPIItem, KPIAssessmentPeriod
+from apps.payroll.tasks import recalculate_payroll_slip_task
+from apps.payroll.utils import kpi_assessment
+
+from .conftest import random_code, random_digits
+
+User = get_user_model()
+
+GRADE_THRESHOLDS = [
+    {"min": 0, "max": 60, "possible_codes": ["D"], "label": "Poor"},
+    {"min": 60, "max": 70, "possible_codes": ["C"], "label": "Average"},
+    {"min": 70, "max": 90, "possible_codes": ["B"], "label": "Good"},
+    {"min": 90, "max": 110, "possible_codes": ["A"], "label": "Excellent"},
+]
+
+
+def _employee(department, **fields):
+    suffix = random_code(length=6)
+    employee = Employee.objects.create(
+        code=f"E{suffix}",
+        fullname="Scored Employee",
+        username=f"emp{suffix}",
+        email=f"emp{suffix}@example.com",
+        branch=department.branch,
+        block=department.block,
+        department=department,
+        start_date=date(2024, 1, 1),
+        attendance_code=random_digits(6),
+        citizen_id=random_digits(12),
+        phone=f"09{random_digits(8)}",
+        personal_email=f"emp{suffix}.personal@example.com",
+        **fields,
+    )
+    if not employee.user_id:
+        employee.user = User.objects.create(username=employee.username, email=employee.email)
+        employee.save(update_fields=["user"])
+    employee.user.is_superuser = True
+    employee.user.save(update_fields=["is_superuser"])
+    return employee
+
+
+def _assessment(employee, period, manager=None, scores=(Decimal("40"), Decimal("30"), Decimal("30"))):
+    assessment = EmployeeKPIAssessment.objects.create(employee=employee, period=period, manager=manager)
+    EmployeeKPIItem.objects.bulk_create(
+        [
+            EmployeeKPIItem(
+                assessment=assessment,
+                criterion=f"Criterion {index}",
+                evaluation_type="work_performance",
+                component_total_score=score,
+                order=index,
+            )
+            for index, score in enumerate(scores)
+        ]
+    )
+    return assessment
+
+
+def _items(assessment):
+    return list(assessment.items.order_by("order"))
+
+
+@pytest.fixture
+def period(db):
+    return KPIAssessmentPeriod.objects.create(
+        month=date(2025, 11, 1), kpi_config_snapshot={"grade_thresholds": GRADE_THRESHOLDS}
+    )
+
+
+@pytest.fixture
+def manager(department):
+    return _employee(department)
+
+
+@pytest.fixture
+def employee(department):
+    return _employee(department)
+
+
+def _client(employee):
+    client = APIClient()
+    client.force_authenticate(user=employee.user)
+    return client
+
+
+@pytest.fixture
+def count_recalculations():
+    with (
+        patch.object(
+            kpi_assessment,
+            "recalculate_assessment_scores",
+            wraps=kpi_assessment.recalculate_assessment_scores,
+        ) as recalculate,
+        patch.object(recalculate_payroll_slip_task, "delay") as payroll_task,
+    ):
+        yield recalculate, payroll_task
+
+
+@pytest.mark.django_db
+class TestSelfAssessmentItemScores:
+    def test_scores_all_items_with_one_recalculation(self, period, employee, count_recalculations):
+        assessment = _assessment(employee, period)
+        items = _items(assessment)
+        recalculate, payroll_task = count_recalculations
+        payroll_task.reset_mock()
+
+        response = _client(employee).patch(
+            f"/api/payroll/kpi-assessments/mine/{assessment.id}/items/scores/",
+            {"items": [{"item_id": item.id, "score": str(item.component_total_score - 5)} for item in items]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["total_employee_score"] == "85.00"
+        assert [item.employee_score for item in _items(assessment)] == [Decimal("35"), Decimal("25"), Decimal("25")]
+        assert recalculate.call_count == 1
+        assert payroll_task.call_count == 1
+        assessment.refresh_from_db()
+        assert assessment.status == EmployeeKPIAssessment.StatusChoices.WAITING_MANAGER
+
+    @pytest.mark.parametrize(
+        "url", ["/api/payroll/kpi-assessments/mine/{}/items/scores/", "/api/payroll/kpi-assessments/mine/{}/"]
+    )
+    def test_each_scored_item_is_audit_logged(self, period, employee, url):
+        assessment = _assessment(employee, period)
+        items = _items(assessment)
+
+        with (
+            patch.object(recalculate_payroll_slip_task, "delay"),
+            patch("apps.audit_logging.batch.log_audit_event") as log_audit_event,
+        ):
+            response = _client(employee).patch(
+                url.format(assessment.id),
+                {"items": [{"item_id": item.id, "score": "20.00"} for item in items]},
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        logged = [call.kwargs for call in log_audit_event.call_args_list]
+        assert [log["modified_object"].id for log in logged] == [item.id for item in items]
+        assert {log["modified_object"].employee_score for log in logged} == {Decimal("20.00")}
+        assert [log["original_object"].id for log in logged] == [item.id for item in items]
+        assert [log["original_object"].employee_score for log in logged] == [item.employee_score for item in items]
+        assert {log["action"] for log in logged} == {LogAction.CHANGE}
+        assert {log["user"] for log in logged} == {employee.user}
+        assert len({log["batch_id"] for log in logged}) == 1
+
+    def test_invalid_scores_are_reported_together(self, period, employee, manager):
+        assessment = _assessment(employee, period)
+        other_item = _items(_assessment(manager, period))[0]
+        first, second, _third = _items(assessment)
+
+        response = _client(employee).patch(
+            f"/api/payroll/kpi-assessments/mine/{assessment.id}/items/scores/",
+            {
+                "items": [
+                    {"item_id": first.id, "score": "41.00"},
+                    {"item_id": second.id, "score": "10.00"},
+                    {"item_id": other_item.id, "score": "10.00"},
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not EmployeeKPIItem.objects.filter(assessment=assessment, employee_score__isnull=False).exists()
+
+    def test_graded_assessment_cannot_be_scored(self, period, employee):
+        assessment = _assessment(employee, period)
+        EmployeeKPIAssessment.objects.filter(pk=assessment.pk).update(grade_manager="B")
+
+        response = _client(employee).patch(
+            f"/api/payroll/kpi-assessments/mine/{assessment.id}/items/scores/",
+            {"items": [{"item_id": _items(assessment)[0].id, "score": "10.00"}]},
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestManagerBulkItemScores:
+    url = "/api/payroll/kpi-assessments/manager/items/scores/"
+
+    def test_scores_several_assessments_once_each(self, period, department, manager, count_recalculations):
+        assessments = [_assessment(_employee(department), period, manager=manager) for _ in range(3)]
+        recalculate, payroll_task = count_recalculations
+        payroll_task.reset_mock()
+
+        response = _client(manager).patch(
+            self.url,
+            {
+                "assessments": [
+                    {
+                        "assessment_id": assessment.id,
+                        "items": [
+                            {"item_id": item.id, "score": str(item.component_total_score)}
+                            for item in _items(assessment)
+                        ],
+                    }
+                    for assessment in assessments
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {row["id"] for row in response.json()["data"]} == {assessment.id for assessment in assessments}
+        assert recalculate.call_count == 3
+        assert payroll_task.call_count == 3
+        for assessment in assessments:
+            assessment.refresh_from_db()
+            assert assessment.total_manager_score == Decimal("100")
+            assert assessment.grade_manager == "A"
+            assert assessment.manager_assessment_date is not None
+
+    def test_query_count_does_not_grow_with_items(self, period, department, manager, django_assert_max_num_queries):
+        assessment = _assessment(
+            manager=manager, employee=_employee(department), period=period, scores=[Decimal("5")] * 15
+        )
+
+        with patch.object(recalculate_payroll_slip_task, "delay"), django_assert_max_num_queries(20):
+            response = _client(manager).patch(
+                self.url,
+                {
+                    "assessments": [
+                        {
+                            "assessment_id": assessment.id,
+                            "items": [{"item_id": item.id, "score": "4.00"} for item in _items(assessment)],
+                        }
+                    ]
+                },
+                format="json",
+            )
+
+        assert response.status_code == status.HTTP_200_OK
+        assessment.refresh_from_db()
+        assert assessment.total_manager_score == Decimal("60")
+
+    def test_other_managers_assessment_rejects_whole_batch(self, period, department, manager):
+        own = _assessment(_employee(department), period, manager=manager)
+        foreign = _assessment(_employee(department), period, manager=_employee(department))
+
+        response = _client(manager).patch(
+            self.url,
+            {
+                "assessments": [
+                    {"assessment_id": assessment.id, "items": [{"item_id": _items(assessment)[0].id, "score": "1.00"}]}
+                    for assessment in (own, foreign)
+                ]
+            },
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not EmployeeKPIItem.objects.filter(manager_score__isnull=False).exists()
@@ -0,0 +1,158 @@
+"""Tests for the set-based KPI assessment period finalization."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.audit_logging import LogAction
+from apps.hrm.models import Department, Employee
+from apps.payroll.models import DepartmentKPIAssessment, EmployeeKPIAssessment, KPIAssessmentPeriod
+from apps.payroll.tasks import finalize_kpi_period_task
+from apps.payroll.utils import finalize_kpi_assessment_period
+
+from .conftest import random_code, random_digits
+
+UNIT_CONTROL = {"A": {"A": {"max": 0.5}}}
+
+
+def _employee(department):
+    suffix = random_code(length=6)
+    return Employee.objects.create(
+        code=f"E{suffix}",
+        fullname="Graded Employee",
+        username=f"emp{suffix}",
+        email=f"emp{suffix}@example.com",
+        branch=department.branch,
+        block=department.block,
+        department=department,
+        start_date=date(2024, 1, 1),
+        attendance_code=random_digits(6),
+        citizen_id=random_digits(12),
+        phone=f"09{random_digits(8)}",
+        personal_email=f"emp{suffix}.personal@example.com",
+    )
+
+
+@pytest.fixture
+def period(db):
+    return KPIAssessmentPeriod.objects.create(
+        month=date(2025, 6, 1), kpi_config_snapshot={"unit_control": UNIT_CONTROL}, finalized=False
+    )
+
+
+@pytest.fixture
+def departments(branch, block, department):
+    other = Department.objects.create(name="Finalize IT", code="FIN_IT", branch=branch, block=block)
+    return department, other
+
+
+@pytest.fixture
+def assessments(period, departments):
+    sales, it = departments
+    rows = [
+        # Sales: one manager grade, one never assessed, one scored but not graded yet
+        (sales, {"grade_manager": "A", "total_manager_score": Decimal("95")}),
+        (sales, {}),
+        (sales, {"total_employee_score": Decimal("70")}),
+        # IT: everyone graded A by the manager, above the unit control maximum
+        (it, {"grade_manager": "A", "total_manager_score": Decimal("95")}),
+        (it, {"grade_manager": "A", "total_manager_score": Decimal("92")}),
+    ]
+    created = EmployeeKPIAssessment.objects.bulk_create(
+        [
+            EmployeeKPIAssessment(
+                employee=_employee(department), period=period, department_snapshot=department, **fields
+            )
+            for department, fields in rows
+        ]
+    )
+    DepartmentKPIAssessment.objects.bulk_create(
+        [
+            DepartmentKPIAssessment(period=period, department=department, grade="A", default_grade="C")
+            for department in departments
+        ]
+    )
+    return created
+
+
+@pytest.mark.django_db
+class TestFinalizeKPIAssessmentPeriod:
+    def test_applies_default_grades_and_department_statuses(self, period, departments, assessments, user):
+        result = finalize_kpi_assessment_period(period.id, updated_by=user)
+
+        assert result == {"employees_set_to_c": 1, "departments_validated": 1, "departments_invalid": 1}
+
+        grades = dict(EmployeeKPIAssessment.objects.filter(period=period).values_list("id", "grade_hrm"))
+        assert grades == {assessment.id: ("C" if index == 1 else None) for index, assessment in enumerate(assessments)}
+        assert not EmployeeKPIAssessment.objects.filter(period=period, finalized=False).exists()
+
+        sales, it = (DepartmentKPIAssessment.objects.get(period=period, department=d) for d in departments)
+        # Sales still has an employee without a grade
+        assert (sales.finalized, sales.is_finished, sales.is_valid_unit_control) == (True, False, True)
+        assert sales.grade_distribution == {"A": 1, "B": 0, "C": 1, "D": 0}
+        assert sales.manager_grade_distribution == {"A": 1, "B": 0, "C": 0, "D": 0}
+        assert (it.finalized, it.is_finished, it.is_valid_unit_control) == (True, True, False)
+        assert it.grade_distribution == {"A": 2, "B": 0, "C": 0, "D": 0}
+
+        period.refresh_from_db()
+        assert period.finalized
+        assert period.updated_by == user
+
+    def test_query_count_does_not_grow_with_departments(
+        self, period, departments, assessments, django_assert_max_num_queries
+    ):
+        with django_assert_max_num_queries(12):
+            finalize_kpi_assessment_period(period.id)
+
+    def test_each_department_assessment_is_audit_logged(self, period, departments, assessments, user):
+        with patch("apps.audit_logging.batch.log_audit_event") as log_audit_event:
+            finalize_kpi_assessment_period(period.id, updated_by=user)
+
+        logged = [call.kwargs for call in log_audit_event.call_args_list]
+        assert {log["modified_object"].department_id for log in logged} == {d.id for d in departments}
+        assert {log["original_object"].finalized for log in logged} == {False}
+        assert {log["modified_object"].finalized for log in logged} == {True}
+        assert {log["action"] for log in logged} == {LogAction.CHANGE}
+        assert {log["user"] for log in logged} == {user}
+
+    def test_already_finalized_period_is_skipped(self, period, assessments):
+        finalize_kpi_assessment_period(period.id)
+
+        assert finalize_kpi_assessment_period(period.id) is None
+        assert finalize_kpi_period_task.apply(args=(period.id,)).result["status"] == "skipped"
+
+
+@pytest.mark.django_db
+class TestKPIAssessmentPeriodFinalizeAPI:
+    @pytest.fixture
+    def api_client(self, superuser):
+        client = APIClient()
+        client.force_authenticate(user=superuser)
+        return client
+
+    def test_finalize_runs_in_background(self, api_client, period, assessments, settings):
+        settings.CELERY_TASK_ALWAYS_EAGER = True
+
+        response = api_client.post(f"/api/payroll/kpi-periods/{period.id}/finalize/")
+
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert "task_id" in response.json()["data"]
+        period.refresh_from_db()
+        assert period.finalized
+
+    def test_summary_uses_one_aggregate_query(self, api_client, period, assessments, django_assert_max_num_queries):
+        finalize_kpi_assessment_period(period.id)
+
+        with django_assert_max_num_queries(4):
+            response = api_client.get(f"/api/payroll/kpi-periods/{period.id}/summary/")
+
+        assert response.json()["data"] == {
+            "total_departments": 2,
+            "departments_finished": 2,
+            "departments_not_finished": 0,
+            "departments_not_valid_control": 1,
+        }
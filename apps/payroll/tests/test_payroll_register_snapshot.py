@@ -0,0 +1,157 @@
+"""Tests for the payroll register snapshot frozen on salary period completion."""
+
+from datetime import date
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.hrm.models import Bank, BankAccount, Employee
+from apps.payroll.models import PayrollRegisterSnapshot, PayrollSlip
+from apps.payroll.services.payroll_register import (
+    SHEET_DEFERRED,
+    SHEET_PAYMENT,
+    build_payroll_register,
+    get_payroll_register,
+)
+
+from .conftest import random_code, random_digits
+
+
+def _employee(employee):
+    suffix = random_code(length=6)
+    return Employee.objects.create(
+        code=f"E{suffix}",
+        fullname="Deferred Employee",
+        username=f"emp{suffix}",
+        email=f"emp{suffix}@example.com",
+        branch=employee.branch,
+        block=employee.block,
+        department=employee.department,
+        position=employee.position,
+        start_date=date(2024, 1, 1),
+        attendance_code=random_digits(6),
+        citizen_id=random_digits(12),
+        phone=f"09{random_digits(8)}",
+        personal_email=f"emp{suffix}.personal@example.com",
+    )
+
+
+def _slip(salary_period, employee, slip_status, **amounts):
+    slip = PayrollSlip.objects.create(salary_period=salary_period, employee=employee)
+    # Bypass the recalculation on save to pin the register values
+    PayrollSlip.objects.filter(pk=slip.pk).update(status=slip_status, **amounts)
+    slip.refresh_from_db()
+    return slip
+
+
+@pytest.fixture
+def slips(salary_period, employee):
+    bank = Bank.objects.create(name="Register Bank", code=f"RB{random_code(length=4)}")
+    BankAccount.objects.create(
+        employee=employee, bank=bank, account_number="0123456789", account_name="JOHN DOE", is_primary=True
+    )
+    ready = _slip(
+        salary_period,
+        employee,
+        PayrollSlip.Status.READY,
+        gross_income=Decimal("12000000"),
+        net_salary=Decimal("10000000"),
+        standard_working_days=Decimal("22.00"),
+        total_working_days=Decimal("21.50"),
+    )
+    pending = _slip(salary_period, _employee(employee), PayrollSlip.Status.PENDING, net_salary=Decimal("5000000"))
+    return ready, pending
+
+
+@pytest.mark.django_db
+class TestPayrollRegisterSnapshot:
+    def test_complete_freezes_payment_and_deferred_tables(self, salary_period, slips, user):
+        ready, pending = slips
+
+        salary_period.complete(user=user)
+
+        snapshot = PayrollRegisterSnapshot.objects.get(salary_period=salary_period)
+        assert (snapshot.payment_count, snapshot.deferred_count) == (1, 1)
+        assert snapshot.totals[SHEET_PAYMENT]["net_salary"] == "10000000"
+        assert snapshot.totals[SHEET_DEFERRED]["net_salary"] == "5000000"
+
+        register = get_payroll_register(salary_period)
+        assert register == build_payroll_register(salary_period)
+        (row,) = register[SHEET_PAYMENT]
+        assert row["code"] == ready.code
+        assert row["bank_account"] == "0123456789"
+        assert row["total_working_days"] == Decimal("21.50")
+        assert [row["code"] for row in register[SHEET_DEFERRED]] == [pending.code]
+
+    def test_completed_register_does_not_follow_live_slips(self, salary_period, slips, user):
+        ready, _pending = slips
+        salary_period.complete(user=user)
+
+        PayrollSlip.objects.filter(pk=ready.pk).update(net_salary=Decimal("1"))
+
+        with CaptureQueriesContext(connection) as queries:
+            register = get_payroll_register(salary_period)
+        assert register[SHEET_PAYMENT][0]["net_salary"] == Decimal("10000000")
+        assert not any("payroll_payroll_slip" in query["sql"] for query in queries.captured_queries)
+
+    def test_uncomplete_invalidates_snapshot(self, salary_period, slips, user):
+        salary_period.complete(user=user)
+
+        salary_period.uncomplete(user=user)
+
+        assert not PayrollRegisterSnapshot.objects.filter(salary_period=salary_period).exists()
+
+    def test_missing_snapshot_is_frozen_on_read(self, salary_period, slips, user):
+        salary_period.complete(user=user)
+        PayrollRegisterSnapshot.objects.all().delete()
+
+        register = get_payroll_register(salary_period)
+
+        assert len(register[SHEET_PAYMENT]) == 1
+        assert PayrollRegisterSnapshot.objects.filter(salary_period=salary_period).exists()
+
+
+@pytest.mark.django_db
+class TestPayrollRegisterAPI:
+    @pytest.fixture
+    def api_client(self, superuser):
+        client = APIClient()
+        client.force_authenticate(user=superuser)
+        return client
+
+    def test_export_of_completed_period_reads_snapshot(self, api_client, salary_period, slips, user):
+        salary_period.complete(user=user)
+        storage = MagicMock()
+        storage.save.return_value = "exports/register.xlsx"
+        storage.get_url.return_value = "https://storage.local/exports/register.xlsx"
+        storage.get_file_size.return_value = 10
+
+        with (
+            patch("libs.export_xlsx.generator.XLSXGenerator.generate", return_value=b"xlsx") as generate,
+            patch("libs.export_xlsx.storage.get_storage_backend", return_value=storage),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            response = api_client.get(f"/api/payroll/salary-periods/{salary_period.id}/payrollslips-export/")
+
+        assert response.status_code == status.HTTP_200_OK
+        payment_sheet, deferred_sheet = generate.call_args.args[0]["sheets"]
+        assert [row["employee_code"] for row in payment_sheet["data"]] == [slips[0].employee_code]
+        assert payment_sheet["data"][0]["bank_account"] == "0123456789"
+        assert len(deferred_sheet["data"]) == 1
+        assert not any("payroll_payroll_slip" in query["sql"] for query in queries.captured_queries)
+
+    def test_register_totals_compares_completed_periods(self, api_client, salary_period, slips, user):
+        salary_period.complete(user=user)
+
+        response = api_client.get("/api/payroll/salary-periods/register-totals/")
+
+        assert response.status_code == status.HTTP_200_OK
+        (row,) = response.json()["data"]["results"]
+        assert row["id"] == salary_period.id
+        assert (row["payment_count"], row["deferred_count"]) == (1, 1)
+        assert row["totals"][SHEET_PAYMENT]["gross_income"] == "12000000"
@@ -1,10 +1,14 @@
 from .kpi_assessment import (
+    apply_item_scores,
     create_assessment_items_from_criteria,
+    create_assessments_for_new_employees,
+    finalize_kpi_assessment_period,
     generate_department_assessments_for_period,
     generate_employee_assessments_for_period,
     recalculate_assessment_scores,
     resync_assessment_add_missing,
     resync_assessment_apply_current,
+    write_item_scores,
 )
 from .kpi_calculation import (
     allocate_grades_by_quota,
@@ -19,9 +23,13 @@ __all__ = [
     "allocate_grades_by_quota",
     "update_department_assessment_status",
     "create_assessment_items_from_criteria",
+    "create_assessments_for_new_employees",
     "recalculate_assessment_scores",
+    "write_item_scores",
+    "apply_item_scores",
     "resync_assessment_add_missing",
     "resync_assessment_apply_current",
     "generate_employee_assessments_for_period",
     "generate_department_assessments_for_period",
+    "finalize_kpi_assessment_period",
 ]
@@ -5,24 +5,52 @@ This module provides functions for:
 - Resyncing assessments
 - Recalculating scores and grades
 - Generating assessments for periods
+- Finalizing periods
 """
 
+import copy
 import logging
 from decimal import Decimal
-from typing import List
+from typing import List, Mapping, Optional, Sequence
 
 from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
 
+from apps.audit_logging import LogAction, batch_audit_context
 from apps.payroll.models import (
+    DepartmentKPIAssessment,
     EmployeeKPIAssessment,
     EmployeeKPIItem,
+    KPIAssessmentPeriod,
     KPICriterion,
 )
-from apps.payroll.utils.kpi_calculation import calculate_grade_from_percent
+from apps.payroll.utils.kpi_calculation import (
+    DEPARTMENT_STATUS_FIELDS,
+    apply_department_grade_stats,
+    calculate_grade_from_percent,
+    get_department_grade_stats,
+    update_department_assessment_status,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _build_assessment_item(assessment: EmployeeKPIAssessment, criterion: KPICriterion) -> EmployeeKPIItem:
+    return EmployeeKPIItem(
+        assessment=assessment,
+        criterion_id=criterion,
+        target=criterion.target,
+        criterion=criterion.criterion,
+        sub_criterion=criterion.sub_criterion,
+        evaluation_type=criterion.evaluation_type,
+        description=criterion.description,
+        component_total_score=criterion.component_total_score,
+        group_number=criterion.group_number,
+        order=criterion.order,
+    )
+
+
 def create_assessment_items_from_criteria(
     assessment: EmployeeKPIAssessment,
     criteria: List[KPICriterion],
@@ -36,23 +64,7 @@ def create_assessment_items_from_criteria(
     Returns:
         List of created EmployeeKPIItem instances with IDs populated
     """
-    items = []
-    for criterion in criteria:
-        item = EmployeeKPIItem(
-            assessment=assessment,
-            criterion_id=criterion,
-            target=criterion.target,
-            criterion=criterion.criterion,
-            sub_criterion=criterion.sub_criterion,
-            evaluation_type=criterion.evaluation_type,
-            description=criterion.description,
-            component_total_score=criterion.component_total_score,
-            group_number=criterion.group_number,
-            order=criterion.order,
-        )
-        items.append(item)
-
-    EmployeeKPIItem.objects.bulk_create(items)
+    EmployeeKPIItem.objects.bulk_create([_build_assessment_item(assessment, criterion) for criterion in criteria])
 
     # Refetch items to get IDs (bulk_create doesn't return IDs on SQLite)
     return list(EmployeeKPIItem.objects.filter(assessment=assessment).order_by("order"))
@@ -120,6 +132,80 @@ def recalculate_assessment_scores(assessment: EmployeeKPIAssessment) -> Employee
     return assessment
 
 
+def write_item_scores(
+    assessments: Sequence[EmployeeKPIAssessment],
+    scores: Mapping[int, Decimal],
+    score_field: str,
+    user=None,
+    request=None,
+) -> List[EmployeeKPIItem]:
+    """Write KPI item scores of assessments with one bulk UPDATE.
+
+    Totals and grades are not recalculated, see `apply_item_scores`. Each
+    updated item gets its audit log, as when it is saved individually.
+
+    Args:
+        assessments: Assessments owning the items, ideally with `items` prefetched
+        scores: New score by item ID; items of other assessments are ignored
+        score_field: Either "employee_score" or "manager_score"
+        user: User changing the scores, for the audit logs
+        request: Current request, for the audit logs
+
+    Returns:
+        The updated items
+    """
+    now = timezone.now()
+    updated = []
+    for assessment in assessments:
+        for item in assessment.items.all():
+            if item.id in scores:
+                original = copy.copy(item)
+                setattr(item, score_field, scores[item.id])
+                item.updated_at = now
+                updated.append((original, item))
+
+    with batch_audit_context(
+        action=LogAction.CHANGE,
+        model_class=EmployeeKPIItem,
+        user=user,
+        request=request,
+        bulk_operation=f"update_{score_field}",
+    ) as batch:
+        EmployeeKPIItem.objects.bulk_update([item for _, item in updated], [score_field, "updated_at"])
+        batch.log_objects(LogAction.CHANGE, updated)
+    return [item for _, item in updated]
+
+
+@transaction.atomic
+def apply_item_scores(
+    assessments: Sequence[EmployeeKPIAssessment],
+    scores: Mapping[int, Decimal],
+    score_field: str,
+    user=None,
+    request=None,
+) -> List[EmployeeKPIItem]:
+    """Write KPI item scores and recalculate each assessment once.
+
+    Scoring items one by one recalculates the assessment (and triggers its
+    post_save payroll recalculation) for every item; here all the scores are
+    written together and each assessment is saved a single time.
+
+    Args:
+        assessments: Assessments owning the items, ideally with `items` prefetched
+        scores: New score by item ID
+        score_field: Either "employee_score" or "manager_score"
+        user: User changing the scores, for the audit logs
+        request: Current request, for the audit logs
+
+    Returns:
+        The updated items
+    """
+    updated = write_item_scores(assessments, scores, score_field, user=user, request=request)
+    for assessment in assessments:
+        recalculate_assessment_scores(assessment)
+    return updated
+
+
 @transaction.atomic
 def resync_assessment_add_missing(assessment: EmployeeKPIAssessment) -> int:
     """Add missing criteria to assessment that were created after assessment generation.
@@ -221,6 +307,91 @@ def resync_assessment_apply_current(assessment: EmployeeKPIAssessment) -> int:
     return len(new_items)
 
 
+def create_assessments_for_new_employees(
+    period: KPIAssessmentPeriod, employees: Sequence
+) -> List[EmployeeKPIAssessment]:
+    """Create the KPI assessments of new employees in a period with set-based queries.
+
+    Gives the same records as `create_assessments_for_new_employee` does for one
+    hire: items snapshotted from the active criteria of the employee's target
+    ("sales" in business departments, else "backoffice") and the department
+    leader as manager. The department assessments are refreshed once each, and
+    the notification and dashboard cache tasks are scheduled after the commit.
+    Employees without a department, without criteria for their target or
+    already assessed in the period are skipped.
+
+    Args:
+        period: Open KPIAssessmentPeriod
+        employees: Saved Employee instances
+
+    Returns:
+        The created assessments
+    """
+    from apps.hrm.models import Department
+    from apps.payroll.tasks import invalidate_dashboard_cache_task, send_kpi_notification_task
+
+    assessed = set(
+        EmployeeKPIAssessment.objects.filter(period=period, employee__in=employees).values_list(
+            "employee_id", flat=True
+        )
+    )
+    employees = [employee for employee in employees if employee.department_id and employee.pk not in assessed]
+    if not employees:
+        return []
+
+    departments = Department.objects.only("function", "leader_id").in_bulk(
+        {employee.department_id for employee in employees}
+    )
+    criteria_by_target = {"sales": [], "backoffice": []}
+    for criterion in KPICriterion.objects.filter(target__in=criteria_by_target, active=True).order_by(
+        "evaluation_type", "order"
+    ):
+        criteria_by_target[criterion.target].append(criterion)
+
+    assessments = []
+    items = []
+    for employee in employees:
+        department = departments[employee.department_id]
+        target = "sales" if department.function == Department.DepartmentFunction.BUSINESS else "backoffice"
+        criteria = criteria_by_target[target]
+        if not criteria:
+            continue
+        # Items have no scores yet, so only the possible total is known
+        assessment = EmployeeKPIAssessment(
+            employee=employee,
+            period=period,
+            manager_id=department.leader_id,
+            department_snapshot=department,
+            total_possible_score=sum(criterion.component_total_score for criterion in criteria),
+        )
+        assessments.append(assessment)
+        items.extend(_build_assessment_item(assessment, criterion) for criterion in criteria)
+
+    EmployeeKPIAssessment.objects.bulk_create(assessments, batch_size=1000)
+    EmployeeKPIItem.objects.bulk_create(items, batch_size=1000)
+
+    for department_assessment in DepartmentKPIAssessment.objects.filter(
+        period=period, department_id__in={assessment.department_snapshot_id for assessment in assessments}
+    ):
+        update_department_assessment_status(department_assessment)
+
+    with batch_audit_context(action=LogAction.ADD, model_class=EmployeeKPIAssessment) as batch:
+        batch.log_objects(LogAction.ADD, assessments)
+
+    # Without a grade yet, the new assessments do not change any payroll slip
+    month = period.month.isoformat()
+
+    def schedule_tasks():
+        for assessment in assessments:
+            if assessment.employee.user_id:
+                send_kpi_notification_task.delay(str(assessment.id), month)
+        for manager_id in {assessment.manager_id for assessment in assessments if assessment.manager_id}:
+            invalidate_dashboard_cache_task.delay("manager", str(manager_id))
+
+    transaction.on_commit(schedule_tasks)
+    return assessments
+
+
 def generate_employee_assessments_for_period(  # noqa: C901
     period,
     targets=None,
@@ -392,3 +563,71 @@ def generate_department_assessments_for_period(
             )
 
     return created_count
+
+
+# Grade given by HRM to employees nobody assessed when their period is finalized
+DEFAULT_FINALIZE_GRADE = "C"
+
+
+@transaction.atomic
+def finalize_kpi_assessment_period(period_id: int, updated_by=None) -> Optional[dict]:
+    """Finalize a KPI assessment period with set-based queries.
+
+    Employees without scores nor grades get grade_hrm='C', all employee
+    assessments are marked finalized with conditional UPDATE statements, and the
+    finished/unit-control status of every department is computed from one grouped
+    query and saved with one bulk update.
+
+    Args:
+        period_id: ID of the KPIAssessmentPeriod to finalize
+        updated_by: User finalizing the period (None when finalized by the system)
+
+    Returns:
+        Dict with employees_set_to_c, departments_validated and departments_invalid,
+        or None if the period was already finalized
+    """
+    # Locked so that concurrent finalizations of the same period run one after the other
+    period = KPIAssessmentPeriod.objects.select_for_update().get(pk=period_id)
+    if period.finalized:
+        return None
+
+    employee_assessments = EmployeeKPIAssessment.objects.filter(period=period)
+    employees_set_to_c = employee_assessments.filter(
+        Q(grade_hrm__isnull=True) | Q(grade_hrm=""),
+        Q(grade_manager__isnull=True) | Q(grade_manager=""),
+        total_employee_score__isnull=True,
+        total_manager_score__isnull=True,
+    ).update(grade_hrm=DEFAULT_FINALIZE_GRADE)
+    employee_assessments.filter(finalized=False).update(finalized=True)
+
+    # Related objects are loaded up front for the audit logs of the batch
+    department_assessments = list(
+        DepartmentKPIAssessment.objects.filter(period=period).select_related("department", "period")
+    )
+    stats = get_department_grade_stats(period)
+    unit_control = period.kpi_config_snapshot.get("unit_control", {})
+    originals = [copy.copy(department_assessment) for department_assessment in department_assessments]
+    for department_assessment in department_assessments:
+        apply_department_grade_stats(
+            department_assessment, stats.get(department_assessment.department_id), unit_control
+        )
+        department_assessment.finalized = True
+    with batch_audit_context(
+        action=LogAction.CHANGE, model_class=DepartmentKPIAssessment, user=updated_by, bulk_operation="finalize_period"
+    ) as batch:
+        DepartmentKPIAssessment.objects.bulk_update(
+            department_assessments, [*DEPARTMENT_STATUS_FIELDS, "finalized"], batch_size=500
+        )
+        batch.log_objects(LogAction.CHANGE, zip(originals, department_assessments, strict=True))
+    departments_validated = sum(1 for assessment in department_assessments if assessment.is_valid_unit_control)
+
+    period.finalized = True
+    period.updated_by = updated_by
+    period.save()
+
+    logger.info("Finalized KPI assessment period %s", period.month.strftime("%Y-%m"))
+    return {
+        "employees_set_to_c": employees_set_to_c,
+        "departments_validated": departments_validated,
+        "departments_invalid": len(department_assessments) - departments_validated,
+    }
@@ -4,11 +4,14 @@ This module provides functions for:
 - Grade resolution with ambiguous handling
 - Unit control validation
 - Department auto-assignment algorithms
+- Department grading status
 """
 
 from decimal import Decimal
 from typing import Any, Dict, List, Optional, Tuple
 
+from django.db.models import Count, Q
+
 
 def calculate_grade_from_percent(  # noqa: C901
     percent: Decimal,
@@ -245,69 +248,106 @@ def allocate_grades_by_quota(  # noqa: C901
     return (assignments, warnings)
 
 
-def update_department_assessment_status(department_assessment) -> None:
-    """Update department assessment is_finished and is_valid_unit_control status.
+GRADES = ("A", "B", "C", "D")
+
+
+def _blank(field: str) -> Q:
+    return Q(**{f"{field}__isnull": True}) | Q(**{field: ""})
 
-    This function:
-    1. Checks if all employees in the department have been graded (grade_manager or grade_hrm)
-    2. If finished, validates unit control against current grade distribution
-    3. Updates is_finished, is_valid_unit_control, and grade_distribution fields
+
+def get_department_grade_stats(period, department_ids: Optional[List[int]] = None) -> Dict[int, Dict[str, Any]]:
+    """Count the graded employees of each department of a period with one grouped query.
 
     Args:
-        department_assessment: DepartmentKPIAssessment instance to update
+        period: KPIAssessmentPeriod whose employee assessments are counted
+        department_ids: Restrict the result to these departments (all if None)
 
-    Side effects:
-        Updates and saves department_assessment with new is_finished, is_valid_unit_control,
-        and grade_distribution values
+    Returns:
+        Dict mapping department id to {"total", "ungraded", "grade_counts", "manager_grade_counts"},
+        where grade_counts uses grade_hrm and falls back to grade_manager
     """
     from apps.payroll.models import EmployeeKPIAssessment
 
-    # Get all employee assessments in this department for this period
-    employee_assessments = EmployeeKPIAssessment.objects.filter(
-        period=department_assessment.period, department_snapshot=department_assessment.department
-    )
+    ungraded = _blank("grade_manager") & _blank("grade_hrm")
+    aggregates = {"total": Count("id"), "ungraded": Count("id", filter=ungraded)}
+    for grade in GRADES:
+        aggregates[f"grade_{grade}"] = Count(
+            "id", filter=Q(grade_hrm=grade) | (_blank("grade_hrm") & Q(grade_manager=grade))
+        )
+        aggregates[f"manager_grade_{grade}"] = Count("id", filter=Q(grade_manager=grade))
 
-    # Check if all employees have been graded
-    all_graded = True
-    for emp_assessment in employee_assessments:
-        if not emp_assessment.grade_manager and not emp_assessment.grade_hrm:
-            all_graded = False
-            break
+    queryset = EmployeeKPIAssessment.objects.filter(period=period, department_snapshot__isnull=False)
+    if department_ids is not None:
+        queryset = queryset.filter(department_snapshot_id__in=department_ids)
+    rows = queryset.order_by().values("department_snapshot_id").annotate(**aggregates)
 
-    department_assessment.is_finished = all_graded and employee_assessments.exists()
+    return {
+        row["department_snapshot_id"]: {
+            "total": row["total"],
+            "ungraded": row["ungraded"],
+            "grade_counts": {grade: row[f"grade_{grade}"] for grade in GRADES},
+            "manager_grade_counts": {grade: row[f"manager_grade_{grade}"] for grade in GRADES},
+        }
+        for row in rows
+    }
 
-    # Count grades (use hrm_grade if available, else manager_grade)
-    # Priority: grade_hrm > grade_manager
-    grade_counts = {"A": 0, "B": 0, "C": 0, "D": 0}
-    manager_grade_counts = {"A": 0, "B": 0, "C": 0, "D": 0}
-    for emp_assessment in employee_assessments:
-        grade = emp_assessment.grade_hrm or emp_assessment.grade_manager
-        if grade in grade_counts:
-            grade_counts[grade] += 1
 
-        if emp_assessment.grade_manager in manager_grade_counts:
-            manager_grade_counts[emp_assessment.grade_manager] += 1
+def apply_department_grade_stats(department_assessment, stats: Optional[Dict[str, Any]], unit_control: Dict) -> None:
+    """Set is_finished, is_valid_unit_control and the grade distributions of a department assessment.
 
-    # Update grade distribution
-    department_assessment.grade_distribution = grade_counts
-    department_assessment.manager_grade_distribution = manager_grade_counts
+    The department is finished when it has employees and all of them are graded
+    (grade_manager or grade_hrm); only finished departments are validated against
+    unit control. The instance is not saved.
 
-    # If department is finished, validate unit control
-    if department_assessment.is_finished:
-        # Get unit control rules from period snapshot
-        unit_control = department_assessment.period.kpi_config_snapshot.get("unit_control", {})
+    Args:
+        department_assessment: DepartmentKPIAssessment instance to update
+        stats: Entry of `get_department_grade_stats` for the department (None if it has no employees)
+        unit_control: Unit control rules of the period
+    """
+    stats = stats or {
+        "total": 0,
+        "ungraded": 0,
+        "grade_counts": dict.fromkeys(GRADES, 0),
+        "manager_grade_counts": dict.fromkeys(GRADES, 0),
+    }
 
-        # Validate unit control
-        total_employees = employee_assessments.count()
-        is_valid, violations = validate_unit_control(
-            department_assessment.grade, manager_grade_counts, total_employees, unit_control
-        )
+    department_assessment.is_finished = stats["total"] > 0 and stats["ungraded"] == 0
+    department_assessment.grade_distribution = stats["grade_counts"]
+    department_assessment.manager_grade_distribution = stats["manager_grade_counts"]
 
+    if department_assessment.is_finished:
+        is_valid, _ = validate_unit_control(
+            department_assessment.grade, stats["manager_grade_counts"], stats["total"], unit_control
+        )
         department_assessment.is_valid_unit_control = is_valid
     else:
         # If not finished, keep default valid status
         department_assessment.is_valid_unit_control = True
 
-    department_assessment.save(
-        update_fields=["is_finished", "is_valid_unit_control", "grade_distribution", "manager_grade_distribution"]
+
+DEPARTMENT_STATUS_FIELDS = ["is_finished", "is_valid_unit_control", "grade_distribution", "manager_grade_distribution"]
+
+
+def update_department_assessment_status(department_assessment) -> None:
+    """Update department assessment is_finished and is_valid_unit_control status.
+
+    This function:
+    1. Checks if all employees in the department have been graded (grade_manager or grade_hrm)
+    2. If finished, validates unit control against current grade distribution
+    3. Updates is_finished, is_valid_unit_control, and grade_distribution fields
+
+    Args:
+        department_assessment: DepartmentKPIAssessment instance to update
+
+    Side effects:
+        Updates and saves department_assessment with new is_finished, is_valid_unit_control,
+        and grade_distribution values
+    """
+    period = department_assessment.period
+    stats = get_department_grade_stats(period, [department_assessment.department_id])
+    apply_department_grade_stats(
+        department_assessment,
+        stats.get(department_assessment.department_id),
+        period.kpi_config_snapshot.get("unit_control", {}),
     )
+    department_assessment.save(update_fields=DEPARTMENT_STATUS_FIELDS)
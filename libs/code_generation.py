@@ -1,7 +1,18 @@
-"""Helper functions for generating model codes."""
+"""Helper functions for generating model codes.
 
+Codes derived from the primary key are assigned before the INSERT whenever the
+database can reserve primary keys up front (PostgreSQL sequences, SQLite
+AUTOINCREMENT counters). The row is then written once with its final code, for
+single saves and `bulk_create` alike. Models or backends that cannot be handled
+that way keep the temporary code and are finalized by the post_save handler.
+"""
+
+from django.db import connections, router, transaction
 from django.db.models.signals import post_save
 
+# Model -> callable(instance) assigning the final code without saving
+_PRE_INSERT_CODE_GENERATORS: dict = {}
+
 
 def generate_model_code(instance) -> str:
     """Generate a code for a model instance based on its ID and class prefix.
@@ -37,6 +48,102 @@ def generate_model_code(instance) -> str:
     return f"{prefix}{subcode}"
 
 
+def reserve_ids(model, count: int, using: str | None = None) -> list[int] | None:
+    """Reserve `count` primary key values for `model` ahead of inserting rows.
+
+    The values come from the table's sequence (PostgreSQL) or AUTOINCREMENT
+    counter (SQLite), so concurrent writers never receive the same value and
+    later default inserts never collide with reserved ones.
+
+    Args:
+        model: Model class with an auto-incrementing integer primary key.
+        count: Number of values to reserve.
+        using: Database alias; defaults to the router's write database.
+
+    Returns:
+        List of reserved ids in ascending order, or None when the database
+        backend does not support reservation.
+    """
+    if count <= 0:
+        return []
+
+    using = using or router.db_for_write(model)
+    connection = connections[using]
+    table = model._meta.db_table
+    pk_column = model._meta.pk.column
+
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT nextval(pg_get_serial_sequence(%s, %s)) FROM generate_series(1, %s)",
+                [connection.ops.quote_name(table), pk_column, count],
+            )
+            return sorted(row[0] for row in cursor.fetchall())
+
+    if connection.vendor == "sqlite":
+        # Writes are serialized in SQLite, so bumping the counter inside a transaction is race-free
+        with transaction.atomic(using=using), connection.cursor() as cursor:
+            cursor.execute("UPDATE sqlite_sequence SET seq = seq + %s WHERE name = %s RETURNING seq", [count, table])
+            row = cursor.fetchone()
+            if row is None:
+                quoted_table = connection.ops.quote_name(table)
+                quoted_pk = connection.ops.quote_name(pk_column)
+                cursor.execute(f"SELECT COALESCE(MAX({quoted_pk}), 0) FROM {quoted_table}")  # nosec B608
+                last = cursor.fetchone()[0] + count
+                cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES (%s, %s)", [table, last])
+            else:
+                last = row[0]
+            return list(range(last - count + 1, last + 1))
+
+    return None
+
+
+def assign_auto_codes(instances, using: str | None = None) -> bool:
+    """Assign final codes to new instances before they are inserted.
+
+    Instances without a code (or with a temporary one) and without a primary key
+    get one reserved with `reserve_ids`, then the model's registered generator
+    computes the code. Use this before `bulk_create` so the rows are inserted with
+    their final codes.
+
+    Args:
+        instances: New instances of one model registered with `register_auto_code_signal`.
+        using: Database alias the rows will be written to.
+
+    Returns:
+        True when codes were assigned, False when the model or database does not
+        support pre-insert codes (callers then fall back to temporary codes).
+    """
+    instances = [instance for instance in instances if not instance.code or is_temp_code(instance)]
+    if not instances:
+        return True
+
+    generator = _PRE_INSERT_CODE_GENERATORS.get(type(instances[0]))
+    if generator is None:
+        return False
+
+    without_pk = [instance for instance in instances if instance.pk is None]
+    ids = reserve_ids(type(instances[0]), len(without_pk), using=using)
+    if ids is None:
+        return False
+
+    for instance, reserved_id in zip(without_pk, ids, strict=True):
+        instance.pk = reserved_id
+    for instance in instances:
+        generator(instance)
+    return True
+
+
+def is_temp_code(instance) -> bool:
+    """Return whether the instance holds a temporary placeholder code."""
+    temp_prefix = getattr(instance.__class__, "TEMP_CODE_PREFIX", "TEMP_")
+    return bool(instance.code) and instance.code.startswith(temp_prefix)
+
+
+def _assign_default_code(instance) -> None:
+    instance.code = generate_model_code(instance)
+
+
 def create_auto_code_signal_handler(temp_code_prefix: str, custom_generate_code=None):
     """Factory that returns a post-save signal handler for auto-generating model codes.
 
@@ -98,7 +205,9 @@ def create_auto_code_signal_handler(temp_code_prefix: str, custom_generate_code=
     return signal_handler
 
 
-def register_auto_code_signal(*models, temp_code_prefix: str = "TEMP_", custom_generate_code=None):
+def register_auto_code_signal(
+    *models, temp_code_prefix: str = "TEMP_", custom_generate_code=None, assign_before_insert: bool | None = None
+):
     """Connect an auto-code generation handler to `post_save` for models.
 
     This convenience wrapper constructs the handler via
@@ -122,6 +231,11 @@ def register_auto_code_signal(*models, temp_code_prefix: str = "TEMP_", custom_g
             optionally persist the final code. If it returns a string, the
             handler will assign that string to `instance.code` and save it;
             if it performs its own save it may return None.
+        assign_before_insert: Whether codes are assigned before the INSERT (see
+            `assign_auto_codes`). Defaults to True for the default generator and
+            False for custom ones; a custom generator opting in must accept
+            `force_save=False` and only derive the code from the id and fields
+            set before saving.
 
     Returns:
         None
@@ -132,5 +246,16 @@ def register_auto_code_signal(*models, temp_code_prefix: str = "TEMP_", custom_g
     """
     handler = create_auto_code_signal_handler(temp_code_prefix, custom_generate_code=custom_generate_code)
 
+    if assign_before_insert is None:
+        assign_before_insert = custom_generate_code is None
+    if custom_generate_code is None:
+        pre_insert_generator = _assign_default_code
+    else:
+
+        def pre_insert_generator(instance):
+            custom_generate_code(instance, force_save=False)
+
     for model in models:
         post_save.connect(handler, sender=model, weak=False)
+        if assign_before_insert:
+            _PRE_INSERT_CODE_GENERATORS[model] = pre_insert_generator
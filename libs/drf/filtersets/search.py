@@ -1,4 +1,7 @@
-from rest_framework.filters import SearchFilter
+from django.db.models import Case, IntegerField, Value, When
+from rest_framework.filters import OrderingFilter, SearchFilter
+
+from libs.strings import normalize_search_text
 
 
 class PhraseSearchFilter(SearchFilter):
@@ -13,3 +16,56 @@ class PhraseSearchFilter(SearchFilter):
         """
         params = request.query_params.get(self.search_param, "")
         return [params] if params else []
+
+
+class NormalizedSearchFilter(PhraseSearchFilter):
+    """
+    Accent-insensitive phrase search over the `search_text` column of models using `SearchTextMixin`.
+
+    The phrase is normalized the same way as the column ("nguyen van a" matches "Nguyễn Văn A")
+    and matched with a single LIKE on that column, which a trigram index can serve. Results are
+    ranked: matches at the start of the first search field, then matches at the start of a word,
+    then any other match. Place this filter after `OrderingFilter`: an ordering requested with
+    its query parameter comes first and the rank only breaks ties, otherwise the default
+    ordering breaks the ties of the rank.
+    """
+
+    search_text_field = "search_text"
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        term = normalize_search_text(search_terms[0])
+        if not term:
+            return queryset
+
+        field = self.search_text_field
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        if self.has_requested_ordering(request, queryset, view):
+            ordering = [*ordering, "search_rank"]
+        else:
+            ordering = ["search_rank", *ordering]
+        return (
+            queryset.filter(**{f"{field}__contains": term})
+            .annotate(
+                search_rank=Case(
+                    When(**{f"{field}__startswith": term}, then=Value(0)),
+                    When(**{f"{field}__contains": f" {term}"}, then=Value(1)),
+                    default=Value(2),
+                    output_field=IntegerField(),
+                )
+            )
+            .order_by(*ordering)
+        )
+
+    def has_requested_ordering(self, request, queryset, view):
+        """Whether the request orders the results through the view's `OrderingFilter`."""
+        for backend in getattr(view, "filter_backends", []):
+            if issubclass(backend, OrderingFilter):
+                params = request.query_params.get(backend.ordering_param)
+                if params:
+                    fields = [param.strip() for param in params.split(",")]
+                    return bool(backend().remove_invalid_fields(queryset, fields, view, request))
+        return False
@@ -1,10 +1,42 @@
 """
 Custom pagination classes for the API.
 
-Provides pagination classes with configurable page size via query parameters.
+Provides pagination classes with configurable page size via query parameters,
+and a keyset (cursor) mode for list endpoints over large tables.
 """
 
-from rest_framework.pagination import PageNumberPagination
+import json
+from typing import Optional
+
+from django.core.exceptions import EmptyResultSet, ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q
+from django.utils.translation import gettext_lazy as _
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+
+def estimate_count(queryset) -> Optional[int]:
+    """Estimate the number of rows of a queryset from the database planner statistics.
+
+    Only plans the query (EXPLAIN) instead of counting the matching rows, so the
+    cost does not grow with the table. Returns None on databases other than
+    PostgreSQL.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
 
 
 class PageNumberWithSizePagination(PageNumberPagination):
@@ -21,3 +53,216 @@ class PageNumberWithSizePagination(PageNumberPagination):
 
     page_size_query_param = "page_size"
     max_page_size = 100
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination: pages are selected by the ordering values of the last row
+    of the previous page instead of an OFFSET, and no COUNT is run by default.
+
+    Every page costs the same whatever its depth, as long as the ordering columns
+    are indexed. The ordering is the one requested through the view's
+    OrderingFilter, else the view's `ordering`, the queryset or model ordering,
+    completed with the primary key so rows with equal values are never skipped
+    or repeated. Ordering columns must be non-nullable fields of the model.
+
+    Query Parameters:
+        - cursor: Cursor from the `next`/`previous` links (absent or empty for the first page)
+        - page_size: Number of items per page (default: 25, max: 100)
+        - with_count: Set to true to get the exact `count` of matching rows
+
+    Unless the exact count is requested, the first page returns `estimated_count`,
+    the number of matching rows estimated by the database planner (null when no
+    estimate is available).
+
+    Example:
+        GET /api/endpoint/?cursor=&page_size=50
+    """
+
+    ordering = "-pk"
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    count_query_param = "with_count"
+    count_query_description = _("Set to true to return the exact count of matching rows.")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.count, self.estimated_count = self.get_counts(queryset, request)
+
+        self.cursor = self.decode_cursor(request)
+        if self.cursor is None:
+            (offset, reverse, current_position) = (0, False, None)
+        else:
+            (offset, reverse, current_position) = self.cursor
+
+        ordering = self._reverse_ordering(self.ordering) if reverse else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if current_position is not None:
+            try:
+                queryset = queryset.filter(self._after_position(ordering, current_position))
+            except (TypeError, ValueError, DjangoValidationError):
+                # Position values not matching the ordering fields
+                raise NotFound(self.invalid_cursor_message)
+
+        # Fetch one extra row to know whether a following page exists
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.page = list(results[: self.page_size])
+
+        if len(results) > len(self.page):
+            has_following_position = True
+            following_position = self._get_position_from_instance(results[-1], self.ordering)
+        else:
+            has_following_position = False
+            following_position = None
+
+        if reverse:
+            # The page was read backwards, give it back in the requested order
+            self.page = list(reversed(self.page))
+            self.has_next = (current_position is not None) or (offset > 0)
+            self.has_previous = has_following_position
+            self.next_position, self.previous_position = current_position, following_position
+        else:
+            self.has_next = has_following_position
+            self.has_previous = (current_position is not None) or (offset > 0)
+            self.next_position, self.previous_position = following_position, current_position
+
+        if (self.has_previous or self.has_next) and self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_counts(self, queryset, request):
+        """Get the exact count when requested, else the estimated count on the first page."""
+        if request.query_params.get(self.count_query_param, "").lower() == "true":
+            return queryset.count(), None
+        if not request.query_params.get(self.cursor_query_param):
+            return None, self.get_estimated_count(queryset)
+        return None, None
+
+    def get_estimated_count(self, queryset) -> Optional[int]:
+        return estimate_count(queryset)
+
+    def get_ordering(self, request, queryset, view):
+        ordering = None
+        for backend in getattr(view, "filter_backends", []):
+            if hasattr(backend, "get_ordering"):
+                ordering = backend().get_ordering(request, queryset, view)
+                break
+        if not ordering:
+            ordering = queryset.query.order_by or queryset.model._meta.ordering or self.ordering
+        ordering = [ordering] if isinstance(ordering, str) else list(ordering)
+
+        if not all(isinstance(field, str) and "__" not in field and field != "?" for field in ordering):
+            raise ValidationError({"ordering": _("Cursor pagination only supports ordering by fields of the model.")})
+
+        pk_name = queryset.model._meta.pk.name
+        last_field = ordering[-1].lstrip("-")
+        if last_field not in ("pk", pk_name):
+            ordering.append(f"-{pk_name}" if ordering[-1].startswith("-") else pk_name)
+        return tuple(ordering)
+
+    @staticmethod
+    def _reverse_ordering(ordering):
+        return tuple(field[1:] if field.startswith("-") else f"-{field}" for field in ordering)
+
+    def _after_position(self, ordering, position) -> Q:
+        """Filter the rows following `position` in `ordering`."""
+        try:
+            values = json.loads(position)
+        except ValueError:
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise NotFound(self.invalid_cursor_message)
+
+        # (a, b) after (x, y) is: a after x, or a equal to x and b after y
+        condition = Q()
+        equal = Q()
+        for field, value in zip(ordering, values, strict=True):
+            lookup = "lt" if field.startswith("-") else "gt"
+            name = field.lstrip("-")
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _get_position_from_instance(self, instance, ordering):
+        values = []
+        for field in ordering:
+            name = field.lstrip("-")
+            value = instance[name] if isinstance(instance, dict) else getattr(instance, name)
+            values.append(str(value))
+        return json.dumps(values)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "count": self.count,
+                "estimated_count": self.estimated_count,
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        response_schema = super().get_paginated_response_schema(schema)
+        response_schema["properties"] = {
+            **response_schema["properties"],
+            "count": {"type": "integer", "nullable": True, "example": None},
+            "estimated_count": {"type": "integer", "nullable": True, "example": 12000},
+        }
+        return response_schema
+
+    def get_schema_operation_parameters(self, view):
+        return super().get_schema_operation_parameters(view) + [
+            {
+                "name": self.count_query_param,
+                "required": False,
+                "in": "query",
+                "description": str(self.count_query_description),
+                "schema": {"type": "boolean"},
+            }
+        ]
+
+
+class PageNumberOrKeysetPagination(PageNumberWithSizePagination):
+    """
+    Page number pagination switching to `KeysetPagination` when the request has a
+    `cursor` query parameter.
+
+    Lets list endpoints over large tables serve infinite scroll clients (e.g.
+    mobile) with constant cost pages, starting from `?cursor=`, while `?page=`
+    keeps working for the other clients.
+    """
+
+    keyset_pagination_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.keyset_pagination_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_pagination_class()
+            page = self.keyset.paginate_queryset(queryset, request, view)
+            self.display_page_controls = self.keyset.display_page_controls
+            return page
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.keyset is not None:
+            return self.keyset.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        known = {parameter["name"] for parameter in parameters}
+        keyset_parameters = self.keyset_pagination_class().get_schema_operation_parameters(view)
+        return parameters + [parameter for parameter in keyset_parameters if parameter["name"] not in known]
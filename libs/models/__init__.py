@@ -1,6 +1,19 @@
 from .base_model_mixin import AutoCodeMixin, BaseModel, BaseReportModel
 from .colored_value_mixin import ColoredValueMixin
 from .dummy_models import create_dummy_model
+from .field_tracker import FieldTrackerMixin, get_tracked_changes, reset_tracked_values
 from .fields import SafeTextField
+from .search_text_mixin import SearchTextMixin
 
-__all__ = ["BaseModel", "BaseReportModel", "AutoCodeMixin", "ColoredValueMixin", "SafeTextField", "create_dummy_model"]
+__all__ = [
+    "BaseModel",
+    "BaseReportModel",
+    "AutoCodeMixin",
+    "ColoredValueMixin",
+    "FieldTrackerMixin",
+    "SafeTextField",
+    "SearchTextMixin",
+    "create_dummy_model",
+    "get_tracked_changes",
+    "reset_tracked_values",
+]
@@ -1,6 +1,8 @@
 from django.db import models
 from django.utils.crypto import get_random_string
 
+from libs.code_generation import assign_auto_codes, is_temp_code
+
 
 class BaseModel(models.Model):
     created_at = models.DateTimeField(
@@ -18,14 +20,14 @@ class BaseModel(models.Model):
 
 
 class AutoCodeMixin(models.Model):
-    """Mixin that provides automatic temporary code generation for new instances.
-
-    This mixin automatically generates a temporary code for new model instances
-    that don't have a code yet. The temporary code uses a configurable prefix
-    followed by a random string to avoid collisions.
+    """Mixin that provides automatic code generation for new instances.
 
-    The temporary code is later replaced by the final code through a signal handler
-    that uses the instance ID and the model's CODE_PREFIX attribute.
+    For models registered with `register_auto_code_signal` the primary key is
+    reserved before the INSERT and the final code is written with the row (see
+    `libs.code_generation.assign_auto_codes`). Otherwise a temporary code with a
+    configurable prefix followed by a random string is saved, and later replaced
+    by the final code through a signal handler that uses the instance ID and the
+    model's CODE_PREFIX attribute.
 
     Attributes:
         TEMP_CODE_PREFIX: Class attribute that defines the temporary code prefix.
@@ -54,6 +56,24 @@ class AutoCodeMixin(models.Model):
             self.code = f"{temp_prefix}{get_random_string(20)}"
         super().save(*args, **kwargs)
 
+    def _save_table(self, raw=False, cls=None, force_insert=False, force_update=False, using=None, update_fields=None):
+        """Replace the temporary code with the final one right before the INSERT.
+
+        This runs after pre_save handlers, which therefore still see a new instance
+        without a primary key.
+        """
+        if (
+            self._state.adding
+            and not raw
+            and self.pk is None
+            and hasattr(self, "code")
+            and is_temp_code(self)
+            and assign_auto_codes([self], using=using)
+        ):
+            # The reserved pk is not in the table yet, skip the UPDATE attempt
+            force_insert = True
+        return super()._save_table(raw, cls, force_insert, force_update, using, update_fields)
+
 
 class BaseReportModel(BaseModel):
     """Base model for all report models.
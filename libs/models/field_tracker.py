@@ -0,0 +1,132 @@
+from typing import Any, Iterable, List, Tuple
+
+from django.db import models
+
+
+class FieldTrackerMixin(models.Model):
+    """Mixin that remembers the database values of selected fields.
+
+    The values of `TRACKED_FIELDS` are captured when an instance is loaded from
+    the database and after each save, so `pre_save`/`post_save` handlers can
+    compare them with the current values without re-reading the row.
+
+    Instances that were never loaded (e.g. built with an explicit pk) or whose
+    tracked fields were deferred fall back to a single query on first access.
+
+    Example:
+        class User(FieldTrackerMixin, BaseModel):
+            TRACKED_FIELDS = ("role",)
+
+        if instance.has_tracked_change("role"):
+            ...
+    """
+
+    TRACKED_FIELDS: Tuple[str, ...] = ()
+
+    class Meta:
+        abstract = True
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._capture_tracked_values()
+        return instance
+
+    def _save_table(self, raw=False, cls=None, force_insert=False, force_update=False, using=None, update_fields=None):
+        # Captured right after the write, so handlers of nested saves (e.g. a
+        # post_save handler saving the instance again) already see the new values
+        updated = super()._save_table(raw, cls, force_insert, force_update, using, update_fields)
+        if update_fields is None:
+            self._capture_tracked_values()
+        else:
+            # Only the saved fields changed in the database
+            self._capture_tracked_values(self._tracked_fields_among(update_fields))
+        return updated
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        if fields is None:
+            self._capture_tracked_values()
+        else:
+            self._capture_tracked_values(self._tracked_fields_among(fields))
+
+    def _tracked_fields_among(self, names: Iterable[str]) -> List[str]:
+        # Field lists may use either the field name or the attname ("role" / "role_id")
+        names = set(names)
+        return [name for name in self.TRACKED_FIELDS if name in names or self._meta.get_field(name).attname in names]
+
+    @property
+    def _tracked_originals(self) -> dict:
+        return self.__dict__.setdefault("_tracked_original_values", {})
+
+    def _capture_tracked_values(self, names: Iterable[str] | None = None) -> None:
+        deferred = self.get_deferred_fields()
+        originals = self._tracked_originals
+        for name in self.TRACKED_FIELDS if names is None else names:
+            attname = self._meta.get_field(name).attname
+            if attname in deferred:
+                originals.pop(name, None)
+            else:
+                originals[name] = getattr(self, attname)
+
+    def _load_missing_tracked_values(self) -> None:
+        missing = [name for name in self.TRACKED_FIELDS if name not in self._tracked_originals]
+        attnames = [self._meta.get_field(name).attname for name in missing]
+        row = type(self)._base_manager.using(self._state.db).filter(pk=self.pk).values(*attnames).first() or {}
+        for name, attname in zip(missing, attnames, strict=True):
+            self._tracked_originals[name] = row.get(attname)
+
+    def get_original_value(self, name: str) -> Any:
+        """Return the database value of a tracked field (None for unsaved instances).
+
+        For FK fields the original related object's id is returned.
+        """
+        if name not in self.TRACKED_FIELDS:
+            raise ValueError(f"{type(self).__name__}.{name} is not a tracked field")
+        if self.pk is None:
+            return None
+        if name not in self._tracked_originals:
+            self._load_missing_tracked_values()
+        return self._tracked_originals[name]
+
+    def has_tracked_change(self, name: str) -> bool:
+        """Return whether a tracked field differs from its database value."""
+        if self.pk is None:
+            return False
+        return self.get_original_value(name) != getattr(self, self._meta.get_field(name).attname)
+
+
+def get_tracked_changes(instances: Iterable[FieldTrackerMixin], name: str) -> List[Tuple[Any, Any, Any]]:
+    """Return `(instance, old_value, new_value)` for the instances whose tracked field changed.
+
+    Meant for bulk paths (`bulk_update`, `QuerySet.update`) that bypass the save
+    signals. Instances without a captured value are resolved with one query for
+    the whole batch instead of one per instance.
+    """
+    instances = [instance for instance in instances if instance.pk is not None]
+    if not instances:
+        return []
+
+    model = type(instances[0])
+    attname = model._meta.get_field(name).attname
+    missing = [instance for instance in instances if name not in instance._tracked_originals]
+    if missing:
+        originals = dict(
+            model._base_manager.filter(pk__in=[instance.pk for instance in missing]).values_list("pk", attname)
+        )
+        for instance in missing:
+            instance._tracked_originals[name] = originals.get(instance.pk)
+
+    changes = []
+    for instance in instances:
+        old_value = instance._tracked_originals[name]
+        new_value = getattr(instance, attname)
+        if old_value != new_value:
+            changes.append((instance, old_value, new_value))
+    return changes
+
+
+def reset_tracked_values(instances: Iterable[FieldTrackerMixin]) -> None:
+    """Mark the current values as saved, e.g. after a `bulk_update`."""
+    for instance in instances:
+        instance._capture_tracked_values()
@@ -0,0 +1,77 @@
+from django.db import models
+
+from libs.strings import normalize_search_text
+
+SEARCH_TEXT_SEPARATOR = " | "
+
+
+class SearchTextMixin(models.Model):
+    """Mixin that maintains a normalized, accent-insensitive search column.
+
+    `search_text` holds the values of `SEARCH_TEXT_FIELDS` normalized with
+    `normalize_search_text` and joined with `SEARCH_TEXT_SEPARATOR`. It is
+    recomputed right before every INSERT/UPDATE (after codes are assigned) and is
+    added to `update_fields` whenever one of the source fields is saved.
+
+    Paths that bypass `save()` (`bulk_create`, `bulk_update`, `QuerySet.update`)
+    must call `update_search_text()` on the instances before writing, or
+    `refresh_search_text()` afterwards.
+
+    Example:
+        class Employee(AutoCodeMixin, SearchTextMixin, BaseModel):
+            SEARCH_TEXT_FIELDS = ("fullname", "code", "email")
+    """
+
+    SEARCH_TEXT_FIELDS: tuple[str, ...] = ()
+
+    search_text = models.TextField(
+        blank=True,
+        default="",
+        editable=False,
+        verbose_name="Search text",
+        help_text="Normalized, unaccented values of the searchable fields",
+    )
+
+    class Meta:
+        abstract = True
+
+    def update_search_text(self) -> None:
+        """Recompute `search_text` from the current field values."""
+        self.search_text = SEARCH_TEXT_SEPARATOR.join(
+            normalize_search_text(getattr(self, field_name)) for field_name in self.SEARCH_TEXT_FIELDS
+        )
+
+    def _save_table(self, raw=False, cls=None, force_insert=False, force_update=False, using=None, update_fields=None):
+        self.update_search_text()
+        if update_fields is not None and "search_text" not in update_fields:
+            if set(update_fields) & set(self.SEARCH_TEXT_FIELDS):
+                update_fields = frozenset(update_fields) | {"search_text"}
+        return super()._save_table(raw, cls, force_insert, force_update, using, update_fields)
+
+    @classmethod
+    def refresh_search_text(cls, queryset=None, batch_size: int = 1000) -> int:
+        """Recompute `search_text` for existing rows.
+
+        Args:
+            queryset: Rows to refresh (all rows by default)
+            batch_size: Number of rows fetched and updated per batch
+
+        Returns:
+            Number of rows whose search text changed
+        """
+        queryset = cls._default_manager.all() if queryset is None else queryset
+        changed = []
+        updated = 0
+        for instance in queryset.only("pk", "search_text", *cls.SEARCH_TEXT_FIELDS).iterator(chunk_size=batch_size):
+            previous = instance.search_text
+            instance.update_search_text()
+            if instance.search_text != previous:
+                changed.append(instance)
+            if len(changed) >= batch_size:
+                updated += len(changed)
+                cls._default_manager.bulk_update(changed, ["search_text"])
+                changed = []
+        if changed:
+            updated += len(changed)
+            cls._default_manager.bulk_update(changed, ["search_text"])
+        return updated
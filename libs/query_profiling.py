@@ -0,0 +1,329 @@
+"""Per-request SQL query and latency profiling.
+
+`profiling()` records, for the code running inside it, every SQL query (with
+its fingerprint, i.e. the statement with literals and `IN` lists collapsed),
+the time spent in the database, cache hits and misses of the default cache and
+the time spent producing serializer data. Queries repeated with the same
+fingerprint are reported as duplicates, which is how N+1 patterns show up.
+
+It backs the opt-in `apps.core.middlewares.QueryProfilingMiddleware` and the
+test helpers `assert_query_budget` and `assert_queries_do_not_grow`.
+"""
+
+import functools
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from django.core.cache import cache
+from django.db import connections
+from rest_framework import serializers
+
+_current_profile: ContextVar[Optional["RequestProfile"]] = ContextVar("query_profile", default=None)
+
+_IN_LIST_RE = re.compile(r"\bIN \((?:\s*(?:%s|\?|\d+|'[^']*')\s*,?)+\)", re.IGNORECASE)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SPACE_RE = re.compile(r"\s+")
+
+# Number of duplicated fingerprints listed in reports and assertion messages
+TOP_DUPLICATES = 5
+
+_MISSING = object()
+_report_lock = threading.Lock()
+
+
+def fingerprint_sql(sql: str) -> str:
+    """Normalize a SQL statement so that queries differing only by values match."""
+    sql = _STRING_RE.sub("?", sql)
+    sql = _IN_LIST_RE.sub("IN (...)", sql)
+    sql = _NUMBER_RE.sub("?", sql)
+    return _SPACE_RE.sub(" ", sql).strip()
+
+
+class RequestProfile:
+    """Measurements collected while profiling a request (or any block of code)."""
+
+    def __init__(self):
+        self.route = ""
+        self.status_code = None
+        self.fingerprints: List[str] = []
+        self.db_time = 0.0
+        self.serializer_time = 0.0
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self.total_time = 0.0
+        self._started = time.perf_counter()
+        self._serializing = False
+
+    def __call__(self, execute, sql, params, many, context):
+        """Database execute wrapper recording each query."""
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - started
+            self.fingerprints.append(fingerprint_sql(sql))
+
+    def finish(self) -> None:
+        self.total_time = time.perf_counter() - self._started
+
+    @property
+    def query_count(self) -> int:
+        return len(self.fingerprints)
+
+    @property
+    def duplicates(self) -> Dict[str, int]:
+        """Fingerprints executed more than once, most repeated first."""
+        return {sql: count for sql, count in Counter(self.fingerprints).most_common() if count > 1}
+
+    @property
+    def duplicate_count(self) -> int:
+        """Number of queries repeating an earlier fingerprint."""
+        return sum(count - 1 for count in self.duplicates.values())
+
+    def headers(self) -> Dict[str, str]:
+        """Response headers exposing the measurements."""
+        db_ms = self.db_time * 1000
+        serializer_ms = self.serializer_time * 1000
+        total_ms = self.total_time * 1000
+        return {
+            "X-Query-Count": str(self.query_count),
+            "X-Query-Duplicates": str(self.duplicate_count),
+            "X-DB-Time-Ms": f"{db_ms:.1f}",
+            "X-Serializer-Time-Ms": f"{serializer_ms:.1f}",
+            "X-Cache-Hits": str(self.cache_hits),
+            "X-Cache-Misses": str(self.cache_misses),
+            "Server-Timing": f"db;dur={db_ms:.1f}, serializer;dur={serializer_ms:.1f}, total;dur={total_ms:.1f}",
+        }
+
+    def as_dict(self) -> dict:
+        """Report entry of the profile."""
+        return {
+            "route": self.route,
+            "status": self.status_code,
+            "queries": self.query_count,
+            "duplicates": self.duplicate_count,
+            "duplicate_fingerprints": [
+                {"sql": sql, "count": count, "hash": hashlib.md5(sql.encode()).hexdigest()[:8]}  # noqa: S324
+                for sql, count in list(self.duplicates.items())[:TOP_DUPLICATES]
+            ],
+            "db_ms": round(self.db_time * 1000, 2),
+            "serializer_ms": round(self.serializer_time * 1000, 2),
+            "total_ms": round(self.total_time * 1000, 2),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+    def describe(self) -> str:
+        """Human readable summary used in assertion messages."""
+        lines = [f"{self.query_count} queries ({self.duplicate_count} duplicated), {self.db_time * 1000:.1f} ms in DB"]
+        for sql, count in list(self.duplicates.items())[:TOP_DUPLICATES]:
+            lines.append(f"  {count}x {sql[:300]}")
+        return "\n".join(lines)
+
+
+def _timed_serializer_data(fget):
+    @functools.wraps(fget)
+    def data(self):
+        profile = _current_profile.get()
+        # Only the outermost serializer is timed, nested ones are part of it
+        if profile is None or profile._serializing:
+            return fget(self)
+        profile._serializing = True
+        started = time.perf_counter()
+        try:
+            return fget(self)
+        finally:
+            profile.serializer_time += time.perf_counter() - started
+            profile._serializing = False
+
+    data._query_profiling = True
+    return data
+
+
+def install_serializer_timing() -> None:
+    """Time `Serializer.data` and `ListSerializer.data` while a profile is active.
+
+    Safe to call several times; without an active profile the overhead is a
+    context variable lookup.
+    """
+    for serializer_class in (serializers.Serializer, serializers.ListSerializer):
+        fget = serializer_class.data.fget
+        if not getattr(fget, "_query_profiling", False):
+            serializer_class.data = property(_timed_serializer_data(fget))
+
+
+@contextmanager
+def _count_cache_lookups(profile: RequestProfile) -> Iterator[None]:
+    # `cache` proxies the current thread's instance of the default cache
+    backend = cache._connections[cache._alias] if hasattr(cache, "_connections") else cache
+    get, get_many = backend.get, backend.get_many
+    # Some backends implement get_many() with get(), only the outer call counts
+    nested = False
+
+    def counted_get(key, default=None, version=None):
+        value = get(key, _MISSING, version=version)
+        if not nested:
+            if value is _MISSING:
+                profile.cache_misses += 1
+            else:
+                profile.cache_hits += 1
+        return default if value is _MISSING else value
+
+    def counted_get_many(keys, version=None):
+        nonlocal nested
+        keys = list(keys)
+        nested = True
+        try:
+            values = get_many(keys, version=version)
+        finally:
+            nested = False
+        profile.cache_hits += len(values)
+        profile.cache_misses += len(keys) - len(values)
+        return values
+
+    # Restore the counting functions of an enclosing profiling() block, if any
+    previous = {name: backend.__dict__[name] for name in ("get", "get_many") if name in backend.__dict__}
+    backend.get, backend.get_many = counted_get, counted_get_many
+    try:
+        yield
+    finally:
+        del backend.get, backend.get_many
+        for name, method in previous.items():
+            setattr(backend, name, method)
+
+
+@contextmanager
+def profiling() -> Iterator[RequestProfile]:
+    """Profile the queries, cache lookups and serializer time of the enclosed block."""
+    profile = RequestProfile()
+    token = _current_profile.set(profile)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(profile))
+            stack.enter_context(_count_cache_lookups(profile))
+            yield profile
+    finally:
+        profile.finish()
+        _current_profile.reset(token)
+
+
+def append_report(path: str, profile: RequestProfile) -> None:
+    """Append a profile to a JSON lines report file."""
+    line = json.dumps(profile.as_dict(), ensure_ascii=False)
+    with _report_lock, open(path, "a", encoding="utf-8") as report:
+        report.write(line + "\n")
+
+
+def read_report(path: str) -> List[dict]:
+    """Read the profiles of a JSON lines report file."""
+    with open(path, encoding="utf-8") as report:
+        return [json.loads(line) for line in report if line.strip()]
+
+
+def aggregate_report(entries: Sequence[dict]) -> List[dict]:
+    """Aggregate report entries by route, routes with the most queries first."""
+    by_route: Dict[str, List[dict]] = {}
+    for entry in entries:
+        by_route.setdefault(entry["route"], []).append(entry)
+
+    rows = []
+    for route, route_entries in by_route.items():
+        queries = sorted(entry["queries"] for entry in route_entries)
+        db_ms = sorted(entry["db_ms"] for entry in route_entries)
+        duplicates = Counter()
+        for entry in route_entries:
+            for fingerprint in entry["duplicate_fingerprints"]:
+                duplicates[fingerprint["sql"]] = max(duplicates[fingerprint["sql"]], fingerprint["count"])
+        hits = sum(entry["cache_hits"] for entry in route_entries)
+        lookups = hits + sum(entry["cache_misses"] for entry in route_entries)
+        rows.append(
+            {
+                "route": route,
+                "requests": len(route_entries),
+                "queries_avg": round(sum(queries) / len(queries), 1),
+                "queries_max": queries[-1],
+                "duplicates_max": max(entry["duplicates"] for entry in route_entries),
+                "db_ms_avg": round(sum(db_ms) / len(db_ms), 1),
+                "db_ms_p95": db_ms[min(len(db_ms) - 1, int(len(db_ms) * 0.95))],
+                "serializer_ms_avg": round(
+                    sum(entry["serializer_ms"] for entry in route_entries) / len(route_entries), 1
+                ),
+                "total_ms_avg": round(sum(entry["total_ms"] for entry in route_entries) / len(route_entries), 1),
+                "cache_hit_ratio": round(hits / lookups, 2) if lookups else None,
+                "top_duplicates": duplicates.most_common(TOP_DUPLICATES),
+            }
+        )
+    return sorted(rows, key=lambda row: (row["queries_max"], row["queries_avg"]), reverse=True)
+
+
+def _result_count(response) -> Optional[int]:
+    content = json.loads(response.content)
+    data = content.get("data", content) if isinstance(content, dict) else content
+    if isinstance(data, dict):
+        data = data.get("results")
+    return len(data) if isinstance(data, list) else None
+
+
+def assert_query_budget(client, url: str, max_queries: int, method: str = "get", data=None, **extra):
+    """Request an endpoint and fail when it runs more than `max_queries` queries.
+
+    Returns:
+        The response, for further assertions
+    """
+    install_serializer_timing()
+    with profiling() as profile:
+        response = getattr(client, method)(url, data, **extra)
+    if profile.query_count > max_queries:
+        raise AssertionError(
+            f"{method.upper()} {url} exceeded its query budget of {max_queries}: {profile.describe()}"
+        )
+    return response
+
+
+def assert_queries_do_not_grow(
+    client,
+    url: str,
+    page_sizes: Sequence[int] = (1, 10),
+    page_size_param: str = "page_size",
+    data: Optional[dict] = None,
+    **extra,
+) -> Dict[int, int]:
+    """Fail when the query count of a list endpoint grows with its page size.
+
+    The endpoint must return more results for the largest page size than for
+    the smallest one, otherwise the check would prove nothing.
+
+    Returns:
+        Query count by page size
+    """
+    profiles = {}
+    result_counts = {}
+    for page_size in page_sizes:
+        with profiling() as profile:
+            response = client.get(url, {**(data or {}), page_size_param: page_size}, **extra)
+        assert response.status_code == 200, f"GET {url} returned {response.status_code}"
+        profiles[page_size] = profile
+        result_counts[page_size] = _result_count(response)
+
+    smallest, largest = min(page_sizes), max(page_sizes)
+    if not (result_counts[largest] or 0) > (result_counts[smallest] or 0):
+        raise AssertionError(
+            f"GET {url} returned {result_counts[largest]} result(s) with {page_size_param}={largest}; "
+            f"create more rows than {smallest} to check the query growth"
+        )
+    if profiles[largest].query_count > profiles[smallest].query_count:
+        raise AssertionError(
+            f"GET {url} runs more queries with {page_size_param}={largest} "
+            f"({profiles[largest].query_count}) than with {page_size_param}={smallest} "
+            f"({profiles[smallest].query_count}): {profiles[largest].describe()}"
+        )
+    return {page_size: profile.query_count for page_size, profile in profiles.items()}
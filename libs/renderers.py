@@ -0,0 +1,62 @@
+"""JSON rendering of the API response envelope.
+
+Every API response body has the shape `{"success": ..., "data": ..., "error": ...}`.
+`EnvelopeJSONRenderer` builds that envelope while DRF renders the response, so the
+payload is serialized once (with orjson) instead of being rendered by DRF and
+then wrapped and serialized again by `ApiResponseWrapperMiddleware`.
+"""
+
+import orjson
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# Dates and times are passed to `_default` to keep the DjangoJSONEncoder formats
+# (e.g. milliseconds and "Z" for UTC datetimes); non-string keys are stringified like json.dumps
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+_django_encoder = DjangoJSONEncoder()
+_drf_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """Encode the values orjson does not support natively."""
+    try:
+        return _django_encoder.default(obj)
+    except TypeError:
+        # Querysets, generators, objects with tolist() and other DRF supported values
+        return _drf_encoder.default(obj)
+
+
+def dumps(data) -> bytes:
+    """Serialize data to JSON bytes."""
+    return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+
+
+def build_envelope(data, is_error: bool) -> dict:
+    """Wrap response data in the API envelope, empty data being sent as null."""
+    data = data if data else None
+    return {
+        "success": not is_error,
+        "data": None if is_error else data,
+        "error": data if is_error else None,
+    }
+
+
+def is_error_response(response) -> bool:
+    return bool(getattr(response, "exception", False)) or response.status_code >= 400
+
+
+class EnvelopeJSONRenderer(JSONRenderer):
+    """
+    Render DRF responses directly as the API envelope.
+
+    `ApiResponseWrapperMiddleware` leaves responses rendered by this renderer
+    untouched.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        response = (renderer_context or {}).get("response")
+        if response is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(build_envelope(data, is_error_response(response)))
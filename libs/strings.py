@@ -1,4 +1,5 @@
 import random
+import unicodedata
 
 import nh3
 from django.utils.crypto import get_random_string
@@ -28,6 +29,29 @@ def normalize_header(header: str) -> str:
     return str(header).strip().lower()
 
 
+def normalize_search_text(value: str | None) -> str:
+    """Normalize text for accent-insensitive search.
+
+    Removes diacritics (including the Vietnamese "đ"), lowercases and collapses
+    whitespace, so "Nguyễn  Văn Đức" and "nguyen van duc" normalize to the same value.
+
+    Args:
+        value: Raw text
+
+    Returns:
+        Normalized text ("" for empty values)
+
+    Example:
+        >>> normalize_search_text("Nguyễn Văn Đức")
+        "nguyen van duc"
+    """
+    if not value:
+        return ""
+    decomposed = unicodedata.normalize("NFD", str(value).replace("đ", "d").replace("Đ", "D"))
+    stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
+    return " ".join(stripped.lower().split())
+
+
 def generate_valid_password() -> str:
     """Generate a valid random password meeting complexity requirements.
 
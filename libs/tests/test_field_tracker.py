@@ -0,0 +1,89 @@
+"""Tests for FieldTrackerMixin, using the tracked `role` field of User."""
+
+from unittest.mock import patch
+
+import pytest
+
+from apps.core.models import Role, User
+from libs.models import get_tracked_changes, reset_tracked_values
+
+
+@pytest.fixture
+def roles(db):
+    return (
+        Role.objects.create(code="VT_TRACK_1", name="Tracked Role 1"),
+        Role.objects.create(code="VT_TRACK_2", name="Tracked Role 2"),
+    )
+
+
+@pytest.fixture
+def user(roles):
+    created = User.objects.create_user(username="tracked", email="tracked@example.com", role=roles[0])
+    return User.objects.get(pk=created.pk)
+
+
+@pytest.mark.django_db
+class TestFieldTrackerMixin:
+    def test_loaded_instance_detects_change_without_query(self, user, roles, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            assert not user.has_tracked_change("role")
+            user.role = roles[1]
+            assert user.has_tracked_change("role")
+            assert user.get_original_value("role") == roles[0].id
+
+    def test_save_resets_original_value(self, user, roles):
+        user.role = roles[1]
+        user.save()
+
+        assert user.get_original_value("role") == roles[1].id
+        assert not user.has_tracked_change("role")
+
+    def test_unloaded_instance_falls_back_to_one_query(self, user, roles, django_assert_num_queries):
+        detached = User(pk=user.pk, role=roles[1])
+
+        with django_assert_num_queries(1):
+            assert detached.get_original_value("role") == roles[0].id
+            assert detached.has_tracked_change("role")
+
+    def test_unsaved_instance_has_no_original_value(self, roles):
+        new_user = User(username="new", email="new@example.com", role=roles[0])
+
+        assert new_user.get_original_value("role") is None
+        assert not new_user.has_tracked_change("role")
+
+    def test_untracked_field_is_rejected(self, user):
+        with pytest.raises(ValueError):
+            user.get_original_value("email")
+
+    def test_get_tracked_changes_for_bulk_update(self, user, roles, django_assert_num_queries):
+        other = User.objects.create_user(username="tracked2", email="tracked2@example.com", role=roles[1])
+        detached = User(pk=other.pk, role=roles[1])
+        user.role = roles[1]
+
+        # Only the detached instance needs its original value loaded
+        with django_assert_num_queries(1):
+            changes = get_tracked_changes([user, detached], "role")
+
+        assert changes == [(user, roles[0].id, roles[1].id)]
+
+        User.objects.bulk_update([user], ["role"])
+        reset_tracked_values([user])
+        assert get_tracked_changes([user], "role") == []
+
+
+@pytest.mark.django_db
+class TestUserRoleChangeCacheInvalidation:
+    @patch("apps.hrm.signals.role_data_scope.invalidate_role_units_cache")
+    def test_role_change_invalidates_cache(self, mock_invalidate, user, roles):
+        user.role = roles[1]
+        user.save()
+
+        mock_invalidate.assert_called_once_with(user.pk)
+
+    @patch("apps.hrm.signals.role_data_scope.invalidate_role_units_cache")
+    def test_last_login_update_does_not_read_user(self, mock_invalidate, user, django_assert_num_queries):
+        # Only the UPDATE itself, no SELECT to compare the role
+        with django_assert_num_queries(1):
+            user.save(update_fields=["last_login"])
+
+        mock_invalidate.assert_not_called()
@@ -0,0 +1,124 @@
+"""Tests for the keyset pagination of libs.drf.pagination."""
+
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.filters import OrderingFilter
+from rest_framework.pagination import Cursor
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from apps.core.models import Province
+from libs.drf.pagination import KeysetPagination, PageNumberOrKeysetPagination
+
+
+class ProvinceView:
+    filter_backends = [OrderingFilter]
+    ordering_fields = ["level", "name"]
+    ordering = ["level"]
+
+
+def paginate(params, paginator_class=KeysetPagination, view=None):
+    request = Request(APIRequestFactory().get("/api/provinces/", params))
+    paginator = paginator_class()
+    page = paginator.paginate_queryset(Province.objects.all(), request, view or ProvinceView())
+    return paginator, page, paginator.get_paginated_response([item.name for item in page]).data
+
+
+def query_params(link):
+    return {key: values[0] for key, values in parse_qs(urlparse(link).query, keep_blank_values=True).items()}
+
+
+@pytest.fixture
+def provinces(db):
+    # Most provinces share their level, which checks the primary key tie-breaker
+    levels = [Province.ProvinceLevel.PROVINCE] * 6 + [Province.ProvinceLevel.CENTRAL_CITY] * 2
+    return Province.objects.bulk_create(
+        [
+            Province(code=f"{index:02d}", name=f"Province {chr(ord('A') + index)}", level=level)
+            for index, level in enumerate(levels)
+        ]
+    )
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_walks_every_row_once_forward_and_backward(self, provinces):
+        expected = [n.pk for n in sorted(provinces, key=lambda n: (n.level, n.pk))]
+
+        pages = []
+        params = {"cursor": "", "page_size": 3}
+        while params is not None:
+            paginator, page, data = paginate(params)
+            pages.append([item.pk for item in page])
+            params = query_params(data["next"]) if data["next"] else None
+        assert [pk for page in pages for pk in page] == expected
+        assert len(pages) == 3
+
+        backwards = []
+        params = query_params(data["previous"])
+        while params is not None:
+            paginator, page, data = paginate(params)
+            backwards.insert(0, [item.pk for item in page])
+            params = query_params(data["previous"]) if data["previous"] else None
+        assert backwards == pages[:-1]
+
+    def test_pages_filter_on_position_without_offset(self, provinces):
+        _paginator, _page, data = paginate({"cursor": "", "page_size": 3})
+
+        with CaptureQueriesContext(connection) as queries:
+            paginate(query_params(data["next"]))
+
+        (query,) = queries.captured_queries
+        assert "OFFSET" not in query["sql"]
+
+    def test_ordering_requested_by_client(self, provinces):
+        paginator, page, _data = paginate({"cursor": "", "ordering": "-name", "page_size": 2})
+
+        assert paginator.ordering == ("-name", "-id")
+        assert [item.name for item in page] == ["Province H", "Province G"]
+
+    def test_related_ordering_is_rejected(self, provinces):
+        class View(ProvinceView):
+            ordering = ["created_by__username"]
+
+        with pytest.raises(ValidationError):
+            paginate({"cursor": ""}, view=View())
+
+    def test_counts(self, provinces):
+        _paginator, _page, first = paginate({"cursor": "", "page_size": 3})
+        _paginator, _page, exact = paginate({"cursor": "", "page_size": 3, "with_count": "true"})
+        _paginator, _page, following = paginate(query_params(first["next"]))
+
+        # No planner estimate on SQLite
+        assert (first["count"], first["estimated_count"]) == (None, None)
+        assert exact["count"] == len(provinces)
+        assert (following["count"], following["estimated_count"]) == (None, None)
+
+    @pytest.mark.parametrize("position", ['["province"]', "not json", '["province", "x"]'])
+    def test_invalid_cursor(self, provinces, position):
+        paginator = KeysetPagination()
+        paginator.base_url = "http://testserver/api/provinces/"
+        link = paginator.encode_cursor(Cursor(offset=0, reverse=False, position=position))
+
+        with pytest.raises(NotFound):
+            paginate(query_params(link))
+
+
+@pytest.mark.django_db
+class TestPageNumberOrKeysetPagination:
+    def test_page_number_mode_without_cursor(self, provinces):
+        _paginator, _page, data = paginate({"page": 2, "page_size": 3}, PageNumberOrKeysetPagination)
+
+        assert data["count"] == len(provinces)
+        assert "estimated_count" not in data
+
+    def test_keyset_mode_with_cursor(self, provinces):
+        _paginator, page, data = paginate({"cursor": "", "page_size": 3}, PageNumberOrKeysetPagination)
+
+        assert [item.code for item in page] == ["06", "07", "00"]
+        assert "cursor=" in data["next"]
+        assert data["estimated_count"] is None
@@ -0,0 +1,113 @@
+"""
+Benchmark the rendering of the API response envelope on a large payload.
+
+Compares the CPU time of the previous rendering, where DRF rendered the
+response and ApiResponseWrapperMiddleware wrapped and serialized it again
+(decoding plain JSON responses first), with EnvelopeJSONRenderer, which
+serializes the envelope once, and with the middleware embedding a plain JSON
+response body without decoding it.
+
+Run with:
+    poetry run python scripts/benchmark_envelope_rendering.py [--rows 5000] [--repeat 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import django
+
+# Setup Django environment
+sys.path.append(os.getcwd())
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "settings")
+django.setup()
+
+from django.core.serializers.json import DjangoJSONEncoder  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from apps.core.middlewares import ApiResponseWrapperMiddleware  # noqa: E402
+from libs.renderers import EnvelopeJSONRenderer, build_envelope  # noqa: E402
+
+
+class FakeResponse:
+    status_code = 200
+    exception = False
+
+
+def build_payload(rows):
+    """Paginated list shaped like a timesheet grid: one row per employee and day."""
+    return {
+        "count": rows,
+        "next": None,
+        "previous": None,
+        "results": [
+            {
+                "id": index,
+                "uuid": uuid.uuid4(),
+                "employee": {"id": index % 500, "code": f"MV{index % 500:05d}", "fullname": f"Employee {index}"},
+                "date": date(2025, 1, 1 + index % 28),
+                "check_in_time": datetime(2025, 1, 1 + index % 28, 8, 0, tzinfo=timezone.utc),
+                "working_days": Decimal("1.00"),
+                "overtime_hours": str(Decimal(index % 4)),
+                "status": "on_time",
+                "note": "Checked in on time",
+                "tags": ["office", "fulltime"],
+            }
+            for index in range(rows)
+        ],
+    }
+
+
+def measure(func, repeat):
+    func()  # warm up
+    started = time.process_time()
+    for _ in range(repeat):
+        func()
+    return (time.process_time() - started) / repeat * 1000
+
+
+def run(rows, repeat):
+    data = build_payload(rows)
+    context = {"response": FakeResponse()}
+    json_body = json.dumps(data, cls=DjangoJSONEncoder).encode()
+
+    def previous_drf():
+        JSONRenderer().render(data, renderer_context=context)
+        return json.dumps(build_envelope(data, False), cls=DjangoJSONEncoder).encode()
+
+    def previous_json():
+        return json.dumps(build_envelope(json.loads(json_body), False), cls=DjangoJSONEncoder).encode()
+
+    def current_drf():
+        return EnvelopeJSONRenderer().render(data, renderer_context=context)
+
+    def current_json():
+        return ApiResponseWrapperMiddleware._wrap_json(json_body, False)
+
+    assert json.loads(previous_drf()) == json.loads(current_drf())
+    assert json.loads(previous_json()) == json.loads(current_json())
+
+    print(f"Payload: {rows} rows, {len(current_drf()) / 1024:.0f} KiB, CPU ms per response over {repeat} runs")
+    for label, previous, current in (
+        ("DRF response", previous_drf, current_drf),
+        ("JsonResponse", previous_json, current_json),
+    ):
+        previous_ms = measure(previous, repeat)
+        current_ms = measure(current, repeat)
+        print(
+            f"  {label:<13} previous {previous_ms:9.2f}  current {current_ms:9.2f}  "
+            f"saved {previous_ms - current_ms:9.2f} ({previous_ms / current_ms:.1f}x faster)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
@@ -27,3 +27,4 @@ from .export import *
 from .import_xlsx import *
 from .imports import *
 from .newrelic import *
+from .profiling import *
@@ -12,6 +12,8 @@ AWS_S3_REGION_NAME = AWS_REGION_NAME
 AWS_QUERYSTRING_AUTH = False
 AWS_S3_CUSTOM_DOMAIN = f"{AWS_STORAGE_BUCKET_NAME}.s3.amazonaws.com"
 AWS_LOCATION = "media"
+# S3-compatible endpoint (e.g. MinIO for local development); None uses AWS S3
+AWS_S3_ENDPOINT_URL = config("AWS_S3_ENDPOINT_URL", default="") or None
 # AWS_S3_OBJECT_PARAMETERS = {
 #     "ACL": "public-read",
 # }
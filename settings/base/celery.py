@@ -24,41 +24,11 @@ CELERY_TASK_EAGER_PROPAGATES = config("CELERY_TASK_EAGER_PROPAGATES", default=Fa
 CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
 
 CELERY_BEAT_SCHEDULE: dict[str, dict] = {
-    # Reactivate employees from maternity leave when leave period ends
-    "reactive_maternity_leave_employees": {
-        "task": "apps.hrm.tasks.employee.reactive_maternity_leave_employees_task",
+    # Run the nightly maintenance jobs in dependency order (see NIGHTLY_PIPELINE)
+    "run_nightly_pipeline": {
+        "task": "apps.core.tasks.nightly.run_nightly_pipeline",
         "schedule": crontab(hour=0, minute=0),  # Daily at midnight
     },
-    # Sync attendance logs from all devices once a day at midnight
-    "backup_database": {
-        "task": "apps.core.tasks.dbbackup.run_dbbackup",
-        "schedule": crontab(hour=0, minute=0),  # Daily at midnight
-    },
-    # Sync attendance logs from all devices once a day at midnight
-    "sync_all_attendance_devices": {
-        "task": "apps.hrm.tasks.attendances.sync_all_attendance_devices",
-        "schedule": crontab(hour=0, minute=2),  # Daily at midnight
-    },
-    # Aggregate HR reports batch at midnight
-    "aggregate_hr_reports_batch": {
-        "task": "apps.hrm.tasks.reports_hr.aggregate_hr_reports_batch",
-        "schedule": crontab(hour=0, minute=5),  # Daily at 00:05 (after attendance sync)
-    },
-    # Aggregate recruitment reports batch at midnight
-    "aggregate_recruitment_reports_batch": {
-        "task": "apps.hrm.tasks.reports_recruitment.aggregate_recruitment_reports_batch",
-        "schedule": crontab(hour=0, minute=10),  # Daily at 00:10 (after HR reports)
-    },
-    # Update certificate statuses based on expiry dates
-    "update_certificate_statuses": {
-        "task": "apps.hrm.tasks.certificates.update_certificate_statuses",
-        "schedule": crontab(hour=1, minute=0),  # Daily at 01:00
-    },
-    # Recalculate Daily Attendance Reports
-    "recalculate_daily_attendance_reports": {
-        "task": "hrm.tasks.attendance_report.recalculate_daily_attendance_reports",
-        "schedule": crontab(hour=1, minute=10),
-    },
     # Prepare timesheet entries and monthly model at the beginning of month
     "prepare_monthly_timesheets": {
         "task": "apps.hrm.tasks.timesheets.prepare_monthly_timesheets",
@@ -74,29 +44,101 @@ CELERY_BEAT_SCHEDULE: dict[str, dict] = {
         "task": "apps.payroll.tasks.generate_kpi_assessment_period_task",
         "schedule": crontab(day_of_month="1", hour=0, minute=1),  # First day at 00:01 (after salary period)
     },
-    # Check KPI assessment deadlines and finalize periods daily
-    "check_kpi_assessment_deadline_and_finalize": {
-        "task": "apps.payroll.tasks.check_kpi_assessment_deadline_and_finalize_task",
-        "schedule": crontab(hour=0, minute=30),  # Daily at 00:30
-    },
     # Update EmployeeMonthlyTimesheet rows marked with need_refresh every short period
     "update_monthly_timesheet_async": {
         "task": "apps.hrm.tasks.timesheets.update_monthly_timesheet_async",
         "schedule": 30.0,
     },
+    # Materialize attendance punches buffered by the quick mobile check-in endpoints
+    "materialize_pending_attendance_punches": {
+        "task": "apps.hrm.tasks.attendances.materialize_pending_attendance_punches",
+        "schedule": 10.0,
+    },
+    # Correct drifted unread/total notification counters kept in the cache
+    "reconcile_notification_counters": {
+        "task": "apps.notifications.tasks.reconcile_notification_counters_task",
+        "schedule": crontab(minute="*/15"),
+    },
     # Finalize daily timesheets at 17:30
     "finalize_daily_timesheets": {
         "task": "apps.hrm.tasks.timesheets.finalize_daily_timesheets",
         "schedule": crontab(hour=17, minute=30),
     },
-    # Check contract status daily
-    "check_contract_status": {
-        "task": "apps.hrm.tasks.contracts.check_contract_status",
-        "schedule": crontab(hour=0, minute=0),  # Daily at 00:00
+}
+
+# Nightly maintenance jobs, run by `run_nightly_pipeline` in dependency order.
+# A step starts once all steps in `depends_on` succeeded, and at most
+# NIGHTLY_PIPELINE_RESOURCE_LIMITS[resource] steps of the same resource run at once.
+NIGHTLY_PIPELINE: list[dict] = [
+    {
+        "name": "sync_all_attendance_devices",
+        "task": "apps.hrm.tasks.attendances.sync_all_attendance_devices",
+        "resource": "devices",
+        "kwargs": {"inline": True},
     },
-    # Update employee status from approved leave proposals daily
-    "update_employee_status_from_leave_proposals": {
+    {
+        "name": "reactive_maternity_leave_employees",
+        "task": "apps.hrm.tasks.employee.reactive_maternity_leave_employees_task",
+        "depends_on": ["sync_all_attendance_devices"],
+    },
+    {
+        "name": "update_employee_status_from_leave_proposals",
         "task": "apps.hrm.tasks.proposal.update_employee_status_from_approved_leave_proposals",
-        "schedule": crontab(hour=0, minute=0),  # Daily at 00:00
+        "depends_on": ["reactive_maternity_leave_employees"],
+    },
+    {
+        "name": "check_contract_status",
+        "task": "apps.hrm.tasks.contracts.check_contract_status",
+        "depends_on": ["sync_all_attendance_devices"],
+    },
+    {
+        "name": "update_certificate_statuses",
+        "task": "apps.hrm.tasks.certificates.update_certificate_statuses",
+        "depends_on": ["sync_all_attendance_devices"],
+    },
+    {
+        "name": "recalculate_daily_attendance_reports",
+        "task": "hrm.tasks.attendance_report.recalculate_daily_attendance_reports",
+        "depends_on": ["sync_all_attendance_devices"],
+    },
+    {
+        "name": "aggregate_hr_reports_batch",
+        "task": "apps.hrm.tasks.reports_hr.batch_tasks.aggregate_hr_reports_batch",
+        "depends_on": [
+            "update_employee_status_from_leave_proposals",
+            "check_contract_status",
+            "update_certificate_statuses",
+        ],
+    },
+    {
+        "name": "aggregate_recruitment_reports_batch",
+        "task": "apps.hrm.tasks.reports_recruitment.batch_tasks.aggregate_recruitment_reports_batch",
+        "depends_on": ["aggregate_hr_reports_batch"],
+    },
+    {
+        "name": "check_kpi_assessment_deadline_and_finalize",
+        "task": "apps.payroll.tasks.check_kpi_assessment_deadline_and_finalize_task",
+        "depends_on": ["update_employee_status_from_leave_proposals"],
+    },
+    {
+        "name": "purge_expired_tokens",
+        "task": "apps.core.tasks.tokens.purge_expired_tokens_task",
+    },
+    # The compressed dump runs alone, after every job that writes
+    {
+        "name": "backup_database",
+        "task": "apps.core.tasks.dbbackup.run_dbbackup",
+        "resource": "backup",
+        "depends_on": [
+            "recalculate_daily_attendance_reports",
+            "aggregate_recruitment_reports_batch",
+            "check_kpi_assessment_deadline_and_finalize",
+            "purge_expired_tokens",
+        ],
     },
+]
+NIGHTLY_PIPELINE_RESOURCE_LIMITS: dict[str, int] = {
+    "devices": 1,
+    "database": 2,
+    "backup": 1,
 }
@@ -3,9 +3,10 @@ from datetime import timedelta
 from .base import config
 
 REST_FRAMEWORK = {
-    # "DEFAULT_RENDERER_CLASSES": [
-    #     "libs.renderers.EnvelopeJSONRenderer",
-    # ],
+    "DEFAULT_RENDERER_CLASSES": [
+        "libs.renderers.EnvelopeJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "apps.core.api.authentication.ClientAwareJWTAuthentication",
     ],
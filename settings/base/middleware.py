@@ -1,5 +1,6 @@
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    "apps.core.middlewares.QueryProfilingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
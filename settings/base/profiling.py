@@ -0,0 +1,7 @@
+from .base import config
+
+# Query and latency profiling of API requests, see apps.core.middlewares.QueryProfilingMiddleware
+QUERY_PROFILING_ENABLED = config("QUERY_PROFILING_ENABLED", default=False, cast=bool)
+# JSON lines file the profiles are appended to (empty to only send response headers),
+# summarized by the query_profile_report management command
+QUERY_PROFILING_REPORT_PATH = config("QUERY_PROFILING_REPORT_PATH", default="")
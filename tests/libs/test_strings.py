@@ -1,6 +1,6 @@
 import pytest
 
-from libs.strings import clean_html
+from libs.strings import clean_html, normalize_search_text
 
 
 @pytest.mark.parametrize(
@@ -23,3 +23,21 @@ def test_clean_html_removes_unsafe_tags(html, expected):
 
     # Assert
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("Nguyễn Văn Đức", "nguyen van duc"),
+        ("  TRẦN   thị\tÁnh ", "tran thi anh"),
+        ("emp001@example.com", "emp001@example.com"),
+        ("", ""),
+        (None, ""),
+    ],
+)
+def test_normalize_search_text_strips_accents_and_case(value, expected):
+    # Act
+    result = normalize_search_text(value)
+
+    # Assert
+    assert result == expected